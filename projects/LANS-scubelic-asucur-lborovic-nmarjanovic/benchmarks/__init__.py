@@ -0,0 +1,11 @@
+"""
+Throughput benchmarks for LLM Answer Watcher.
+
+Run from the project root:
+
+    python -m benchmarks --scenario smoke
+    python -m benchmarks --scenario default --scenario chaos --output results.json
+    python -m benchmarks --scenario default --compare baseline.json
+
+See benchmarks/README.md for scenario parameters and the result format.
+"""
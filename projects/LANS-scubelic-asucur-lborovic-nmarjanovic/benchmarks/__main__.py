@@ -0,0 +1,137 @@
+"""
+Command-line entry point for the benchmark suite.
+
+Runs one or more scenarios, prints a summary table, optionally writes a
+machine-readable JSON result file, and optionally compares against a
+previous result file (exit code 1 on regression).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+from benchmarks.harness import (
+    LATENCY_DISTRIBUTIONS,
+    RESULT_SCHEMA_VERSION,
+    SCENARIOS,
+    compare_results,
+    environment_info,
+    run_scenario,
+)
+from llm_answer_watcher.utils.time import utc_timestamp
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark run_all throughput against mock LLM clients.",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Predefined scenario to run (repeatable, default: default)",
+    )
+    parser.add_argument("--intents", type=int, help="Override number of intents")
+    parser.add_argument("--models", type=int, help="Override number of models")
+    parser.add_argument("--competitors", type=int, help="Override number of competitor brands")
+    parser.add_argument("--operations", type=int, help="Override number of global operations")
+    parser.add_argument(
+        "--latency",
+        choices=LATENCY_DISTRIBUTIONS,
+        help="Override latency distribution",
+    )
+    parser.add_argument("--latency-ms", type=float, help="Override mean latency (ms)")
+    parser.add_argument("--failure-rate", type=float, help="Override chaos failure rate")
+    parser.add_argument("--concurrency", type=int, help="Override max concurrent requests")
+    parser.add_argument("--output", "-o", type=Path, help="Write JSON results to this file")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Compare against a previous JSON result file; exit 1 on regression",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative change counted as a regression (default: 0.10)",
+    )
+    return parser.parse_args(argv)
+
+
+def _apply_overrides(scenario, args):
+    overrides = {
+        "intents": args.intents,
+        "models": args.models,
+        "competitors": args.competitors,
+        "operations": args.operations,
+        "latency_distribution": args.latency,
+        "latency_mean_ms": args.latency_ms,
+        "failure_rate": args.failure_rate,
+        "max_concurrent": args.concurrency,
+    }
+    return replace(scenario, **{k: v for k, v in overrides.items() if v is not None})
+
+
+def _print_run(run: dict) -> None:
+    metrics = run["metrics"]
+    print(
+        f"{run['scenario']['name']:<12} "
+        f"{metrics['queries']:>6} q  "
+        f"{metrics['queries_per_sec']:>9.1f} q/s  "
+        f"lag p99 {metrics['event_loop_lag_p99_ms']:>7.1f} ms  "
+        f"db {metrics['db_write_ms']:>8.1f} ms  "
+        f"report {metrics['report_ms']:>7.1f} ms  "
+        f"rss {metrics['peak_rss_mb'] or 0:>7.1f} MB"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    # Keep per-query logs (including injected chaos errors) out of the timing
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("llm_answer_watcher").setLevel(logging.CRITICAL)
+
+    names = args.scenario or ["default"]
+    document = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "timestamp_utc": utc_timestamp(),
+        "environment": environment_info(),
+        "results": [],
+    }
+
+    for name in names:
+        scenario = _apply_overrides(SCENARIOS[name], args)
+        with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as work_dir:
+            run = asyncio.run(run_scenario(scenario, Path(work_dir)))
+        document["results"].append(run)
+        _print_run(run)
+
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        rows = compare_results(baseline, document, threshold=args.threshold)
+        regressions = [row for row in rows if row["regression"]]
+        for row in rows:
+            marker = "REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['scenario']:<12} {row['metric']:<24} "
+                f"{row['baseline']:>10} -> {row['current']:>10} "
+                f"({row['change']:+.1%}) {marker}"
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Micro-benchmark for brand extraction on long answers with many brands.
+
+Builds a synthetic markdown answer (numbered list, bullets, headers and
+prose; ~20k characters by default) against a brand list of several hundred
+names, then times the extraction steps run for every answer:
+
+- rank_ms: extract_ranked_list_pattern() (list scan and brand matching)
+- mentions_ms: detect_mentions() (regex matching and overlap removal)
+- overlap_ms: remove_overlapping_mentions() on every occurrence of every
+  brand (many overlaps, before first-occurrence deduplication)
+- labels_ms: classify_mentions() labeling sentiment and context of every
+  detected mention locally
+
+Times are the median over repeats, in milliseconds per call.
+
+Example:
+    $ python -m benchmarks.extraction --answer-chars 20000 --brands 300
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from llm_answer_watcher.extractor.mention_detector import (
+    BrandMention,
+    create_brand_pattern,
+    detect_mentions,
+    remove_overlapping_mentions,
+)
+from llm_answer_watcher.extractor.rank_extractor import extract_ranked_list_pattern
+from llm_answer_watcher.extractor.sentiment_classifier import classify_mentions
+
+_FILLER = (
+    "Pricing, integrations and support quality vary between vendors, so evaluate "
+    "each option against your team's workflow before committing."
+)
+
+
+def build_brands(count: int, rng: random.Random) -> list[str]:
+    """Build distinct brand names, some of which are prefixes of others."""
+    syllables = ["war", "mly", "hub", "spot", "lem", "list", "quick", "mail", "zo", "ho", "pipe"]
+    brands: set[str] = set()
+    while len(brands) < count:
+        name = "".join(rng.sample(syllables, k=rng.randint(2, 3))).capitalize()
+        brands.add(name)
+        if len(brands) < count and rng.random() < 0.2:
+            brands.add(f"{name} Pro")
+    return sorted(brands)
+
+
+def build_long_answer(brands: list[str], answer_chars: int, rng: random.Random) -> str:
+    """
+    Build a markdown answer of about answer_chars characters.
+
+    Most list lines do not name a brand exactly, so rank extraction has to
+    try fuzzy matching on them, which is the expensive path.
+    """
+    lines = ["Here is a detailed comparison of the options:", ""]
+    rank = 1
+    while sum(len(line) + 1 for line in lines) < answer_chars:
+        brand = rng.choice(brands)
+        kind = rng.random()
+        if kind < 0.3:
+            lines.append(f"{rank}. **{brand}** - solid choice for growing teams.")
+            rank += 1
+        elif kind < 0.5:
+            lines.append(f"{rank}. Pricing starts at ${rng.randint(10, 99)} per seat per month.")
+            rank += 1
+        elif kind < 0.7:
+            lines.append(f"- Works well alongside {brand} for reporting.")
+        elif kind < 0.8:
+            lines.append(f"## Notes on {brand[:-1]}")
+        else:
+            lines.append(f"{_FILLER} Teams switching from {brand} mention onboarding.")
+    return "\n".join(lines)
+
+
+def _median_ms(call: Callable[[], object], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def run_extraction_benchmark(
+    answer_chars: int = 20_000, brand_count: int = 300, repeats: int = 5, seed: int = 0
+) -> dict:
+    """
+    Time rank extraction, mention detection, overlap removal and labeling.
+
+    Args:
+        answer_chars: Approximate answer length
+        brand_count: Number of brands (split between mine and competitors)
+        repeats: Timed calls per step (median reported)
+        seed: Random seed for brands and answer
+
+    Returns:
+        dict: Scenario parameters, result sizes and median ms per step
+    """
+    rng = random.Random(seed)
+    brands = build_brands(brand_count, rng)
+    answer = build_long_answer(brands, answer_chars, rng)
+    mine, competitors = brands[:10], brands[10:]
+
+    occurrences = [
+        BrandMention(match.group(0), brand, "competitor", match.start())
+        for brand in brands
+        for match in create_brand_pattern(brand).finditer(answer)
+    ]
+
+    ranked, confidence = extract_ranked_list_pattern(answer, brands)
+    mentions = detect_mentions(answer, mine, competitors)
+    return {
+        "answer_chars": len(answer),
+        "brands": len(brands),
+        "ranked_brands": len(ranked),
+        "rank_confidence": confidence,
+        "mentions": len(mentions),
+        "occurrences": len(occurrences),
+        "rank_ms": _median_ms(lambda: extract_ranked_list_pattern(answer, brands), repeats),
+        "mentions_ms": _median_ms(lambda: detect_mentions(answer, mine, competitors), repeats),
+        "overlap_ms": _median_ms(lambda: remove_overlapping_mentions(occurrences), repeats),
+        "labels_ms": _median_ms(lambda: classify_mentions(answer, mentions), repeats),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and print the result as JSON."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.extraction",
+        description="Benchmark brand extraction on long answers with many brands.",
+    )
+    parser.add_argument("--answer-chars", type=int, default=20_000, help="Answer length")
+    parser.add_argument("--brands", type=int, default=300, help="Number of brands")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed calls per step")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args(argv)
+
+    result = run_extraction_benchmark(args.answer_chars, args.brands, args.repeats, args.seed)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,436 @@
+"""
+Benchmark harness for run_all throughput.
+
+Drives the real run_all orchestration (extraction, JSON artifacts, SQLite
+writes, operations) against MockLLMClient/ChaosLLMClient so provider latency
+and failure rates are controlled, then measures:
+
+- queries_per_sec: completed (intent x model) queries per wall-clock second
+- peak_rss_mb: peak resident set size of the process
+- event_loop_lag_ms: p50/p99/max scheduling delay of a 10ms heartbeat task
+- db_write_ms: total time spent in database writes (from query_timings)
+- report_ms: time to render and write the HTML report
+
+Only build_client and pricing lookups are replaced; everything else is the
+production code path.
+
+Example:
+    >>> scenario = BenchmarkScenario(name="smoke", intents=5, models=2)
+    >>> result = asyncio.run(run_scenario(scenario, work_dir=Path("/tmp/bench")))
+    >>> result["metrics"]["queries_per_sec"]
+    412.7
+"""
+
+import asyncio
+import math
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    RuntimeOperation,
+)
+from llm_answer_watcher.daemon.watcher import build_report_results
+from llm_answer_watcher.llm_runner.chaos_client import create_chaos_client
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.timing import percentile
+from llm_answer_watcher.report.generator import write_report
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.utils.pricing import ModelPricing
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Result file format version (bump when metrics change meaning)
+RESULT_SCHEMA_VERSION = 1
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+# Heartbeat interval for event loop lag measurement
+LAG_INTERVAL_SECONDS = 0.01
+
+# Metrics where a larger value is a regression (everything except throughput)
+LOWER_IS_BETTER = {
+    "wall_seconds",
+    "peak_rss_mb",
+    "event_loop_lag_p99_ms",
+    "event_loop_lag_max_ms",
+    "db_write_ms",
+    "report_ms",
+}
+HIGHER_IS_BETTER = {"queries_per_sec"}
+
+
+@dataclass
+class BenchmarkScenario:
+    """
+    Parameters for one benchmark run.
+
+    Attributes:
+        name: Scenario name used in result files
+        intents: Number of intents
+        models: Number of API models (each queried for every intent)
+        competitors: Number of competitor brands
+        operations: Number of global operations run after each query
+        latency_distribution: One of LATENCY_DISTRIBUTIONS
+        latency_mean_ms: Mean injected latency per LLM call
+        failure_rate: Chaos failure rate (0.0 disables ChaosLLMClient)
+        max_concurrent: run_settings.max_concurrent_requests
+        answer_paragraphs: Filler paragraphs per answer (controls answer size)
+        seed: Random seed for latency sampling and chaos
+    """
+
+    name: str = "default"
+    intents: int = 10
+    models: int = 3
+    competitors: int = 20
+    operations: int = 0
+    latency_distribution: str = "lognormal"
+    latency_mean_ms: float = 50.0
+    failure_rate: float = 0.0
+    max_concurrent: int = 10
+    answer_paragraphs: int = 5
+    seed: int = 42
+
+    def __post_init__(self):
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"latency_distribution must be one of {LATENCY_DISTRIBUTIONS}, "
+                f"got '{self.latency_distribution}'"
+            )
+        if self.intents < 1 or self.models < 1:
+            raise ValueError("Scenario needs at least one intent and one model")
+
+    @property
+    def total_queries(self) -> int:
+        return self.intents * self.models
+
+
+# Predefined scenarios for `python -m benchmarks --scenario NAME`
+SCENARIOS = {
+    "smoke": BenchmarkScenario(name="smoke", intents=3, models=2, latency_mean_ms=5),
+    "default": BenchmarkScenario(name="default"),
+    "wide": BenchmarkScenario(
+        name="wide", intents=50, models=6, competitors=100, max_concurrent=25
+    ),
+    "operations": BenchmarkScenario(name="operations", intents=10, models=3, operations=3),
+    "chaos": BenchmarkScenario(name="chaos", intents=20, models=3, failure_rate=0.3),
+}
+
+
+def make_latency_sampler(
+    distribution: str, mean_ms: float, rng: random.Random
+) -> Callable[[], float]:
+    """
+    Build a latency sampler (milliseconds) with the given mean.
+
+    Args:
+        distribution: "fixed", "uniform" (0 to 2x mean), "exponential", or
+            "lognormal" (sigma 0.5, long right tail like real LLM latency)
+        mean_ms: Mean latency in milliseconds
+        rng: Random source (seeded for reproducibility)
+
+    Returns:
+        Callable returning one latency sample in milliseconds
+    """
+    if mean_ms <= 0:
+        return lambda: 0.0
+    if distribution == "fixed":
+        return lambda: mean_ms
+    if distribution == "uniform":
+        return lambda: rng.uniform(0, 2 * mean_ms)
+    if distribution == "exponential":
+        return lambda: rng.expovariate(1 / mean_ms)
+    if distribution == "lognormal":
+        sigma = 0.5
+        mu = math.log(mean_ms) - sigma**2 / 2
+        return lambda: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"Unknown latency distribution: {distribution}")
+
+
+def build_answer(brands: list[str], paragraphs: int, rng: random.Random) -> str:
+    """Build a ranked-list answer mentioning a random subset of brands."""
+    picked = rng.sample(brands, k=min(len(brands), 8))
+    lines = ["Here are the top options to consider:", ""]
+    lines += [
+        f"{i}. **{brand}** - solid choice for growing teams." for i, brand in enumerate(picked, 1)
+    ]
+    filler = (
+        "Pricing, integrations and support quality vary between vendors, so "
+        "evaluate each option against your team's workflow before committing. "
+    )
+    lines += ["", *(filler * 3 for _ in range(paragraphs))]
+    return "\n".join(lines)
+
+
+def build_scenario_config(scenario: BenchmarkScenario, work_dir: Path) -> RuntimeConfig:
+    """Build a RuntimeConfig for a scenario, writing output under work_dir."""
+    models = [
+        RuntimeModel(
+            provider="openai",
+            model_name=f"bench-model-{i}",
+            api_key="bench-key",
+        )
+        for i in range(scenario.models)
+    ]
+    operations = [
+        RuntimeOperation(
+            id=f"op-{i}",
+            prompt="Summarize the ranking for {intent:id}: {intent:response}",
+        )
+        for i in range(scenario.operations)
+    ]
+
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(work_dir / "output"),
+            sqlite_db_path=str(work_dir / "bench.db"),
+            max_concurrent_requests=scenario.max_concurrent,
+            models=[
+                ModelConfig(
+                    provider=m.provider,
+                    model_name=m.model_name,
+                    env_api_key="BENCH_API_KEY",
+                )
+                for m in models
+            ],
+        ),
+        brands=Brands(
+            mine=["MyBrand", "MyBrand.io"],
+            competitors=[f"Competitor{i}" for i in range(scenario.competitors)],
+        ),
+        intents=[
+            Intent(id=f"intent-{i}", prompt=f"What are the best tools for use case {i}?")
+            for i in range(scenario.intents)
+        ],
+        models=models,
+        global_operations=operations,
+    )
+
+
+class EventLoopLagMonitor:
+    """
+    Measure event loop responsiveness with a heartbeat task.
+
+    The heartbeat sleeps LAG_INTERVAL_SECONDS and records how late it wakes
+    up. Blocking work on the loop (synchronous SQLite, file writes, regex
+    extraction) shows up as lag.
+    """
+
+    def __init__(self, interval: float = LAG_INTERVAL_SECONDS):
+        self.interval = interval
+        self.samples_ms: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = loop.time() - started - self.interval
+            self.samples_ms.append(max(lag, 0.0) * 1000)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+
+def _peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB (None if unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 2)
+
+
+def _db_write_ms(db_path: str, run_id: str) -> float:
+    """Sum database write time for a run from the query_timings table."""
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(db_write_ms), 0) FROM query_timings WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+    return round(row[0], 3)
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _fixed_pricing(provider: str, model: str, use_cache: bool = True) -> ModelPricing:
+    """Offline pricing stub so cost estimation never hits the network."""
+    return ModelPricing(provider=provider, model=model, input=0.15, output=0.60)
+
+
+async def run_scenario(scenario: BenchmarkScenario, work_dir: Path) -> dict:
+    """
+    Run one scenario end-to-end and collect metrics.
+
+    Args:
+        scenario: Scenario parameters
+        work_dir: Empty directory for the database and run artifacts
+
+    Returns:
+        dict: {"scenario": {...}, "metrics": {...}} (see module docstring)
+    """
+    work_dir.mkdir(parents=True, exist_ok=True)
+    config = build_scenario_config(scenario, work_dir)
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+
+    rng = random.Random(scenario.seed)
+    sampler = make_latency_sampler(scenario.latency_distribution, scenario.latency_mean_ms, rng)
+    brands = config.brands.mine + config.brands.competitors
+    answers = {
+        intent.prompt: build_answer(brands, scenario.answer_paragraphs, rng)
+        for intent in config.intents
+    }
+
+    def fake_build_client(provider, model_name, **_kwargs):
+        client = MockLLMClient(
+            responses=answers,
+            default_response="Operation result.",
+            provider=provider,
+            model_name=model_name,
+            cost_per_response=0.0001,
+            latency_sampler=sampler,
+        )
+        if scenario.failure_rate > 0:
+            # No per-client seed: ChaosLLMClient reseeds the global RNG, which
+            # would make every query roll the same outcome
+            return create_chaos_client(client, scenario.failure_rate)
+        return client
+
+    # Seed chaos once per scenario for reproducible failure patterns
+    random.seed(scenario.seed)
+
+    monitor = EventLoopLagMonitor()
+    with (
+        patch("llm_answer_watcher.llm_runner.runner.build_client", fake_build_client),
+        patch(
+            "llm_answer_watcher.llm_runner.operation_executor.build_client",
+            fake_build_client,
+        ),
+        patch("llm_answer_watcher.utils.pricing.get_pricing", _fixed_pricing),
+    ):
+        monitor.start()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        results = await run_all(config)
+        wall_seconds = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        await monitor.stop()
+
+    report_start = time.perf_counter()
+    write_report(
+        results["output_dir"],
+        config,
+        build_report_results(config, results),
+    )
+    report_ms = (time.perf_counter() - report_start) * 1000
+
+    lag = monitor.samples_ms
+    completed = results["success_count"] + results["error_count"]
+    metrics = {
+        "wall_seconds": round(wall_seconds, 4),
+        "cpu_seconds": round(cpu_seconds, 4),
+        "queries": completed,
+        "success_count": results["success_count"],
+        "error_count": results["error_count"],
+        "queries_per_sec": round(completed / wall_seconds, 2) if wall_seconds else 0.0,
+        "peak_rss_mb": _peak_rss_mb(),
+        "event_loop_lag_p50_ms": round(percentile(lag, 50), 3),
+        "event_loop_lag_p99_ms": round(percentile(lag, 99), 3),
+        "event_loop_lag_max_ms": round(max(lag, default=0.0), 3),
+        "db_write_ms": _db_write_ms(config.run_settings.sqlite_db_path, results["run_id"]),
+        "report_ms": round(report_ms, 3),
+    }
+
+    return {"scenario": asdict(scenario), "metrics": metrics}
+
+
+def environment_info() -> dict:
+    """Describe the machine and commit a result was produced on."""
+    return {
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.10) -> list[dict]:
+    """
+    Compare two result documents scenario by scenario.
+
+    Args:
+        baseline: Earlier result document (from a previous commit)
+        current: New result document
+        threshold: Relative change that counts as a regression (0.10 = 10%)
+
+    Returns:
+        list[dict]: One entry per compared metric with keys "scenario",
+            "metric", "baseline", "current", "change" (relative) and
+            "regression" (bool)
+    """
+    baseline_runs = {run["scenario"]["name"]: run for run in baseline.get("results", [])}
+    rows = []
+
+    for run in current.get("results", []):
+        name = run["scenario"]["name"]
+        previous = baseline_runs.get(name)
+        if previous is None:
+            continue
+        for metric in sorted(LOWER_IS_BETTER | HIGHER_IS_BETTER):
+            old = previous["metrics"].get(metric)
+            new = run["metrics"].get(metric)
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            regression = change > threshold if metric in LOWER_IS_BETTER else change < -threshold
+            rows.append(
+                {
+                    "scenario": name,
+                    "metric": metric,
+                    "baseline": old,
+                    "current": new,
+                    "change": round(change, 4),
+                    "regression": regression,
+                }
+            )
+
+    return rows
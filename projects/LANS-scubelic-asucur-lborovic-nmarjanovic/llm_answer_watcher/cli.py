@@ -10,6 +10,9 @@ Commands:
     run: Execute LLM queries and generate reports
     validate: Validate configuration without running queries
     eval: Run evaluation suite to test extraction accuracy
+    run-many: Run several configs at once, sending each unique query once
+    daemon: Run watchers continuously on cron-style schedules
+    serve: Serve on-demand runs over HTTP with progress streaming
     prices: Manage LLM pricing data (show, refresh, list)
 
 Exit codes:
@@ -38,32 +41,24 @@ Security:
     - All exceptions are caught and formatted appropriately
 """
 
-import asyncio
+import importlib
 import json
-from contextlib import nullcontext
+from contextlib import nullcontext, suppress
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
-from rich.traceback import install as install_rich_traceback
 
-from llm_answer_watcher.config.loader import load_config
-from llm_answer_watcher.evals.runner import run_eval_suite
 from llm_answer_watcher.exceptions import (
     APIKeyMissingError,
     ConfigFileNotFoundError,
     ConfigValidationError,
 )
-from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
-from llm_answer_watcher.report.generator import write_report
-from llm_answer_watcher.storage.db import init_db_if_needed
-from llm_answer_watcher.storage.eval_db import (
-    init_eval_db_if_needed,
-    store_eval_results,
-)
 from llm_answer_watcher.storage.layout import get_parsed_answer_filename
 from llm_answer_watcher.utils.console import (
     create_progress_bar,
     error,
+    format_duration,
     info,
     output_mode,
     print_banner,
@@ -76,8 +71,56 @@ from llm_answer_watcher.utils.console import (
 )
 from llm_answer_watcher.utils.logging import setup_logging
 
-# Install Rich tracebacks for better error messages
-install_rich_traceback(show_locals=False)
+if TYPE_CHECKING:
+    from llm_answer_watcher.config.loader import load_config
+    from llm_answer_watcher.evals.runner import run_eval_suite
+    from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all, run_many
+    from llm_answer_watcher.report.generator import write_report
+    from llm_answer_watcher.storage.db import init_db_if_needed
+    from llm_answer_watcher.storage.eval_db import (
+        init_eval_db_if_needed,
+        store_eval_results,
+    )
+
+# Heavy dependencies (pydantic schemas, the async runner and provider
+# clients, Jinja2, the eval suite) are imported on first use so that
+# `--help`, `validate` and the small utility commands start quickly.
+# Each name still becomes a module attribute, so `cli.run_all` etc. can be
+# patched in tests exactly as if it had been imported eagerly.
+_LAZY_IMPORTS = {
+    "load_config": "llm_answer_watcher.config.loader",
+    "run_eval_suite": "llm_answer_watcher.evals.runner",
+    "estimate_run_cost": "llm_answer_watcher.llm_runner.runner",
+    "run_all": "llm_answer_watcher.llm_runner.runner",
+    "run_many": "llm_answer_watcher.llm_runner.runner",
+    "write_report": "llm_answer_watcher.report.generator",
+    "init_db_if_needed": "llm_answer_watcher.storage.db",
+    "init_eval_db_if_needed": "llm_answer_watcher.storage.eval_db",
+    "store_eval_results": "llm_answer_watcher.storage.eval_db",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily loaded name on first attribute access (PEP 562)."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def _require(*names: str) -> None:
+    """
+    Bind lazily imported names as module globals before a command uses them.
+
+    Names that are already bound (imported earlier, or patched in tests)
+    are left untouched.
+    """
+    for name in names:
+        if name not in globals():
+            __getattr__(name)
 
 
 def _check_brands_appeared(
@@ -210,6 +253,13 @@ def run(
         "-v",
         help="Enable debug logging",
     ),
+    *,
+    batch: bool = typer.Option(
+        False,
+        "--batch",
+        help="Send OpenAI/Anthropic queries through provider Batch APIs "
+        "(results within 24h, ~50% cheaper; for scheduled runs)",
+    ),
 ):
     """
     Execute LLM queries and generate brand mention report.
@@ -243,7 +293,17 @@ def run(
 
       # Quiet mode for scripts
       llm-answer-watcher run --config watcher.config.yaml --quiet
+
+      # Nightly run at batch pricing
+      llm-answer-watcher run --config watcher.config.yaml --batch --yes
     """
+    import asyncio
+
+    from llm_answer_watcher.daemon.watcher import build_report_results
+    from llm_answer_watcher.llm_runner.http_pool import closing_pool
+
+    _require("load_config", "init_db_if_needed", "estimate_run_cost", "run_all", "write_report")
+
     # Set global output mode based on flags
     output_mode.format = format
     output_mode.quiet = quiet
@@ -261,6 +321,8 @@ def run(
     try:
         with spinner("Loading configuration..."):
             runtime_config = load_config(config)
+            if batch:
+                runtime_config.run_settings.execution_mode = "batch"
 
         # Build model summary
         model_summary = f"{len(runtime_config.models)} models"
@@ -344,9 +406,10 @@ def run(
     # Confirm if expensive (human mode only, unless --yes)
     if output_mode.is_human() and not yes:
         estimated_cost = cost_estimate["total_estimated_cost"]
+        wall_time = format_duration(cost_estimate["predicted_duration_s"])
 
         if (total_queries > 10 or estimated_cost > 0.10) and not typer.confirm(
-            "Continue?"
+            f"Continue? (~${estimated_cost:.4f}, ~{wall_time} wall time)"
         ):
             info("Cancelled by user")
             raise typer.Exit(EXIT_SUCCESS)
@@ -423,56 +486,18 @@ def run(
                 else nullcontext()
             ):
                 results = asyncio.run(
-                    run_all(
-                        runtime_config,
-                        progress_callback=progress_callback,
-                        config_filename=config.name,
+                    closing_pool(
+                        run_all(
+                            runtime_config,
+                            progress_callback=progress_callback,
+                            config_filename=config.name,
+                        )
                     )
                 )
 
         # Generate HTML report
         with spinner("Generating report..."):
-            # Build list of result dicts for report generator
-            result_list = []
-            for intent in runtime_config.intents:
-                for model in runtime_config.models:
-                    # Find matching result (success or error)
-                    found_error = False
-                    for error_record in results.get("errors", []):
-                        if (
-                            error_record["intent_id"] == intent.id
-                            and error_record["model_provider"] == model.provider
-                            and error_record["model_name"] == model.model_name
-                        ):
-                            result_list.append(
-                                {
-                                    "intent_id": intent.id,
-                                    "provider": model.provider,
-                                    "model_name": model.model_name,
-                                    "status": "error",
-                                    "cost_usd": 0.0,
-                                    "timestamp_utc": results["timestamp_utc"],
-                                }
-                            )
-                            found_error = True
-                            break
-
-                    if not found_error:
-                        # Must be success
-                        result_list.append(
-                            {
-                                "intent_id": intent.id,
-                                "provider": model.provider,
-                                "model_name": model.model_name,
-                                "status": "success",
-                                "cost_usd": results["total_cost_usd"]
-                                / results["success_count"]
-                                if results["success_count"] > 0
-                                else 0.0,
-                                "timestamp_utc": results["timestamp_utc"],
-                            }
-                        )
-
+            result_list = build_report_results(runtime_config, results)
             write_report(results["output_dir"], runtime_config, result_list)
 
         success("Report generated successfully")
@@ -485,50 +510,32 @@ def run(
             traceback.print_exc()
         raise typer.Exit(EXIT_DB_ERROR)
 
-    # Build summary table data
-    summary_results = []
-    for intent in runtime_config.intents:
-        for model in runtime_config.models:
-            # Check if this combination had an error
-            found_error = False
-            for error_record in results.get("errors", []):
-                if (
-                    error_record["intent_id"] == intent.id
-                    and error_record["model_provider"] == model.provider
-                    and error_record["model_name"] == model.model_name
-                ):
-                    summary_results.append(
-                        {
-                            "intent_id": intent.id,
-                            "model": f"{model.provider}/{model.model_name}",
-                            "appeared": False,
-                            "cost": 0.0,
-                            "status": "error",
-                        }
-                    )
-                    found_error = True
-                    break
-
-            if not found_error:
-                # Must be success - check if our brands actually appeared by reading parsed file
-                appeared = _check_brands_appeared(
-                    results["output_dir"], intent.id, model.provider, model.model_name
-                )
-                summary_results.append(
-                    {
-                        "intent_id": intent.id,
-                        "model": f"{model.provider}/{model.model_name}",
-                        "appeared": appeared,
-                        "cost": results["total_cost_usd"] / results["success_count"]
-                        if results["success_count"] > 0
-                        else 0.0,
-                        "status": "success",
-                    }
-                )
+    # Build summary table data (same per-query statuses as the report)
+    summary_results = [
+        {
+            "intent_id": row["intent_id"],
+            "model": f"{row['provider']}/{row['model_name']}",
+            "appeared": row["status"] == "success"
+            and _check_brands_appeared(
+                results["output_dir"], row["intent_id"], row["provider"], row["model_name"]
+            ),
+            "cost": row["cost_usd"],
+            "status": row["status"],
+        }
+        for row in result_list
+    ]
 
     # Print summary table
     print_summary_table(summary_results)
 
+    if results.get("status") == "budget-truncated":
+        budget = results["budget"]
+        warning(
+            f"Run budget-truncated: spent ${budget['spent_usd']:.4f}, "
+            f"skipped {budget['skipped_count']} queries/samples/operations "
+            f"(limit reached: {budget['limit_reached']})"
+        )
+
     # Print final summary
     print_final_summary(
         run_id=results["run_id"],
@@ -594,6 +601,8 @@ def validate(
       # Validate for CI/CD (JSON output)
       llm-answer-watcher validate --config watcher.config.yaml --format json
     """
+    _require("load_config")
+
     # Set global output mode
     output_mode.format = format
 
@@ -684,6 +693,21 @@ def eval(
         "--save-results",
         help="Save evaluation results to database for historical tracking",
     ),
+    *,
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes for large suites (default: CPU count, 1 = serial)",
+    ),
+    fixture_cache: Path | None = typer.Option(
+        None,
+        "--fixture-cache",
+        help="Directory for caching parsed fixtures by file hash (e.g., in CI)",
+        file_okay=False,
+        dir_okay=True,
+    ),
 ):
     """
     Run evaluation suite to test extraction accuracy.
@@ -717,7 +741,12 @@ def eval(
 
       # Run evaluation and save results to database
       llm-answer-watcher eval --fixtures evals/testcases/fixtures.yaml --save-results
+
+      # CI: 8 worker processes, reuse parsed fixtures between runs
+      llm-answer-watcher eval -f fixtures.yaml --workers 8 --fixture-cache .cache/evals
     """
+    _require("run_eval_suite", "init_eval_db_if_needed", "store_eval_results")
+
     # Set global output mode
     output_mode.format = format
 
@@ -745,7 +774,9 @@ def eval(
     # Run evaluation suite
     try:
         with spinner("Running evaluation suite..."):
-            eval_results = run_eval_suite(fixtures)
+            eval_results = run_eval_suite(
+                fixtures, workers=workers, cache_dir=fixture_cache
+            )
 
         total_cases = eval_results["total_test_cases"]
         passed_cases = eval_results["total_passed"]
@@ -950,6 +981,8 @@ def demo(
       # Run demo with minimal output
       llm-answer-watcher demo --mode quiet
     """
+    _require("init_db_if_needed")
+
     import tempfile
     from pathlib import Path
 
@@ -1154,6 +1187,618 @@ For most users, I'd recommend starting with Warmly due to its balance of feature
     raise typer.Exit(EXIT_SUCCESS)
 
 
+@app.command()
+def daemon(
+    config: list[Path] = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Path to YAML configuration file (repeat for multiple configs)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    schedule: list[str] = typer.Option(
+        ["@hourly"],
+        "--schedule",
+        "-s",
+        help=(
+            "Cron expression, e.g. '*/30 * * * *', '@daily' or '@every 15m'. "
+            "Give one for all configs or one per --config, in order"
+        ),
+    ),
+    status_port: int = typer.Option(
+        8765,
+        "--status-port",
+        help="Port for the local status endpoint on 127.0.0.1 (0 disables it)",
+    ),
+    no_report: bool = typer.Option(
+        False,
+        "--no-report",
+        help="Skip HTML report generation after each run",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Run watchers continuously on cron-style schedules.
+
+    Replaces a cron job that spawns 'run' repeatedly. The daemon stays up
+    and keeps imports, configs, pricing data, database setup and HTTP
+    connections warm between runs, so small frequent runs are much cheaper.
+
+    Config files are hot-reloaded when they change on disk. If a changed
+    file is invalid, the previous version keeps running and the error is
+    shown by the status endpoint.
+
+    Stop with Ctrl+C (or SIGTERM); in-flight runs finish first.
+
+    Examples:
+      # Run one config every 30 minutes
+      llm-answer-watcher daemon --config watcher.config.yaml --schedule "*/30 * * * *"
+
+      # Two configs with their own schedules
+      llm-answer-watcher daemon -c brand.yaml -s "@hourly" -c competitors.yaml -s "0 9 * * 1-5"
+
+      # Check last-run timings
+      curl http://127.0.0.1:8765/status
+    """
+    import asyncio
+    import signal
+
+    from llm_answer_watcher.daemon import CronSchedule, DaemonJob, WatcherDaemon
+
+    # Daemon output goes to structured logs, not interactive widgets
+    setup_logging(verbose=verbose, quiet_logs=False)
+
+    if len(schedule) not in (1, len(config)):
+        error(
+            f"Got {len(schedule)} --schedule values for {len(config)} --config files. "
+            "Give one schedule for all configs or one per config."
+        )
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    schedules = schedule * len(config) if len(schedule) == 1 else schedule
+    jobs = []
+    for config_path, expression in zip(config, schedules, strict=True):
+        try:
+            cron = CronSchedule.parse(expression)
+        except ValueError as e:
+            error(f"Invalid schedule for {config_path}: {e}")
+            raise typer.Exit(EXIT_CONFIG_ERROR)
+        jobs.append(DaemonJob(config_path=config_path, schedule=cron))
+
+    watcher_daemon = WatcherDaemon(
+        jobs,
+        status_port=status_port or None,
+        generate_reports=not no_report,
+    )
+
+    # Fail fast on configs that cannot be loaded at startup
+    for job in jobs:
+        job.reload_if_changed()
+        if job.runtime_config is None:
+            error(f"Configuration error in {job.config_path}: {job.last_reload_error}")
+            raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    async def _serve() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Not available on Windows; Ctrl+C then raises KeyboardInterrupt
+            with suppress(NotImplementedError):
+                loop.add_signal_handler(sig, watcher_daemon.request_stop)
+        await watcher_daemon.serve_forever()
+
+    for job in jobs:
+        info(f"Scheduled {job.config_path} with '{job.schedule.expression}'")
+    if status_port:
+        info(f"Status endpoint: http://127.0.0.1:{status_port}/status")
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve())
+
+    success("Daemon stopped")
+    raise typer.Exit(EXIT_SUCCESS)
+
+
+@app.command()
+def serve(
+    config: list[Path] = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Path to YAML configuration file to serve (repeat for multiple configs)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    *,
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="Interface to bind (the service has no authentication)",
+    ),
+    port: int = typer.Option(
+        8780,
+        "--port",
+        "-p",
+        help="Port to listen on",
+    ),
+    max_concurrent_runs: int = typer.Option(
+        2,
+        "--max-concurrent-runs",
+        help="Runs executed at the same time",
+        min=1,
+    ),
+    queue_size: int = typer.Option(
+        16,
+        "--queue-size",
+        help="Runs that may wait in the queue before requests get HTTP 429",
+        min=1,
+    ),
+    no_report: bool = typer.Option(
+        False,
+        "--no-report",
+        help="Skip HTML report generation after each run",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Serve on-demand runs of configs over HTTP.
+
+    Each POST /runs request queues a run of one of the served configs,
+    named by file name. A fixed number of workers executes queued runs;
+    when the queue is full, requests are answered with HTTP 429. Progress
+    is streamed as server-sent events, and stored runs and HTML reports are
+    served from each config's database and output directory.
+
+    Like the daemon, the service keeps imports, configs, pricing data,
+    database setup and HTTP connections warm between runs.
+
+    Stop with Ctrl+C (or SIGTERM); running jobs finish first, queued jobs
+    are cancelled.
+
+    Examples:
+      # Serve two configs
+      llm-answer-watcher serve -c brand.yaml -c competitors.yaml
+
+      # Queue a run and follow its progress
+      curl -X POST http://127.0.0.1:8780/runs -d '{"config": "brand.yaml"}'
+      curl -N http://127.0.0.1:8780/runs/<job_id>/events
+
+      # Latest stored runs of a config
+      curl http://127.0.0.1:8780/configs/brand.yaml/runs
+    """
+    import asyncio
+    import signal
+
+    from llm_answer_watcher.daemon import RunService
+
+    # Service output goes to structured logs, not interactive widgets
+    setup_logging(verbose=verbose, quiet_logs=False)
+
+    try:
+        service = RunService(
+            config,
+            host=host,
+            port=port,
+            max_concurrent_runs=max_concurrent_runs,
+            queue_size=queue_size,
+            generate_reports=not no_report,
+        )
+    except ValueError as e:
+        error(str(e))
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    # Fail fast on configs that cannot be loaded at startup
+    for entry in service.configs.values():
+        entry.reload_if_changed()
+        if entry.runtime_config is None:
+            error(f"Configuration error in {entry.config_path}: {entry.last_reload_error}")
+            raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    async def _serve() -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            # Not available on Windows; Ctrl+C then raises KeyboardInterrupt
+            with suppress(NotImplementedError):
+                loop.add_signal_handler(sig, service.request_stop)
+        await service.serve_forever()
+
+    for name in service.configs:
+        info(f"Serving {name}")
+    info(f"Run service: http://{host}:{port}/status")
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_serve())
+
+    success("Service stopped")
+    raise typer.Exit(EXIT_SUCCESS)
+
+
+@app.command("run-many")
+def run_many_command(
+    config: list[Path] = typer.Option(
+        ...,
+        "--config",
+        "-c",
+        help="Path to YAML configuration file (repeat for each config)",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+    ),
+    *,
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' (human-friendly) or 'json' (machine-readable)",
+    ),
+    quiet: bool = typer.Option(
+        False,
+        "--quiet",
+        "-q",
+        help="Minimal output (tab-separated values, one line per config)",
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Skip all confirmation prompts (for automation)",
+    ),
+    max_concurrent: int = typer.Option(
+        None,
+        "--max-concurrent",
+        help="API calls in flight across all configs "
+        "(default: the largest max_concurrent_requests of the configs)",
+        min=1,
+    ),
+    no_report: bool = typer.Option(
+        False,
+        "--no-report",
+        help="Skip HTML report generation",
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        "-v",
+        help="Enable debug logging",
+    ),
+):
+    """
+    Run many configs in one process, sending each unique query once.
+
+    For shops with one config per customer or brand whose intents overlap:
+    the queries of all configs are deduplicated (same prompt, model and
+    system prompt), each unique query is sent once, and its answer is fanned
+    out to every config that asks it. Each config still gets its own run
+    directory, database rows, report and brand extraction.
+
+    Exit codes:
+      0: All queries of all configs succeeded
+      1: Configuration error
+      2: Database error
+      3: Partial failure (some queries or configs failed)
+      4: Complete failure (no query succeeded)
+
+    Examples:
+      # Three customers in one invocation
+      llm-answer-watcher run-many -c acme.yaml -c globex.yaml -c initech.yaml
+
+      # Automation, at most 20 API calls in flight overall
+      llm-answer-watcher run-many -c acme.yaml -c globex.yaml --max-concurrent 20 --yes --format json
+    """
+    import asyncio
+
+    from rich.table import Table
+
+    from llm_answer_watcher.daemon.watcher import build_report_results
+    from llm_answer_watcher.llm_runner.fanout import plan_queries
+    from llm_answer_watcher.llm_runner.http_pool import closing_pool
+    from llm_answer_watcher.utils.console import console
+
+    _require("load_config", "init_db_if_needed", "estimate_run_cost", "run_many", "write_report")
+
+    output_mode.format = format
+    output_mode.quiet = quiet
+    setup_logging(verbose=verbose, quiet_logs=output_mode.is_human())
+    print_banner(_read_version())
+
+    runtime_configs = []
+    with spinner("Loading configurations..."):
+        for config_path in config:
+            try:
+                runtime_configs.append(load_config(config_path))
+            except (ConfigFileNotFoundError, APIKeyMissingError, ConfigValidationError) as e:
+                error(f"Configuration error in {config_path}: {e}")
+                raise typer.Exit(EXIT_CONFIG_ERROR)
+            except Exception as e:
+                error(f"Unexpected error loading {config_path}: {e}")
+                raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    try:
+        with spinner("Initializing databases..."):
+            for runtime_config in runtime_configs:
+                init_db_if_needed(runtime_config.run_settings.sqlite_db_path)
+    except Exception as e:
+        error(f"Failed to initialize database: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    plan = plan_queries(runtime_configs)
+    success(
+        f"Loaded {len(runtime_configs)} configs: {plan.total_queries} queries, "
+        f"{plan.unique_queries} unique"
+    )
+
+    # Each config's estimate counts its shared queries too, so the sum is an
+    # upper bound
+    with spinner("Estimating costs..."):
+        estimated_cost = sum(
+            estimate_run_cost(runtime_config)["total_estimated_cost"]
+            for runtime_config in runtime_configs
+        )
+    info(f"Estimated cost: at most ${estimated_cost:.4f}")
+
+    if (
+        output_mode.is_human()
+        and not yes
+        and (plan.unique_queries > 10 or estimated_cost > 0.10)
+        and not typer.confirm(f"Continue? (at most ~${estimated_cost:.4f})")
+    ):
+        info("Cancelled by user")
+        raise typer.Exit(EXIT_SUCCESS)
+
+    try:
+        with spinner(f"Running {plan.unique_queries} unique queries..."):
+            summary = asyncio.run(
+                closing_pool(
+                    run_many(
+                        runtime_configs,
+                        config_filenames=[config_path.name for config_path in config],
+                        max_concurrent_requests=max_concurrent,
+                    )
+                )
+            )
+
+        if not no_report:
+            with spinner("Generating reports..."):
+                for runtime_config, results in zip(
+                    runtime_configs, summary["results"], strict=True
+                ):
+                    if results is not None:
+                        write_report(
+                            results["output_dir"],
+                            runtime_config,
+                            build_report_results(runtime_config, results),
+                        )
+    except Exception as e:
+        error(f"Run failed: {e}")
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    runs = []
+    for config_path, results, run_error in zip(
+        config, summary["results"], summary["errors"], strict=True
+    ):
+        if results is None:
+            runs.append({"config": str(config_path), "status": "error", "error": run_error})
+            continue
+        runs.append(
+            {
+                "config": str(config_path),
+                "run_id": results["run_id"],
+                "output_dir": results["output_dir"],
+                "status": results["status"],
+                "success_count": results["success_count"],
+                "total_queries": results["total_queries"],
+                "total_cost_usd": results["total_cost_usd"],
+            }
+        )
+
+    sharing = summary["sharing"]
+    if output_mode.is_agent():
+        output_mode.add_json("plan", summary["plan"])
+        output_mode.add_json("sharing", sharing)
+        output_mode.add_json("runs", runs)
+        output_mode.flush_json()
+    elif output_mode.quiet:
+        for run_info in runs:
+            print(
+                f"{run_info['config']}\t{run_info.get('run_id', '')}\t"
+                f"{run_info.get('output_dir', '')}\t{run_info.get('total_cost_usd', 0.0):.6f}\t"
+                f"{run_info.get('success_count', 0)}\t{run_info.get('total_queries', 0)}"
+            )
+    else:
+        table = Table(title="Runs")
+        table.add_column("Config", style="cyan")
+        table.add_column("Run ID")
+        table.add_column("Queries", justify="right")
+        table.add_column("Cost", justify="right", style="green")
+        table.add_column("Status")
+        for run_info in runs:
+            if "run_id" not in run_info:
+                table.add_row(run_info["config"], "-", "-", "-", f"[red]{run_info['error']}[/red]")
+                continue
+            table.add_row(
+                run_info["config"],
+                run_info["run_id"],
+                f"{run_info['success_count']}/{run_info['total_queries']}",
+                f"${run_info['total_cost_usd']:.4f}",
+                run_info["status"],
+            )
+        console.print(table)
+        info(
+            f"{sharing['api_calls']} API calls for {plan.total_queries} queries "
+            f"({sharing['shared_answers']} answers shared, "
+            f"saved ${sharing['saved_cost_usd']:.4f})"
+        )
+
+    succeeded = sum(run_info.get("success_count", 0) for run_info in runs)
+    if succeeded == 0:
+        raise typer.Exit(EXIT_COMPLETE_FAILURE)
+    if succeeded < plan.total_queries or any(r["status"] == "error" for r in runs):
+        raise typer.Exit(EXIT_PARTIAL_FAILURE)
+    raise typer.Exit(EXIT_SUCCESS)
+
+
+@app.command()
+def search(
+    query: str = typer.Argument(
+        ...,
+        help="Full-text query, e.g. 'HubSpot AND Warmly' or '\"email warmup\"'",
+    ),
+    *,
+    db: Path = typer.Option(
+        "./output/watcher.db",
+        "--db",
+        help="Path to SQLite database",
+        exists=True,
+    ),
+    since: str = typer.Option(
+        None,
+        "--since",
+        help="Only answers on or after this date (YYYY-MM-DD or ISO timestamp)",
+    ),
+    until: str = typer.Option(
+        None,
+        "--until",
+        help="Only answers on or before this date (YYYY-MM-DD or ISO timestamp)",
+    ),
+    provider: str = typer.Option(
+        None,
+        "--provider",
+        help="Filter by provider (e.g. openai)",
+    ),
+    model: str = typer.Option(
+        None,
+        "--model",
+        help="Filter by model name (e.g. gpt-4o-mini)",
+    ),
+    brand: str = typer.Option(
+        None,
+        "--brand",
+        help="Only answers in which this brand was detected",
+    ),
+    order: str = typer.Option(
+        "newest",
+        "--order",
+        help="Result order: 'newest', 'oldest' or 'rank' (BM25 relevance)",
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        "-n",
+        help="Maximum number of results",
+        min=1,
+    ),
+    format: str = typer.Option(
+        "text",
+        "--format",
+        "-f",
+        help="Output format: 'text' or 'json'",
+    ),
+):
+    """
+    Search stored LLM answers using the full-text index.
+
+    Queries use SQLite FTS5 syntax: words (stemmed), "quoted phrases",
+    AND / OR / NOT and NEAR(a b, 10). Matched terms are highlighted in
+    the snippets.
+
+    Examples:
+      # Answers mentioning both brands, oldest first
+      llm-answer-watcher search "HubSpot AND Warmly" --order oldest
+
+      # Most relevant answers from one model this month
+      llm-answer-watcher search '"email warmup"' --model gpt-4o-mini --since 2025-11-01 --order rank
+
+      # Answers where Warmly was detected as a mention
+      llm-answer-watcher search "pricing" --brand Warmly --format json
+    """
+    import sqlite3
+
+    from rich.console import Console
+    from rich.markup import escape
+
+    from llm_answer_watcher.storage.db import init_db_if_needed, search_answers
+
+    output_mode.format = format
+
+    if order not in ("newest", "oldest", "rank"):
+        error(f"Invalid order: {order}. Must be 'newest', 'oldest' or 'rank'")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+
+    # Control characters as highlight markers: they never occur in answers,
+    # so the snippet can be escaped for rich before they are replaced
+    start_marker, end_marker = "\x02", "\x03"
+    try:
+        # Brings older databases up to date (builds the index on first use)
+        init_db_if_needed(str(db))
+        with sqlite3.connect(str(db)) as conn:
+            results = search_answers(
+                conn,
+                query,
+                since=since,
+                until=until,
+                provider=provider,
+                model_name=model,
+                brand=brand,
+                order=order,
+                limit=limit,
+                highlight=(start_marker, end_marker),
+            )
+    except sqlite3.OperationalError as e:
+        error(f"Search failed: {e}")
+        raise typer.Exit(EXIT_CONFIG_ERROR)
+    except sqlite3.Error as e:
+        error(f"Database error: {e}")
+        raise typer.Exit(EXIT_DB_ERROR)
+
+    if output_mode.is_agent():
+        for result in results:
+            result["snippet"] = (
+                result["snippet"].replace(start_marker, "**").replace(end_marker, "**")
+            )
+            result["score"] = round(result["score"], 4)
+        output_mode.add_json("query", query)
+        output_mode.add_json("results", results)
+        output_mode.flush_json()
+        raise typer.Exit(EXIT_SUCCESS)
+
+    if not results:
+        warning(f"No answers match: {query}")
+        raise typer.Exit(EXIT_SUCCESS)
+
+    console = Console()
+    for result in results:
+        snippet = (
+            escape(result["snippet"])
+            .replace(start_marker, "[bold yellow]")
+            .replace(end_marker, "[/bold yellow]")
+        )
+        console.print(
+            f"[cyan]{result['timestamp_utc']}[/cyan]  "
+            f"[magenta]{escape(result['model_provider'])}/{escape(result['model_name'])}[/magenta]  "
+            f"[blue]{escape(result['intent_id'])}[/blue]"
+        )
+        console.print(f"  {' '.join(snippet.split())}")
+        console.print()
+    info(f"{len(results)} answers shown (limit {limit})")
+    raise typer.Exit(EXIT_SUCCESS)
+
+
 # Create export command subapp
 export_app = typer.Typer(help="Export data to CSV or JSON")
 app.add_typer(export_app, name="export")
@@ -1753,6 +2398,12 @@ def main(
 
     Use 'llm-answer-watcher COMMAND --help' for detailed command documentation.
     """
+    # Install Rich tracebacks for better error messages (deferred from import
+    # time; rich.traceback is one of the slower imports)
+    from rich.traceback import install as install_rich_traceback
+
+    install_rich_traceback(show_locals=False)
+
     if version:
         from rich.console import Console
 
@@ -1778,6 +2429,7 @@ def main(
         console.print("  validate  Validate configuration without running")
         console.print("  eval      Run evaluation suite to test extraction accuracy")
         console.print("  demo      Run interactive demo with sample data (no API keys needed)")
+        console.print("  daemon    Run watchers continuously on cron-style schedules")
         console.print("  prices    Manage LLM pricing data (show, refresh, list)")
 
 
@@ -6,6 +6,7 @@ watcher.config.yaml file. All models use Python 3.12+ type hints and
 Pydantic v2 field validators for comprehensive validation.
 
 Models:
+    FreshnessPolicy: When earlier answers are reused instead of re-queried
     ModelConfig: LLM model configuration (provider, model_name, env_api_key) [LEGACY]
     RunnerConfig: Unified runner configuration for API and browser runners [NEW]
     RunSettings: Runtime settings (output paths, models, feature flags)
@@ -23,10 +24,53 @@ Models:
 
 from typing import Literal
 
-from pydantic import BaseModel, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator, model_validator
 
+from .templates import CompiledCondition, CompiledTemplate, compile_condition, compile_template
 
-class ModelConfig(BaseModel):
+
+class _SchemaModel(BaseModel):
+    """
+    Base class for config schema models.
+
+    Validators are built on first use instead of at import time
+    (defer_build), so importing this module stays cheap for code paths that
+    never validate a config.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class FreshnessPolicy(_SchemaModel):
+    """
+    When an earlier answer is reused instead of querying the model again.
+
+    An answer is fresh if it was fetched with the same prompt, system prompt
+    and model and, with max_age_hours, is younger than that. Fresh answers
+    are carried forward into the new run (answer, mentions and artifacts)
+    without an API call.
+
+    Can be set in run_settings (all queries), per model and per intent; the
+    intent's policy wins over the model's, which wins over run_settings.
+
+    Attributes:
+        max_age_hours: Reuse answers younger than this. None reuses answers
+            until the prompt, system prompt or model changes; 0 always
+            re-queries (to opt out of a broader policy).
+    """
+
+    max_age_hours: float | None = None
+
+    @field_validator("max_age_hours")
+    @classmethod
+    def validate_max_age_hours(cls, v: float | None) -> float | None:
+        """Validate the maximum age is not negative."""
+        if v is not None and v < 0:
+            raise ValueError(f"max_age_hours cannot be negative (got: {v})")
+        return v
+
+
+class ModelConfig(_SchemaModel):
     """
     LLM model configuration from watcher.config.yaml.
 
@@ -45,6 +89,10 @@ class ModelConfig(BaseModel):
                Config is passed directly to provider API without translation.
         tool_choice: Tool selection mode ("auto", "required", "none"). Default: "auto"
                     Note: Only used by OpenAI. Google auto-decides when to use tools.
+        base_url: Optional API base URL override (e.g., "http://127.0.0.1:8900/openai/v1")
+                  for proxies, gateways or the local stand-in server. If not set,
+                  the provider's *_BASE_URL environment variable or public API is used.
+        freshness: Optional policy for reusing this model's earlier answers
     """
 
     provider: Literal["openai", "anthropic", "google", "mistral", "grok", "perplexity"]
@@ -53,6 +101,8 @@ class ModelConfig(BaseModel):
     system_prompt: str | None = None
     tools: list[dict] | None = None
     tool_choice: str = "auto"
+    base_url: str | None = None
+    freshness: FreshnessPolicy | None = None
 
     @field_validator("model_name")
     @classmethod
@@ -79,8 +129,16 @@ class ModelConfig(BaseModel):
             raise ValueError(f"tool_choice must be one of {allowed}, got: {v}")
         return v
 
+    @field_validator("base_url")
+    @classmethod
+    def validate_base_url(cls, v: str | None) -> str | None:
+        """Validate base_url is an http(s) URL."""
+        if v is not None and not v.startswith(("http://", "https://")):
+            raise ValueError(f"base_url must start with http:// or https://, got: {v}")
+        return v
+
 
-class BudgetConfig(BaseModel):
+class BudgetConfig(_SchemaModel):
     """
     Budget control settings to prevent runaway costs.
 
@@ -107,7 +165,116 @@ class BudgetConfig(BaseModel):
         return v
 
 
-class RunnerConfig(BaseModel):
+class CircuitBreakerConfig(_SchemaModel):
+    """
+    Per-provider/model circuit breaker settings.
+
+    When a model's recent calls mostly fail, its circuit opens and remaining
+    queries for it fail immediately instead of spending the full retry budget.
+    After open_seconds one probe request is let through (half-open); success
+    closes the circuit, failure reopens it.
+
+    Attributes:
+        enabled: Enable circuit breakers (default: True)
+        failure_rate_threshold: Failure rate in the window that opens the circuit
+        window_size: Number of most recent calls considered
+        min_calls: Calls needed in the window before the circuit can open
+        open_seconds: Time the circuit stays open before a probe is allowed
+    """
+
+    enabled: bool = True
+    failure_rate_threshold: float = 0.5
+    window_size: int = 10
+    min_calls: int = 4
+    open_seconds: float = 30.0
+
+    @field_validator("failure_rate_threshold")
+    @classmethod
+    def validate_failure_rate_threshold(cls, v: float) -> float:
+        """Validate the threshold is a rate in (0, 1]."""
+        if not 0 < v <= 1:
+            raise ValueError(f"failure_rate_threshold must be in (0, 1] (got: {v})")
+        return v
+
+    @field_validator("window_size", "min_calls")
+    @classmethod
+    def validate_counts(cls, v: int) -> int:
+        """Validate window sizes are at least one call."""
+        if v < 1:
+            raise ValueError(f"Circuit breaker call counts must be at least 1 (got: {v})")
+        return v
+
+    @field_validator("open_seconds")
+    @classmethod
+    def validate_open_seconds(cls, v: float) -> float:
+        """Validate the open period is not negative."""
+        if v < 0:
+            raise ValueError(f"open_seconds cannot be negative (got: {v})")
+        return v
+
+
+class SamplingConfig(_SchemaModel):
+    """
+    Adaptive multi-sampling of each (intent, model) query.
+
+    Answers are stochastic, so one sample per query gives noisy visibility.
+    With sampling, each API query is repeated until the confidence intervals
+    on "my brand appeared" and on my brand's mean rank are narrow enough, or
+    max_samples is reached. Stable answers stop after few samples; only
+    queries with varying answers use the full budget.
+
+    Attributes:
+        min_samples: Samples taken before stopping is considered
+        max_samples: Hard cap on samples per query
+        confidence: Confidence level of the intervals
+        max_appearance_interval_width: Stop once the interval on the
+            appearance rate is at most this wide (rate in [0, 1])
+        max_rank_interval_width: Stop once the interval on the mean rank is
+            at most this many positions wide
+    """
+
+    min_samples: int = 3
+    max_samples: int = 10
+    confidence: float = 0.9
+    max_appearance_interval_width: float = 0.4
+    max_rank_interval_width: float = 1.0
+
+    @field_validator("min_samples", "max_samples")
+    @classmethod
+    def validate_sample_counts(cls, v: int) -> int:
+        """Validate sample counts are at least one sample."""
+        if v < 1:
+            raise ValueError(f"Sample counts must be at least 1 (got: {v})")
+        return v
+
+    @field_validator("confidence")
+    @classmethod
+    def validate_confidence(cls, v: float) -> float:
+        """Validate the confidence level is in (0, 1)."""
+        if not 0 < v < 1:
+            raise ValueError(f"confidence must be in (0, 1) (got: {v})")
+        return v
+
+    @field_validator("max_appearance_interval_width", "max_rank_interval_width")
+    @classmethod
+    def validate_interval_widths(cls, v: float) -> float:
+        """Validate interval widths are positive."""
+        if v <= 0:
+            raise ValueError(f"Interval widths must be positive (got: {v})")
+        return v
+
+    @model_validator(mode="after")
+    def validate_sample_range(self) -> "SamplingConfig":
+        """Validate min_samples does not exceed max_samples."""
+        if self.min_samples > self.max_samples:
+            raise ValueError(
+                f"min_samples ({self.min_samples}) cannot exceed "
+                f"max_samples ({self.max_samples})"
+            )
+        return self
+
+
+class RunnerConfig(_SchemaModel):
     """
     Unified runner configuration for API-based and browser-based runners.
 
@@ -161,7 +328,7 @@ class RunnerConfig(BaseModel):
         return v
 
 
-class ExtractionModelConfig(BaseModel):
+class ExtractionModelConfig(_SchemaModel):
     """
     Extraction model configuration (project-level).
 
@@ -173,12 +340,14 @@ class ExtractionModelConfig(BaseModel):
         model_name: Specific model identifier (e.g., "gpt-5-nano")
         env_api_key: Environment variable name containing the API key
         system_prompt: Optional relative path to system prompt JSON
+        base_url: Optional API base URL override (see ModelConfig.base_url)
     """
 
     provider: Literal["openai", "anthropic", "google", "mistral", "grok", "perplexity"]
     model_name: str
     env_api_key: str
     system_prompt: str | None = None
+    base_url: str | None = None
 
     @field_validator("model_name")
     @classmethod
@@ -196,8 +365,16 @@ class ExtractionModelConfig(BaseModel):
             raise ValueError("env_api_key cannot be empty")
         return v
 
+    @field_validator("base_url")
+    @classmethod
+    def validate_base_url(cls, v: str | None) -> str | None:
+        """Validate base_url is an http(s) URL."""
+        if v is not None and not v.startswith(("http://", "https://")):
+            raise ValueError(f"base_url must start with http:// or https://, got: {v}")
+        return v
 
-class ExtractionSettings(BaseModel):
+
+class ExtractionSettings(_SchemaModel):
     """
     Extraction configuration (project-level).
 
@@ -209,7 +386,8 @@ class ExtractionSettings(BaseModel):
         method: Extraction method - "function_calling", "regex", or "hybrid"
         fallback_to_regex: If true, fall back to regex when function calling fails
         min_confidence: Minimum confidence threshold (0.0-1.0) for accepting results
-        enable_sentiment_analysis: Extract sentiment/context for each brand mention (default: True)
+        enable_sentiment_analysis: Extract sentiment/context for each brand mention (default: True);
+            regex extraction labels mentions with the local sentiment classifier
         enable_intent_classification: Classify user query intent before extraction (default: True)
 
     Example:
@@ -240,7 +418,7 @@ class ExtractionSettings(BaseModel):
         return v
 
 
-class RunSettings(BaseModel):
+class RunSettings(_SchemaModel):
     """
     Runtime settings for watcher execution.
 
@@ -258,6 +436,37 @@ class RunSettings(BaseModel):
                          Optional - if empty, operations fall back to models list
         use_llm_rank_extraction: Enable LLM-assisted ranking (slower, more accurate)
         budget: Optional budget controls to prevent runaway costs
+        export_otel_timings: Write per-query timing spans as OpenTelemetry
+                            JSON (timings.otel.json) in each run directory
+        stream_responses: Stream answers from providers that support it
+                         (OpenAI, Anthropic, Gemini) to record time-to-first-token
+                         and match brands while the answer is generated
+        stream_stop_after_ranked_items: With stream_responses, stop generation
+                                        once this many ranked list items mentioning
+                                        a brand have arrived (None = read full answer)
+        execution_mode: "sync" (default) queries models directly; "batch" sends
+                       OpenAI/Anthropic queries through provider Batch APIs
+                       (results within 24h at ~50% of the token price)
+        batch_poll_interval_seconds: Initial delay between batch status checks
+                                    (backs off up to 10 minutes)
+        coalesce_requests: Share one in-flight API call between identical
+                          concurrent requests in a run (cost counted once)
+        adaptive_timeouts: Derive per-attempt request timeouts from each model's
+                          observed latency (persisted across runs) instead of
+                          the fixed 120s default
+        hedge_requests: Send a duplicate of a request still running after the
+                       model's p95 latency and use whichever finishes first
+        hedge_max_extra_cost_usd: Stop hedging once the estimated cost of
+                                 duplicates reaches this amount per run
+        circuit_breaker: Per-provider/model circuit breaker that fails queries
+                        fast during provider outages
+        freshness: Default policy for reusing earlier answers that are still
+                  fresh instead of re-querying (None = always query)
+        reuse_unchanged_extractions: Keep the previous run's mentions for
+                                    answers whose SimHash shows them unchanged,
+                                    skipping re-extraction and operations
+        sampling: Repeat API queries until visibility estimates are precise
+                 enough (None = one sample per query)
     """
 
     output_dir: str
@@ -267,6 +476,19 @@ class RunSettings(BaseModel):
     operation_models: list[ModelConfig] = []  # Models used only for operations
     use_llm_rank_extraction: bool = False
     budget: BudgetConfig | None = None
+    export_otel_timings: bool = False
+    stream_responses: bool = False
+    stream_stop_after_ranked_items: int | None = None
+    execution_mode: Literal["sync", "batch"] = "sync"
+    batch_poll_interval_seconds: float = 30.0
+    coalesce_requests: bool = True
+    adaptive_timeouts: bool = True
+    hedge_requests: bool = False
+    hedge_max_extra_cost_usd: float = 0.10
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    freshness: FreshnessPolicy | None = None
+    reuse_unchanged_extractions: bool = False
+    sampling: SamplingConfig | None = None
 
     @field_validator("output_dir")
     @classmethod
@@ -302,6 +524,30 @@ class RunSettings(BaseModel):
             )
         return v
 
+    @field_validator("stream_stop_after_ranked_items")
+    @classmethod
+    def validate_stream_stop_after_ranked_items(cls, v: int | None) -> int | None:
+        """Validate the early-stop threshold is at least one ranked item."""
+        if v is not None and v < 1:
+            raise ValueError(f"stream_stop_after_ranked_items must be at least 1 (got: {v})")
+        return v
+
+    @field_validator("batch_poll_interval_seconds")
+    @classmethod
+    def validate_batch_poll_interval_seconds(cls, v: float) -> float:
+        """Validate the batch poll interval is positive."""
+        if v <= 0:
+            raise ValueError(f"batch_poll_interval_seconds must be positive (got: {v})")
+        return v
+
+    @field_validator("hedge_max_extra_cost_usd")
+    @classmethod
+    def validate_hedge_max_extra_cost_usd(cls, v: float) -> float:
+        """Validate the hedging spend cap is not negative."""
+        if v < 0:
+            raise ValueError(f"hedge_max_extra_cost_usd cannot be negative (got: {v})")
+        return v
+
     @field_validator("models")
     @classmethod
     def validate_models(cls, v: list[ModelConfig]) -> list[ModelConfig]:
@@ -330,7 +576,7 @@ class RunSettings(BaseModel):
         return v
 
 
-class Brands(BaseModel):
+class Brands(_SchemaModel):
     """
     Brand alias collections for mention detection.
 
@@ -415,7 +661,7 @@ class Brands(BaseModel):
         return cleaned
 
 
-class Operation(BaseModel):
+class Operation(_SchemaModel):
     """
     Custom post-intent operation configuration.
 
@@ -605,7 +851,7 @@ class Operation(BaseModel):
         return self
 
 
-class Intent(BaseModel):
+class Intent(_SchemaModel):
     """
     Buyer-intent query configuration.
 
@@ -616,11 +862,14 @@ class Intent(BaseModel):
         id: Unique identifier slug (alphanumeric, hyphens, underscores)
         prompt: The actual question to ask the LLM
         operations: Optional list of custom operations to run after this intent completes
+        freshness: Optional policy for reusing this intent's earlier answers
+                  (overrides model and run_settings policies)
     """
 
     id: str
     prompt: str
     operations: list[Operation] = []
+    freshness: FreshnessPolicy | None = None
 
     @field_validator("id")
     @classmethod
@@ -681,7 +930,7 @@ class Intent(BaseModel):
         return v
 
 
-class WatcherConfig(BaseModel):
+class WatcherConfig(_SchemaModel):
     """
     Root configuration model for watcher.config.yaml.
 
@@ -884,7 +1133,7 @@ class WatcherConfig(BaseModel):
         return self
 
 
-class RuntimeModel(BaseModel):
+class RuntimeModel(_SchemaModel):
     """
     Resolved model configuration with API key and system prompt.
 
@@ -899,6 +1148,8 @@ class RuntimeModel(BaseModel):
         system_prompt: Resolved system prompt text (loaded from JSON file or default)
         tools: Optional list of tool configurations (e.g., [{"type": "web_search"}])
         tool_choice: Tool selection mode ("auto", "required", "none")
+        base_url: Optional API base URL override (None = env var or public API)
+        freshness: Optional policy for reusing this model's earlier answers
     """
 
     provider: str
@@ -907,6 +1158,8 @@ class RuntimeModel(BaseModel):
     system_prompt: str = "You are a helpful AI assistant."
     tools: list[dict] | None = None
     tool_choice: str = "auto"
+    base_url: str | None = None
+    freshness: FreshnessPolicy | None = None
 
     @field_validator("provider")
     @classmethod
@@ -941,7 +1194,7 @@ class RuntimeModel(BaseModel):
         return v
 
 
-class RuntimeExtractionModel(BaseModel):
+class RuntimeExtractionModel(_SchemaModel):
     """
     Resolved extraction model configuration with API key.
 
@@ -953,12 +1206,14 @@ class RuntimeExtractionModel(BaseModel):
         model_name: Specific model identifier (e.g., "gpt-5-nano")
         api_key: Resolved API key from environment (NEVER log this)
         system_prompt: Resolved system prompt text
+        base_url: Optional API base URL override (None = env var or public API)
     """
 
     provider: str
     model_name: str
     api_key: str
     system_prompt: str = "You are a brand mention extraction assistant."
+    base_url: str | None = None
 
     @field_validator("provider")
     @classmethod
@@ -993,7 +1248,7 @@ class RuntimeExtractionModel(BaseModel):
         return v
 
 
-class RuntimeExtractionSettings(BaseModel):
+class RuntimeExtractionSettings(_SchemaModel):
     """
     Runtime extraction settings with resolved extraction model.
 
@@ -1016,12 +1271,14 @@ class RuntimeExtractionSettings(BaseModel):
     enable_intent_classification: bool
 
 
-class RuntimeOperation(BaseModel):
+class RuntimeOperation(_SchemaModel):
     """
     Resolved operation configuration for runtime execution.
 
     Created by config.loader after resolving model overrides and validating
     dependencies. Contains all information needed to execute the operation.
+    The prompt and condition are compiled when the operation is created, so
+    executing it for every intent and model does not parse them again.
 
     Attributes:
         id: Unique operation identifier
@@ -1053,8 +1310,33 @@ class RuntimeOperation(BaseModel):
     function_template: str | None = None
     function_params: dict | None = None
 
-
-class RuntimeConfig(BaseModel):
+    _compiled_prompt: CompiledTemplate = PrivateAttr()
+    _compiled_condition: CompiledCondition | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context, /) -> None:
+        """Compile the prompt and condition once, when the config is loaded."""
+        self._compiled_prompt = compile_template(self.prompt)
+        if self.condition:
+            self._compiled_condition = compile_condition(self.condition)
+
+    @property
+    def compiled_prompt(self) -> CompiledTemplate:
+        """Compiled prompt template (recompiled if prompt was reassigned)."""
+        if self._compiled_prompt.source != self.prompt:
+            self._compiled_prompt = compile_template(self.prompt)
+        return self._compiled_prompt
+
+    @property
+    def compiled_condition(self) -> CompiledCondition | None:
+        """Compiled condition, or None without a condition."""
+        if not self.condition:
+            return None
+        if self._compiled_condition is None or self._compiled_condition.source != self.condition:
+            self._compiled_condition = compile_condition(self.condition)
+        return self._compiled_condition
+
+
+class RuntimeConfig(_SchemaModel):
     """
     Runtime configuration with resolved API keys.
 
@@ -0,0 +1,253 @@
+"""
+Compiled operation prompt templates and conditions.
+
+Operation prompts and conditions are rendered for every operation, intent
+and model of a run. Instead of running one str.replace() pass per template
+variable (and one per earlier operation result) each time, they are parsed
+once when the config is loaded:
+
+- compile_template() splits a prompt into literal segments and variable
+  slots, so rendering is a single join of the literals with the slot values
+- compile_condition() parses a condition into a small predicate object
+  whose operands are compiled templates
+
+Rendering asks a resolver for each slot's value. A resolver returning None
+leaves the placeholder as written, like an unknown variable or a
+{operation:<id>} whose operation has not produced a result. Slot values
+are inserted as-is: a response that happens to contain "{run:id}" is not
+expanded again.
+
+Example:
+    >>> template = compile_template("Is {brand:mine} ranked in {intent:response}?")
+    >>> template.slots
+    ('brand:mine', 'intent:response')
+    >>> template.render({"brand:mine": "Acme", "intent:response": "1. Acme"}.get)
+    'Is Acme ranked in 1. Acme?'
+    >>> condition = compile_condition("{rank:mine} > 3")
+    >>> condition.evaluate({"rank:mine": "5"}.get)
+    True
+"""
+
+import logging
+import operator
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Variables an operation prompt may use, besides {operation:<operation_id>}
+TEMPLATE_VARIABLES = frozenset(
+    {
+        "brand:mine",
+        "brand:mine_all",
+        "brand:competitors",
+        "competitors:mentioned",
+        "intent:id",
+        "intent:prompt",
+        "intent:response",
+        "rank:mine",
+        "mentions:mine",
+        "mentions:competitors",
+        "model:provider",
+        "model:name",
+        "run:id",
+        "run:timestamp",
+    }
+)
+
+OPERATION_VARIABLE_PREFIX = "operation:"
+
+# Rendered value of {rank:mine} when my brand is not ranked
+RANK_NOT_FOUND = "not found"
+
+_PLACEHOLDER = re.compile(r"\{([a-z_]+:[^{}\s]+)\}")
+_COMPARISON = re.compile(r"(?P<left>.*?)\s*(?P<op>==|!=|>=|<=|>|<)\s*(?P<right>\d+)", re.DOTALL)
+_COMPARISONS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+}
+
+Resolver = Callable[[str], str | None]
+
+
+def is_template_variable(name: str) -> bool:
+    """Whether name (without braces) is a variable operation prompts can use."""
+    return name in TEMPLATE_VARIABLES or (
+        name.startswith(OPERATION_VARIABLE_PREFIX) and len(name) > len(OPERATION_VARIABLE_PREFIX)
+    )
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    Template parsed into literal segments and variable slots.
+
+    literals always has one more entry than slots; rendering interleaves
+    them: literals[0], value of slots[0], literals[1], ...
+
+    Attributes:
+        source: Template as written
+        literals: Text around the slots
+        slots: Variable names, without braces
+    """
+
+    source: str
+    literals: tuple[str, ...]
+    slots: tuple[str, ...]
+
+    def render(self, resolve: Resolver) -> str:
+        """
+        Render the template in one join.
+
+        Args:
+            resolve: Returns a slot's value, or None to keep the placeholder
+
+        Returns:
+            str: Rendered text
+        """
+        if not self.slots:
+            return self.source
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:], strict=True):
+            value = resolve(slot)
+            parts.append(f"{{{slot}}}" if value is None else value)
+            parts.append(literal)
+        return "".join(parts)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Parse a template into literal segments and variable slots.
+
+    Only supported variables become slots; any other text in braces stays
+    literal. Results are cached, so compiling the same text again is cheap.
+
+    Args:
+        template: Template with {variable} placeholders
+
+    Returns:
+        CompiledTemplate: Parsed template
+    """
+    literals: list[str] = []
+    slots: list[str] = []
+    literal_start = 0
+    for match in _PLACEHOLDER.finditer(template):
+        name = match.group(1)
+        if not is_template_variable(name):
+            continue
+        literals.append(template[literal_start : match.start()])
+        slots.append(name)
+        literal_start = match.end()
+    literals.append(template[literal_start:])
+    return CompiledTemplate(source=template, literals=tuple(literals), slots=tuple(slots))
+
+
+@dataclass(frozen=True)
+class NullCheck:
+    """Condition "<left> == null": true when left renders to "not found"."""
+
+    source: str
+    left: CompiledTemplate
+
+    def evaluate(self, resolve: Resolver) -> bool:
+        """Evaluate the condition with the given variable values."""
+        return self.left.render(resolve).strip() == RANK_NOT_FOUND
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """
+    Condition "<left> <op> <number>" with op one of ==, !=, >, <, >=, <=.
+
+    False when left renders to "not found" (nothing to compare).
+    """
+
+    source: str
+    left: CompiledTemplate
+    op: str
+    right: int
+
+    def evaluate(self, resolve: Resolver) -> bool:
+        """Evaluate the condition with the given variable values."""
+        left = self.left.render(resolve).strip()
+        if left == RANK_NOT_FOUND:
+            return False
+        if not left.isdigit():
+            return _not_understood(self.source, left)
+        return _COMPARISONS[self.op](int(left), self.right)
+
+
+@dataclass(frozen=True)
+class Contains:
+    """Condition '<haystack> contains "<needle>"' (quotes optional)."""
+
+    source: str
+    haystack: CompiledTemplate
+    needle: CompiledTemplate
+
+    def evaluate(self, resolve: Resolver) -> bool:
+        """Evaluate the condition with the given variable values."""
+        needle = self.needle.render(resolve).strip().strip('"').strip("'")
+        return needle in self.haystack.render(resolve).strip()
+
+
+@dataclass(frozen=True)
+class UnparsedCondition:
+    """Condition in no supported form; never skips the operation."""
+
+    source: str
+
+    def evaluate(self, resolve: Resolver) -> bool:
+        """Log that the condition is not understood and return True."""
+        return _not_understood(self.source, self.source)
+
+
+CompiledCondition = NullCheck | Comparison | Contains | UnparsedCondition
+
+
+def _not_understood(condition: str, rendered: str) -> bool:
+    logger.warning(f"Could not evaluate condition: {condition} (rendered: {rendered})")
+    return True
+
+
+@lru_cache(maxsize=256)
+def compile_condition(condition: str) -> CompiledCondition:
+    """
+    Parse an operation condition into a predicate.
+
+    Supported forms:
+        {rank:mine} == null
+        {rank:mine} > 3  (also ==, !=, <, >=, <=)
+        {competitors:mentioned} contains "HubSpot"
+
+    Args:
+        condition: Condition as written in the config
+
+    Returns:
+        CompiledCondition: Predicate with an evaluate(resolve) method;
+            UnparsedCondition if the condition has no supported form
+    """
+    if "== null" in condition:
+        return NullCheck(condition, compile_template(condition.split("== null", 1)[0]))
+
+    parts = condition.split(" contains ")
+    if len(parts) == 2:
+        return Contains(condition, compile_template(parts[0]), compile_template(parts[1]))
+
+    match = _COMPARISON.match(condition.strip())
+    if match:
+        return Comparison(
+            condition,
+            compile_template(match.group("left")),
+            match.group("op"),
+            int(match.group("right")),
+        )
+
+    return UnparsedCondition(condition)
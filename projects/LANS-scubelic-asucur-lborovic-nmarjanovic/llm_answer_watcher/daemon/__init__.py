@@ -0,0 +1,24 @@
+"""
+Long-running watcher daemon and run service.
+
+Runs one or more watcher configs on cron-style schedules (WatcherDaemon) or
+on HTTP request (RunService) inside a single process, keeping imports,
+configs, pricing/capability data, database setup, and HTTP connection pools
+warm between runs.
+"""
+
+from .cron import CronSchedule
+from .service import JobProgress, RunJob, RunService
+from .watcher import DaemonJob, RunRecord, WatcherDaemon, build_report_results, warm_up
+
+__all__ = [
+    "CronSchedule",
+    "DaemonJob",
+    "JobProgress",
+    "RunJob",
+    "RunRecord",
+    "RunService",
+    "WatcherDaemon",
+    "build_report_results",
+    "warm_up",
+]
@@ -0,0 +1,247 @@
+"""
+Cron-style schedule parsing for the watcher daemon.
+
+Supports the standard 5-field cron syntax (minute hour day-of-month month
+day-of-week) with the common field forms, plus a few shortcuts:
+
+Field forms:
+- "*"          every value
+- "*/15"       every 15th value
+- "5"          single value
+- "1-5"        inclusive range
+- "1-30/5"     stepped range
+- "1,15,30"    list of any of the above
+
+Shortcuts: @hourly, @daily (@midnight), @weekly, @monthly, and
+"@every <N>m" / "@every <N>h" for fixed intervals independent of the clock.
+
+Day-of-week uses 0-6 with 0 = Sunday (7 is also accepted as Sunday).
+Following cron semantics, when both day-of-month and day-of-week are
+restricted, a time matches if EITHER field matches.
+
+Example:
+    >>> from datetime import datetime, UTC
+    >>> schedule = CronSchedule.parse("*/15 * * * *")
+    >>> schedule.next_after(datetime(2025, 11, 1, 8, 7, tzinfo=UTC))
+    datetime.datetime(2025, 11, 1, 8, 15, tzinfo=datetime.timezone.utc)
+
+    >>> CronSchedule.parse("@every 90m").next_after(
+    ...     datetime(2025, 11, 1, 8, 0, tzinfo=UTC)
+    ... )
+    datetime.datetime(2025, 11, 1, 9, 30, tzinfo=datetime.timezone.utc)
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+SHORTCUTS = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# (name, min, max) for each of the 5 cron fields
+FIELD_SPECS = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day-of-month", 1, 31),
+    ("month", 1, 12),
+    ("day-of-week", 0, 7),
+)
+
+# Upper bound for the minute-by-minute search (a bit over 4 years covers Feb 29)
+MAX_SEARCH_MINUTES = 60 * 24 * 366 * 5
+
+_EVERY_PATTERN = re.compile(r"^@every\s+(\d+)\s*([mh])$")
+
+
+def _parse_field(expr: str, name: str, low: int, high: int) -> frozenset[int]:
+    """
+    Parse one cron field into the set of matching values.
+
+    Raises:
+        ValueError: If the field is malformed or out of range
+    """
+    values: set[int] = set()
+    for raw_part in expr.split(","):
+        part = raw_part.strip()
+        if not part:
+            raise ValueError(f"Empty entry in cron {name} field: '{expr}'")
+
+        step = 1
+        if "/" in part:
+            part, step_str = part.split("/", 1)
+            if not step_str.isdigit() or int(step_str) == 0:
+                raise ValueError(f"Invalid step in cron {name} field: '{expr}'")
+            step = int(step_str)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            if not (start_str.isdigit() and end_str.isdigit()):
+                raise ValueError(f"Invalid range in cron {name} field: '{expr}'")
+            start, end = int(start_str), int(end_str)
+        elif part.isdigit():
+            start = int(part)
+            # "5/10" means "from 5 to max, every 10"
+            end = high if step > 1 else start
+        else:
+            raise ValueError(f"Invalid value in cron {name} field: '{expr}'")
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron {name} field '{expr}' out of range ({low}-{high})")
+        values.update(range(start, end + 1, step))
+
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """
+    Parsed cron schedule.
+
+    Use CronSchedule.parse() to build instances.
+
+    Attributes:
+        expression: Original expression (for display)
+        minutes: Matching minutes (0-59)
+        hours: Matching hours (0-23)
+        days: Matching days of month (1-31)
+        months: Matching months (1-12)
+        weekdays: Matching days of week (0-6, 0 = Sunday)
+        dom_restricted: Whether the day-of-month field was not "*"
+        dow_restricted: Whether the day-of-week field was not "*"
+        interval: Fixed interval for "@every" schedules (None for cron fields)
+    """
+
+    expression: str
+    minutes: frozenset[int] = frozenset()
+    hours: frozenset[int] = frozenset()
+    days: frozenset[int] = frozenset()
+    months: frozenset[int] = frozenset()
+    weekdays: frozenset[int] = frozenset()
+    dom_restricted: bool = False
+    dow_restricted: bool = False
+    interval: timedelta | None = None
+
+    @classmethod
+    def parse(cls, expression: str) -> "CronSchedule":
+        """
+        Parse a cron expression or shortcut.
+
+        Args:
+            expression: 5-field cron expression, shortcut (e.g., "@hourly"),
+                or fixed interval (e.g., "@every 30m")
+
+        Returns:
+            CronSchedule: Parsed schedule
+
+        Raises:
+            ValueError: If the expression is invalid
+
+        Example:
+            >>> CronSchedule.parse("0 9 * * 1-5").expression
+            '0 9 * * 1-5'
+        """
+        text = expression.strip()
+        if not text:
+            raise ValueError("Cron expression cannot be empty")
+
+        every = _EVERY_PATTERN.match(text)
+        if every:
+            amount = int(every.group(1))
+            if amount <= 0:
+                raise ValueError(f"Interval must be positive: '{expression}'")
+            unit = every.group(2)
+            interval = timedelta(minutes=amount) if unit == "m" else timedelta(hours=amount)
+            return cls(expression=text, interval=interval)
+
+        fields_text = SHORTCUTS.get(text, text)
+        if fields_text.startswith("@"):
+            raise ValueError(
+                f"Unknown cron shortcut '{expression}'. "
+                f"Valid: {', '.join(SHORTCUTS)}, @every <N>m, @every <N>h"
+            )
+
+        fields = fields_text.split()
+        if len(fields) != 5:
+            raise ValueError(
+                f"Cron expression must have 5 fields "
+                f"(minute hour day month weekday), got {len(fields)}: '{expression}'"
+            )
+
+        parsed = [
+            _parse_field(expr, name, low, high)
+            for expr, (name, low, high) in zip(fields, FIELD_SPECS, strict=True)
+        ]
+        # Normalize Sunday: cron accepts both 0 and 7
+        weekdays = frozenset(0 if d == 7 else d for d in parsed[4])
+
+        return cls(
+            expression=text,
+            minutes=parsed[0],
+            hours=parsed[1],
+            days=parsed[2],
+            months=parsed[3],
+            weekdays=weekdays,
+            dom_restricted=fields[2] != "*",
+            dow_restricted=fields[4] != "*",
+        )
+
+    def matches(self, moment: datetime) -> bool:
+        """
+        Check whether a moment (minute resolution) matches the schedule.
+
+        Always False for "@every" interval schedules, which are not
+        anchored to the wall clock.
+        """
+        if self.interval is not None:
+            return False
+        if (
+            moment.minute not in self.minutes
+            or moment.hour not in self.hours
+            or moment.month not in self.months
+        ):
+            return False
+
+        # Python: Monday=0..Sunday=6 -> cron: Sunday=0..Saturday=6
+        cron_weekday = (moment.weekday() + 1) % 7
+        day_match = moment.day in self.days
+        weekday_match = cron_weekday in self.weekdays
+        if self.dom_restricted and self.dow_restricted:
+            return day_match or weekday_match
+        return day_match and weekday_match
+
+    def next_after(self, moment: datetime) -> datetime:
+        """
+        Compute the next fire time strictly after a moment.
+
+        Args:
+            moment: Reference time (timezone-aware recommended; the result
+                keeps the same tzinfo)
+
+        Returns:
+            datetime: Next matching time, truncated to the minute for cron
+                schedules or moment + interval for "@every" schedules
+
+        Raises:
+            ValueError: If no matching time exists (e.g., "0 0 31 2 *")
+        """
+        if self.interval is not None:
+            return moment + self.interval
+
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(MAX_SEARCH_MINUTES):
+            if self.matches(candidate):
+                return candidate
+            # Skip whole hours/days quickly when they cannot match
+            if candidate.hour not in self.hours or candidate.month not in self.months:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            else:
+                candidate += timedelta(minutes=1)
+
+        raise ValueError(f"Cron expression never fires: '{self.expression}'")
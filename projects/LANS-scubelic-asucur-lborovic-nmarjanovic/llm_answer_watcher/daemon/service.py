@@ -0,0 +1,573 @@
+"""
+HTTP service that runs watcher configs on request.
+
+runner.run_all() is the internal "POST /run" contract; RunService exposes it
+over HTTP (utils.http_server, no web framework) so one host can serve many
+on-demand monitoring jobs. Like the daemon, the process keeps imports,
+parsed configs, database setup, pricing data and HTTP connection pools
+warm, so a run request only pays for its LLM calls.
+
+Runs are queued in a bounded job queue and executed by a fixed number of
+workers; when the queue is full, POST /runs answers 429. Progress is
+streamed as server-sent events from the same start_query/complete_query
+hooks that drive the CLI progress bar.
+
+Endpoints:
+    GET  /healthz                               Liveness probe
+    GET  /status                                Served configs, queue and job counters
+    POST /runs {"config": "<name>"}             Queue a run of a served config (202)
+    GET  /runs                                  Recent jobs
+    GET  /runs/<job_id>                         Job status and run_all() summary
+    GET  /runs/<job_id>/events                  Progress as server-sent events
+    GET  /configs/<name>/runs?limit=N           Runs stored in the config's database
+    GET  /configs/<name>/runs/<run_id>          Stored run summary
+    GET  /configs/<name>/runs/<run_id>/report   The run's HTML report
+
+Only configs given at startup can be run, by file name; requests never name
+paths. Config files are reloaded when they change, as in the daemon.
+
+Example:
+    >>> service = RunService([Path("brand.yaml")], port=8780)
+    >>> asyncio.run(service.serve_forever())  # until request_stop()
+
+    $ curl -X POST http://127.0.0.1:8780/runs -d '{"config": "brand.yaml"}'
+    {"job_id": "3f9c...", "status": "queued", ...}
+    $ curl -N http://127.0.0.1:8780/runs/3f9c.../events
+
+Security:
+    Binds to 127.0.0.1 by default and has no authentication. Do not expose
+    it to untrusted networks.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from llm_answer_watcher.config.schema import RuntimeConfig
+from llm_answer_watcher.daemon.watcher import DaemonJob, build_report_results, warm_up
+from llm_answer_watcher.llm_runner.http_pool import close_pooled_clients
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.report.generator import write_report
+from llm_answer_watcher.storage.db import get_run_summary, list_runs
+from llm_answer_watcher.storage.layout import get_run_directory
+from llm_answer_watcher.utils.http_server import HTTPRequest, HTTPResponse, LocalHTTPServer
+from llm_answer_watcher.utils.time import run_id_from_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_PORT = 8780
+DEFAULT_MAX_CONCURRENT_RUNS = 2
+DEFAULT_QUEUE_SIZE = 16
+
+# Finished jobs kept for GET /runs (older ones are forgotten; their runs stay
+# in the database)
+MAX_FINISHED_JOBS = 200
+
+# Upper bound for ?limit= on stored run listings
+MAX_LISTED_RUNS = 100
+
+# Seconds a client is told to wait when the queue is full
+RETRY_AFTER_SECONDS = 5
+
+# Job statuses
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+@dataclass
+class RunJob:
+    """
+    One requested run and its progress events.
+
+    Events are kept for the job's lifetime, so a client that connects to
+    /events late still receives the full history before live events.
+
+    Attributes:
+        job_id: Random job identifier
+        config_name: File name of the served config
+        submitted_at: ISO 8601 UTC time the job was queued
+        status: JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED or JOB_FAILED
+        started_at: ISO 8601 UTC start time
+        finished_at: ISO 8601 UTC finish time
+        results: Summary dict returned by run_all() once succeeded
+        error: Error message once failed
+        events: Published events ({"event": name, "data": dict})
+    """
+
+    job_id: str
+    config_name: str
+    submitted_at: str
+    status: str = JOB_QUEUED
+    started_at: str | None = None
+    finished_at: str | None = None
+    results: dict | None = None
+    error: str | None = None
+    events: list[dict] = field(default_factory=list)
+    _subscribers: set[asyncio.Queue] = field(default_factory=set, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (successfully or not)."""
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    def publish(self, event: str, **data) -> None:
+        """Record an event and pass it to every subscriber."""
+        entry = {"event": event, "data": data}
+        self.events.append(entry)
+        for queue in self._subscribers:
+            queue.put_nowait(entry)
+
+    def subscribe(self) -> tuple[list[dict], asyncio.Queue]:
+        """
+        Subscribe to future events.
+
+        Returns:
+            tuple: (events so far, queue receiving every later event)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        return list(self.events), queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop passing events to a subscriber queue."""
+        self._subscribers.discard(queue)
+
+    def to_status(self, include_results: bool = True) -> dict:
+        """Build the JSON-serializable status of the job."""
+        status = {
+            "job_id": self.job_id,
+            "config": self.config_name,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+            "links": {"self": f"/runs/{self.job_id}", "events": f"/runs/{self.job_id}/events"},
+        }
+        if include_results:
+            status["results"] = self.results
+        return status
+
+
+class JobProgress:
+    """
+    progress_callback for run_all() that publishes query events to a job.
+
+    Attributes:
+        job: Job receiving the events
+        completed: Queries finished so far
+    """
+
+    def __init__(self, job: RunJob):
+        self.job = job
+        self.completed = 0
+
+    async def start_query(self, intent_id: str, provider: str, model: str) -> None:
+        """Publish a query_started event."""
+        self.job.publish("query_started", intent_id=intent_id, provider=provider, model_name=model)
+
+    async def complete_query(self, query_key: str, success: bool = True) -> None:
+        """Publish a query_completed event."""
+        self.completed += 1
+        self.job.publish(
+            "query_completed", query=query_key, success=success, completed=self.completed
+        )
+
+
+def _sse(entry: dict) -> bytes:
+    """Encode an event as a server-sent event."""
+    return f"event: {entry['event']}\ndata: {json.dumps(entry['data'])}\n\n".encode()
+
+
+class RunService:
+    """
+    HTTP service running served configs on request through a bounded queue.
+
+    Attributes:
+        configs: Served configs by file name (DaemonJobs without schedules)
+        host: Interface to bind
+        port: Port to bind (0 picks a free port; read back after start())
+        max_concurrent_runs: Runs executed at the same time
+        queue_size: Runs that may wait in the queue
+        generate_reports: Whether to write the HTML report after each run
+        jobs: Queued, running and recently finished jobs by job_id
+    """
+
+    def __init__(
+        self,
+        config_paths: list[Path],
+        *,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_SERVICE_PORT,
+        max_concurrent_runs: int = DEFAULT_MAX_CONCURRENT_RUNS,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        generate_reports: bool = True,
+    ):
+        if not config_paths:
+            raise ValueError("RunService requires at least one config")
+        if max_concurrent_runs < 1:
+            raise ValueError(f"max_concurrent_runs must be at least 1, got {max_concurrent_runs}")
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+
+        self.configs: dict[str, DaemonJob] = {}
+        for config_path in config_paths:
+            if config_path.name in self.configs:
+                raise ValueError(f"Served configs need distinct file names: {config_path.name}")
+            self.configs[config_path.name] = DaemonJob(config_path, schedule=None)
+
+        self.host = host
+        self.port = port
+        self.max_concurrent_runs = max_concurrent_runs
+        self.queue_size = queue_size
+        self.generate_reports = generate_reports
+        self.jobs: dict[str, RunJob] = {}
+
+        self.started_at: datetime | None = None
+        self.server: LocalHTTPServer | None = None
+        self._queue: asyncio.Queue[RunJob] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task] = []
+        self._accepting = False
+        self._stop_event: asyncio.Event | None = None
+        self._initialized_dbs: set[str] = set()
+        self._warmed_models: set[tuple[str, str]] = set()
+        self._run_id_counts: dict[tuple[str, str], int] = {}
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running service."""
+        return f"http://{self.host}:{self.port}"
+
+    def status(self) -> dict:
+        """Build the JSON-serializable service status."""
+        counts = dict.fromkeys((JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JOB_FAILED), 0)
+        for job in self.jobs.values():
+            counts[job.status] += 1
+        return {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "max_concurrent_runs": self.max_concurrent_runs,
+            "queue_size": self.queue_size,
+            "queued": self._queue.qsize(),
+            "jobs": counts,
+            "configs": [
+                {
+                    "name": name,
+                    "config_path": str(entry.config_path),
+                    "config_loaded": entry.runtime_config is not None,
+                    "last_reload_error": entry.last_reload_error,
+                    "run_count": entry.run_count,
+                }
+                for name, entry in self.configs.items()
+            ],
+        }
+
+    def submit(self, config_name: str) -> RunJob:
+        """
+        Queue a run of a served config.
+
+        Args:
+            config_name: File name of the served config
+
+        Returns:
+            RunJob: The queued job
+
+        Raises:
+            KeyError: If no served config has that name
+            asyncio.QueueFull: If the queue is full
+            RuntimeError: If the service is not accepting runs
+        """
+        if not self._accepting:
+            raise RuntimeError("Service is not accepting runs")
+        if config_name not in self.configs:
+            raise KeyError(config_name)
+
+        job = RunJob(
+            job_id=uuid.uuid4().hex,
+            config_name=config_name,
+            submitted_at=utc_now().isoformat(),
+        )
+        self._queue.put_nowait(job)
+        self.jobs[job.job_id] = job
+        job.publish("queued", position=self._queue.qsize())
+        self._forget_old_jobs()
+        logger.info(f"[{config_name}] Queued run job {job.job_id}")
+        return job
+
+    def _forget_old_jobs(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.done]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def _next_run_id(self, config: RuntimeConfig) -> str:
+        """
+        Run ID for a new run of a config.
+
+        Runs started in the same second that share a database or output
+        directory get "-2", "-3", ... suffixes.
+        """
+        base = run_id_from_timestamp()
+        keys = [
+            f"db:{config.run_settings.sqlite_db_path}",
+            f"dir:{config.run_settings.output_dir}",
+        ]
+        self._run_id_counts = {
+            key: count for key, count in self._run_id_counts.items() if key[1] == base
+        }
+        count = 1 + max(self._run_id_counts.get((key, base), 0) for key in keys)
+        for key in keys:
+            self._run_id_counts[(key, base)] = count
+        return base if count == 1 else f"{base}-{count}"
+
+    async def run_job(self, job: RunJob) -> None:
+        """
+        Execute a job's run and publish its progress.
+
+        Never raises: failures are recorded on the job.
+        """
+        entry = self.configs[job.config_name]
+        job.status = JOB_RUNNING
+        job.started_at = utc_now().isoformat()
+        try:
+            entry.reload_if_changed()
+            config = entry.runtime_config
+            if config is None:
+                raise RuntimeError(f"No valid config loaded: {entry.last_reload_error}")
+            warm_up(config, self._initialized_dbs, self._warmed_models)
+
+            total_queries = len(config.intents) * (
+                len(config.models) + len(config.runner_configs or [])
+            )
+            job.publish("started", total_queries=total_queries)
+            results = await run_all(
+                config,
+                progress_callback=JobProgress(job),
+                config_filename=job.config_name,
+                run_id=self._next_run_id(config),
+            )
+            if self.generate_reports:
+                write_report(results["output_dir"], config, build_report_results(config, results))
+
+            job.results = results
+            job.status = JOB_SUCCEEDED
+            job.publish(
+                JOB_SUCCEEDED,
+                run_id=results["run_id"],
+                status=results["status"],
+                success_count=results["success_count"],
+                total_queries=results["total_queries"],
+                total_cost_usd=results["total_cost_usd"],
+            )
+        except Exception as e:
+            logger.error(f"[{job.config_name}] Run job {job.job_id} failed: {e}", exc_info=True)
+            job.error = str(e)
+            job.status = JOB_FAILED
+            job.publish(JOB_FAILED, error=str(e))
+        finally:
+            entry.run_count += 1
+            job.finished_at = utc_now().isoformat()
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self.run_job(job)
+            finally:
+                self._queue.task_done()
+
+    async def start(self) -> None:
+        """Load the configs, start the workers and the HTTP server."""
+        self.started_at = utc_now()
+        for name, entry in self.configs.items():
+            entry.reload_if_changed()
+            if entry.runtime_config is not None:
+                warm_up(entry.runtime_config, self._initialized_dbs, self._warmed_models)
+            logger.info(f"Serving config {name}")
+
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrent_runs)
+        ]
+        self.server = LocalHTTPServer(self.handle, host=self.host, port=self.port)
+        await self.server.start()
+        self.port = self.server.port
+        self._accepting = True
+
+    async def stop(self) -> None:
+        """
+        Stop accepting runs, let running jobs finish and shut down.
+
+        Jobs still waiting in the queue are marked failed.
+        """
+        self._accepting = False
+        while not self._queue.empty():
+            job = self._queue.get_nowait()
+            job.status = JOB_FAILED
+            job.error = "Service stopped before the run started"
+            job.finished_at = utc_now().isoformat()
+            job.publish(JOB_FAILED, error=job.error)
+            self._queue.task_done()
+        await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        for worker in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers = []
+        if self.server is not None:
+            await self.server.stop()
+            self.server = None
+        await close_pooled_clients()
+
+    def request_stop(self) -> None:
+        """Ask serve_forever() to finish running jobs and return."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def serve_forever(self) -> None:
+        """Serve until request_stop() is called."""
+        self._stop_event = asyncio.Event()
+        await self.start()
+        try:
+            await self._stop_event.wait()
+        finally:
+            await self.stop()
+            logger.info("Run service stopped")
+
+    async def handle(self, request: HTTPRequest) -> HTTPResponse:
+        """Route a request to its endpoint."""
+        parts = [part for part in request.path.split("/") if part]
+
+        if parts == ["runs"] and request.method == "POST":
+            return self._post_run(request)
+        if request.method != "GET":
+            return HTTPResponse.json({"error": "method not allowed"}, status=405)
+        if len(parts) in (2, 3) and parts[0] == "runs":
+            return self._job_route(parts)
+        if 3 <= len(parts) <= 5 and parts[0] == "configs" and parts[2] == "runs":
+            return self._stored_runs(request, parts)
+        return self._service_route(parts)
+
+    def _service_route(self, parts: list[str]) -> HTTPResponse:
+        if parts == ["healthz"]:
+            return HTTPResponse.json({"status": "ok"})
+        if parts == ["status"]:
+            return HTTPResponse.json(self.status())
+        if parts == ["runs"]:
+            return HTTPResponse.json(
+                {"jobs": [job.to_status(include_results=False) for job in self.jobs.values()]}
+            )
+        return HTTPResponse.json({"error": "not found"}, status=404)
+
+    def _job_route(self, parts: list[str]) -> HTTPResponse:
+        job = self.jobs.get(parts[1])
+        if job is None:
+            return HTTPResponse.json({"error": "job not found"}, status=404)
+        if len(parts) == 2:
+            return HTTPResponse.json(job.to_status())
+        if parts[2] == "events":
+            return HTTPResponse(
+                headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+                stream=self._event_stream(job),
+            )
+        return HTTPResponse.json({"error": "not found"}, status=404)
+
+    def _post_run(self, request: HTTPRequest) -> HTTPResponse:
+        try:
+            body = request.json()
+        except ValueError:
+            return HTTPResponse.json({"error": "request body must be JSON"}, status=400)
+        config_name = body.get("config") if isinstance(body, dict) else None
+        if not isinstance(config_name, str):
+            return HTTPResponse.json(
+                {"error": 'request body must be {"config": "<config file name>"}'}, status=400
+            )
+
+        try:
+            job = self.submit(config_name)
+        except KeyError:
+            return HTTPResponse.json(
+                {"error": f"unknown config: {config_name}", "configs": list(self.configs)},
+                status=404,
+            )
+        except asyncio.QueueFull:
+            return HTTPResponse.json(
+                {"error": "run queue is full"},
+                status=429,
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+        except RuntimeError as e:
+            return HTTPResponse.json({"error": str(e)}, status=503)
+        return HTTPResponse.json(job.to_status(include_results=False), status=202)
+
+    async def _event_stream(self, job: RunJob) -> AsyncIterator[bytes]:
+        backlog, queue = job.subscribe()
+        try:
+            for entry in backlog:
+                yield _sse(entry)
+                if entry["event"] in (JOB_SUCCEEDED, JOB_FAILED):
+                    return
+            while True:
+                entry = await queue.get()
+                yield _sse(entry)
+                if entry["event"] in (JOB_SUCCEEDED, JOB_FAILED):
+                    return
+        finally:
+            job.unsubscribe(queue)
+
+    def _stored_runs(self, request: HTTPRequest, parts: list[str]) -> HTTPResponse:
+        """Serve run listings, summaries and reports from a config's database."""
+        entry = self.configs.get(parts[1])
+        if entry is None:
+            return HTTPResponse.json({"error": "unknown config"}, status=404)
+        entry.reload_if_changed()
+        config = entry.runtime_config
+        if config is None:
+            return HTTPResponse.json(
+                {"error": f"config not loaded: {entry.last_reload_error}"}, status=503
+            )
+
+        try:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                if len(parts) == 3:
+                    return self._list_stored_runs(request, conn)
+                summary = get_run_summary(conn, parts[3])
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read runs of {parts[1]}: {e}", exc_info=True)
+            return HTTPResponse.json({"error": "database error"}, status=500)
+        return self._stored_run(request, parts, config.run_settings.output_dir, summary)
+
+    def _list_stored_runs(self, request: HTTPRequest, conn: sqlite3.Connection) -> HTTPResponse:
+        try:
+            limit = int(request.query.get("limit", "20"))
+        except ValueError:
+            return HTTPResponse.json({"error": "limit must be an integer"}, status=400)
+        limit = min(max(limit, 1), MAX_LISTED_RUNS)
+        return HTTPResponse.json({"runs": list_runs(conn, limit)})
+
+    def _stored_run(
+        self, request: HTTPRequest, parts: list[str], output_dir: str, summary: dict | None
+    ) -> HTTPResponse:
+        if summary is None:
+            return HTTPResponse.json({"error": "run not found"}, status=404)
+        if len(parts) == 4:
+            return HTTPResponse.json({**summary, "report": f"{request.path.rstrip('/')}/report"})
+        if parts[4] != "report":
+            return HTTPResponse.json({"error": "not found"}, status=404)
+
+        # run_id comes from the database, so the path cannot leave output_dir
+        report_path = Path(get_run_directory(output_dir, summary["run_id"])) / "report.html"
+        if not report_path.is_file():
+            return HTTPResponse.json({"error": "report not found"}, status=404)
+        return HTTPResponse(
+            body=report_path.read_bytes(),
+            headers={"Content-Type": "text/html; charset=utf-8"},
+        )
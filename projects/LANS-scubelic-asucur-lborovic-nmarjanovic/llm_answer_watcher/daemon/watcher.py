@@ -0,0 +1,459 @@
+"""
+Long-running watcher daemon with scheduled runs.
+
+The daemon replaces "cron spawns the CLI every N minutes" with a single
+process that stays up and runs each configured watcher on its own
+cron-style schedule. Everything that a one-shot CLI run pays for on every
+invocation is paid once and kept warm:
+
+- Interpreter startup and module imports
+- Config parsing (re-parsed only when the file's mtime changes)
+- Database schema initialization (once per database path)
+- Model capability registry and pricing data
+- HTTP keep-alive connections to providers (shared pool per event loop)
+
+A small JSON status endpoint (GET /status, GET /healthz) reports per-job
+schedule, last-run wall/CPU timings, costs, and reload errors.
+
+Hot reload:
+    Config files are checked for changes before every scheduling tick. A
+    changed file is re-parsed; if parsing fails the previous config is kept
+    and the error is surfaced in /status, so a typo never stops monitoring.
+
+Example:
+    >>> from llm_answer_watcher.daemon import CronSchedule, DaemonJob, WatcherDaemon
+    >>> job = DaemonJob(Path("watcher.config.yaml"), CronSchedule.parse("0 * * * *"))
+    >>> daemon = WatcherDaemon([job], status_port=8765)
+    >>> asyncio.run(daemon.serve_forever())  # until SIGINT/SIGTERM
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from llm_answer_watcher.config.capabilities import get_model_capabilities
+from llm_answer_watcher.config.loader import load_config
+from llm_answer_watcher.config.schema import RuntimeConfig
+from llm_answer_watcher.daemon.cron import CronSchedule
+from llm_answer_watcher.llm_runner.http_pool import close_pooled_clients
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.report.generator import write_report
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.utils.http_server import HTTPRequest, HTTPResponse, LocalHTTPServer
+from llm_answer_watcher.utils.pricing import PricingNotAvailableError, get_pricing
+from llm_answer_watcher.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Default port for the local status endpoint
+DEFAULT_STATUS_PORT = 8765
+
+# Maximum time the scheduler sleeps between checks (also bounds how quickly
+# config changes are picked up)
+DEFAULT_POLL_INTERVAL_SECONDS = 5.0
+
+
+@dataclass
+class RunRecord:
+    """
+    Timing and outcome of one scheduled run.
+
+    Attributes:
+        started_at: ISO 8601 UTC start time
+        finished_at: ISO 8601 UTC finish time
+        wall_seconds: Wall-clock duration of the run
+        cpu_seconds: Process CPU time consumed during the run
+        run_id: Run ID from run_all (None if the run failed before starting)
+        success_count: Number of successful queries
+        total_queries: Number of queries attempted
+        total_cost_usd: Total run cost in USD
+        error: Error message if the run raised (None on success)
+    """
+
+    started_at: str
+    finished_at: str
+    wall_seconds: float
+    cpu_seconds: float
+    run_id: str | None = None
+    success_count: int = 0
+    total_queries: int = 0
+    total_cost_usd: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class DaemonJob:
+    """
+    One config file scheduled by the daemon (or served by RunService).
+
+    Attributes:
+        config_path: Path to the watcher YAML config
+        schedule: When to run (None for configs only run on request)
+        runtime_config: Currently loaded config (None until first load)
+        config_mtime_ns: mtime of the file when it was last loaded
+        next_run_at: Next scheduled run time (UTC)
+        last_run: Record of the most recent run
+        run_count: Number of runs completed since the daemon started
+        reload_count: Number of successful config (re)loads
+        last_reload_error: Error from the most recent failed reload, if any
+        running: Whether a run of this job is currently in progress
+    """
+
+    config_path: Path
+    schedule: CronSchedule | None
+    runtime_config: RuntimeConfig | None = None
+    config_mtime_ns: int | None = None
+    next_run_at: datetime | None = None
+    last_run: RunRecord | None = None
+    run_count: int = 0
+    reload_count: int = 0
+    last_reload_error: str | None = None
+    running: bool = False
+
+    @property
+    def name(self) -> str:
+        """Job name used in logs and status output (config file name)."""
+        return self.config_path.name
+
+    def reload_if_changed(self) -> bool:
+        """
+        Load the config if it is new or its file changed since last load.
+
+        On failure the previously loaded config stays active and the error
+        is kept in last_reload_error.
+
+        Returns:
+            bool: True if a new config was loaded
+        """
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except OSError as e:
+            self.last_reload_error = f"Cannot stat config: {e}"
+            logger.warning(f"[{self.name}] {self.last_reload_error}")
+            return False
+
+        if self.runtime_config is not None and mtime_ns == self.config_mtime_ns:
+            return False
+
+        # Remember the mtime even on failure so a broken file is not
+        # re-parsed (and re-logged) on every tick until it changes again
+        self.config_mtime_ns = mtime_ns
+        try:
+            self.runtime_config = load_config(self.config_path)
+        except Exception as e:
+            self.last_reload_error = str(e)
+            logger.error(f"[{self.name}] Failed to load config, keeping previous version: {e}")
+            return False
+
+        self.reload_count += 1
+        self.last_reload_error = None
+        logger.info(
+            f"[{self.name}] Loaded config: {len(self.runtime_config.intents)} intents, "
+            f"{len(self.runtime_config.models)} models"
+        )
+        return True
+
+    def to_status(self) -> dict:
+        """Build the JSON-serializable status entry for this job."""
+        return {
+            "config_path": str(self.config_path),
+            "schedule": self.schedule.expression if self.schedule else None,
+            "config_loaded": self.runtime_config is not None,
+            "next_run_at": self.next_run_at.isoformat() if self.next_run_at else None,
+            "running": self.running,
+            "run_count": self.run_count,
+            "reload_count": self.reload_count,
+            "last_reload_error": self.last_reload_error,
+            "last_run": asdict(self.last_run) if self.last_run else None,
+        }
+
+
+def build_report_results(runtime_config: RuntimeConfig, results: dict) -> list[dict]:
+    """
+    Build the per-query result list expected by write_report().
+
+    One entry per intent x model, marked as error if the query is in
+    run_all's failed_queries and as skipped if it is in skipped_queries
+    (live budget enforcement skipped it). Used by the `run`, `run-many`, `daemon` and `serve` commands.
+
+    Args:
+        runtime_config: Config the run was executed with
+        results: Summary dict returned by run_all()
+
+    Returns:
+        list[dict]: Result dicts with intent_id, provider, model_name,
+            status, cost_usd and timestamp_utc
+    """
+    # "errors" is capped for display; failed_queries lists every failure
+    failed = {tuple(key) for key in results.get("failed_queries", [])} | {
+        (err["intent_id"], err["model_provider"], err["model_name"])
+        for err in results.get("errors", [])
+    }
+    # Likewise the budget account lists few skips; skipped_queries lists all
+    skipped = {tuple(key) for key in results.get("skipped_queries", [])} | {
+        (skip["intent_id"], skip["model_provider"], skip["model_name"])
+        for skip in results.get("budget", {}).get("skipped", [])
+        if skip["stage"] == "query"
+    }
+    per_query_cost = (
+        results["total_cost_usd"] / results["success_count"]
+        if results["success_count"] > 0
+        else 0.0
+    )
+
+    result_list = []
+    for intent in runtime_config.intents:
+        for model in runtime_config.models:
+            key = (intent.id, model.provider, model.model_name)
+            status = "skipped" if key in skipped else "error" if key in failed else "success"
+            result_list.append(
+                {
+                    "intent_id": intent.id,
+                    "provider": model.provider,
+                    "model_name": model.model_name,
+                    "status": status,
+                    "cost_usd": per_query_cost if status == "success" else 0.0,
+                    "timestamp_utc": results["timestamp_utc"],
+                }
+            )
+    return result_list
+
+
+def warm_up(
+    config: RuntimeConfig,
+    initialized_dbs: set[str],
+    warmed_models: set[tuple[str, str]],
+) -> None:
+    """
+    Initialize a config's database and pre-load its model data, once each.
+
+    Args:
+        config: Config about to run
+        initialized_dbs: Database paths already initialized (updated in place)
+        warmed_models: (provider, model) pairs already warmed (updated in place)
+    """
+    db_path = config.run_settings.sqlite_db_path
+    if db_path not in initialized_dbs:
+        init_db_if_needed(db_path)
+        initialized_dbs.add(db_path)
+
+    get_model_capabilities()
+    for model in [*config.models, *config.operation_models]:
+        key = (model.provider, model.model_name)
+        if key in warmed_models:
+            continue
+        with contextlib.suppress(PricingNotAvailableError):
+            get_pricing(model.provider, model.model_name)
+        warmed_models.add(key)
+
+
+class WatcherDaemon:
+    """
+    Scheduler that runs DaemonJobs on their schedules in one process.
+
+    Runs of the same job never overlap: if a run is still in progress when
+    the next fire time arrives, that fire time is skipped. Different jobs
+    run concurrently.
+
+    Attributes:
+        jobs: Scheduled jobs
+        status_host: Interface for the status endpoint
+        status_port: Port for the status endpoint (None disables it, 0 picks
+            a free port)
+        generate_reports: Whether to write the HTML report after each run
+        poll_interval: Maximum seconds between scheduler checks
+    """
+
+    def __init__(
+        self,
+        jobs: list[DaemonJob],
+        status_host: str = "127.0.0.1",
+        status_port: int | None = DEFAULT_STATUS_PORT,
+        generate_reports: bool = True,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    ):
+        if not jobs:
+            raise ValueError("WatcherDaemon requires at least one job")
+        if poll_interval <= 0:
+            raise ValueError(f"poll_interval must be positive, got {poll_interval}")
+        unscheduled = [job.name for job in jobs if job.schedule is None]
+        if unscheduled:
+            raise ValueError(f"WatcherDaemon jobs need a schedule: {', '.join(unscheduled)}")
+
+        self.jobs = jobs
+        self.status_host = status_host
+        self.status_port = status_port
+        self.generate_reports = generate_reports
+        self.poll_interval = poll_interval
+
+        self.started_at: datetime | None = None
+        self.status_server: LocalHTTPServer | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._initialized_dbs: set[str] = set()
+        self._warmed_models: set[tuple[str, str]] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    def request_stop(self) -> None:
+        """Ask serve_forever() to finish in-flight runs and return."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def status(self) -> dict:
+        """Build the JSON-serializable daemon status."""
+        return {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "uptime_seconds": (
+                round((utc_now() - self.started_at).total_seconds(), 3) if self.started_at else 0.0
+            ),
+            "jobs": [job.to_status() for job in self.jobs],
+        }
+
+    def prepare_job(self, job: DaemonJob) -> None:
+        """
+        Reload the job's config if needed and warm everything it uses.
+
+        Initializes each database path once and pre-loads capability and
+        pricing data for newly seen models, so scheduled runs start hot.
+        """
+        job.reload_if_changed()
+        if job.runtime_config is not None:
+            warm_up(job.runtime_config, self._initialized_dbs, self._warmed_models)
+
+    async def run_job(self, job: DaemonJob) -> RunRecord:
+        """
+        Execute one run of a job and record its timings.
+
+        Never raises: failures are captured in the returned RunRecord (also
+        stored as job.last_run) so one bad run does not stop the daemon.
+
+        Args:
+            job: Job to run (must have a loaded config)
+
+        Returns:
+            RunRecord: Outcome and wall/CPU timings of the run
+        """
+        job.running = True
+        started_at = utc_now()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        record_kwargs: dict = {}
+
+        try:
+            self.prepare_job(job)
+            config = job.runtime_config
+            if config is None:
+                raise RuntimeError(f"No valid config loaded: {job.last_reload_error}")
+
+            results = await run_all(config, config_filename=job.config_path.name)
+            if self.generate_reports:
+                write_report(results["output_dir"], config, build_report_results(config, results))
+
+            record_kwargs = {
+                "run_id": results["run_id"],
+                "success_count": results["success_count"],
+                "total_queries": results["total_queries"],
+                "total_cost_usd": results["total_cost_usd"],
+            }
+        except Exception as e:
+            logger.error(f"[{job.name}] Scheduled run failed: {e}", exc_info=True)
+            record_kwargs = {"error": str(e)}
+        finally:
+            job.running = False
+
+        record = RunRecord(
+            started_at=started_at.isoformat(),
+            finished_at=utc_now().isoformat(),
+            wall_seconds=round(time.perf_counter() - wall_start, 6),
+            cpu_seconds=round(time.process_time() - cpu_start, 6),
+            **record_kwargs,
+        )
+        job.last_run = record
+        job.run_count += 1
+        logger.info(
+            f"[{job.name}] Run finished in {record.wall_seconds:.2f}s wall, "
+            f"{record.cpu_seconds:.2f}s CPU "
+            f"({record.success_count}/{record.total_queries} successful)"
+        )
+        return record
+
+    async def serve_forever(self) -> None:
+        """
+        Run the scheduler (and status endpoint) until request_stop() is called.
+
+        In-flight runs are awaited before returning, and the shared HTTP
+        pool is closed on the way out.
+        """
+        self._stop_event = asyncio.Event()
+        self.started_at = utc_now()
+
+        for job in self.jobs:
+            self.prepare_job(job)
+            job.next_run_at = job.schedule.next_after(self.started_at)
+            logger.info(
+                f"[{job.name}] Scheduled '{job.schedule.expression}', "
+                f"next run at {job.next_run_at.isoformat()}"
+            )
+
+        if self.status_port is not None:
+            self.status_server = LocalHTTPServer(
+                self._handle_status, host=self.status_host, port=self.status_port
+            )
+            await self.status_server.start()
+
+        try:
+            while not self._stop_event.is_set():
+                self._tick()
+                await self._sleep_until_next_due()
+        finally:
+            if self._tasks:
+                logger.info(f"Waiting for {len(self._tasks)} in-flight run(s) to finish")
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+            if self.status_server is not None:
+                await self.status_server.stop()
+            await close_pooled_clients()
+            logger.info("Watcher daemon stopped")
+
+    def _tick(self) -> None:
+        """Hot-reload configs and start every job that is due."""
+        now = utc_now()
+        for job in self.jobs:
+            job.reload_if_changed()
+            if job.next_run_at is None or now < job.next_run_at:
+                continue
+
+            job.next_run_at = job.schedule.next_after(now)
+            if job.running:
+                logger.warning(
+                    f"[{job.name}] Previous run still in progress, skipping this fire time"
+                )
+                continue
+
+            task = asyncio.create_task(self.run_job(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _sleep_until_next_due(self) -> None:
+        """Sleep until the earliest next run (capped by poll_interval) or stop."""
+        now = utc_now()
+        delays = [
+            (job.next_run_at - now).total_seconds()
+            for job in self.jobs
+            if job.next_run_at is not None
+        ]
+        delay = min([self.poll_interval, *delays])
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stop_event.wait(), timeout=max(delay, 0.0))
+
+    async def _handle_status(self, request: HTTPRequest) -> HTTPResponse:
+        """Serve GET /status and GET /healthz."""
+        if request.method != "GET":
+            return HTTPResponse.json({"error": "method not allowed"}, status=405)
+        if request.path == "/healthz":
+            return HTTPResponse.json({"status": "ok"})
+        if request.path == "/status":
+            return HTTPResponse.json(self.status())
+        return HTTPResponse.json({"error": "not found"}, status=404)
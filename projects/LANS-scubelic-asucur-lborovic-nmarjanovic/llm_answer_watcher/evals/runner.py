@@ -3,9 +3,21 @@ Evaluation runner for the LLM Answer Watcher evaluation framework.
 
 This module provides the main orchestrator function `run_eval_suite()` that
 loads test cases, executes the evaluation pipeline, and returns results.
+
+Performance:
+    - Parsed fixtures are cached by file content hash (in memory, and
+      optionally on disk as JSON) so unchanged fixtures skip YAML parsing
+    - Large suites are evaluated in a process pool; test cases are grouped
+      by brand set so each worker compiles each brand matcher once
 """
 
+import hashlib
+import json
+import logging
+import math
+import os
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -21,6 +33,21 @@ from .metrics import (
 )
 from .schema import EvalResult, EvalTestCase
 
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when available (several times faster than pure Python)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed fixtures keyed by SHA-256 of the fixtures file content
+_FIXTURE_CACHE: dict[str, list[EvalTestCase]] = {}
+
+# Suites smaller than this run serially (process startup outweighs the gain)
+PARALLEL_MIN_TEST_CASES = 64
+
+# Batches per worker: small enough to balance load, large enough that each
+# batch reuses its compiled brand matchers
+BATCHES_PER_WORKER = 4
+
 # Evaluation quality thresholds
 # These define the minimum acceptable quality levels for different metrics
 # If evaluation results fall below these thresholds, the evaluation is considered failed
@@ -55,12 +82,21 @@ FALSE_IS_MINE_VIOLATIONS_THRESHOLD = (
 MINIMUM_PASS_RATE = 0.75  # 75% - At least 75% of test cases must pass overall
 
 
-def load_test_cases(fixtures_path: str | Path) -> list[EvalTestCase]:
+def load_test_cases(
+    fixtures_path: str | Path,
+    cache_dir: str | Path | None = None,
+) -> list[EvalTestCase]:
     """
     Load test cases from a YAML fixtures file.
 
+    Parsed test cases are cached by the SHA-256 of the file content, so
+    repeated loads of an unchanged file skip YAML parsing and validation.
+    With cache_dir set, the validated test cases are also written there as
+    JSON (``<sha256>.json``) and reused across processes, e.g. CI runs.
+
     Args:
         fixtures_path: Path to the YAML file containing test cases
+        cache_dir: Optional directory for the on-disk fixture cache
 
     Returns:
         List of EvalTestCase objects loaded from the file
@@ -75,8 +111,28 @@ def load_test_cases(fixtures_path: str | Path) -> list[EvalTestCase]:
     if not fixtures_path.exists():
         raise FileNotFoundError(f"Test fixtures file not found: {fixtures_path}")
 
-    with open(fixtures_path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    raw = fixtures_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    cached = _FIXTURE_CACHE.get(digest)
+    if cached is not None:
+        return list(cached)
+
+    cache_file = Path(cache_dir) / f"{digest}.json" if cache_dir else None
+    test_cases = _read_fixture_cache(cache_file) if cache_file else None
+
+    if test_cases is None:
+        test_cases = _parse_test_cases(raw)
+        if cache_file:
+            _write_fixture_cache(cache_file, test_cases)
+
+    _FIXTURE_CACHE[digest] = test_cases
+    return list(test_cases)
+
+
+def _parse_test_cases(raw: bytes) -> list[EvalTestCase]:
+    """Parse and validate fixtures YAML content."""
+    data = yaml.load(raw, Loader=_YAML_LOADER)
 
     if not data or "test_cases" not in data:
         raise ValueError("Invalid fixtures file: must contain 'test_cases' key")
@@ -92,6 +148,32 @@ def load_test_cases(fixtures_path: str | Path) -> list[EvalTestCase]:
     return test_cases
 
 
+def _read_fixture_cache(cache_file: Path) -> list[EvalTestCase] | None:
+    """Load validated test cases from the on-disk cache (None on miss)."""
+    if not cache_file.exists():
+        return None
+    try:
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        return [EvalTestCase.model_validate(case) for case in data]
+    except Exception as e:
+        # Corrupt or outdated cache entry: fall back to parsing the YAML
+        logger.warning(f"Ignoring unreadable fixture cache {cache_file}: {e}")
+        return None
+
+
+def _write_fixture_cache(cache_file: Path, test_cases: list[EvalTestCase]) -> None:
+    """Write validated test cases to the on-disk cache (best effort)."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps([case.model_dump(mode="json") for case in test_cases])
+        # Write-then-rename so concurrent CI jobs never read a partial file
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(payload, encoding="utf-8")
+        tmp_file.replace(cache_file)
+    except OSError as e:
+        logger.warning(f"Could not write fixture cache {cache_file}: {e}")
+
+
 def evaluate_single_test_case(
     test_case: EvalTestCase,
 ) -> EvalResult:
@@ -148,6 +230,80 @@ def evaluate_single_test_case(
     )
 
 
+def _evaluate_or_fail(test_case: EvalTestCase) -> EvalResult:
+    """Evaluate a test case, turning exceptions into a failed result."""
+    try:
+        return evaluate_single_test_case(test_case)
+    except Exception:
+        # Note: In a real implementation, you might want to include the error
+        # information in the result, but the current schema doesn't support it
+        return EvalResult(
+            test_description=test_case.description,
+            metrics=[],
+            overall_passed=False,
+        )
+
+
+def _evaluate_batch(test_cases: list[EvalTestCase]) -> list[EvalResult]:
+    """Evaluate a batch of test cases (process pool worker entry point)."""
+    return [_evaluate_or_fail(test_case) for test_case in test_cases]
+
+
+def _brand_set_batches(
+    test_cases: list[EvalTestCase], batch_count: int
+) -> list[list[int]]:
+    """
+    Split test case indices into batches, keeping brand sets together.
+
+    Indices are ordered by brand set before chunking, so consecutive cases in
+    a batch share compiled brand matchers inside the worker process.
+
+    Args:
+        test_cases: Test cases to split
+        batch_count: Target number of batches
+
+    Returns:
+        List of index batches covering every test case exactly once
+    """
+    order = sorted(
+        range(len(test_cases)),
+        key=lambda i: (
+            tuple(test_cases[i].brands_mine),
+            tuple(test_cases[i].brands_competitors),
+        ),
+    )
+    batch_size = max(1, math.ceil(len(order) / max(batch_count, 1)))
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+def _evaluate_parallel(
+    test_cases: list[EvalTestCase], workers: int
+) -> list[EvalResult] | None:
+    """
+    Evaluate test cases in a process pool, preserving input order.
+
+    Returns None if the pool cannot be used (e.g., restricted sandboxes
+    without multiprocessing support) so the caller can fall back to serial.
+    """
+    batches = _brand_set_batches(test_cases, workers * BATCHES_PER_WORKER)
+    results: list[EvalResult | None] = [None] * len(test_cases)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batch_results = pool.map(
+                _evaluate_batch, [[test_cases[i] for i in batch] for batch in batches]
+            )
+            for batch, batch_result in zip(batches, batch_results, strict=True):
+                for index, result in zip(batch, batch_result, strict=True):
+                    results[index] = result
+    except (OSError, RuntimeError) as e:
+        # BrokenProcessPool is a RuntimeError subclass
+        logger.warning(f"Parallel evaluation unavailable ({e}); running serially")
+        return None
+
+    return results
+
+
 def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
     """
     Check evaluation results against defined quality thresholds.
@@ -268,6 +424,8 @@ def check_evaluation_thresholds(results: list[EvalResult]) -> dict[str, Any]:
 
 def run_eval_suite(
     fixtures_path: str | Path,
+    workers: int | None = None,
+    cache_dir: str | Path | None = None,
 ) -> dict[str, Any]:
     """
     Run the complete evaluation suite on all test cases.
@@ -276,8 +434,14 @@ def run_eval_suite(
     runs them through the extraction pipeline, computes metrics, and returns
     comprehensive results.
 
+    Suites with at least PARALLEL_MIN_TEST_CASES cases are evaluated in a
+    process pool; smaller suites run serially. Results are always returned
+    in fixture order.
+
     Args:
         fixtures_path: Path to YAML file containing test cases
+        workers: Worker processes for evaluation (default: CPU count; 1 = serial)
+        cache_dir: Optional directory for the on-disk fixture cache
 
     Returns:
         Dictionary containing:
@@ -287,24 +451,18 @@ def run_eval_suite(
         - 'total_passed': Number of test cases that passed overall
     """
     # Load test cases
-    test_cases = load_test_cases(fixtures_path)
-
-    # Evaluate each test case
-    results = []
-    for test_case in test_cases:
-        try:
-            result = evaluate_single_test_case(test_case)
-            results.append(result)
-        except Exception as e:
-            # Create a failure result for test cases that throw exceptions
-            failure_result = EvalResult(
-                test_description=test_case.description,
-                metrics=[],
-                overall_passed=False,
-            )
-            # Note: In a real implementation, you might want to include the error
-            # information in the result, but the current schema doesn't support it
-            results.append(failure_result)
+    test_cases = load_test_cases(fixtures_path, cache_dir=cache_dir)
+
+    # Evaluate each test case (in parallel for large suites)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(test_cases))
+
+    results = None
+    if workers > 1 and len(test_cases) >= PARALLEL_MIN_TEST_CASES:
+        results = _evaluate_parallel(test_cases, workers)
+    if results is None:
+        results = _evaluate_batch(test_cases)
 
     # Compute summary statistics
     total_test_cases = len(results)
@@ -0,0 +1,231 @@
+"""
+Agreement of the local sentiment classifier with LLM labels.
+
+The local classifier (extractor.sentiment_classifier) replaces the
+function calling extraction call for sentiment and mention_context. This
+module measures how often both agree, on either source of LLM labels:
+
+- load_labeled_answers(): a YAML file of answers with reference labels
+  (testcases/sentiment_labels.yaml ships with the package)
+- load_stored_labels(): mentions stored by runs that used function calling
+  extraction, joined with their raw answers
+
+compare_with_llm_labels() re-detects each labeled brand in its answer,
+classifies it locally and reports agreement rates and confusion counts.
+
+Example:
+    $ python -m llm_answer_watcher.evals.sentiment --db output/watcher.db --run-id 2025-11-05T10-00-00Z
+"""
+
+import argparse
+import json
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ..extractor.mention_detector import detect_mentions
+from ..extractor.sentiment_classifier import classify_mentions
+from ..storage.db import get_blob
+
+DEFAULT_LABELS_PATH = Path(__file__).parent / "testcases" / "sentiment_labels.yaml"
+
+
+@dataclass
+class LabeledAnswer:
+    """
+    An answer with LLM (or reference) labels for its brand mentions.
+
+    Attributes:
+        description: Where the answer comes from
+        answer_text: Raw answer text
+        brands_mine: Our brand names
+        brands_competitors: Competitor brand names
+        labels: Brand name -> (sentiment, mention_context)
+    """
+
+    description: str
+    answer_text: str
+    brands_mine: list[str]
+    brands_competitors: list[str]
+    labels: dict[str, tuple[str, str]] = field(default_factory=dict)
+
+
+def load_labeled_answers(path: Path = DEFAULT_LABELS_PATH) -> list[LabeledAnswer]:
+    """
+    Load answers with reference labels from a YAML file.
+
+    Args:
+        path: YAML file with an "answers" list (see sentiment_labels.yaml)
+
+    Returns:
+        list[LabeledAnswer]: Answers in file order
+
+    Raises:
+        ValueError: If the file has no "answers" list
+    """
+    data = yaml.safe_load(Path(path).read_text(encoding="utf-8")) or {}
+    if not isinstance(data.get("answers"), list):
+        raise ValueError(f"{path} must contain an 'answers' list")
+    return [
+        LabeledAnswer(
+            description=entry["description"],
+            answer_text=entry["llm_answer_text"],
+            brands_mine=entry.get("brands_mine", []),
+            brands_competitors=entry.get("brands_competitors", []),
+            labels={
+                brand: (label["sentiment"], label["mention_context"])
+                for brand, label in entry["labels"].items()
+            },
+        )
+        for entry in data["answers"]
+    ]
+
+
+def load_stored_labels(
+    db_path: str | Path, run_ids: list[str] | None = None
+) -> list[LabeledAnswer]:
+    """
+    Load labeled mentions stored by earlier runs, grouped by answer.
+
+    The database does not record which extraction method produced a label,
+    so pass the ids of runs that used function calling; otherwise locally
+    labeled mentions would be compared with themselves.
+
+    Args:
+        db_path: SQLite database of the runs
+        run_ids: Runs to load (default: all runs)
+
+    Returns:
+        list[LabeledAnswer]: One entry per stored answer with labeled mentions
+    """
+    query = """
+        SELECT m.run_id, m.intent_id, m.model_provider, m.model_name,
+               m.normalized_name, m.is_mine, m.sentiment, m.mention_context,
+               a.answer_hash, a.answer_text
+        FROM mentions m
+        JOIN answers_raw a
+          ON a.run_id = m.run_id AND a.intent_id = m.intent_id
+         AND a.model_provider = m.model_provider AND a.model_name = m.model_name
+        WHERE m.sentiment IS NOT NULL AND m.mention_context IS NOT NULL
+    """
+    params: list[str] = []
+    if run_ids:
+        query += f" AND m.run_id IN ({', '.join('?' * len(run_ids))})"
+        params.extend(run_ids)
+    query += " ORDER BY m.run_id, m.intent_id, m.model_provider, m.model_name, m.id"
+
+    answers: dict[tuple[str, str, str, str], LabeledAnswer] = {}
+    with sqlite3.connect(db_path) as conn:
+        for row in conn.execute(query, params):
+            run_id, intent_id, provider, model_name, brand, is_mine, sentiment, context = row[:8]
+            key = (run_id, intent_id, provider, model_name)
+            answer = answers.get(key)
+            if answer is None:
+                # Texts are in the blob store since schema v10; older rows keep them inline
+                answer_hash, text = row[8:]
+                answer = answers[key] = LabeledAnswer(
+                    description=f"{run_id} {intent_id} {provider}/{model_name}",
+                    answer_text=get_blob(conn, answer_hash) if answer_hash else text,
+                    brands_mine=[],
+                    brands_competitors=[],
+                )
+            (answer.brands_mine if is_mine else answer.brands_competitors).append(brand)
+            answer.labels[brand] = (sentiment, context)
+    return list(answers.values())
+
+
+def compare_with_llm_labels(answers: list[LabeledAnswer]) -> dict[str, Any]:
+    """
+    Classify every labeled mention locally and compare with its label.
+
+    Brands that regex detection does not find in their answer (e.g., the
+    LLM normalized a name that is not written that way) are counted as
+    unmatched and left out of the agreement rates.
+
+    Args:
+        answers: Labeled answers
+
+    Returns:
+        dict: Mention counts, sentiment and context agreement (0.0-1.0),
+            confusion counts as {llm_label: {local_label: count}} and the
+            disagreements
+    """
+    sentiment_pairs: Counter[tuple[str, str]] = Counter()
+    context_pairs: Counter[tuple[str, str]] = Counter()
+    disagreements = []
+    unmatched = []
+
+    for answer in answers:
+        mentions = detect_mentions(
+            answer.answer_text, answer.brands_mine, answer.brands_competitors
+        )
+        found = {mention.normalized_name: mention for mention in mentions}
+        local = dict(zip(found, classify_mentions(answer.answer_text, mentions), strict=True))
+
+        for brand, (sentiment, context) in answer.labels.items():
+            if brand not in local:
+                unmatched.append({"answer": answer.description, "brand": brand})
+                continue
+            label = local[brand]
+            sentiment_pairs[sentiment, label.sentiment] += 1
+            context_pairs[context, label.mention_context] += 1
+            if (sentiment, context) != (label.sentiment, label.mention_context):
+                disagreements.append(
+                    {
+                        "answer": answer.description,
+                        "brand": brand,
+                        "llm": [sentiment, context],
+                        "local": [label.sentiment, label.mention_context],
+                    }
+                )
+
+    compared = sum(sentiment_pairs.values())
+    return {
+        "mentions_compared": compared,
+        "mentions_unmatched": len(unmatched),
+        "sentiment_agreement": _agreement(sentiment_pairs, compared),
+        "context_agreement": _agreement(context_pairs, compared),
+        "sentiment_confusion": _confusion(sentiment_pairs),
+        "context_confusion": _confusion(context_pairs),
+        "disagreements": disagreements,
+        "unmatched": unmatched,
+    }
+
+
+def _agreement(pairs: Counter[tuple[str, str]], total: int) -> float:
+    agreed = sum(count for (llm, local), count in pairs.items() if llm == local)
+    return round(agreed / total, 4) if total else 0.0
+
+
+def _confusion(pairs: Counter[tuple[str, str]]) -> dict[str, dict[str, int]]:
+    confusion: dict[str, dict[str, int]] = {}
+    for (llm, local), count in sorted(pairs.items()):
+        confusion.setdefault(llm, {})[local] = count
+    return confusion
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Compare local labels with stored or reference labels and print JSON."""
+    parser = argparse.ArgumentParser(
+        prog="python -m llm_answer_watcher.evals.sentiment",
+        description="Compare the local sentiment classifier with LLM labels.",
+    )
+    parser.add_argument("--labels", type=Path, help="YAML file with reference labels")
+    parser.add_argument("--db", type=Path, help="SQLite database of function calling runs")
+    parser.add_argument("--run-id", action="append", dest="run_ids", help="Run to compare")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        answers = load_stored_labels(args.db, args.run_ids)
+    else:
+        answers = load_labeled_answers(args.labels or DEFAULT_LABELS_PATH)
+    print(json.dumps(compare_with_llm_labels(answers), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
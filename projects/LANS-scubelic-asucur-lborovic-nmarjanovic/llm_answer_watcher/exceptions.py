@@ -19,7 +19,8 @@ Exception Hierarchy:
     │   ├── LLMAuthenticationError
     │   ├── LLMRateLimitError
     │   ├── LLMTimeoutError
-    │   └── LLMResponseError
+    │   ├── LLMResponseError
+    │   └── LLMCircuitOpenError
     ├── BudgetExceededError
     ├── ExtractionError
     │   ├── MentionDetectionError
@@ -227,6 +228,20 @@ class LLMResponseError(LLMProviderError):
     pass
 
 
+class LLMCircuitOpenError(LLMProviderError):
+    """
+    Request short-circuited because the provider/model circuit breaker is open.
+
+    Raised without contacting the provider after repeated failures. This
+    error should NOT be retried within the run.
+
+    Example:
+        raise LLMCircuitOpenError("Circuit open for openai/gpt-4o-mini")
+    """
+
+    pass
+
+
 # ============================================================================
 # Budget Errors
 # ============================================================================
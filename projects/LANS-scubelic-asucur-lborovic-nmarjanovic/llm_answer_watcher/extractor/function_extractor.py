@@ -38,12 +38,14 @@ import logging
 from dataclasses import dataclass
 
 from ..config.schema import Brands, RuntimeExtractionSettings
+from ..llm_runner.coalescing import generate_coalesced
 from ..llm_runner.models import LLMResponse, build_client
 from .function_schemas import (
     EXTRACT_BRAND_MENTIONS_FUNCTION,
     validate_function_response,
 )
 from .mention_detector import detect_mentions
+from .sentiment_classifier import label_mentions
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,8 @@ class FunctionExtractionResult:
         fallback_used: True if regex fallback was triggered
         raw_function_call: Raw function call result for debugging
         extraction_cost_usd: Cost of extraction call in USD
+        extraction_usage: Token usage of the extraction call ("prompt_tokens",
+            "completion_tokens", "cached_tokens"), None if no call succeeded
 
     Example:
         >>> result = FunctionExtractionResult(
@@ -87,6 +91,7 @@ class FunctionExtractionResult:
     fallback_used: bool
     raw_function_call: dict | None = None
     extraction_cost_usd: float = 0.0
+    extraction_usage: dict | None = None
 
 
 def build_extraction_prompt(
@@ -101,6 +106,11 @@ def build_extraction_prompt(
     known brands (both ours and competitors) to help the LLM identify
     variations and normalize names.
 
+    Instructions and brand context come first and the answer text last, so
+    every extraction call in a run starts with the same text. Providers with
+    prompt caching (OpenAI caches prefixes of 1024+ tokens automatically)
+    then bill the brand list at the cached input rate after the first call.
+
     Args:
         answer_text: Raw LLM answer to analyze for brand mentions
         our_brands: List of our brand names (for context)
@@ -133,13 +143,13 @@ def build_extraction_prompt(
 
     return f"""You are analyzing an LLM's answer to extract brand/product mentions.
 
+Extract ALL brand mentions using the extract_brand_mentions function.
+Include brands even if they're not in the context lists below.{brand_context}
+
 ANSWER TO ANALYZE:
 \"\"\"
 {answer_text}
-\"\"\"{brand_context}
-
-Extract ALL brand mentions using the extract_brand_mentions function.
-Include brands even if they're not in the context lists above.
+\"\"\"
 """
 
 
@@ -238,6 +248,7 @@ async def extract_with_function_calling(
         system_prompt=extraction_model.system_prompt,
         tools=[EXTRACT_BRAND_MENTIONS_FUNCTION],
         tool_choice="required",  # FORCE function call
+        base_url=extraction_model.base_url,
     )
 
     # Build prompt with brand context
@@ -253,7 +264,7 @@ async def extract_with_function_calling(
             f"Calling extraction model {extraction_model.provider}/{extraction_model.model_name} "
             f"for intent {intent_id}"
         )
-        response: LLMResponse = await client.generate_answer(prompt)
+        response: LLMResponse = await generate_coalesced(client, prompt)
 
         # Parse function call result
         function_result = parse_function_call_response(response)
@@ -293,6 +304,11 @@ async def extract_with_function_calling(
             fallback_used=False,
             raw_function_call=function_result,
             extraction_cost_usd=response.cost_usd,
+            extraction_usage={
+                "prompt_tokens": response.prompt_tokens,
+                "completion_tokens": response.completion_tokens,
+                "cached_tokens": response.cached_tokens,
+            },
         )
 
     except Exception as e:
@@ -303,8 +319,10 @@ async def extract_with_function_calling(
         if extraction_settings.fallback_to_regex:
             logger.info(f"Falling back to regex extraction for {intent_id}")
 
-            # Fall back to old method
+            # Fall back to old method, labeling sentiment locally
             mentions = detect_mentions(answer_text, brands.mine, brands.competitors)
+            if extraction_settings.enable_sentiment_analysis:
+                label_mentions(answer_text, mentions)
 
             return FunctionExtractionResult(
                 brands_mentioned=[
@@ -315,8 +333,8 @@ async def extract_with_function_calling(
                         "context_snippet": answer_text[
                             mention.match_position : mention.match_position + 100
                         ],
-                        "sentiment": None,  # Regex can't determine sentiment
-                        "mention_context": None,  # Regex can't determine context
+                        "sentiment": mention.sentiment,
+                        "mention_context": mention.mention_context,
                     }
                     for mention in mentions
                 ],
@@ -44,6 +44,7 @@ import sqlite3
 from dataclasses import dataclass
 
 from ..config.schema import RuntimeExtractionSettings
+from ..llm_runner.coalescing import generate_coalesced
 from ..llm_runner.models import LLMResponse, build_client
 from ..storage.db import (
     lookup_intent_classification_cache,
@@ -316,6 +317,7 @@ async def classify_intent(
         system_prompt="You are an expert at classifying user search intent for SEO and marketing analysis.",
         tools=[CLASSIFY_QUERY_INTENT_FUNCTION],
         tool_choice="required",  # FORCE function call
+        base_url=extraction_model.base_url,
     )
 
     # Build prompt
@@ -327,7 +329,7 @@ async def classify_intent(
             f"Calling classification model {extraction_model.provider}/{extraction_model.model_name} "
             f"for intent {intent_id}"
         )
-        response: LLMResponse = await client.generate_answer(prompt)
+        response: LLMResponse = await generate_coalesced(client, prompt)
 
         # Parse function call result
         function_result = parse_classification_response(response)
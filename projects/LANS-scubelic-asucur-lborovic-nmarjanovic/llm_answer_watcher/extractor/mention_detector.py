@@ -18,12 +18,14 @@ Security:
 - Validates all inputs
 
 Performance:
-- Compiles regex patterns once for reuse
+- Compiles regex patterns once per brand set (LRU cached) for reuse
+- Removes overlapping mentions with one sort and a linear sweep
 - Sorts results by position for deterministic output
 """
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rapidfuzz import fuzz
 
@@ -163,37 +165,66 @@ def remove_overlapping_mentions(mentions: list[BrandMention]) -> list[BrandMenti
         mentions, key=lambda m: (m.match_position, -len(m.original_text))
     )
 
-    # Remove overlapping mentions
-    result = []
+    # Sweep in position order. Kept mentions never overlap each other, so a
+    # mention can only overlap the last kept one (the one reaching furthest)
+    result: list[BrandMention] = []
+    kept_end = 0
     for mention in sorted_mentions:
-        # Check if this mention overlaps with any already-kept mention
-        overlaps = False
         mention_end = mention.match_position + len(mention.original_text)
 
-        for kept_mention in result:
-            kept_end = kept_mention.match_position + len(kept_mention.original_text)
+        if result and (
+            mention.match_position < kept_end
+            and mention_end > result[-1].match_position
+        ):
+            # Overlaps - keep the longer one
+            if len(mention.original_text) > len(result[-1].original_text):
+                result[-1] = mention
+                kept_end = mention_end
+            continue
+
+        result.append(mention)
+        kept_end = mention_end
 
-            # Check for overlap
-            if (
-                mention.match_position < kept_end
-                and mention_end > kept_mention.match_position
-            ):
-                # Overlaps - keep the longer one
-                if len(mention.original_text) > len(kept_mention.original_text):
-                    # Replace kept mention with this longer one
-                    result.remove(kept_mention)
-                    result.append(mention)
-                overlaps = True
-                break
-
-        if not overlaps:
-            result.append(mention)
-
-    # Re-sort by position for final output
-    result.sort(key=lambda m: m.match_position)
     return result
 
 
+@lru_cache(maxsize=256)
+def _compile_brand_patterns(
+    our_brands: tuple[str, ...],
+    competitor_brands: tuple[str, ...],
+) -> tuple[tuple[str, str, str, re.Pattern], ...]:
+    """
+    Compile word-boundary patterns for a brand set, cached per brand set.
+
+    Runs and eval suites call detect_mentions() many times with the same
+    brands, so compiling once per brand set avoids rebuilding every regex
+    for every answer.
+
+    Args:
+        our_brands: Brands representing "us" (tuple for hashability)
+        competitor_brands: Competitor brands (tuple for hashability)
+
+    Returns:
+        Tuple of (alias, primary_name, category, pattern) entries, our brands
+        first, skipping empty or invalid brand names
+    """
+    brand_patterns: list[tuple[str, str, str, re.Pattern]] = []
+
+    for category, brands in (("mine", our_brands), ("competitor", competitor_brands)):
+        # Each brand is tracked separately (normalized name = itself)
+        for brand_name in brands:
+            if not brand_name or brand_name.isspace():
+                continue
+            try:
+                pattern = create_brand_pattern(brand_name)
+            except ValueError:
+                # Skip invalid brand names
+                continue
+            brand_patterns.append((brand_name, brand_name, category, pattern))
+
+    return tuple(brand_patterns)
+
+
 def detect_mentions(
     answer_text: str,
     our_brands: list[str],
@@ -282,32 +313,8 @@ def detect_mentions(
     our_brands = our_brands or []
     competitor_brands = competitor_brands or []
 
-    # Build mapping of alias -> (primary_name, category, pattern)
-    brand_patterns: list[tuple[str, str, str, re.Pattern]] = []
-
-    # Add our brands (EACH is a SEPARATE brand tracked independently)
-    for brand_name in our_brands:
-        if not brand_name or brand_name.isspace():
-            continue
-        try:
-            pattern = create_brand_pattern(brand_name)
-            # Each "mine" brand is tracked separately (normalized name = itself)
-            brand_patterns.append((brand_name, brand_name, "mine", pattern))
-        except ValueError:
-            # Skip invalid brand names
-            continue
-
-    # Add competitor brands (each is a SEPARATE brand tracked independently)
-    for brand_name in competitor_brands:
-        if not brand_name or brand_name.isspace():
-            continue
-        try:
-            pattern = create_brand_pattern(brand_name)
-            # Each competitor is tracked separately (normalized name = itself)
-            brand_patterns.append((brand_name, brand_name, "competitor", pattern))
-        except ValueError:
-            # Skip invalid brand names
-            continue
+    # Compiled patterns are cached per brand set (see _compile_brand_patterns)
+    brand_patterns = _compile_brand_patterns(tuple(our_brands), tuple(competitor_brands))
 
     # Find all matches
     all_matches: list[BrandMention] = []
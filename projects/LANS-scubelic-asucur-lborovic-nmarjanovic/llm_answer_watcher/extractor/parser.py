@@ -10,6 +10,10 @@ The parser supports three extraction modes:
 2. Regex: Traditional word-boundary matching (backward compatible)
 3. Hybrid: Function calling with regex fallback
 
+With extraction settings and sentiment analysis enabled, regex extraction
+labels mentions with the local sentiment classifier, so sentiment and
+mention_context are filled without an extraction call.
+
 Key features:
 - Single entry point (parse_answer) for all extraction logic
 - Structured output with all metadata
@@ -45,6 +49,7 @@ from .rank_extractor import (
     extract_ranked_list_llm,
     extract_ranked_list_pattern,
 )
+from .sentiment_classifier import label_mentions
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +74,8 @@ class ExtractionResult:
         rank_extraction_method: Method used ("pattern", "llm", "function_calling", "regex_fallback")
         rank_confidence: Overall confidence in ranking (0.0-1.0)
         extraction_cost_usd: Cost of extraction in USD (0.0 for regex)
+        extraction_usage: Token usage of the function calling extraction
+            call (None for regex extraction)
     """
 
     intent_id: str
@@ -82,6 +89,7 @@ class ExtractionResult:
     rank_extraction_method: str
     rank_confidence: float
     extraction_cost_usd: float = 0.0
+    extraction_usage: dict | None = None
 
     def __post_init__(self):
         """Validate rank_extraction_method."""
@@ -126,6 +134,7 @@ async def parse_answer(
        - Fall back to regex if function calling fails (if enabled)
     2. Otherwise (backward compatible):
        - Detect brand mentions using regex (mine vs competitors)
+       - Label sentiment and context locally (if sentiment analysis is enabled)
        - Extract ranked list (pattern-based or LLM-assisted)
     3. Build ExtractionResult with all signals
 
@@ -179,6 +188,7 @@ async def parse_answer(
     )
 
     extraction_cost = 0.0
+    extraction_usage = None
 
     if use_function_calling:
         # Use function calling for extraction
@@ -198,6 +208,7 @@ async def parse_answer(
             )
 
             extraction_cost = func_result.extraction_cost_usd
+            extraction_usage = func_result.extraction_usage
 
             # Convert function calling results to mentions and rankings
             my_mentions = []
@@ -280,6 +291,8 @@ async def parse_answer(
             our_brands=brands.mine,
             competitor_brands=brands.competitors,
         )
+        if extraction_settings is not None and extraction_settings.enable_sentiment_analysis:
+            label_mentions(answer_text, all_mentions)
 
         # Step 2: Separate mentions into mine vs competitors
         my_mentions = [m for m in all_mentions if m.brand_category == "mine"]
@@ -323,4 +336,5 @@ async def parse_answer(
         rank_extraction_method=rank_method,
         rank_confidence=rank_confidence,
         extraction_cost_usd=extraction_cost,
+        extraction_usage=extraction_usage,
     )
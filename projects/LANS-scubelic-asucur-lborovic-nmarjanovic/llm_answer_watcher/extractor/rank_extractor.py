@@ -21,6 +21,14 @@ Key features:
 - Confidence scoring (1.0 = clear numbered list, 0.3 = no structure)
 - First-seen deduplication
 
+Performance:
+- The answer is scanned once: _scan_list_lines() classifies every line as
+  numbered item, bullet or header, and each list heuristic reads its lines
+  from that scan instead of re-splitting and re-matching the text
+- Brand names are lower-cased once per answer, and fuzzy matching skips the
+  full SequenceMatcher ratio when its cheap upper bounds already rule a
+  brand out
+
 Example:
     >>> known_brands = ["Warmly", "HubSpot", "Instantly"]
     >>> text = "1. Warmly\\n2. HubSpot\\n3. Instantly"
@@ -34,7 +42,7 @@ Example:
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 
 from .mention_detector import create_brand_pattern
@@ -48,6 +56,11 @@ from .mention_detector import create_brand_pattern
 # Lower values increase false positives, higher values miss valid matches
 FUZZY_THRESHOLD = 0.8
 
+# One line of a list structure, classified in a single match:
+# numbered item ("1. X", "1) X"), bullet ("- X", "• X", "* X") or markdown
+# header ("## X", "### X"); group 4 is the item text
+_LIST_LINE_PATTERN = re.compile(r"^\s*(?:(\d+)[\.\)]|([-•*])|(#{2,3}))\s+(.+)$")
+
 
 @dataclass
 class RankedBrand:
@@ -120,16 +133,19 @@ def extract_ranked_list_pattern(
     if not text or not known_brands:
         return ([], 0.3)
 
-    # Try pattern-based extraction in priority order
-    ranked, confidence = _extract_numbered_list(text, known_brands)
+    # Classify every line once, then try the list heuristics in priority order
+    lines = _scan_list_lines(text)
+    matcher = _BrandMatcher(known_brands)
+
+    ranked, confidence = _rank_numbered(lines.numbered, matcher)
     if ranked:
         return (ranked, confidence)
 
-    ranked, confidence = _extract_bullet_list(text, known_brands)
+    ranked, confidence = _rank_in_order(lines.bullets, matcher)
     if ranked:
         return (ranked, confidence)
 
-    ranked, confidence = _extract_headers(text, known_brands)
+    ranked, confidence = _rank_in_order(lines.headers, matcher)
     if ranked:
         return (ranked, confidence)
 
@@ -138,36 +154,52 @@ def extract_ranked_list_pattern(
     return (ranked, confidence)
 
 
-def _extract_numbered_list(
-    text: str, known_brands: list[str]
-) -> tuple[list[RankedBrand], float]:
+@dataclass
+class _ListLines:
     """
-    Extract brands from numbered list patterns.
-
-    Patterns matched:
-    - "1. ToolName" / "1) ToolName" / "1 ToolName"
-    - "2. ToolName" / "2) ToolName" / "2 ToolName"
+    List lines of an answer, grouped by kind, in text order.
 
-    Returns:
-        (ranked_brands, 1.0) if numbered list found, else ([], 0.0)
+    Attributes:
+        numbered: (number, item text) of numbered list lines
+        bullets: Item text of bullet list lines
+        headers: Item text of "##"/"###" header lines
     """
-    # Pattern: number (with optional period/paren) followed by text
-    # Captures: (number, content after number)
-    pattern = r"^\s*(\d+)[\.\)]\s+(.+)$"
 
-    ranked_brands = []
-    seen_brands = set()
+    numbered: list[tuple[int, str]] = field(default_factory=list)
+    bullets: list[str] = field(default_factory=list)
+    headers: list[str] = field(default_factory=list)
 
+
+def _scan_list_lines(text: str) -> _ListLines:
+    """
+    Classify each line of text once as numbered item, bullet or header.
+
+    Item text is stripped; lines that are none of the three are skipped.
+    """
+    lines = _ListLines()
     for line in text.split("\n"):
-        match = re.match(pattern, line)
+        match = _LIST_LINE_PATTERN.match(line)
         if not match:
             continue
+        number, bullet, _header, candidate = match.groups()
+        if number is not None:
+            lines.numbered.append((int(number), candidate.strip()))
+        elif bullet is not None:
+            lines.bullets.append(candidate.strip())
+        else:
+            lines.headers.append(candidate.strip())
+    return lines
+
+
+def _rank_numbered(
+    items: list[tuple[int, str]], matcher: "_BrandMatcher"
+) -> tuple[list[RankedBrand], float]:
+    """Rank matched brands of numbered items by their list numbers."""
+    ranked_brands = []
+    seen_brands = set()
 
-        rank_num = int(match.group(1))
-        candidate = match.group(2).strip()
-
-        # Match candidate against known_brands
-        matched_brand = _match_brand(candidate, known_brands)
+    for rank_num, candidate in items:
+        matched_brand = matcher.match(candidate)
         if matched_brand and matched_brand not in seen_brands:
             ranked_brands.append(
                 RankedBrand(
@@ -187,36 +219,16 @@ def _extract_numbered_list(
     return ([], 0.0)
 
 
-def _extract_bullet_list(
-    text: str, known_brands: list[str]
+def _rank_in_order(
+    items: list[str], matcher: "_BrandMatcher"
 ) -> tuple[list[RankedBrand], float]:
-    """
-    Extract brands from bullet list patterns.
-
-    Patterns matched:
-    - "- ToolName"
-    - "" ToolName"
-    - "* ToolName"
-
-    Returns:
-        (ranked_brands, 0.8) if bullet list found, else ([], 0.0)
-    """
-    # Pattern: bullet marker followed by text
-    pattern = r"^\s*[-•*]\s+(.+)$"
-
+    """Rank matched brands of bullet or header items in order of appearance."""
     ranked_brands = []
     seen_brands = set()
     rank_position = 1
 
-    for line in text.split("\n"):
-        match = re.match(pattern, line)
-        if not match:
-            continue
-
-        candidate = match.group(1).strip()
-
-        # Match candidate against known_brands
-        matched_brand = _match_brand(candidate, known_brands)
+    for candidate in items:
+        matched_brand = matcher.match(candidate)
         if matched_brand and matched_brand not in seen_brands:
             ranked_brands.append(
                 RankedBrand(
@@ -228,58 +240,60 @@ def _extract_bullet_list(
             seen_brands.add(matched_brand)
             rank_position += 1
 
-    # Only return if we found bullet list items
+    # Only return if we found list items
     if ranked_brands:
         return (ranked_brands, 0.8)
 
     return ([], 0.0)
 
 
-def _extract_headers(
+def _extract_numbered_list(
     text: str, known_brands: list[str]
 ) -> tuple[list[RankedBrand], float]:
     """
-    Extract brands from markdown header patterns.
+    Extract brands from numbered list patterns.
 
     Patterns matched:
-    - "## ToolName"
-    - "### ToolName"
+    - "1. ToolName" / "1) ToolName"
+    - "2. ToolName" / "2) ToolName"
 
     Returns:
-        (ranked_brands, 0.8) if headers found, else ([], 0.0)
+        (ranked_brands, 1.0) if numbered list found, else ([], 0.0)
     """
-    # Pattern: markdown headers (## or ###) followed by text
-    pattern = r"^\s*#{2,3}\s+(.+)$"
+    return _rank_numbered(_scan_list_lines(text).numbered, _BrandMatcher(known_brands))
 
-    ranked_brands = []
-    seen_brands = set()
-    rank_position = 1
 
-    for line in text.split("\n"):
-        match = re.match(pattern, line)
-        if not match:
-            continue
+def _extract_bullet_list(
+    text: str, known_brands: list[str]
+) -> tuple[list[RankedBrand], float]:
+    """
+    Extract brands from bullet list patterns.
 
-        candidate = match.group(1).strip()
+    Patterns matched:
+    - "- ToolName"
+    - "• ToolName"
+    - "* ToolName"
 
-        # Match candidate against known_brands
-        matched_brand = _match_brand(candidate, known_brands)
-        if matched_brand and matched_brand not in seen_brands:
-            ranked_brands.append(
-                RankedBrand(
-                    brand_name=matched_brand,
-                    rank_position=rank_position,
-                    confidence=0.8,
-                )
-            )
-            seen_brands.add(matched_brand)
-            rank_position += 1
+    Returns:
+        (ranked_brands, 0.8) if bullet list found, else ([], 0.0)
+    """
+    return _rank_in_order(_scan_list_lines(text).bullets, _BrandMatcher(known_brands))
 
-    # Only return if we found header items
-    if ranked_brands:
-        return (ranked_brands, 0.8)
 
-    return ([], 0.0)
+def _extract_headers(
+    text: str, known_brands: list[str]
+) -> tuple[list[RankedBrand], float]:
+    """
+    Extract brands from markdown header patterns.
+
+    Patterns matched:
+    - "## ToolName"
+    - "### ToolName"
+
+    Returns:
+        (ranked_brands, 0.8) if headers found, else ([], 0.0)
+    """
+    return _rank_in_order(_scan_list_lines(text).headers, _BrandMatcher(known_brands))
 
 
 def _extract_from_mention_order(
@@ -328,6 +342,59 @@ def _extract_from_mention_order(
     return (ranked_brands, 0.5)
 
 
+class _BrandMatcher:
+    """
+    Matches list item text against known brands.
+
+    Brand names are lower-cased once, so an answer with many list lines
+    and many brands does not lower-case every brand for every line.
+    """
+
+    def __init__(self, known_brands: list[str]):
+        self._brands = [(brand.lower(), brand) for brand in known_brands]
+        self._sequence_matcher = SequenceMatcher(None)
+
+    def match(self, candidate: str) -> str | None:
+        """
+        Match candidate text against the known brands.
+
+        Uses exact (substring) match first, in known_brands order, then fuzzy
+        matching with FUZZY_THRESHOLD.
+
+        Returns:
+            Matched brand name from known_brands, or None if no match
+        """
+        candidate_lower = candidate.lower()
+
+        # Try exact match first
+        for brand_lower, brand in self._brands:
+            if brand_lower in candidate_lower:
+                return brand
+
+        # Try fuzzy matching. real_quick_ratio() and quick_ratio() are upper
+        # bounds of ratio(), so brands they rule out are skipped without
+        # computing the full matching blocks.
+        best_match = None
+        best_ratio = 0.0
+        sequence_matcher = self._sequence_matcher
+        sequence_matcher.set_seq1(candidate_lower)
+
+        for brand_lower, brand in self._brands:
+            sequence_matcher.set_seq2(brand_lower)
+            floor = max(best_ratio, FUZZY_THRESHOLD)
+            if (
+                sequence_matcher.real_quick_ratio() < floor
+                or sequence_matcher.quick_ratio() < floor
+            ):
+                continue
+            ratio = sequence_matcher.ratio()
+            if ratio > best_ratio and ratio >= FUZZY_THRESHOLD:
+                best_ratio = ratio
+                best_match = brand
+
+        return best_match
+
+
 def _match_brand(candidate: str, known_brands: list[str]) -> str | None:
     """
     Match candidate text against known brands list.
@@ -345,24 +412,7 @@ def _match_brand(candidate: str, known_brands: list[str]) -> str | None:
         Fuzzy matching threshold is defined by FUZZY_THRESHOLD constant (0.8).
         This can be adjusted if more lenient or strict matching is needed.
     """
-    candidate_lower = candidate.lower()
-
-    # Try exact match first
-    for brand in known_brands:
-        if brand.lower() in candidate_lower:
-            return brand
-
-    # Try fuzzy matching using FUZZY_THRESHOLD constant
-    best_match = None
-    best_ratio = 0.0
-
-    for brand in known_brands:
-        ratio = SequenceMatcher(None, candidate_lower, brand.lower()).ratio()
-        if ratio > best_ratio and ratio >= FUZZY_THRESHOLD:
-            best_ratio = ratio
-            best_match = brand
-
-    return best_match
+    return _BrandMatcher(known_brands).match(candidate)
 
 
 def extract_ranked_list_llm(
@@ -0,0 +1,280 @@
+"""
+Local sentiment and mention-context classifier for regex extraction.
+
+Function calling labels every brand mention with a sentiment and a
+mention_context, at the cost of one extraction call per answer. Regex
+extraction has no such call, so this module fills the same two fields
+locally, on the CPU, at no cost:
+
+- Sentiment is a weighted lexicon score over the words around the mention
+  (negations like "not" or "never" flip the next few words)
+- mention_context combines that score with the mention's position: its
+  place in a numbered or bulleted list, recommendation cues ("recommend",
+  "best", "top"), alternative cues ("also", "alternative", "consider") and
+  whether it is only a parenthetical or a bare name
+
+Labels use the same values as the extraction function schema, so they are
+stored and reported exactly like function calling labels.
+
+The window of a mention is the text of its sentence from the end of the
+mention up to the next mention in that sentence, plus the sentence prefix
+before the first mention (so "The best tools are A and B" credits both).
+The answer is tokenized and scored once; every window is then summed from
+prefix sums, so classifying all mentions of an answer costs one pass over
+the text however many mentions it has.
+
+Example:
+    >>> text = "1. Lemwarm - excellent deliverability\\n2. HubSpot - expensive and clunky"
+    >>> mentions = detect_mentions(text, our_brands=["Lemwarm"], competitor_brands=["HubSpot"])
+    >>> [(m.sentiment, m.mention_context) for m in label_mentions(text, mentions)]
+    [('positive', 'primary_recommendation'), ('negative', 'competitor_negative')]
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+
+from .mention_detector import BrandMention
+
+
+def _terms(words: str) -> tuple[str, ...]:
+    return tuple(words.split())
+
+
+# Word weights: positive values praise, negative values criticize. Price
+# caveats ("expensive") weigh half, so a lone caveat on an otherwise
+# neutral mention stays neutral.
+SENTIMENT_WEIGHTS: dict[str, float] = {
+    **dict.fromkeys(
+        _terms("""
+        recommend recommended best excellent great good top leading reliable
+        powerful popular solid strong ideal perfect outstanding favorite love
+        loved easy intuitive affordable comprehensive robust standout stands
+        impressive superior trusted excels shines user-friendly seamless
+        efficient versatile established useful valuable competitive generous
+        praised winner well
+        """),
+        1.0,
+    ),
+    **dict.fromkeys(
+        _terms("""
+        poor bad worse worst avoid lacks lacking clunky slow buggy complicated
+        difficult confusing outdated unreliable disappointing frustrating weak
+        drawback drawbacks downside downsides issues problems complaints
+        overpriced inferior struggles risky spam blacklisted cons
+        """),
+        -1.0,
+    ),
+    **dict.fromkeys(_terms("expensive pricey costly steep limited"), -0.5),
+}
+
+NEGATIONS = frozenset(_terms("not no never don't doesn't isn't wasn't won't without hardly"))
+
+# Words a negation flips after it ("not very good", "never a reliable")
+NEGATION_SCOPE = 3
+
+PRIMARY_CUES = frozenset(
+    _terms("recommend recommended best top favorite winner pick choice standout")
+)
+ALTERNATIVE_CUES = frozenset(
+    _terms("also alternative alternatives alternatively option options consider another instead")
+)
+
+# Window score at or beyond which a mention is positive (or negative)
+SENTIMENT_THRESHOLD = 1.0
+
+# Mentions with fewer window words than this (and no list position or cue)
+# are passing references
+PASSING_MAX_WORDS = 3
+
+_WORD = re.compile(r"[a-z]+(?:['-][a-z]+)*")
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|[;\n]")
+_LIST_ITEM = re.compile(r"^[ \t]*(?:(\d+)[.)]|[-•*])[ \t]+", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class MentionLabel:
+    """
+    Local labels for one brand mention.
+
+    Attributes:
+        sentiment: "positive", "neutral" or "negative"
+        mention_context: One of the extraction schema's mention contexts
+            ("primary_recommendation", "alternative_listing",
+            "competitor_negative", "competitor_neutral", "passing_reference")
+    """
+
+    sentiment: str
+    mention_context: str
+
+
+class _AnswerFeatures:
+    """Token scores of one answer with prefix sums for window queries."""
+
+    def __init__(self, answer_text: str):
+        self.starts: list[int] = []
+        polarity: list[float] = []
+        primary: list[int] = []
+        alternative: list[int] = []
+        negated_until = -1
+
+        for index, match in enumerate(_WORD.finditer(answer_text.lower())):
+            word = match.group(0)
+            self.starts.append(match.start())
+            weight = SENTIMENT_WEIGHTS.get(word, 0.0)
+            if word in NEGATIONS:
+                negated_until = index + NEGATION_SCOPE
+            elif index <= negated_until:
+                weight = -weight
+            polarity.append(weight)
+            primary.append(word in PRIMARY_CUES and weight > 0)
+            alternative.append(word in ALTERNATIVE_CUES)
+
+        self._polarity = [0.0, *accumulate(polarity)]
+        self._primary = [0, *accumulate(primary)]
+        self._alternative = [0, *accumulate(alternative)]
+
+    def window(self, start: int, end: int) -> tuple[float, int, int, int]:
+        """Polarity sum, primary cues, alternative cues and words in [start, end)."""
+        first = bisect_left(self.starts, start)
+        last = bisect_left(self.starts, end)
+        return (
+            self._polarity[last] - self._polarity[first],
+            self._primary[last] - self._primary[first],
+            self._alternative[last] - self._alternative[first],
+            last - first,
+        )
+
+
+def _list_positions(answer_text: str, line_starts: list[int], lines: set[int]) -> dict[int, int]:
+    """
+    Map list lines holding mentions to their list position.
+
+    Numbered items keep their number; bullets are counted among the bullet
+    lines that hold a mention, so an intro bullet without brands does not
+    push the first brand to position 2.
+    """
+    positions: dict[int, int] = {}
+    bullets = 0
+    for line in sorted(lines):
+        match = _LIST_ITEM.match(answer_text, line_starts[line])
+        if not match:
+            continue
+        if match.group(1):
+            positions[line] = int(match.group(1))
+        else:
+            bullets += 1
+            positions[line] = bullets
+    return positions
+
+
+def _in_parentheses(answer_text: str, sentence_start: int, position: int) -> bool:
+    return answer_text.rfind("(", sentence_start, position) > answer_text.rfind(
+        ")", sentence_start, position
+    )
+
+
+def _label(
+    *,
+    score: float,
+    primary: int,
+    alternative: int,
+    words: int,
+    list_position: int | None,
+    parenthetical: bool,
+) -> MentionLabel:
+    if score >= SENTIMENT_THRESHOLD:
+        sentiment = "positive"
+    elif score <= -SENTIMENT_THRESHOLD:
+        sentiment = "negative"
+    else:
+        sentiment = "neutral"
+
+    if sentiment == "negative":
+        context = "competitor_negative"
+    elif list_position == 1 or (primary and sentiment == "positive" and not alternative):
+        context = "primary_recommendation"
+    elif list_position is not None or alternative:
+        context = "alternative_listing"
+    elif parenthetical or words < PASSING_MAX_WORDS:
+        context = "passing_reference"
+    else:
+        context = "competitor_neutral"
+    return MentionLabel(sentiment, context)
+
+
+def classify_mentions(answer_text: str, mentions: Sequence[BrandMention]) -> list[MentionLabel]:
+    """
+    Label every mention of one answer with sentiment and mention context.
+
+    Args:
+        answer_text: Answer the mentions were detected in
+        mentions: Mentions with match_position set (e.g., from detect_mentions)
+
+    Returns:
+        list[MentionLabel]: One label per mention, in the order given
+    """
+    if not mentions:
+        return []
+
+    features = _AnswerFeatures(answer_text)
+    boundaries = [match.end() for match in _SENTENCE_END.finditer(answer_text)]
+    line_starts = [0, *(match.end() for match in re.finditer("\n", answer_text))]
+
+    # Group mentions by sentence, in text order, to find each window's end
+    order = sorted(range(len(mentions)), key=lambda i: mentions[i].match_position)
+    sentence_of = {i: bisect_right(boundaries, mentions[i].match_position) for i in order}
+    line_of = {i: bisect_right(line_starts, mentions[i].match_position) - 1 for i in order}
+    list_positions = _list_positions(answer_text, line_starts, set(line_of.values()))
+
+    labels: list[MentionLabel | None] = [None] * len(mentions)
+    first_in_sentence = None
+    for rank, i in enumerate(order):
+        mention = mentions[i]
+        sentence = sentence_of[i]
+        if rank == 0 or sentence_of[order[rank - 1]] != sentence:
+            first_in_sentence = mention
+        sentence_start = boundaries[sentence - 1] if sentence else 0
+        sentence_end = boundaries[sentence] if sentence < len(boundaries) else len(answer_text)
+
+        following = order[rank + 1] if rank + 1 < len(order) else None
+        segment_end = (
+            mentions[following].match_position
+            if following is not None and sentence_of[following] == sentence
+            else sentence_end
+        )
+        segment = features.window(mention.match_position + len(mention.original_text), segment_end)
+
+        # Sentence prefix before its first mention applies to all its mentions
+        prefix = features.window(sentence_start, first_in_sentence.match_position)
+
+        labels[i] = _label(
+            score=segment[0] + prefix[0],
+            primary=segment[1] + prefix[1],
+            alternative=segment[2] + prefix[2],
+            words=segment[3] + prefix[3],
+            list_position=list_positions.get(line_of[i]),
+            parenthetical=_in_parentheses(answer_text, sentence_start, mention.match_position),
+        )
+    return labels
+
+
+def label_mentions(answer_text: str, mentions: list[BrandMention]) -> list[BrandMention]:
+    """
+    Set sentiment and mention_context on mentions that have none yet.
+
+    Args:
+        answer_text: Answer the mentions were detected in
+        mentions: Mentions to label (modified in place)
+
+    Returns:
+        list[BrandMention]: The same mentions, for chaining
+    """
+    for mention, label in zip(mentions, classify_mentions(answer_text, mentions), strict=True):
+        if mention.sentiment is None:
+            mention.sentiment = label.sentiment
+        if mention.mention_context is None:
+            mention.mention_context = label.mention_context
+    return mentions
@@ -0,0 +1,190 @@
+"""
+Incremental brand mention matching for streamed LLM answers.
+
+IncrementalMentionMatcher consumes text deltas as a provider streams them
+and runs the same word-boundary patterns as detect_mentions() over only the
+newly arrived text (plus a small overlap), so mentions are known while the
+answer is still being generated.
+
+It records when the first brand mention arrived and can ask the stream to
+stop once the answer's ranked list is long enough to extract from, which
+saves output tokens on long answers.
+
+The final answer is still parsed by parse_answer(); the matcher only
+provides timing and the early-stop signal.
+
+Example:
+    >>> matcher = IncrementalMentionMatcher(
+    ...     our_brands=["Warmly"],
+    ...     competitor_brands=["HubSpot", "Instantly"],
+    ...     stop_after_ranked_items=2,
+    ... )
+    >>> matcher.feed("1. HubSpot\\n2. War")
+    False
+    >>> matcher.feed("mly\\n3. Instantly")
+    True
+    >>> [m.normalized_name for m in matcher.finish()]
+    ['HubSpot', 'Warmly', 'Instantly']
+"""
+
+import re
+import time
+
+from llm_answer_watcher.extractor.mention_detector import (
+    BrandMention,
+    _compile_brand_patterns,
+    remove_overlapping_mentions,
+)
+
+# Same numbered-item shape as rank_extractor ("1. Tool" / "2) Tool"),
+# also allowing markdown bold around the number ("**1.** Tool")
+_NUMBERED_ITEM = re.compile(r"^\s*(?:\*\*)?\d+[.)](?:\*\*)?\s+\S")
+
+
+class IncrementalMentionMatcher:
+    """
+    Detects brand mentions and ranked list items as text streams in.
+
+    feed() is the on_chunk callback for StreamingLLMClient.stream_answer().
+    A match touching the end of the buffer is not accepted until more text
+    arrives (or finish() is called), because the next delta could extend it
+    past a word boundary ("Hub" -> "HubSpot").
+
+    Attributes:
+        first_mention_ms: Milliseconds from matcher creation to the delta
+            that completed the first brand mention (None if none yet)
+        ranked_items: Completed numbered list lines that mention a brand
+        stopped: Whether feed() has asked the stream to stop
+    """
+
+    def __init__(
+        self,
+        our_brands: list[str],
+        competitor_brands: list[str],
+        stop_after_ranked_items: int | None = None,
+    ):
+        """
+        Create a matcher for one streamed answer.
+
+        Args:
+            our_brands: Brands representing "us"
+            competitor_brands: Competitor brands
+            stop_after_ranked_items: Stop the stream once this many numbered
+                list items mentioning a brand have completed. None disables
+                early stop.
+
+        Raises:
+            ValueError: If stop_after_ranked_items is less than 1
+        """
+        if stop_after_ranked_items is not None and stop_after_ranked_items < 1:
+            raise ValueError("stop_after_ranked_items must be at least 1")
+
+        self._patterns = _compile_brand_patterns(
+            tuple(our_brands or []), tuple(competitor_brands or [])
+        )
+        # Rescan this many characters before the scanned boundary so a brand
+        # split across deltas is still found
+        self._overlap = max((len(alias) for alias, *_ in self._patterns), default=0)
+        self.stop_after_ranked_items = stop_after_ranked_items
+
+        self.first_mention_ms: float | None = None
+        self.ranked_items = 0
+        self.stopped = False
+
+        self._parts: list[str] = []
+        self._text = ""
+        self._scanned = 0
+        self._line_start = 0
+        self._mentions: dict[str, BrandMention] = {}
+        self._start = time.perf_counter()
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return self._text
+
+    @property
+    def mentions(self) -> list[BrandMention]:
+        """Mentions accepted so far, in order of appearance."""
+        return remove_overlapping_mentions(list(self._mentions.values()))
+
+    def feed(self, delta: str) -> bool:
+        """
+        Consume a text delta.
+
+        Args:
+            delta: Next chunk of streamed answer text
+
+        Returns:
+            bool: True if the stream should stop (enough ranked items seen)
+        """
+        if not delta or self.stopped:
+            return self.stopped
+
+        self._text += delta
+        self._scan(final=False)
+        self._count_ranked_lines(final=False)
+
+        if (
+            self.stop_after_ranked_items is not None
+            and self.ranked_items >= self.stop_after_ranked_items
+        ):
+            self.stopped = True
+        return self.stopped
+
+    def finish(self) -> list[BrandMention]:
+        """
+        Scan the tail of the buffer once the stream has ended.
+
+        Returns:
+            list[BrandMention]: All mentions, deduplicated per brand and
+                sorted by position (same rules as detect_mentions())
+        """
+        self._scan(final=True)
+        self._count_ranked_lines(final=True)
+        return self.mentions
+
+    def _scan(self, final: bool) -> None:
+        text = self._text
+        start = max(0, self._scanned - self._overlap)
+        end = len(text)
+        found = False
+
+        for _alias, primary_name, category, pattern in self._patterns:
+            for match in pattern.finditer(text, start):
+                # A match ending at the buffer edge may grow with the next delta
+                if match.end() >= end and not final:
+                    continue
+                key = primary_name.lower()
+                existing = self._mentions.get(key)
+                if existing is not None and existing.match_position <= match.start():
+                    continue
+                self._mentions[key] = BrandMention(
+                    original_text=match.group(0),
+                    normalized_name=existing.normalized_name if existing else primary_name,
+                    brand_category=category,
+                    match_position=match.start(),
+                )
+                found = True
+
+        if found and self.first_mention_ms is None:
+            self.first_mention_ms = round((time.perf_counter() - self._start) * 1000, 3)
+        self._scanned = end
+
+    def _count_ranked_lines(self, final: bool) -> None:
+        text = self._text
+        while True:
+            newline = text.find("\n", self._line_start)
+            if newline == -1:
+                if final and self._line_start < len(text):
+                    self._count_line(text[self._line_start :])
+                    self._line_start = len(text)
+                return
+            self._count_line(text[self._line_start : newline])
+            self._line_start = newline + 1
+
+    def _count_line(self, line: str) -> None:
+        if _NUMBERED_ITEM.match(line) and any(
+            pattern.search(line) for *_, pattern in self._patterns
+        ):
+            self.ranked_items += 1
@@ -11,6 +11,8 @@ Key features:
 - Automatic cost estimation based on token usage
 - UTC timestamp tracking
 - Configurable system message per model
+- Prompt caching: the system prompt is marked with cache_control so repeated
+  queries read it from Anthropic's prompt cache
 - Security: NEVER logs API keys
 
 Example:
@@ -22,17 +24,25 @@ Example:
     >>> print(f"Cost: ${response.cost_usd:.6f}")
 """
 
+import json
 import logging
 from typing import Any
 
 import httpx
 
+from llm_answer_watcher.llm_runner.batch import BatchStatus
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
+from llm_answer_watcher.llm_runner.streaming import (
+    ChunkCallback,
+    StreamTracker,
+    estimate_tokens,
+    iter_sse_json,
+)
 from llm_answer_watcher.utils.cost import estimate_cost
 from llm_answer_watcher.utils.time import utc_timestamp
 
@@ -41,7 +51,8 @@ httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
 # Anthropic API endpoint
-ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_API_BASE_URL = "https://api.anthropic.com/v1"
+ANTHROPIC_API_URL = f"{ANTHROPIC_API_BASE_URL}/messages"
 
 # Anthropic API version header (required)
 ANTHROPIC_VERSION = "2023-06-01"
@@ -93,7 +104,9 @@ class AnthropicClient:
 
     Note:
         This implementation uses async/await for parallel execution.
-        Streaming is not supported in v1.
+        stream_answer() streams the same request over server-sent events.
+        submit_batch() and friends run prompts through the provider Batch API
+        (see llm_runner.batch).
     """
 
     def __init__(
@@ -103,6 +116,8 @@ class AnthropicClient:
         system_prompt: str,
         tools: list[dict] | None = None,
         tool_choice: str = "auto",
+        *,
+        base_url: str | None = None,
     ):
         """
         Initialize Anthropic client with model, API key, system prompt, and optional tools.
@@ -113,6 +128,8 @@ class AnthropicClient:
             system_prompt: System message for context/instructions
             tools: Optional list of tool configurations (not currently supported)
             tool_choice: Tool selection mode (not currently supported)
+            base_url: Optional API base URL override for proxies or the local
+                stand-in server. Default: https://api.anthropic.com/v1
 
         Raises:
             ValueError: If model_name, api_key, or system_prompt is empty
@@ -146,6 +163,7 @@ class AnthropicClient:
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_choice = tool_choice
+        self.base_url = (base_url or ANTHROPIC_API_BASE_URL).rstrip("/")
 
         # Log warning if tools are provided (not yet supported)
         if tools:
@@ -207,45 +225,18 @@ class AnthropicClient:
             If a non-retryable error occurs (e.g., 401), it checks the status
             code and raises immediately without retry.
         """
-        # Validate prompt is not empty
-        if not prompt or prompt.isspace():
-            raise ValueError("Prompt cannot be empty")
-
-        # Validate prompt length to prevent excessive API costs
-        if len(prompt) > MAX_PROMPT_LENGTH:
-            raise ValueError(
-                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
-                f"(received {len(prompt):,} characters). "
-                f"Please shorten your prompt to stay within the limit."
-            )
-
-        # Build request payload
-        # Anthropic Messages API uses 'messages' array with role/content objects
-        payload = {
-            "model": self.model_name,
-            "max_tokens": DEFAULT_MAX_TOKENS,  # Required by Anthropic API
-            "system": self.system_prompt,  # System prompt is separate parameter
-            "messages": [
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.7,  # Default temperature for consistency
-        }
-
-        # Build headers (NEVER log api_key)
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": ANTHROPIC_VERSION,
-            "content-type": "application/json",
-        }
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
+        headers = self._build_headers()
 
         # Log request (NEVER log api_key or headers)
         logger.debug(f"Sending request to Anthropic: model={self.model_name}")
 
-        # Make async HTTP request with context manager for proper cleanup
+        # Make async HTTP request over the shared connection pool
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
-                    ANTHROPIC_API_URL,
+                    f"{self.base_url}/messages",
                     json=payload,
                     headers=headers,
                 )
@@ -294,16 +285,324 @@ class AnthropicClient:
         except Exception as e:
             raise RuntimeError(f"Failed to parse Anthropic response JSON: {e}") from e
 
+        return self._parse_response_data(data)
+
+    @create_retry_decorator()
+    async def stream_answer(
+        self, prompt: str, on_chunk: ChunkCallback | None = None
+    ) -> LLMResponse:
+        """
+        Stream an answer over server-sent events, calling on_chunk per text delta.
+
+        Sends the same request as generate_answer() with "stream": true.
+        Input tokens come from the message_start event and output tokens
+        from message_delta, so a completed stream reports exact usage.
+
+        Args:
+            prompt: User intent prompt to send to the LLM
+            on_chunk: Optional callback receiving each text delta; return True
+                to stop generation early (see llm_runner.streaming)
+
+        Returns:
+            LLMResponse: Same as generate_answer(), plus ttft_ms,
+                tokens_per_second and stopped_early
+
+        Raises:
+            ValueError: If prompt is empty or too long
+            RuntimeError: On permanent failures, stream error events, or
+                transport errors after the first delta
+            httpx.HTTPStatusError: On retryable HTTP errors after retries exhausted
+        """
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
+        payload["stream"] = True
+        headers = self._build_headers()
+        tracker = StreamTracker(on_chunk)
+        input_tokens: int | None = None
+        output_tokens: int | None = None
+        cache_read_tokens = cache_write_tokens = 0
+
+        logger.debug(f"Streaming request to Anthropic: model={self.model_name}")
+
+        try:
+            async with (
+                pooled_client() as client,
+                client.stream(
+                    "POST", f"{self.base_url}/messages", json=payload, headers=headers
+                ) as response,
+            ):
+                if response.status_code >= 400:
+                    await response.aread()
+                    if response.status_code in NO_RETRY_STATUS_CODES:
+                        raise RuntimeError(
+                            f"Anthropic API error (non-retryable): "
+                            f"status={response.status_code}, "
+                            f"model={self.model_name}, "
+                            f"detail={self._extract_error_detail(response)}"
+                        )
+                    response.raise_for_status()
+
+                async for event, data in iter_sse_json(response):
+                    event_type = data.get("type") or event
+                    if event_type == "message_start":
+                        usage = (data.get("message") or {}).get("usage") or {}
+                        input_tokens = usage.get("input_tokens", input_tokens)
+                        cache_read_tokens, cache_write_tokens = self._extract_cache_usage(
+                            usage
+                        )
+                    elif event_type == "content_block_delta":
+                        delta = data.get("delta") or {}
+                        if delta.get("type") == "text_delta" and tracker.add(
+                            delta.get("text", "")
+                        ):
+                            break
+                    elif event_type == "message_delta":
+                        usage = data.get("usage") or {}
+                        output_tokens = usage.get("output_tokens", output_tokens)
+                    elif event_type == "error":
+                        raise RuntimeError(
+                            f"Anthropic stream error: model={self.model_name}, "
+                            f"detail={data.get('error')}"
+                        )
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Anthropic API HTTP error: "
+                f"status={e.response.status_code}, "
+                f"model={self.model_name}, "
+                f"detail={self._extract_error_detail(e.response)}"
+            )
+            raise
+
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            logger.error(f"Anthropic stream error: model={self.model_name}, error={e}")
+            raise tracker.interrupted("Anthropic", self.model_name, e) from e
+
+        answer_text = tracker.text
+        prompt_tokens = (
+            int(input_tokens or estimate_tokens(self.system_prompt + prompt))
+            + cache_read_tokens
+            + cache_write_tokens
+        )
+        # output_tokens arrives with message_delta at the end; estimate if stopped early
+        completion_tokens = (
+            int(output_tokens)
+            if output_tokens is not None and not tracker.stopped_early
+            else estimate_tokens(answer_text)
+        )
+
+        llm_response = self._build_llm_response(
+            answer_text,
+            tokens_used=prompt_tokens + completion_tokens,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cache_read_tokens,
+            cache_write_tokens=cache_write_tokens,
+        )
+        llm_response.ttft_ms = tracker.ttft_ms
+        llm_response.tokens_per_second = tracker.tokens_per_second(completion_tokens)
+        llm_response.stopped_early = tracker.stopped_early
+        return llm_response
+
+    @create_retry_decorator()
+    async def submit_batch(self, prompts: dict[str, str]) -> str:
+        """
+        Submit prompts as one Message Batches job.
+
+        Each request uses the same params as generate_answer().
+
+        Args:
+            prompts: Prompts keyed by custom ID
+
+        Returns:
+            str: Batch ID for get_batch_status()
+
+        Raises:
+            ValueError: If any prompt is empty or too long
+            RuntimeError: On permanent failures (auth errors, invalid requests)
+            httpx.HTTPStatusError: On retryable HTTP errors after retries exhausted
+        """
+        requests = []
+        for custom_id, prompt in prompts.items():
+            self._validate_prompt(prompt)
+            requests.append({"custom_id": custom_id, "params": self._build_payload(prompt)})
+
+        logger.debug(
+            f"Submitting Anthropic batch: model={self.model_name}, requests={len(prompts)}"
+        )
+
+        async with pooled_client() as client:
+            response = await client.post(
+                f"{self.base_url}/messages/batches",
+                json={"requests": requests},
+                headers=self._build_headers(),
+            )
+            self._raise_for_batch_status(response, "batch create")
+
+        return str(response.json()["id"])
+
+    @create_retry_decorator()
+    async def get_batch_status(self, batch_id: str) -> BatchStatus:
+        """
+        Fetch the state of a Message Batches job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            BatchStatus: "completed" with the results URL once processing has
+                ended (individual requests may still have errored), else "pending"
+        """
+        async with pooled_client() as client:
+            response = await client.get(
+                f"{self.base_url}/messages/batches/{batch_id}",
+                headers=self._build_headers(),
+            )
+            self._raise_for_batch_status(response, "batch status")
+
+        data = response.json()
+        if data.get("processing_status") != "ended":
+            return BatchStatus(batch_id=batch_id, state="pending")
+        return BatchStatus(
+            batch_id=batch_id,
+            state="completed",
+            output_ref=data.get("results_url")
+            or f"{self.base_url}/messages/batches/{batch_id}/results",
+        )
+
+    @create_retry_decorator()
+    async def get_batch_results(
+        self, status: BatchStatus
+    ) -> dict[str, LLMResponse | Exception]:
+        """
+        Download and parse the JSONL results of an ended job.
+
+        Args:
+            status: Finished status from get_batch_status()
+
+        Returns:
+            dict: Custom ID -> LLMResponse, or RuntimeError for errored,
+                canceled or expired requests
+        """
+        async with pooled_client() as client:
+            response = await client.get(status.output_ref, headers=self._build_headers())
+            self._raise_for_batch_status(response, "batch results")
+
+        results: dict[str, LLMResponse | Exception] = {}
+        for line in response.text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            result = item.get("result") or {}
+            if result.get("type") == "succeeded":
+                try:
+                    results[item.get("custom_id")] = self._parse_response_data(
+                        result.get("message") or {}
+                    )
+                except RuntimeError as e:
+                    results[item.get("custom_id")] = e
+            else:
+                results[item.get("custom_id")] = RuntimeError(
+                    f"Anthropic batch request {result.get('type', 'failed')}: "
+                    f"model={self.model_name}, custom_id={item.get('custom_id')}, "
+                    f"detail={result.get('error')}"
+                )
+        return results
+
+    def _raise_for_batch_status(self, response: httpx.Response, action: str) -> None:
+        """Fail fast on permanent errors; raise retryable HTTP errors for @retry."""
+        if response.status_code in NO_RETRY_STATUS_CODES:
+            raise RuntimeError(
+                f"Anthropic API error (non-retryable): "
+                f"status={response.status_code}, "
+                f"model={self.model_name}, "
+                f"action={action}, "
+                f"detail={self._extract_error_detail(response)}"
+            )
+        response.raise_for_status()
+
+    def _parse_response_data(self, data: dict[str, Any]) -> LLMResponse:
+        """Build an LLMResponse from a Messages API response body."""
         # Extract answer text
         answer_text = self._extract_answer_text(data)
 
         # Extract token usage (input and output)
         tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
+        cached_tokens, cache_write_tokens = self._extract_cache_usage(data.get("usage"))
 
-        # Calculate cost
+        return self._build_llm_response(
+            answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=cache_write_tokens,
+        )
+
+    def _validate_prompt(self, prompt: str) -> None:
+        """Reject empty prompts and prompts over MAX_PROMPT_LENGTH."""
+        # Validate prompt is not empty
+        if not prompt or prompt.isspace():
+            raise ValueError("Prompt cannot be empty")
+
+        # Validate prompt length to prevent excessive API costs
+        if len(prompt) > MAX_PROMPT_LENGTH:
+            raise ValueError(
+                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
+                f"(received {len(prompt):,} characters). "
+                f"Please shorten your prompt to stay within the limit."
+            )
+
+    def _build_payload(self, prompt: str) -> dict[str, Any]:
+        """Build the Messages API request payload for a prompt."""
+        # Build request payload
+        # Anthropic Messages API uses 'messages' array with role/content objects
+        # The system prompt is identical for every query of this model, so it
+        # is marked as a prompt cache breakpoint. Prompts shorter than the
+        # model's minimum cacheable length are processed without caching.
+        payload = {
+            "model": self.model_name,
+            "max_tokens": DEFAULT_MAX_TOKENS,  # Required by Anthropic API
+            "system": [  # System prompt is separate parameter
+                {
+                    "type": "text",
+                    "text": self.system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ],
+            "messages": [
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.7,  # Default temperature for consistency
+        }
+
+        return payload
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers (NEVER log the result)."""
+        return {
+            "x-api-key": self.api_key,
+            "anthropic-version": ANTHROPIC_VERSION,
+            "content-type": "application/json",
+        }
+
+    def _build_llm_response(
+        self,
+        answer_text: str,
+        *,
+        tokens_used: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0,
+    ) -> LLMResponse:
+        """Estimate cost and assemble the LLMResponse."""
+        # Calculate cost (cache reads and writes are priced separately)
         usage_meta = {
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_write_tokens": cache_write_tokens,
         }
         cost_usd = estimate_cost("anthropic", self.model_name, usage_meta)
 
@@ -322,6 +621,7 @@ class AnthropicClient:
             timestamp_utc=timestamp,
             web_search_results=None,  # Web search not supported in v1
             web_search_count=0,
+            cached_tokens=cached_tokens,
         )
 
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
@@ -373,7 +673,8 @@ class AnthropicClient:
 
         Returns:
             tuple[int, int, int]: (total_tokens, input_tokens, output_tokens)
-                All values default to 0 if unavailable
+                All values default to 0 if unavailable. input_tokens includes
+                tokens read from and written to the prompt cache.
 
         Note:
             Returns (0, 0, 0) if usage data is missing (graceful degradation).
@@ -387,8 +688,10 @@ class AnthropicClient:
             )
             return 0, 0, 0
 
-        # Anthropic uses 'input_tokens' and 'output_tokens'
-        input_tokens = usage.get("input_tokens", 0)
+        # Anthropic uses 'input_tokens' and 'output_tokens'; input_tokens
+        # excludes prompt cache reads and writes, which are reported separately
+        cache_read_tokens, cache_write_tokens = self._extract_cache_usage(usage)
+        input_tokens = (usage.get("input_tokens") or 0) + cache_read_tokens + cache_write_tokens
         output_tokens = usage.get("output_tokens", 0)
         total_tokens = input_tokens + output_tokens
 
@@ -398,6 +701,21 @@ class AnthropicClient:
             int(output_tokens) if output_tokens else 0,
         )
 
+    def _extract_cache_usage(self, usage: dict[str, Any] | None) -> tuple[int, int]:
+        """
+        Extract prompt cache token counts from an Anthropic usage object.
+
+        Returns:
+            tuple[int, int]: (cache_read_input_tokens, cache_creation_input_tokens),
+                0 when not reported
+        """
+        if not isinstance(usage, dict):
+            return 0, 0
+        return (
+            int(usage.get("cache_read_input_tokens") or 0),
+            int(usage.get("cache_creation_input_tokens") or 0),
+        )
+
     def _extract_error_detail(self, response: httpx.Response) -> str:
         """
         Extract error detail from Anthropic Messages API error response.
@@ -213,6 +213,7 @@ class APIRunnerPlugin:
                 - system_prompt: System prompt (optional)
                 - tools: Tool configurations (optional)
                 - tool_choice: Tool selection mode (optional)
+                - base_url: API base URL override (optional)
 
         Returns:
             IntentRunner: Configured APIRunner instance
@@ -227,6 +228,7 @@ class APIRunnerPlugin:
         system_prompt = config.get("system_prompt", "")
         tools = config.get("tools")
         tool_choice = config.get("tool_choice", "auto")
+        base_url = config.get("base_url")
 
         # Build LLMClient using existing factory
         client = build_client(
@@ -236,6 +238,7 @@ class APIRunnerPlugin:
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
         # Create runner name
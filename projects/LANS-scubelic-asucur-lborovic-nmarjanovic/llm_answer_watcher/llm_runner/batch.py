@@ -0,0 +1,252 @@
+"""
+Provider Batch API execution for scheduled runs.
+
+OpenAI (Batch API over /v1/responses) and Anthropic (Message Batches) accept
+many requests in one job, process them asynchronously within 24 hours, and
+bill them at half the synchronous token price. Batch jobs are not subject to
+per-request rate limits, which makes them a good fit for nightly monitoring
+runs that do not need interactive latency.
+
+Clients that support batches expose:
+
+    async def submit_batch(self, prompts: dict[str, str]) -> str
+    async def get_batch_status(self, batch_id: str) -> BatchStatus
+    async def get_batch_results(
+        self, status: BatchStatus
+    ) -> dict[str, LLMResponse | Exception]
+
+run_batch() drives one job (submit, poll with backoff, collect results) and
+collect_batch_responses() runs one job per configured model so run_all() can
+feed the responses through the normal raw/parsed/DB pipeline.
+
+Example:
+    >>> responses = await collect_batch_responses(config.models, config.intents)
+    >>> responses[("best-crm", "openai", "gpt-4o-mini")].answer_text
+    'Here are the top CRM tools...'
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
+
+from .models import LLMResponse, build_client, has_function_tools
+
+logger = logging.getLogger(__name__)
+
+# Providers with a batch endpoint implemented by their client
+BATCH_PROVIDERS = ("openai", "anthropic")
+
+# Batch jobs are billed at 50% of synchronous token prices
+BATCH_COST_DISCOUNT = 0.5
+
+# Polling defaults: jobs usually finish in minutes to hours, so start slow
+# and back off to avoid hammering the status endpoint
+DEFAULT_POLL_INTERVAL_SECONDS = 30.0
+MAX_POLL_INTERVAL_SECONDS = 600.0
+POLL_BACKOFF_FACTOR = 1.5
+DEFAULT_BATCH_TIMEOUT_SECONDS = 24 * 60 * 60  # Provider completion window
+
+# Key identifying one query in a run: (intent_id, provider, model_name)
+QueryKey = tuple[str, str, str]
+
+
+@dataclass
+class BatchStatus:
+    """
+    Provider-neutral state of a batch job.
+
+    Attributes:
+        batch_id: Provider batch identifier
+        state: "pending" while processing, "completed" when results are
+            ready, "failed" if the job failed, expired or was cancelled
+        output_ref: Where results are read from (OpenAI output file ID,
+            Anthropic results URL); may be set for failed jobs with
+            partial results
+        error_ref: Where per-request errors are read from (OpenAI error file ID)
+        error_message: Job-level failure detail for failed jobs
+    """
+
+    batch_id: str
+    state: Literal["pending", "completed", "failed"]
+    output_ref: str | None = None
+    error_ref: str | None = None
+    error_message: str | None = None
+
+
+class BatchLLMClient(Protocol):
+    """LLM client that can run prompts through a provider Batch API."""
+
+    model_name: str
+
+    async def submit_batch(self, prompts: dict[str, str]) -> str:
+        """Submit prompts keyed by custom ID, returning the batch ID."""
+        ...
+
+    async def get_batch_status(self, batch_id: str) -> BatchStatus:
+        """Fetch the current state of a batch job."""
+        ...
+
+    async def get_batch_results(self, status: BatchStatus) -> dict[str, LLMResponse | Exception]:
+        """Read results of a finished job, keyed by custom ID."""
+        ...
+
+
+def supports_batch(client: Any) -> bool:
+    """Whether a client implements the batch methods."""
+    return all(
+        callable(getattr(client, name, None))
+        for name in ("submit_batch", "get_batch_status", "get_batch_results")
+    )
+
+
+def batch_eligible(model: Any) -> bool:
+    """
+    Whether a configured model can run in batch mode.
+
+    Function-calling models are excluded because their answers feed
+    follow-up requests that must run synchronously.
+    """
+    return model.provider in BATCH_PROVIDERS and not has_function_tools(model.tools)
+
+
+async def run_batch(
+    client: BatchLLMClient,
+    prompts: dict[str, str],
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    timeout: float = DEFAULT_BATCH_TIMEOUT_SECONDS,
+) -> dict[str, LLMResponse | Exception]:
+    """
+    Submit one batch job, poll until it finishes, and collect its results.
+
+    Polling starts at poll_interval and grows by POLL_BACKOFF_FACTOR up to
+    MAX_POLL_INTERVAL_SECONDS. Costs of successful responses are discounted
+    by BATCH_COST_DISCOUNT.
+
+    Args:
+        client: Client implementing BatchLLMClient
+        prompts: Prompts keyed by custom ID (unique within the job)
+        poll_interval: Seconds before the first status check
+        timeout: Give up after this many seconds without completion
+
+    Returns:
+        dict: Custom ID -> LLMResponse, or the exception for requests that
+            failed or are missing from the output
+
+    Raises:
+        RuntimeError: If the job fails without results or times out
+    """
+    if not prompts:
+        return {}
+
+    batch_id = await client.submit_batch(prompts)
+    logger.info(
+        f"Submitted batch: model={client.model_name}, batch_id={batch_id}, requests={len(prompts)}"
+    )
+
+    deadline = time.monotonic() + timeout
+    delay = poll_interval
+    while True:
+        await asyncio.sleep(delay)
+        status = await client.get_batch_status(batch_id)
+        if status.state != "pending":
+            break
+        if time.monotonic() >= deadline:
+            raise RuntimeError(
+                f"Batch did not finish within {timeout:.0f}s: "
+                f"model={client.model_name}, batch_id={batch_id}"
+            )
+        delay = min(delay * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_SECONDS)
+
+    if status.state == "failed" and not status.output_ref:
+        raise RuntimeError(
+            f"Batch failed: model={client.model_name}, batch_id={batch_id}, "
+            f"detail={status.error_message}"
+        )
+
+    results = await client.get_batch_results(status)
+
+    collected: dict[str, LLMResponse | Exception] = {}
+    for custom_id in prompts:
+        result = results.get(custom_id)
+        if result is None:
+            result = RuntimeError(
+                f"Batch returned no result: model={client.model_name}, "
+                f"batch_id={batch_id}, custom_id={custom_id}, "
+                f"detail={status.error_message}"
+            )
+        elif isinstance(result, LLMResponse):
+            result.cost_usd = round(result.cost_usd * BATCH_COST_DISCOUNT, 8)
+        collected[custom_id] = result
+
+    succeeded = sum(isinstance(r, LLMResponse) for r in collected.values())
+    logger.info(
+        f"Batch finished: model={client.model_name}, batch_id={batch_id}, "
+        f"succeeded={succeeded}/{len(prompts)}"
+    )
+    return collected
+
+
+async def collect_batch_responses(
+    models: list[Any],
+    intents: list[Any],
+    poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    timeout: float = DEFAULT_BATCH_TIMEOUT_SECONDS,
+    skip: Collection[QueryKey] = (),
+) -> dict[QueryKey, LLMResponse | Exception]:
+    """
+    Run every intent for every batch-eligible model as one job per model.
+
+    Jobs for different models run concurrently. Models that are not eligible
+    (see batch_eligible()) are skipped; the caller queries them synchronously.
+    A job-level failure is recorded as the exception for each of its queries,
+    so it surfaces through the normal per-query error handling.
+
+    Args:
+        models: RuntimeModel list from the run config
+        intents: Intent list from the run config
+        poll_interval: Seconds before the first status check
+        timeout: Give up on a job after this many seconds
+        skip: Queries left out of the jobs (e.g. answers that are still fresh)
+
+    Returns:
+        dict: (intent_id, provider, model_name) -> LLMResponse or exception
+    """
+
+    async def run_model(model) -> dict[QueryKey, LLMResponse | Exception]:
+        model_intents = [
+            intent
+            for intent in intents
+            if (intent.id, model.provider, model.model_name) not in skip
+        ]
+        if not model_intents:
+            return {}
+        client = build_client(
+            provider=model.provider,
+            model_name=model.model_name,
+            api_key=model.api_key,
+            system_prompt=model.system_prompt,
+            tools=model.tools,
+            tool_choice=model.tool_choice,
+            base_url=model.base_url,
+        )
+        # Provider custom IDs are restricted to [a-zA-Z0-9_-]{1,64}, so
+        # intents are referenced by index rather than by ID
+        prompts = {f"intent-{i}": intent.prompt for i, intent in enumerate(model_intents)}
+        try:
+            results = await run_batch(client, prompts, poll_interval, timeout)
+        except Exception as e:
+            logger.error(f"Batch job failed: model={model.provider}/{model.model_name}: {e}")
+            results = dict.fromkeys(prompts, e)
+        return {
+            (intent.id, model.provider, model.model_name): results[f"intent-{i}"]
+            for i, intent in enumerate(model_intents)
+        }
+
+    eligible = [model for model in models if batch_eligible(model)]
+    collected: dict[QueryKey, LLMResponse | Exception] = {}
+    for results in await asyncio.gather(*(run_model(model) for model in eligible)):
+        collected.update(results)
+    return collected
@@ -34,11 +34,6 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 
-try:
-    from steel import Steel
-except ImportError:
-    Steel = None
-
 from ...utils.time import utc_timestamp
 
 logger = logging.getLogger(__name__)
@@ -124,7 +119,11 @@ class SteelBaseRunner:
         Raises:
             ImportError: If steel-sdk is not installed
         """
-        if Steel is None:
+        # Imported here rather than at module level: the SDK is slow to import
+        # and only needed when a browser runner is actually used
+        try:
+            from steel import Steel
+        except ImportError:
             raise ImportError(
                 "Steel SDK is not installed. Install it with: pip install steel-sdk"
             )
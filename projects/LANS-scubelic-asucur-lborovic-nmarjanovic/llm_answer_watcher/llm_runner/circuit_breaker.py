@@ -0,0 +1,244 @@
+"""
+Per-provider/model circuit breakers for provider outages.
+
+Without a breaker, every queued query for a provider that is down still goes
+through the full retry budget (3 attempts with exponential backoff), holding
+concurrency slots and delaying healthy providers. A CircuitBreaker tracks the
+outcome of the most recent calls to one provider/model. Only transient
+failures count against a provider (timeouts, transport errors, 429 and 5xx
+responses; see is_transient_failure()): a 400/401/404 or an invalid prompt
+is the caller's problem, so it neither opens the circuit nor counts as a
+success.
+
+- closed: calls go through. Once at least min_calls of the last window_size
+  calls are recorded and the failure rate reaches failure_rate_threshold,
+  the circuit opens.
+- open: calls fail immediately with LLMCircuitOpenError, and calls already
+  retrying stop at their next retry decision (see retry_config). After
+  open_seconds the circuit half-opens.
+- half_open: a single probe call goes through while others keep failing
+  fast. A successful probe closes the circuit; a failed one reopens it.
+
+Every state transition is logged and kept for the run summary.
+
+Example:
+    >>> breakers = CircuitBreakers(config.run_settings.circuit_breaker)
+    >>> with breakers.get("openai", "gpt-4o-mini").guard():
+    ...     response = await client.generate_answer(prompt)
+    >>> breakers.summary()["transitions"]
+    []
+"""
+
+import contextvars
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+
+from ..exceptions import LLMCircuitOpenError, LLMRateLimitError, LLMTimeoutError
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Response statuses that say the provider, not the request, is failing
+TRANSIENT_STATUS_CODES = frozenset([408, 429])
+
+_current_breaker: contextvars.ContextVar["CircuitBreaker | None"] = contextvars.ContextVar(
+    "current_circuit_breaker", default=None
+)
+
+
+def current_circuit_open() -> bool:
+    """
+    Whether the circuit guarding the current call is open.
+
+    Used as a tenacity stop condition so in-flight retries end as soon as
+    their provider's circuit opens. False outside of a guarded call.
+    """
+    breaker = _current_breaker.get()
+    return breaker is not None and breaker.state == STATE_OPEN
+
+
+def is_transient_failure(error: BaseException) -> bool:
+    """
+    Whether a failed call counts against the provider's health.
+
+    Timeouts, transport errors, 408/429 and 5xx responses count, also when
+    wrapped in another exception (e.g., a stream interrupted after its first
+    token). Permanent errors (non-retryable 400/401/404 responses, invalid
+    prompts, malformed responses) do not.
+    """
+    while error is not None:
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status in TRANSIENT_STATUS_CODES or status >= 500
+        if isinstance(
+            error, httpx.TransportError | TimeoutError | LLMRateLimitError | LLMTimeoutError
+        ):
+            return True
+        error = error.__cause__
+    return False
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider/model.
+
+    Attributes:
+        key: "provider/model"
+        state: STATE_CLOSED, STATE_OPEN or STATE_HALF_OPEN
+        short_circuited: Calls rejected without contacting the provider
+    """
+
+    def __init__(
+        self,
+        key: str,
+        config: Any,
+        clock: Callable[[], float] = time.monotonic,
+        on_transition: Callable[[dict], None] | None = None,
+    ):
+        self.key = key
+        self.config = config
+        self.state = STATE_CLOSED
+        self.short_circuited = 0
+        self._clock = clock
+        self._on_transition = on_transition
+        self._outcomes: deque[bool] = deque(maxlen=config.window_size)  # True = failed
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def _transition(self, new_state: str, reason: str) -> None:
+        event = {"model": self.key, "from": self.state, "to": new_state, "reason": reason}
+        logger.warning(f"Circuit {self.key}: {self.state} -> {new_state} ({reason})")
+        self.state = new_state
+        if new_state == STATE_OPEN:
+            self._opened_at = self._clock()
+        if new_state == STATE_CLOSED:
+            self._outcomes.clear()
+        if self._on_transition:
+            self._on_transition(event)
+
+    def allow_call(self) -> bool:
+        """
+        Whether a call may be sent now (claims the probe slot when half-open).
+
+        Returns:
+            bool: False if the call should be short-circuited
+        """
+        if self.state == STATE_OPEN and self._clock() - self._opened_at >= self.config.open_seconds:
+            self._transition(STATE_HALF_OPEN, f"probing after {self.config.open_seconds:g}s")
+        if self.state == STATE_CLOSED:
+            return True
+        if self.state == STATE_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.state == STATE_HALF_OPEN:
+            self._probe_in_flight = False
+            self._transition(STATE_CLOSED, "probe succeeded")
+            return
+        self._outcomes.append(False)
+
+    def record_failure(self) -> None:
+        """Record a transiently failed call (after its retries)."""
+        if self.state == STATE_HALF_OPEN:
+            self._probe_in_flight = False
+            self._transition(STATE_OPEN, "probe failed")
+            return
+        self._outcomes.append(True)
+        if self.state != STATE_CLOSED or len(self._outcomes) < self.config.min_calls:
+            return
+        failure_rate = sum(self._outcomes) / len(self._outcomes)
+        if failure_rate >= self.config.failure_rate_threshold:
+            self._transition(
+                STATE_OPEN,
+                f"failure rate {failure_rate:.0%} over last {len(self._outcomes)} calls",
+            )
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one call under the breaker.
+
+        Transient failures are recorded; other exceptions propagate without
+        an outcome (a half-open probe is released for the next call).
+
+        Raises:
+            LLMCircuitOpenError: If the circuit rejects the call
+        """
+        if not self.allow_call():
+            raise LLMCircuitOpenError(
+                f"Circuit open for {self.key}: skipped after repeated provider failures"
+            )
+        probe = self.state == STATE_HALF_OPEN
+        token = _current_breaker.set(self)
+        try:
+            yield
+        except Exception as e:
+            if is_transient_failure(e):
+                self.record_failure()
+            raise
+        else:
+            self.record_success()
+        finally:
+            _current_breaker.reset(token)
+            if probe:
+                self._probe_in_flight = False  # Probe cancelled without an outcome
+
+
+class CircuitBreakers:
+    """
+    Circuit breakers of one run, keyed by provider/model.
+
+    Attributes:
+        transitions: State transitions in order, for the run summary
+    """
+
+    def __init__(self, config: Any, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self.transitions: list[dict] = []
+        self._clock = clock
+        self._start = clock()
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def _record_transition(self, event: dict) -> None:
+        self.transitions.append({**event, "elapsed_s": round(self._clock() - self._start, 3)})
+
+    def get(self, provider: str, model_name: str) -> CircuitBreaker:
+        """Breaker for a provider/model (created closed on first use)."""
+        key = f"{provider}/{model_name}"
+        if key not in self._breakers:
+            self._breakers[key] = CircuitBreaker(
+                key, self.config, clock=self._clock, on_transition=self._record_transition
+            )
+        return self._breakers[key]
+
+    @contextmanager
+    def guard(self, provider: str, model_name: str) -> Iterator[None]:
+        """guard() of the provider/model breaker, or a no-op if disabled."""
+        if not self.config.enabled:
+            yield
+            return
+        with self.get(provider, model_name).guard():
+            yield
+
+    def summary(self) -> dict[str, Any]:
+        """Final states, short-circuit counts and transitions for run_meta.json."""
+        return {
+            "states": {key: b.state for key, b in sorted(self._breakers.items())},
+            "short_circuited": {
+                key: b.short_circuited for key, b in sorted(self._breakers.items())
+            },
+            "transitions": self.transitions,
+        }
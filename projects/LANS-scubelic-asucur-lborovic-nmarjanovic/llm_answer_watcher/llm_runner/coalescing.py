@@ -0,0 +1,170 @@
+"""
+In-flight request coalescing (single-flight) for LLM calls within a run.
+
+Configs often send byte-identical requests several times in one run: the
+same prompt under several intents, an operation prompt that renders the same
+for several answers, or identical extraction prompts. While a RequestCoalescer
+is active, generate_coalesced() fingerprints each request (client type,
+provider, model, system prompt, tools, base URL and prompt); a request whose
+fingerprint matches one already in flight waits for that call instead of
+sending its own and receives a copy of its LLMResponse.
+
+The cost is attributed once: the caller that started the request gets the
+response as returned, and coalesced callers get a copy with cost_usd=0.0 and
+coalesced=True. Only in-flight requests are shared; once a call finishes its
+fingerprint is released, so this is not a response cache.
+
+The active coalescer is held in a context variable (like the query timer in
+llm_runner.timing), so runner, extraction and operation code all participate
+without passing it around. Outside an active coalescer, generate_coalesced()
+simply calls generate_answer().
+
+Example:
+    >>> coalescer = RequestCoalescer()
+    >>> token = coalescer.activate()
+    >>> try:
+    ...     a, b = await asyncio.gather(
+    ...         generate_coalesced(client, "best CRM?"),
+    ...         generate_coalesced(client, "best CRM?"),
+    ...     )
+    ... finally:
+    ...     reset_current_coalescer(token)
+    >>> coalescer.coalesced_count, b.coalesced, b.cost_usd
+    (1, True, 0.0)
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+from dataclasses import replace
+from typing import Any
+
+from .models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+_current_coalescer: contextvars.ContextVar["RequestCoalescer | None"] = contextvars.ContextVar(
+    "current_request_coalescer", default=None
+)
+
+
+def request_fingerprint(client: Any, prompt: str) -> str | None:
+    """
+    Fingerprint everything that determines a client's request for a prompt.
+
+    Args:
+        client: LLM client (provider client or MockLLMClient)
+        prompt: Prompt passed to generate_answer()
+
+    Returns:
+        str: SHA-256 hex digest, or None if the client does not expose a
+            string model_name (e.g., test doubles), which disables coalescing
+    """
+    model_name = getattr(client, "model_name", None)
+    if not isinstance(model_name, str):
+        return None
+
+    fields = {
+        "client": type(client).__qualname__,
+        "provider": getattr(client, "provider", None),
+        "model_name": model_name,
+        "system_prompt": getattr(client, "system_prompt", None),
+        "tools": getattr(client, "tools", None),
+        "tool_choice": getattr(client, "tool_choice", None),
+        "base_url": getattr(client, "base_url", None),
+        "prompt": prompt,
+    }
+    try:
+        encoded = json.dumps(fields, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class RequestCoalescer:
+    """
+    Shares in-flight generate_answer() calls between identical requests.
+
+    Attributes:
+        request_count: Requests seen through generate()
+        coalesced_count: Requests served by another caller's in-flight call
+        saved_cost_usd: Cost of the coalesced requests had they been sent
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.request_count = 0
+        self.coalesced_count = 0
+        self.saved_cost_usd = 0.0
+
+    def activate(self) -> contextvars.Token:
+        """Make this the current coalescer for generate_coalesced()."""
+        return _current_coalescer.set(self)
+
+    async def generate(self, client: Any, prompt: str) -> LLMResponse:
+        """
+        Call client.generate_answer(prompt), joining an identical in-flight call.
+
+        The shared call runs as its own task, so a cancelled caller does not
+        cancel it for the others. Exceptions propagate to every caller.
+
+        Args:
+            client: LLM client
+            prompt: Prompt to send
+
+        Returns:
+            LLMResponse: The response; a copy with cost_usd=0.0 and
+                coalesced=True for callers that joined an in-flight call
+        """
+        fingerprint = request_fingerprint(client, prompt)
+        if fingerprint is None:
+            return await client.generate_answer(prompt)
+
+        self.request_count += 1
+        task = self._in_flight.get(fingerprint)
+        if task is None:
+            task = asyncio.ensure_future(client.generate_answer(prompt))
+            self._in_flight[fingerprint] = task
+            task.add_done_callback(lambda _task: self._in_flight.pop(fingerprint, None))
+            return await asyncio.shield(task)
+
+        response = await asyncio.shield(task)
+        self.coalesced_count += 1
+        self.saved_cost_usd += response.cost_usd
+        logger.info(
+            f"Coalesced request: provider={response.provider}, "
+            f"model={response.model_name}, fingerprint={fingerprint[:12]}"
+        )
+        return replace(response, cost_usd=0.0, coalesced=True)
+
+    def summary(self) -> dict[str, float | int]:
+        """Counters for run_meta.json."""
+        return {
+            "requests": self.request_count,
+            "coalesced": self.coalesced_count,
+            "saved_cost_usd": round(self.saved_cost_usd, 6),
+        }
+
+
+async def generate_coalesced(client: Any, prompt: str) -> LLMResponse:
+    """
+    Generate an answer through the current coalescer, if one is active.
+
+    Args:
+        client: LLM client
+        prompt: Prompt to send
+
+    Returns:
+        LLMResponse: Same as client.generate_answer(prompt)
+    """
+    coalescer = _current_coalescer.get()
+    if coalescer is None:
+        return await client.generate_answer(prompt)
+    return await coalescer.generate(client, prompt)
+
+
+def reset_current_coalescer(token: contextvars.Token) -> None:
+    """Restore the previous coalescer (pair with RequestCoalescer.activate())."""
+    _current_coalescer.reset(token)
@@ -0,0 +1,171 @@
+"""
+History-aware query predictions and longest-first scheduling.
+
+Fixed per-query token guesses make cost estimates wrong for intents whose
+answers are much longer or shorter than average, and executing queries in
+config order lets one slow model finish a run long after everything else is
+done. QueryHistory predicts each (intent, model) query from earlier runs:
+
+1. Average tokens and duration of the same intent on the same model
+2. Otherwise the model's average over all intents
+3. Otherwise the conservative defaults
+
+The predictions feed estimate_run_cost() and order work longest-expected-
+first (LPT scheduling), which keeps the run's makespan close to optimal:
+long queries start early instead of becoming the tail of the run.
+
+Example:
+    >>> history = QueryHistory.load(config.run_settings.sqlite_db_path)
+    >>> history.predict("crm-tools", "openai", "gpt-4o-mini").duration_s
+    7.31
+    >>> predict_makespan([10.0, 8.0, 3.0, 2.0], slots=2)
+    12.0
+"""
+
+import heapq
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..storage.db import load_query_history
+
+logger = logging.getLogger(__name__)
+
+# Conservative defaults for queries without history
+DEFAULT_INPUT_TOKENS = 150  # Prompt + system message
+DEFAULT_OUTPUT_TOKENS = 500  # Response
+DEFAULT_QUERY_SECONDS = 10.0  # API answer incl. extraction and writes
+DEFAULT_RUNNER_SECONDS = 60.0  # Browser/custom runners are much slower
+
+# Runs aggregated for predictions
+HISTORY_RUNS = 20
+
+
+@dataclass(frozen=True)
+class QueryPrediction:
+    """
+    Predicted token usage and duration of one query.
+
+    Attributes:
+        input_tokens: Expected prompt tokens
+        output_tokens: Expected completion tokens
+        duration_s: Expected duration in seconds (without queueing)
+        source: "intent" (same intent and model), "model" (model average)
+            or "default"
+    """
+
+    input_tokens: float
+    output_tokens: float
+    duration_s: float
+    source: str
+
+
+def _weighted_mean(entries: list[dict], field: str) -> float | None:
+    pairs = [(e[field], e["samples"]) for e in entries if e.get(field) is not None]
+    weight = sum(samples for _, samples in pairs)
+    if not weight:
+        return None
+    return sum(value * samples for value, samples in pairs) / weight
+
+
+class QueryHistory:
+    """
+    Per-(intent, model) token and duration history from earlier runs.
+
+    Attributes:
+        entries: (intent_id, provider, model_name) -> aggregates from
+            load_query_history()
+    """
+
+    def __init__(self, entries: dict[tuple[str, str, str], dict] | None = None):
+        self.entries = entries or {}
+        by_model: dict[tuple[str, str], list[dict]] = {}
+        for (_, provider, model_name), entry in self.entries.items():
+            by_model.setdefault((provider, model_name), []).append(entry)
+        self._model_means = {
+            key: {
+                field: _weighted_mean(model_entries, field)
+                for field in ("prompt_tokens", "completion_tokens", "duration_ms")
+            }
+            for key, model_entries in by_model.items()
+        }
+
+    @classmethod
+    def load(cls, db_path: str, recent_runs: int = HISTORY_RUNS) -> "QueryHistory":
+        """
+        Load history of the most recent runs.
+
+        A missing database, or one that cannot be read, gives an empty
+        history (every prediction uses the defaults). The database file is
+        never created here.
+
+        Args:
+            db_path: SQLite database path
+            recent_runs: Number of most recent runs to aggregate
+        """
+        if not Path(db_path).is_file():
+            return cls()
+        try:
+            with sqlite3.connect(db_path) as conn:
+                return cls(load_query_history(conn, recent_runs))
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load query history: {e}")
+            return cls()
+
+    def predict(
+        self, intent_id: str, provider: str, model_name: str, runner: bool = False
+    ) -> QueryPrediction:
+        """
+        Predict one query from the closest available history.
+
+        Args:
+            intent_id: Intent identifier
+            provider: Provider name (runner plugin name for runners)
+            model_name: Model name ("runner" for runners)
+            runner: Whether this is a browser/custom runner (slower default)
+
+        Returns:
+            QueryPrediction: Each field falls back independently, so a query
+                with token history but no timings still gets a duration
+        """
+        default_s = DEFAULT_RUNNER_SECONDS if runner else DEFAULT_QUERY_SECONDS
+        candidates = [
+            ("intent", self.entries.get((intent_id, provider, model_name))),
+            ("model", self._model_means.get((provider, model_name))),
+        ]
+
+        def pick(field: str, default: float) -> tuple[float, str]:
+            for source, entry in candidates:
+                if entry and entry.get(field) is not None:
+                    return entry[field], source
+            return default, "default"
+
+        input_tokens, source = pick("prompt_tokens", DEFAULT_INPUT_TOKENS)
+        output_tokens, _ = pick("completion_tokens", DEFAULT_OUTPUT_TOKENS)
+        duration_ms, duration_source = pick("duration_ms", default_s * 1000)
+        if source == "default":
+            source = duration_source
+        return QueryPrediction(input_tokens, output_tokens, duration_ms / 1000, source)
+
+
+def predict_makespan(durations: list[float], slots: int) -> float:
+    """
+    Wall time of running durations longest-first on a number of slots.
+
+    Simulates LPT scheduling: each job, longest first, starts on the slot
+    that frees up earliest.
+
+    Args:
+        durations: Expected duration of each job in seconds
+        slots: Number of jobs that run concurrently
+
+    Returns:
+        float: Predicted wall time in seconds (0.0 without jobs)
+    """
+    if not durations:
+        return 0.0
+    finish_times = [0.0] * max(1, min(slots, len(durations)))
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
@@ -0,0 +1,283 @@
+"""
+Shared answers for running many watcher configs in one process.
+
+Shops that monitor many brands keep one config per customer, and their
+intents overlap heavily: the same prompt goes to the same model once per
+config. run_many() runs all configs on one event loop with a SharedAnswerPool
+active, which turns the union of their queries into a deduplicated plan:
+
+1. plan_queries() keys every (intent, model) query of every config by what
+   determines the request (provider, model, system prompt, tools, base URL
+   and prompt; see answer_key()), so the plan knows how many configs need
+   each unique answer
+2. While the configs' runs execute, each answer is fetched through
+   share_answer(): the first config to ask sends the request, every other
+   config with the same key receives a copy of that response
+3. Each config then extracts the answer with its own brand list and writes
+   its own run directory and database rows, as in a normal run
+
+Unlike the per-run RequestCoalescer, the pool keeps a finished answer until
+every config that planned it has taken its copy or given it up with
+release_answer() (queries that are skipped, carried forward or fail before
+asking), so configs do not need to ask at the same moment. A failed request is not kept: configs waiting for it
+send their own request (the failure may be the sender's own, e.g. its API
+key), and later configs retry. Neither is an answer whose stream was stopped
+early
+(stream_stop_after_ranked_items): it was cut off once the asking config's
+own brands were ranked, so every other config sends its own request.
+
+The cost is attributed like coalesced requests: the config that sent the
+request is charged, the others get a copy with cost_usd=0.0 and
+coalesced=True. API keys are not part of the key, so whichever config asks
+first pays with its own key.
+
+Only the main answer of each query is shared. Adaptive sampling repeats,
+batch-mode answers, extraction and operations stay per config.
+
+Example:
+    >>> plan = plan_queries([acme_config, globex_config])
+    >>> plan.total_queries, plan.unique_queries
+    (12, 7)
+    >>> pool = SharedAnswerPool(plan)
+    >>> token = pool.activate()
+    >>> try:
+    ...     results = await asyncio.gather(run_all(acme_config), run_all(globex_config))
+    ... finally:
+    ...     reset_current_pool(token)
+"""
+
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+
+from ..config.schema import RuntimeConfig
+from .models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+_current_pool: contextvars.ContextVar["SharedAnswerPool | None"] = contextvars.ContextVar(
+    "current_shared_answer_pool", default=None
+)
+
+
+def answer_key(model_config, prompt: str) -> str:
+    """
+    Key of everything that determines a model's answer to a prompt.
+
+    Args:
+        model_config: RuntimeModel the query is sent to
+        prompt: Intent prompt
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    fields = {
+        "provider": model_config.provider,
+        "model_name": model_config.model_name,
+        "system_prompt": model_config.system_prompt,
+        "tools": model_config.tools,
+        "tool_choice": model_config.tool_choice,
+        "base_url": model_config.base_url,
+        "prompt": prompt,
+    }
+    encoded = json.dumps(fields, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+@dataclass
+class QueryPlan:
+    """
+    Deduplicated API queries of several configs.
+
+    Attributes:
+        total_queries: API queries summed over all configs
+        subscribers: Number of planned queries per answer_key()
+    """
+
+    total_queries: int = 0
+    subscribers: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def unique_queries(self) -> int:
+        """API calls needed if every shared answer is fetched once."""
+        return len(self.subscribers)
+
+    def summary(self) -> dict[str, int]:
+        """Plan counters for the run-many summary."""
+        return {
+            "total_queries": self.total_queries,
+            "unique_queries": self.unique_queries,
+            "shared_queries": self.total_queries - self.unique_queries,
+        }
+
+
+def plan_queries(configs: list[RuntimeConfig]) -> QueryPlan:
+    """
+    Build the deduplicated plan of the configs' API queries.
+
+    Browser/custom runners are not planned; they are never shared.
+
+    Args:
+        configs: Configs to run together
+
+    Returns:
+        QueryPlan: Total and unique query counts
+    """
+    plan = QueryPlan()
+    for config in configs:
+        for intent in config.intents:
+            for model_config in config.models:
+                key = answer_key(model_config, intent.prompt)
+                plan.subscribers[key] = plan.subscribers.get(key, 0) + 1
+                plan.total_queries += 1
+    return plan
+
+
+class SharedAnswerPool:
+    """
+    Answers shared between the runs of several configs.
+
+    Attributes:
+        plan: Plan whose subscriber counts decide when an answer is released
+            (None keeps every answer until the pool is discarded)
+        fetched_count: Requests actually sent
+        shared_count: Answers served from another config's request
+        saved_cost_usd: Cost of the shared answers had they been requested
+    """
+
+    def __init__(self, plan: QueryPlan | None = None, max_concurrent_requests: int | None = None):
+        self.plan = plan
+        self._remaining = dict(plan.subscribers) if plan else {}
+        self._answers: dict[str, asyncio.Task] = {}
+        self._limit = (
+            asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
+        )
+        self.fetched_count = 0
+        self.shared_count = 0
+        self.saved_cost_usd = 0.0
+
+    def activate(self) -> contextvars.Token:
+        """Make this the current pool for share_answer()."""
+        return _current_pool.set(self)
+
+    async def _fetch(self, call: Callable[[], Awaitable[LLMResponse]]) -> LLMResponse:
+        if self._limit is None:
+            return await call()
+        async with self._limit:
+            return await call()
+
+    def release(self, key: str) -> None:
+        """Count one planned query of a key as done; drop the answer after the last."""
+        if key not in self._remaining:
+            return
+        self._remaining[key] -= 1
+        if self._remaining[key] <= 0:
+            self._answers.pop(key, None)
+
+    async def answer(self, key: str, call: Callable[[], Awaitable[LLMResponse]]) -> LLMResponse:
+        """
+        Return the answer for a key, sending call() only if nobody has yet.
+
+        Args:
+            key: answer_key() of the query
+            call: Sends the request (the asking config's client, timeouts,
+                circuit breaker and hedging)
+
+        Returns:
+            LLMResponse: The response as returned for the config that sent
+                it (or of the caller's own request if the shared one failed
+                or stopped early); a copy with cost_usd=0.0 and coalesced=True
+                otherwise
+        """
+        task = self._answers.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(call))
+            self._answers[key] = task
+            self.fetched_count += 1
+            try:
+                response = await asyncio.shield(task)
+            except Exception:
+                # Do not keep failures: the next config asking retries
+                if self._answers.get(key) is task:
+                    del self._answers[key]
+                raise
+            finally:
+                self.release(key)
+            # Nor truncated answers: they stopped at the sender's brands
+            if response.stopped_early and self._answers.get(key) is task:
+                del self._answers[key]
+            return response
+
+        try:
+            response = await asyncio.shield(task)
+        except Exception as e:
+            # The sender's failure may be specific to its config (API key,
+            # quota, circuit breaker), so ask with this config's own call
+            logger.info(f"Shared request failed, sending own request: key={key[:12]}, error={e}")
+            self.fetched_count += 1
+            return await self._fetch(call)
+        finally:
+            self.release(key)
+        if response.stopped_early:
+            self.fetched_count += 1
+            return await self._fetch(call)
+        self.shared_count += 1
+        self.saved_cost_usd += response.cost_usd
+        logger.info(
+            f"Shared answer across configs: provider={response.provider}, "
+            f"model={response.model_name}, key={key[:12]}"
+        )
+        return replace(response, cost_usd=0.0, coalesced=True)
+
+    def summary(self) -> dict[str, float | int]:
+        """Pool counters for the run-many summary."""
+        return {
+            "api_calls": self.fetched_count,
+            "shared_answers": self.shared_count,
+            "saved_cost_usd": round(self.saved_cost_usd, 6),
+        }
+
+
+async def share_answer(
+    model_config, prompt: str, call: Callable[[], Awaitable[LLMResponse]]
+) -> LLMResponse:
+    """
+    Fetch a query's answer through the current pool, if one is active.
+
+    Args:
+        model_config: RuntimeModel the query is sent to
+        prompt: Intent prompt
+        call: Sends the request
+
+    Returns:
+        LLMResponse: Same as call(), possibly shared with another config
+    """
+    pool = _current_pool.get()
+    if pool is None:
+        return await call()
+    return await pool.answer(answer_key(model_config, prompt), call)
+
+
+def release_answer(model_config, prompt: str) -> None:
+    """
+    Give up a planned query's copy without asking (no-op without a pool).
+
+    Call this for queries that never reach share_answer(), so answers are
+    not kept for them until the pool is discarded.
+
+    Args:
+        model_config: RuntimeModel the query would have been sent to
+        prompt: Intent prompt
+    """
+    pool = _current_pool.get()
+    if pool is not None:
+        pool.release(answer_key(model_config, prompt))
+
+
+def reset_current_pool(token: contextvars.Token) -> None:
+    """Restore the previous pool (pair with SharedAnswerPool.activate())."""
+    _current_pool.reset(token)
@@ -0,0 +1,216 @@
+"""
+Freshness policies: reuse earlier answers instead of re-querying.
+
+Every run normally re-queries every (intent, model) pair, even when the same
+prompt was answered by the same model an hour ago. With a FreshnessPolicy
+(run_settings, per model or per intent), pairs whose latest answer is still
+fresh are carried forward into the new run by reference: the answers_raw row
+points at the same blobs, mentions are copied, and no API call is made.
+
+An answer is fresh when it was fetched:
+
+1. For the same prompt and system prompt by the same provider/model
+2. And, with max_age_hours, no longer ago than that
+
+Freshness is looked up for all pairs at once with find_latest_answers() (one
+indexed query). Browser/custom runners are always executed: their answers
+depend on the web UI rather than on a prompt and model we control.
+
+reuse_extraction() applies the same idea one stage later: an answer that was
+queried again but is unchanged from the previous one (see utils.fingerprint)
+keeps that answer's mentions instead of being extracted again.
+
+Example:
+    >>> fresh = find_fresh_answers(config)
+    >>> fresh[("crm-tools", "openai", "gpt-4o-mini")]["run_id"]
+    '2025-11-02T08-00-00Z'
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from ..config.schema import FreshnessPolicy, Intent, RuntimeConfig, RuntimeModel
+from ..storage.db import (
+    carry_forward_answer,
+    copy_mentions,
+    find_latest_answers,
+    find_previous_answer,
+)
+from ..storage.layout import (
+    get_parsed_answer_filename,
+    get_raw_answer_filename,
+    get_run_directory,
+)
+from ..storage.writer import write_parsed_answer, write_raw_answer
+from ..utils.time import parse_timestamp, utc_now
+
+logger = logging.getLogger(__name__)
+
+
+def resolve_freshness_policy(
+    config: RuntimeConfig, intent: Intent, model_config: RuntimeModel
+) -> FreshnessPolicy | None:
+    """
+    Policy for one query: the intent's, else the model's, else run_settings'.
+
+    Returns:
+        FreshnessPolicy | None: None if the query is always executed
+    """
+    return intent.freshness or model_config.freshness or config.run_settings.freshness
+
+
+def find_fresh_answers(
+    config: RuntimeConfig, now: datetime | None = None
+) -> dict[tuple[str, str, str], dict]:
+    """
+    Find the queries of a run whose earlier answers can be reused.
+
+    A missing database, or one that cannot be read, means nothing is fresh.
+    The database file is never created here.
+
+    Args:
+        config: Runtime configuration
+        now: Reference time for max_age_hours (default: current UTC time)
+
+    Returns:
+        dict: (intent_id, provider, model_name) -> {"run_id",
+            "timestamp_utc"} of the answer to carry forward
+    """
+    policies = {}
+    queries = []
+    for intent in config.intents:
+        for model_config in config.models or []:
+            policy = resolve_freshness_policy(config, intent, model_config)
+            if policy is None or policy.max_age_hours == 0:
+                continue
+            key = (intent.id, model_config.provider, model_config.model_name)
+            policies[key] = policy
+            queries.append((*key, intent.prompt, model_config.system_prompt))
+    db_path = config.run_settings.sqlite_db_path
+    if not queries or not Path(db_path).is_file():
+        return {}
+
+    try:
+        with sqlite3.connect(db_path) as conn:
+            latest = find_latest_answers(conn, queries)
+    except sqlite3.Error as e:
+        logger.warning(f"Could not check answer freshness, querying everything: {e}")
+        return {}
+
+    now = now or utc_now()
+    fresh = {}
+    for key, answer in latest.items():
+        max_age_hours = policies[key].max_age_hours
+        age = now - parse_timestamp(answer["timestamp_utc"])
+        if max_age_hours is None or age <= timedelta(hours=max_age_hours):
+            fresh[key] = answer
+    return fresh
+
+
+def carry_forward_answers(
+    config: RuntimeConfig,
+    fresh: dict[tuple[str, str, str], dict],
+    run_id: str,
+    timestamp_utc: str,
+    run_dir: str,
+) -> set[tuple[str, str, str]]:
+    """
+    Carry fresh answers into a new run instead of querying them.
+
+    Database rows are copied with carry_forward_answer() in one transaction.
+    The earlier run's raw and parsed JSON files are copied into run_dir
+    (the raw file gains "reused_from_run_id") so reports of the new run are
+    complete; if they are missing, only the database rows are carried.
+
+    Args:
+        config: Runtime configuration
+        fresh: Result of find_fresh_answers()
+        run_id: New run identifier
+        timestamp_utc: Timestamp of the new run
+        run_dir: Output directory of the new run
+
+    Returns:
+        set: (intent_id, provider, model_name) of carried answers; anything
+            else must be queried
+    """
+    if not fresh:
+        return set()
+
+    reused = set()
+    try:
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            for key, answer in fresh.items():
+                if carry_forward_answer(
+                    conn,
+                    *key,
+                    source_run_id=answer["run_id"],
+                    run_id=run_id,
+                    timestamp_utc=timestamp_utc,
+                ):
+                    reused.add(key)
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.error(f"Failed to carry forward fresh answers, querying them: {e}", exc_info=True)
+        return set()
+
+    for key in reused:
+        source_run_id = fresh[key]["run_id"]
+        source_dir = Path(get_run_directory(config.run_settings.output_dir, source_run_id))
+        try:
+            raw = json.loads((source_dir / get_raw_answer_filename(*key)).read_text("utf-8"))
+            raw["reused_from_run_id"] = source_run_id
+            write_raw_answer(run_dir, *key, data=raw)
+            parsed = json.loads((source_dir / get_parsed_answer_filename(*key)).read_text("utf-8"))
+            write_parsed_answer(run_dir, *key, data=parsed)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not copy artifacts of reused answer {'/'.join(key)}: {e}")
+    return reused
+
+
+def reuse_extraction(
+    config: RuntimeConfig,
+    run_id: str,
+    timestamp_utc: str,
+    run_dir: str,
+    key: tuple[str, str, str],
+) -> bool:
+    """
+    Reuse the previous answer's extraction for an unchanged answer.
+
+    Copies the previous answer's parsed JSON into run_dir and its mentions
+    into the new run. Nothing is copied if the parsed file is missing, so
+    the caller can fall back to extracting the answer.
+
+    Args:
+        config: Runtime configuration
+        run_id: Current run identifier
+        timestamp_utc: Timestamp of the new answer
+        run_dir: Output directory of the current run
+        key: (intent_id, provider, model_name) of the answer
+
+    Returns:
+        bool: True if the extraction was reused
+    """
+    try:
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            previous = find_previous_answer(conn, run_id, *key)
+            if previous is None:
+                return False
+            source_dir = Path(get_run_directory(config.run_settings.output_dir, previous["run_id"]))
+            parsed = json.loads((source_dir / get_parsed_answer_filename(*key)).read_text("utf-8"))
+            write_parsed_answer(run_dir, *key, data=parsed)
+            copy_mentions(
+                conn,
+                *key,
+                source_run_id=previous["run_id"],
+                run_id=run_id,
+                timestamp_utc=timestamp_utc,
+            )
+            conn.commit()
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.warning(f"Could not reuse extraction of {'/'.join(key)}, extracting: {e}")
+        return False
+    return True
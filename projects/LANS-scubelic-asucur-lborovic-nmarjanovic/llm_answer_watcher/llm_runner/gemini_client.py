@@ -27,12 +27,18 @@ from typing import Any
 
 import httpx
 
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
+from llm_answer_watcher.llm_runner.streaming import (
+    ChunkCallback,
+    StreamTracker,
+    estimate_tokens,
+    iter_sse_json,
+)
 from llm_answer_watcher.utils.cost import estimate_cost
 from llm_answer_watcher.utils.time import utc_timestamp
 
@@ -87,7 +93,7 @@ class GeminiClient:
 
     Note:
         This implementation uses async/await for parallel execution.
-        Streaming is not supported in v1.
+        stream_answer() streams the same request over server-sent events.
     """
 
     def __init__(
@@ -97,6 +103,8 @@ class GeminiClient:
         system_prompt: str,
         tools: list[dict] | None = None,
         tool_choice: str = "auto",
+        *,
+        base_url: str | None = None,
     ):
         """
         Initialize Gemini client with model, API key, system prompt, and optional tools.
@@ -107,6 +115,8 @@ class GeminiClient:
             system_prompt: System message for context/instructions
             tools: Optional list of tool configurations (e.g., [{"google_search": {}}])
             tool_choice: Tool selection mode (note: Gemini auto-decides, this param is for API compat)
+            base_url: Optional API base URL override for proxies or the local
+                stand-in server. Default: https://generativelanguage.googleapis.com/v1beta
 
         Raises:
             ValueError: If model_name, api_key, or system_prompt is empty
@@ -150,6 +160,7 @@ class GeminiClient:
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_choice = tool_choice
+        self.base_url = (base_url or GEMINI_API_BASE_URL).rstrip("/")
 
         # Log if Google Search grounding is enabled
         if tools:
@@ -219,63 +230,23 @@ class GeminiClient:
             If a non-retryable error occurs (e.g., 401), it checks the status
             code and raises immediately without retry.
         """
-        # Validate prompt is not empty
-        if not prompt or prompt.isspace():
-            raise ValueError("Prompt cannot be empty")
-
-        # Validate prompt length to prevent excessive API costs
-        if len(prompt) > MAX_PROMPT_LENGTH:
-            raise ValueError(
-                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
-                f"(received {len(prompt):,} characters). "
-                f"Please shorten your prompt to stay within the limit."
-            )
-
-        # Build request payload
-        # Gemini API uses 'contents' array with role/parts objects
-        # System instruction is a separate parameter
-        payload = {
-            "contents": [
-                {
-                    "role": "user",
-                    "parts": [{"text": prompt}],
-                }
-            ],
-            "systemInstruction": {"parts": [{"text": self.system_prompt}]},
-            "generationConfig": {
-                "temperature": 0.7,  # Default temperature for consistency
-            },
-        }
-
-        # Add tools if configured (direct passthrough to Gemini API)
-        # Google format: [{"google_search": {}}] - dictionary with tool name as key
-        # This differs from OpenAI's format: [{"type": "web_search"}] (typed specification)
-        # Gemini automatically decides when to use tools (no tool_choice parameter)
-        # Config schema uses generic list[dict] to support provider-specific formats
-        if self.tools:
-            payload["tools"] = self.tools
-            logger.debug(f"Added tools to request: {len(self.tools)} tool(s)")
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
 
         # Build API endpoint URL
         # Format: /v1beta/models/{model}:generateContent?key={api_key}
-        api_url = f"{GEMINI_API_BASE_URL}/models/{self.model_name}:generateContent"
+        api_url = f"{self.base_url}/models/{self.model_name}:generateContent"
 
-        # Build headers (NEVER log api_key)
-        headers = {
-            "Content-Type": "application/json",
-        }
-
-        # API key is passed as query parameter for Gemini API
-        params = {
-            "key": self.api_key,
-        }
+        # API key is passed as query parameter for Gemini API (NEVER log it)
+        headers = {"Content-Type": "application/json"}
+        params = {"key": self.api_key}
 
         # Log request (NEVER log api_key or params)
         logger.debug(f"Sending request to Gemini: model={self.model_name}")
 
-        # Make HTTP request with context manager for proper cleanup
+        # Make HTTP request over the shared connection pool
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
                     api_url,
                     json=payload,
@@ -333,13 +304,200 @@ class GeminiClient:
         # Extract token usage
         tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
 
+        # Prompt tokens served from Gemini's implicit context cache
+        cached_tokens = self._extract_cached_tokens(data)
+
         # Extract grounding metadata (Google Search results if tools enabled)
         web_search_results, web_search_count = self._extract_grounding_metadata(data)
 
+        return self._build_llm_response(
+            answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+
+    @create_retry_decorator()
+    async def stream_answer(
+        self, prompt: str, on_chunk: ChunkCallback | None = None
+    ) -> LLMResponse:
+        """
+        Stream an answer over server-sent events, calling on_chunk per text delta.
+
+        Sends the same request as generate_answer() to streamGenerateContent
+        with alt=sse. Each chunk carries candidate text parts; usageMetadata
+        and groundingMetadata arrive with the final chunks.
+
+        Args:
+            prompt: User intent prompt to send to the LLM
+            on_chunk: Optional callback receiving each text delta; return True
+                to stop generation early (see llm_runner.streaming)
+
+        Returns:
+            LLMResponse: Same as generate_answer(), plus ttft_ms,
+                tokens_per_second and stopped_early
+
+        Raises:
+            ValueError: If prompt is empty or too long
+            RuntimeError: On permanent failures, blocked responses, or
+                transport errors after the first delta
+            httpx.HTTPStatusError: On retryable HTTP errors after retries exhausted
+        """
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
+        api_url = f"{self.base_url}/models/{self.model_name}:streamGenerateContent"
+        headers = {"Content-Type": "application/json"}
+        params = {"key": self.api_key, "alt": "sse"}
+        tracker = StreamTracker(on_chunk)
+        usage_chunk: dict[str, Any] | None = None
+        grounding_chunk: dict[str, Any] | None = None
+
+        logger.debug(f"Streaming request to Gemini: model={self.model_name}")
+
+        try:
+            async with (
+                pooled_client() as client,
+                client.stream(
+                    "POST", api_url, json=payload, headers=headers, params=params
+                ) as response,
+            ):
+                if response.status_code >= 400:
+                    await response.aread()
+                    if response.status_code in NO_RETRY_STATUS_CODES:
+                        raise RuntimeError(
+                            f"Gemini API error (non-retryable): "
+                            f"status={response.status_code}, "
+                            f"model={self.model_name}, "
+                            f"detail={self._extract_error_detail(response)}"
+                        )
+                    response.raise_for_status()
+
+                async for _event, data in iter_sse_json(response):
+                    if "usageMetadata" in data:
+                        usage_chunk = data
+                    candidates = data.get("candidates") or []
+                    candidate = candidates[0] if candidates else {}
+                    if candidate.get("groundingMetadata"):
+                        grounding_chunk = data
+                    finish_reason = candidate.get("finishReason")
+                    if finish_reason and finish_reason != "STOP":
+                        # Reuse the non-streaming error mapping for blocked output
+                        self._extract_answer_text(data)
+                    parts = (candidate.get("content") or {}).get("parts") or []
+                    delta = "".join(
+                        part.get("text", "") for part in parts if isinstance(part, dict)
+                    )
+                    if tracker.add(delta):
+                        break
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Gemini API HTTP error: "
+                f"status={e.response.status_code}, "
+                f"model={self.model_name}, "
+                f"detail={self._extract_error_detail(e.response)}"
+            )
+            raise
+
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            logger.error(f"Gemini stream error: model={self.model_name}, error={e}")
+            raise tracker.interrupted("Gemini", self.model_name, e) from e
+
+        answer_text = tracker.text
+        if usage_chunk is not None and not tracker.stopped_early:
+            tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(
+                usage_chunk
+            )
+            cached_tokens = self._extract_cached_tokens(usage_chunk)
+        else:
+            prompt_tokens = estimate_tokens(self.system_prompt + prompt)
+            completion_tokens = estimate_tokens(answer_text)
+            tokens_used = prompt_tokens + completion_tokens
+            cached_tokens = 0
+
+        web_search_results, web_search_count = (
+            self._extract_grounding_metadata(grounding_chunk)
+            if grounding_chunk is not None
+            else (None, 0)
+        )
+
+        llm_response = self._build_llm_response(
+            answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+        llm_response.ttft_ms = tracker.ttft_ms
+        llm_response.tokens_per_second = tracker.tokens_per_second(completion_tokens)
+        llm_response.stopped_early = tracker.stopped_early
+        return llm_response
+
+    def _validate_prompt(self, prompt: str) -> None:
+        """Reject empty prompts and prompts over MAX_PROMPT_LENGTH."""
+        # Validate prompt is not empty
+        if not prompt or prompt.isspace():
+            raise ValueError("Prompt cannot be empty")
+
+        # Validate prompt length to prevent excessive API costs
+        if len(prompt) > MAX_PROMPT_LENGTH:
+            raise ValueError(
+                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
+                f"(received {len(prompt):,} characters). "
+                f"Please shorten your prompt to stay within the limit."
+            )
+
+    def _build_payload(self, prompt: str) -> dict[str, Any]:
+        """Build the generateContent request payload for a prompt."""
+        # Build request payload
+        # Gemini API uses 'contents' array with role/parts objects
+        # System instruction is a separate parameter
+        payload = {
+            "contents": [
+                {
+                    "role": "user",
+                    "parts": [{"text": prompt}],
+                }
+            ],
+            "systemInstruction": {"parts": [{"text": self.system_prompt}]},
+            "generationConfig": {
+                "temperature": 0.7,  # Default temperature for consistency
+            },
+        }
+
+        # Add tools if configured (direct passthrough to Gemini API)
+        # Google format: [{"google_search": {}}] - dictionary with tool name as key
+        # This differs from OpenAI's format: [{"type": "web_search"}] (typed specification)
+        # Gemini automatically decides when to use tools (no tool_choice parameter)
+        # Config schema uses generic list[dict] to support provider-specific formats
+        if self.tools:
+            payload["tools"] = self.tools
+            logger.debug(f"Added tools to request: {len(self.tools)} tool(s)")
+
+        return payload
+
+    def _build_llm_response(
+        self,
+        answer_text: str,
+        *,
+        tokens_used: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        web_search_results: list[dict[str, Any]] | None,
+        web_search_count: int,
+        cached_tokens: int = 0,
+    ) -> LLMResponse:
+        """Estimate cost and assemble the LLMResponse."""
         # Calculate cost
         usage_meta = {
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
         }
         cost_usd = estimate_cost("google", self.model_name, usage_meta)
 
@@ -358,6 +516,7 @@ class GeminiClient:
             timestamp_utc=timestamp,
             web_search_results=web_search_results,
             web_search_count=web_search_count,
+            cached_tokens=cached_tokens,
         )
 
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
@@ -564,6 +723,21 @@ class GeminiClient:
             logger.warning(f"Failed to extract grounding metadata: {e}")
             return None, 0
 
+    def _extract_cached_tokens(self, data: dict[str, Any]) -> int:
+        """
+        Extract prompt tokens served from Gemini's context cache.
+
+        Gemini 2.x caches repeated prompt prefixes implicitly and reports the
+        hits in usageMetadata.cachedContentTokenCount (part of promptTokenCount).
+
+        Returns:
+            int: Cached prompt tokens (0 if not reported)
+        """
+        usage = data.get("usageMetadata")
+        if not isinstance(usage, dict):
+            return 0
+        return int(usage.get("cachedContentTokenCount") or 0)
+
     def _extract_token_usage(self, data: dict[str, Any]) -> tuple[int, int, int]:
         """
         Extract token usage breakdown from Gemini API response.
@@ -31,10 +31,10 @@ from typing import Any
 
 import httpx
 
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
@@ -45,7 +45,8 @@ httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
 # X.AI Grok API endpoint (OpenAI-compatible)
-GROK_API_URL = "https://api.x.ai/v1/chat/completions"
+GROK_API_BASE_URL = "https://api.x.ai/v1"
+GROK_API_URL = f"{GROK_API_BASE_URL}/chat/completions"
 
 # Maximum prompt length to prevent excessive API costs
 # ~25k tokens at 4 chars/token average - prevents runaway costs from extremely long prompts
@@ -103,6 +104,8 @@ class GrokClient:
         system_prompt: str,
         tools: list[dict] | None = None,
         tool_choice: str = "auto",
+        *,
+        base_url: str | None = None,
     ):
         """
         Initialize Grok client with model, API key, system prompt, and optional tools.
@@ -113,6 +116,8 @@ class GrokClient:
             system_prompt: System message for context/instructions
             tools: Optional list of tool configurations (not currently supported)
             tool_choice: Tool selection mode (not currently supported)
+            base_url: Optional API base URL override for proxies or the local
+                stand-in server. Default: https://api.x.ai/v1
 
         Raises:
             ValueError: If model_name, api_key, or system_prompt is empty
@@ -146,6 +151,7 @@ class GrokClient:
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_choice = tool_choice
+        self.base_url = (base_url or GROK_API_BASE_URL).rstrip("/")
 
         # Log warning if tools are provided (not yet supported)
         if tools:
@@ -237,11 +243,11 @@ class GrokClient:
         # Log request (NEVER log api_key or headers)
         logger.debug(f"Sending request to Grok: model={self.model_name}")
 
-        # Make HTTP request with async context manager for proper cleanup
+        # Make HTTP request over the shared connection pool
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
-                    GROK_API_URL,
+                    f"{self.base_url}/chat/completions",
                     json=payload,
                     headers=headers,
                 )
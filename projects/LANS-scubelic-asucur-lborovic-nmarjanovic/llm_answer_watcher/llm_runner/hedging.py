@@ -0,0 +1,328 @@
+"""
+Latency histograms, adaptive timeouts and hedged requests.
+
+A single uniform REQUEST_TIMEOUT means one stuck request can hold a run for
+two minutes before its first retry even starts. LatencyController keeps a
+log-bucketed latency histogram per provider/model (loaded from and saved to
+the model_latency_histograms table, so it improves across runs) and uses it
+for two things:
+
+Only calls answered by their own first HTTP attempt are recorded: a retried
+call's duration includes failed attempts and retry backoff, and a call that
+joined an identical in-flight request (coalesced) waited only for its rest,
+so either would skew the percentiles.
+
+- Adaptive timeouts: once a model has MIN_SAMPLES observations, each HTTP
+  attempt times out after TIMEOUT_MULTIPLIER x its p99 latency (clamped to
+  [MIN_TIMEOUT_SECONDS, REQUEST_TIMEOUT]), so stuck attempts are retried
+  early. The timeout is applied with http_pool.request_timeout(), which the
+  shared HTTP pool reads for every request.
+- Hedged requests (opt-in): if a call is still running after the model's p95
+  latency, an identical duplicate is sent and whichever finishes first wins;
+  the other is cancelled. Hedging stops once the estimated extra spend (the
+  winner's cost per hedge, since a cancelled request may still be billed)
+  reaches max_extra_cost_usd. run_all() also charges each hedge to its
+  CostLedger and sends none once the query's budget is used up.
+
+Example:
+    >>> controller = LatencyController.load(db_path, hedge=True, max_extra_cost_usd=0.10)
+    >>> response = await controller.generate(client, "best CRM?", "openai", "gpt-4o-mini")
+    >>> controller.save(db_path)
+    >>> controller.summary()["hedged"]
+    1
+"""
+
+import asyncio
+import logging
+import math
+import sqlite3
+import time
+from collections.abc import Callable
+from typing import Any
+
+from ..storage.db import load_latency_histograms, upsert_latency_histogram
+from .coalescing import generate_coalesced
+from .http_pool import count_attempts, request_timeout
+from .models import LLMResponse
+from .retry_config import REQUEST_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# Histogram buckets: upper bounds grow 12% per bucket from 50ms, so 90
+# buckets cover up to ~20 minutes with ~6% worst-case quantile error
+HISTOGRAM_MIN_MS = 50.0
+HISTOGRAM_GROWTH = 1.12
+HISTOGRAM_BUCKETS = 90
+
+# Persisted histograms are halved once they exceed this many samples so that
+# old runs fade out and the percentiles follow provider latency changes
+MAX_HISTOGRAM_SAMPLES = 5000
+
+# Observations needed before a model's percentiles are trusted
+MIN_SAMPLES = 20
+
+# Adaptive timeout = TIMEOUT_MULTIPLIER x p99, clamped to [min, REQUEST_TIMEOUT]
+TIMEOUT_QUANTILE = 0.99
+TIMEOUT_MULTIPLIER = 3.0
+MIN_TIMEOUT_SECONDS = 15.0
+
+# Hedge a request once it has been running longer than this quantile
+HEDGE_QUANTILE = 0.95
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram.
+
+    Attributes:
+        counts: Observations per bucket (bucket i covers values up to
+            HISTOGRAM_MIN_MS * HISTOGRAM_GROWTH**i; the last bucket is open)
+    """
+
+    def __init__(self, counts: list[int] | None = None):
+        if counts is not None and len(counts) != HISTOGRAM_BUCKETS:
+            counts = None  # Bucket layout changed since it was persisted
+        self.counts = list(counts) if counts is not None else [0] * HISTOGRAM_BUCKETS
+
+    @staticmethod
+    def bucket_index(value_ms: float) -> int:
+        """Bucket holding value_ms."""
+        if value_ms <= HISTOGRAM_MIN_MS:
+            return 0
+        index = math.ceil(math.log(value_ms / HISTOGRAM_MIN_MS) / math.log(HISTOGRAM_GROWTH))
+        return min(index, HISTOGRAM_BUCKETS - 1)
+
+    @staticmethod
+    def bucket_upper_ms(index: int) -> float:
+        """Upper bound of a bucket in milliseconds."""
+        return HISTOGRAM_MIN_MS * HISTOGRAM_GROWTH**index
+
+    @property
+    def count(self) -> int:
+        """Total number of observations."""
+        return sum(self.counts)
+
+    def record(self, value_ms: float) -> None:
+        """Add one observation."""
+        self.counts[self.bucket_index(value_ms)] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Estimate a quantile (upper bound of the bucket reaching it).
+
+        Args:
+            q: Quantile in (0, 1]
+
+        Returns:
+            float | None: Latency in ms, or None for an empty histogram
+        """
+        total = self.count
+        if total == 0:
+            return None
+        target = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return self.bucket_upper_ms(index)
+        return self.bucket_upper_ms(HISTOGRAM_BUCKETS - 1)
+
+    def decay(self) -> None:
+        """Halve all counts while the histogram is over MAX_HISTOGRAM_SAMPLES."""
+        while self.count > MAX_HISTOGRAM_SAMPLES:
+            self.counts = [c // 2 for c in self.counts]
+
+
+class LatencyController:
+    """
+    Per-model latency histograms driving adaptive timeouts and hedging.
+
+    Attributes:
+        histograms: (provider, model_name) -> LatencyHistogram
+        adaptive_timeouts: Whether timeout_for() adapts to the histograms
+        hedge: Whether generate() may send hedged duplicates
+        max_extra_cost_usd: Cap on the estimated spend of hedged duplicates
+        hedged: Number of hedged duplicates sent
+        hedge_wins: Hedges that finished before the original request
+        extra_cost_usd: Estimated spend of hedged duplicates
+    """
+
+    def __init__(
+        self,
+        histograms: dict[tuple[str, str], LatencyHistogram] | None = None,
+        adaptive_timeouts: bool = True,
+        hedge: bool = False,
+        max_extra_cost_usd: float = 0.0,
+    ):
+        self.histograms = histograms or {}
+        self.adaptive_timeouts = adaptive_timeouts
+        self.hedge = hedge
+        self.max_extra_cost_usd = max_extra_cost_usd
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.extra_cost_usd = 0.0
+
+    @classmethod
+    def load(cls, db_path: str, **kwargs: Any) -> "LatencyController":
+        """
+        Create a controller with histograms persisted by earlier runs.
+
+        A missing or unreadable table is logged and treated as no history.
+
+        Args:
+            db_path: SQLite database path
+            **kwargs: Passed to LatencyController()
+        """
+        histograms = {}
+        try:
+            with sqlite3.connect(db_path) as conn:
+                for key, counts in load_latency_histograms(conn).items():
+                    histograms[key] = LatencyHistogram(counts)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not load latency histograms: {e}")
+        return cls(histograms, **kwargs)
+
+    def save(self, db_path: str) -> None:
+        """Persist the histograms (decayed) for future runs."""
+        with sqlite3.connect(db_path) as conn:
+            for (provider, model_name), histogram in self.histograms.items():
+                histogram.decay()
+                upsert_latency_histogram(conn, provider, model_name, histogram.counts)
+            conn.commit()
+
+    def record(self, provider: str, model_name: str, latency_ms: float) -> None:
+        """Add a successful call's latency to the model's histogram."""
+        self.histograms.setdefault((provider, model_name), LatencyHistogram()).record(latency_ms)
+
+    def _quantile_seconds(self, provider: str, model_name: str, q: float) -> float | None:
+        histogram = self.histograms.get((provider, model_name))
+        if histogram is None or histogram.count < MIN_SAMPLES:
+            return None
+        return histogram.quantile(q) / 1000
+
+    def timeout_for(self, provider: str, model_name: str) -> float:
+        """
+        Per-attempt timeout in seconds for a model.
+
+        Returns:
+            float: TIMEOUT_MULTIPLIER x p99 clamped to [MIN_TIMEOUT_SECONDS,
+                REQUEST_TIMEOUT], or REQUEST_TIMEOUT without enough history
+        """
+        p99 = self._quantile_seconds(provider, model_name, TIMEOUT_QUANTILE)
+        if not self.adaptive_timeouts or p99 is None:
+            return REQUEST_TIMEOUT
+        return min(max(p99 * TIMEOUT_MULTIPLIER, MIN_TIMEOUT_SECONDS), REQUEST_TIMEOUT)
+
+    def hedge_delay(self, provider: str, model_name: str) -> float | None:
+        """Seconds to wait before hedging (the model's p95), None if not hedging."""
+        if not self.hedge:
+            return None
+        return self._quantile_seconds(provider, model_name, HEDGE_QUANTILE)
+
+    async def _timed(self, call, provider: str, model_name: str) -> LLMResponse:
+        start = time.perf_counter()
+        with count_attempts() as counter:
+            response = await call
+        if counter.attempts <= 1 and not response.coalesced:
+            self.record(provider, model_name, (time.perf_counter() - start) * 1000)
+        return response
+
+    async def generate(
+        self,
+        client: Any,
+        prompt: str,
+        provider: str,
+        model_name: str,
+        *,
+        coalesce: bool = True,
+        can_hedge: Callable[[], bool] | None = None,
+        on_hedge_cost: Callable[[float], None] | None = None,
+    ) -> LLMResponse:
+        """
+        Generate an answer with the adaptive timeout and optional hedging.
+
+        The original request goes through generate_coalesced() unless
+        coalesce is False; a hedge is sent directly so it never joins the
+        request it is racing. If one of the two fails, the other is awaited;
+        if both fail, the original request's exception is raised.
+
+        Args:
+            client: LLM client
+            prompt: Prompt to send
+            provider: Provider name (histogram key)
+            model_name: Model name (histogram key)
+            coalesce: Whether the request may join an identical in-flight
+                call. Pass False for independent draws of the same prompt
+                (sampling), which must each be a separate answer
+            can_hedge: Checked before sending a hedge; False waits for the
+                original request only (e.g. CostLedger.allows for the
+                query's intent)
+            on_hedge_cost: Called with the estimated extra cost once a
+                hedged call resolves (e.g. to charge it to the CostLedger)
+
+        Returns:
+            LLMResponse: Response of whichever request finished first
+        """
+        with request_timeout(self.timeout_for(provider, model_name)):
+            call = (
+                generate_coalesced(client, prompt) if coalesce else client.generate_answer(prompt)
+            )
+            primary = asyncio.ensure_future(self._timed(call, provider, model_name))
+            delay = self.hedge_delay(provider, model_name)
+            if delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if (
+                done
+                or self.extra_cost_usd >= self.max_extra_cost_usd
+                or (can_hedge is not None and not can_hedge())
+            ):
+                return await primary
+
+            logger.info(
+                f"Hedging slow request: provider={provider}, model={model_name}, after={delay:.2f}s"
+            )
+            self.hedged += 1
+            hedge = asyncio.ensure_future(
+                self._timed(client.generate_answer(prompt), provider, model_name)
+            )
+            return await self._first_success(primary, hedge, on_hedge_cost)
+
+    async def _first_success(
+        self,
+        primary: asyncio.Task,
+        hedge: asyncio.Task,
+        on_hedge_cost: Callable[[float], None] | None,
+    ) -> LLMResponse:
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        response = task.result()
+                        # The cancelled duplicate may still be billed: assume it
+                        # costs as much as the winner
+                        self.extra_cost_usd += response.cost_usd
+                        if on_hedge_cost is not None:
+                            on_hedge_cost(response.cost_usd)
+                        if task is hedge:
+                            self.hedge_wins += 1
+                        return response
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def summary(self) -> dict[str, Any]:
+        """Adaptive timeouts and hedging counters for run_meta.json."""
+        return {
+            "timeouts_s": {
+                f"{provider}/{model_name}": round(self.timeout_for(provider, model_name), 3)
+                for provider, model_name in sorted(self.histograms)
+            },
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_extra_cost_usd": round(self.extra_cost_usd, 6),
+        }
@@ -0,0 +1,215 @@
+"""
+Shared HTTP connection pool for LLM provider clients.
+
+Provider clients used to open a fresh httpx.AsyncClient for every request,
+which meant a new TCP + TLS handshake per query. This module keeps one
+pooled AsyncClient per running event loop so that all requests issued from
+the same loop (a single run, or many runs inside the long-running daemon)
+reuse keep-alive connections.
+
+Clients are keyed by event loop because httpx connections are bound to the
+loop that created them. A client's connections keep its loop alive, so an
+entry is NOT released when its loop finishes: whoever owns the loop must
+close the pool before the loop ends. One-shot runs (the `run` and
+`run-many` commands) wrap their coroutine in closing_pool(); the daemon and
+the HTTP service call close_pooled_clients() on shutdown.
+
+Example:
+    >>> from llm_answer_watcher.llm_runner.http_pool import pooled_client
+    >>> async with pooled_client() as client:
+    ...     response = await client.post(url, json=payload, headers=headers)
+
+    >>> # One-shot runs close the pool when the run finishes
+    >>> results = asyncio.run(closing_pool(run_all(config)))
+
+    >>> # Long-running processes close the pool on shutdown
+    >>> await close_pooled_clients()
+"""
+
+import asyncio
+import contextvars
+import logging
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+import httpx
+
+from llm_answer_watcher.llm_runner.retry_config import REQUEST_TIMEOUT
+from llm_answer_watcher.llm_runner.timing import record_http_attempt
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits shared by all provider clients on a loop
+# max_concurrent_requests is capped at 50 by RunSettings, so 100 connections
+# leaves headroom for extraction and operation calls running alongside queries
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+# Per-attempt timeout override for requests sent in the current context
+# (adaptive timeouts, see llm_runner.hedging)
+_request_timeout: contextvars.ContextVar[float | None] = contextvars.ContextVar(
+    "llm_request_timeout", default=None
+)
+
+# Attempt counter of the innermost count_attempts() block in the current context
+_attempt_counter: contextvars.ContextVar["AttemptCounter | None"] = contextvars.ContextVar(
+    "llm_attempt_counter", default=None
+)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_pooled_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient for the running event loop.
+
+    Creates the client on first use. A client that was closed (e.g. by
+    close_pooled_clients) is transparently replaced.
+
+    Returns:
+        httpx.AsyncClient: Pooled client bound to the current event loop
+
+    Raises:
+        RuntimeError: If called outside of a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            event_hooks={"request": [_on_request]},
+        )
+        _clients[loop] = client
+        logger.debug("Created pooled HTTP client for event loop")
+
+    return client
+
+
+async def _on_request(request: httpx.Request) -> None:
+    """
+    Request hook: count each attempt (including retries) for query timing and
+    count_attempts(), and apply the adaptive per-attempt timeout, if one is
+    active.
+    """
+    record_http_attempt()
+    counter = _attempt_counter.get()
+    if counter is not None:
+        counter.attempts += 1
+    timeout = _request_timeout.get()
+    if timeout is not None:
+        request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+
+
+@contextmanager
+def request_timeout(seconds: float | None) -> Iterator[None]:
+    """
+    Apply a per-attempt timeout to pooled requests sent within the block.
+
+    The override is held in a context variable, so it covers retries and
+    tasks created inside the block without affecting concurrent queries.
+
+    Args:
+        seconds: Timeout in seconds; None keeps the pool default (REQUEST_TIMEOUT)
+
+    Example:
+        >>> with request_timeout(20.0):
+        ...     response = await client.generate_answer(prompt)
+    """
+    token = _request_timeout.set(seconds)
+    try:
+        yield
+    finally:
+        _request_timeout.reset(token)
+
+
+class AttemptCounter:
+    """
+    HTTP attempts sent within a count_attempts() block.
+
+    Attributes:
+        attempts: Pooled requests sent so far (1 + retries for one call)
+    """
+
+    def __init__(self):
+        self.attempts = 0
+
+
+@contextmanager
+def count_attempts() -> Iterator[AttemptCounter]:
+    """
+    Count pooled HTTP requests sent within the block, including retries.
+
+    Tasks created inside the block count towards it as well (e.g., a
+    coalesced request started by this caller).
+
+    Example:
+        >>> with count_attempts() as counter:
+        ...     response = await client.generate_answer(prompt)
+        >>> counter.attempts
+        1
+    """
+    counter = AttemptCounter()
+    token = _attempt_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _attempt_counter.reset(token)
+
+
+@asynccontextmanager
+async def pooled_client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Async context manager yielding the shared AsyncClient.
+
+    Drop-in replacement for ``async with httpx.AsyncClient(...) as client``
+    that does NOT close the client on exit, so connections stay warm for the
+    next request.
+
+    Yields:
+        httpx.AsyncClient: Pooled client bound to the current event loop
+    """
+    yield get_pooled_client()
+
+
+async def close_pooled_clients() -> None:
+    """
+    Close the pooled client for the running event loop.
+
+    Call this before a long-running process (daemon, service) shuts down its
+    loop so keep-alive connections are released cleanly. Safe to call when
+    no client was ever created.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.debug("Closed pooled HTTP client for event loop")
+
+
+async def closing_pool[T](awaitable: Awaitable[T]) -> T:
+    """
+    Await a one-shot run, then close the pooled client of its event loop.
+
+    Use as the coroutine passed to asyncio.run(), so the run's keep-alive
+    connections are closed even if it raises.
+
+    Args:
+        awaitable: Run to await (e.g., run_all(config))
+
+    Returns:
+        The awaitable's result
+    """
+    try:
+        return await awaitable
+    finally:
+        await close_pooled_clients()
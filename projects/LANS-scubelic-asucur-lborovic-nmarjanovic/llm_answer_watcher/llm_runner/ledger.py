@@ -0,0 +1,148 @@
+"""
+Live cost ledger that enforces budget limits while a run executes.
+
+validate_budget() only checks the pre-run estimate; estimates can be far off
+(long answers, LLM extraction, operations, adaptive sampling). The ledger is
+charged with the actual cost of every LLM call as soon as its response
+arrives, and run_all() asks it before starting more work:
+
+- Pending queries of an intent whose spend reached max_per_intent_usd are
+  skipped; queries of other intents continue
+- Once the run's spend reaches max_per_run_usd, every pending query is skipped
+- Requests already in flight finish and are charged, so the final spend can
+  exceed a limit by at most the in-flight work
+- Extra samples (adaptive sampling), operations and hedged requests are
+  skipped the same way; each operation and hedge is charged as it finishes
+
+A run that skipped anything is "budget-truncated"; summary() gives the
+account for run_meta.json. run_all() runs on one event loop, so the ledger
+needs no locking.
+
+Example:
+    >>> ledger = CostLedger(BudgetConfig(max_per_run_usd=0.05))
+    >>> ledger.charge("crm-tools", 0.06, COST_ANSWERS)
+    >>> ledger.allows("email-warmup")
+    False
+"""
+
+import logging
+
+from ..config.schema import BudgetConfig
+
+logger = logging.getLogger(__name__)
+
+# Run statuses (run_meta.json and runs.status)
+RUN_COMPLETE = "complete"
+RUN_BUDGET_TRUNCATED = "budget-truncated"
+
+# Cost categories charged to the ledger
+COST_ANSWERS = "answers"
+COST_SAMPLING = "sampling"
+COST_EXTRACTION = "extraction"
+COST_OPERATIONS = "operations"
+COST_HEDGING = "hedging"
+COST_CLASSIFICATION = "classification"
+
+# Skipped work listed in summary(); the count and skipped_queries cover everything
+MAX_REPORTED_SKIPS = 100
+
+
+class CostLedger:
+    """
+    Actual spend of a run, by intent and cost category.
+
+    Attributes:
+        max_per_run_usd: Run limit (None if not enforced)
+        max_per_intent_usd: Per-intent limit (None if not enforced)
+        spent_usd: Total cost charged so far
+        intent_spent_usd: Cost charged per intent
+        category_spent_usd: Cost charged per category (COST_* constants)
+        skipped_count: Queries, samples and operations skipped for budget
+        limit_reached: First limit reached ("per_run" or "per_intent:<id>")
+    """
+
+    def __init__(self, budget: BudgetConfig | None):
+        enforced = budget is not None and budget.enabled
+        self.max_per_run_usd = budget.max_per_run_usd if enforced else None
+        self.max_per_intent_usd = budget.max_per_intent_usd if enforced else None
+        self.spent_usd = 0.0
+        self.intent_spent_usd: dict[str, float] = {}
+        self.category_spent_usd: dict[str, float] = {}
+        self.skipped_count = 0
+        self.limit_reached: str | None = None
+        self._skipped: list[dict] = []
+        self._skipped_queries: set[tuple[str, str, str]] = set()
+
+    def charge(self, intent_id: str, cost_usd: float, category: str) -> None:
+        """Add the cost of a finished LLM call."""
+        if not cost_usd:
+            return
+        self.spent_usd += cost_usd
+        self.intent_spent_usd[intent_id] = self.intent_spent_usd.get(intent_id, 0.0) + cost_usd
+        self.category_spent_usd[category] = self.category_spent_usd.get(category, 0.0) + cost_usd
+
+        if self.limit_reached is None:
+            if self.max_per_run_usd is not None and self.spent_usd >= self.max_per_run_usd:
+                self.limit_reached = "per_run"
+            elif (
+                self.max_per_intent_usd is not None
+                and self.intent_spent_usd[intent_id] >= self.max_per_intent_usd
+            ):
+                self.limit_reached = f"per_intent:{intent_id}"
+            if self.limit_reached:
+                logger.warning(
+                    f"Budget limit reached ({self.limit_reached}) at ${self.spent_usd:.6f}; "
+                    f"skipping pending work"
+                )
+
+    def allows(self, intent_id: str) -> bool:
+        """Whether new work for an intent may start."""
+        if self.max_per_run_usd is not None and self.spent_usd >= self.max_per_run_usd:
+            return False
+        return not (
+            self.max_per_intent_usd is not None
+            and self.intent_spent_usd.get(intent_id, 0.0) >= self.max_per_intent_usd
+        )
+
+    def skip(self, intent_id: str, provider: str, model_name: str, stage: str = "query") -> None:
+        """Record work skipped because of the budget."""
+        self.skipped_count += 1
+        if stage == "query":
+            self._skipped_queries.add((intent_id, provider, model_name))
+        if len(self._skipped) < MAX_REPORTED_SKIPS:
+            self._skipped.append(
+                {
+                    "intent_id": intent_id,
+                    "model_provider": provider,
+                    "model_name": model_name,
+                    "stage": stage,
+                }
+            )
+        logger.info(f"Budget: skipped {stage} intent={intent_id}, {provider}/{model_name}")
+
+    @property
+    def skipped_queries(self) -> list[tuple[str, str, str]]:
+        """(intent_id, provider, model_name) of every skipped query, uncapped."""
+        return sorted(self._skipped_queries)
+
+    @property
+    def status(self) -> str:
+        """RUN_BUDGET_TRUNCATED if any work was skipped, else RUN_COMPLETE."""
+        return RUN_BUDGET_TRUNCATED if self.skipped_count else RUN_COMPLETE
+
+    def summary(self) -> dict:
+        """Account of the run's spend for run_meta.json."""
+        return {
+            "max_per_run_usd": self.max_per_run_usd,
+            "max_per_intent_usd": self.max_per_intent_usd,
+            "spent_usd": round(self.spent_usd, 6),
+            "by_category": {
+                category: round(cost, 6) for category, cost in self.category_spent_usd.items()
+            },
+            "by_intent": {
+                intent_id: round(cost, 6) for intent_id, cost in self.intent_spent_usd.items()
+            },
+            "limit_reached": self.limit_reached,
+            "skipped_count": self.skipped_count,
+            "skipped": list(self._skipped),
+        }
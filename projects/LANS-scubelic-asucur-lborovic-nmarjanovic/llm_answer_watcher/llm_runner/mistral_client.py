@@ -27,10 +27,10 @@ from typing import Any
 
 import httpx
 
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
 from llm_answer_watcher.utils.cost import estimate_cost
@@ -41,7 +41,8 @@ httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
 # Mistral API endpoint
-MISTRAL_API_URL = "https://api.mistral.ai/v1/chat/completions"
+MISTRAL_API_BASE_URL = "https://api.mistral.ai/v1"
+MISTRAL_API_URL = f"{MISTRAL_API_BASE_URL}/chat/completions"
 
 # Maximum prompt length to prevent excessive API costs
 # ~25k tokens at 4 chars/token average - prevents runaway costs from extremely long prompts
@@ -99,6 +100,8 @@ class MistralClient:
         system_prompt: str,
         tools: list[dict] | None = None,
         tool_choice: str = "auto",
+        *,
+        base_url: str | None = None,
     ):
         """
         Initialize Mistral client with model, API key, system prompt, and optional tools.
@@ -109,6 +112,8 @@ class MistralClient:
             system_prompt: System message for context/instructions
             tools: Optional list of tool configurations (not currently supported)
             tool_choice: Tool selection mode (not currently supported)
+            base_url: Optional API base URL override for proxies or the local
+                stand-in server. Default: https://api.mistral.ai/v1
 
         Raises:
             ValueError: If model_name, api_key, or system_prompt is empty
@@ -142,6 +147,7 @@ class MistralClient:
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_choice = tool_choice
+        self.base_url = (base_url or MISTRAL_API_BASE_URL).rstrip("/")
 
         # Log warning if tools are provided (not yet supported)
         if tools:
@@ -235,11 +241,11 @@ class MistralClient:
         # Log request (NEVER log api_key or headers)
         logger.debug(f"Sending request to Mistral: model={self.model_name}")
 
-        # Make async HTTP request with context manager for proper cleanup
+        # Make async HTTP request over the shared connection pool
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
-                    MISTRAL_API_URL,
+                    f"{self.base_url}/chat/completions",
                     json=payload,
                     headers=headers,
                 )
@@ -18,6 +18,12 @@ Example:
     >>> response.cost_usd
     0.0
 
+Latency example (for benchmarks):
+    >>> import random
+    >>> client = MockLLMClient(
+    ...     latency_sampler=lambda: random.lognormvariate(6.5, 0.4)  # ~700ms median
+    ... )
+
 Streaming example:
     >>> chunks = []
     >>> def on_chunk(text: str):
@@ -37,6 +43,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 
 from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.streaming import ChunkCallback, StreamTracker
 from llm_answer_watcher.utils.time import utc_timestamp
 
 logger = logging.getLogger(__name__)
@@ -62,10 +69,15 @@ class MockLLMClient:
         provider: Provider name to return in responses. Defaults to "mock"
         tokens_per_response: Number of tokens to report for each response. Defaults to 100
         cost_per_response: Cost in USD to report for each response. Defaults to 0.0
-        streaming_chunk_size: Size of chunks when streaming. Defaults to 10 chars.
-            If None, streaming is disabled.
+        streaming_chunk_size: Size of chunks when streaming. Defaults to None
+            (generate_answer() does not stream; stream_answer() uses 10 chars).
         streaming_delay_ms: Delay in milliseconds between chunks. Defaults to 50ms.
             Simulates network latency for realistic streaming tests.
+        latency_ms: Fixed delay in milliseconds before each response.
+            Defaults to 0 (respond immediately).
+        latency_sampler: Optional callable returning a delay in milliseconds
+            for each call. Overrides latency_ms; used to inject latency
+            distributions in benchmarks.
 
     Example:
         >>> client = MockLLMClient(
@@ -104,6 +116,8 @@ class MockLLMClient:
     cost_per_response: float = 0.0
     streaming_chunk_size: int | None = None
     streaming_delay_ms: int = 50
+    latency_ms: float = 0.0
+    latency_sampler: Callable[[], float] | None = None
 
     def __post_init__(self):
         """Initialize responses dict if not provided."""
@@ -167,6 +181,11 @@ class MockLLMClient:
 
         logger.debug(f"MockLLMClient returning answer for prompt: {prompt[:50]}...")
 
+        # Simulate time to first token / full response latency
+        delay_ms = self.latency_sampler() if self.latency_sampler else self.latency_ms
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+
         # Stream if enabled and callback provided
         if self.streaming_chunk_size is not None and on_chunk is not None:
             logger.debug(
@@ -198,3 +217,62 @@ class MockLLMClient:
             web_search_results=None,
             web_search_count=0,
         )
+
+    async def stream_answer(
+        self,
+        prompt: str,
+        on_chunk: ChunkCallback | None = None,
+    ) -> LLMResponse:
+        """
+        Stream mock answer in chunks, honouring early stop like real clients.
+
+        Implements the StreamingLLMClient protocol: on_chunk receives each
+        chunk and may return True to stop. The response then contains only
+        the text streamed so far and has stopped_early set.
+
+        Args:
+            prompt: User intent prompt
+            on_chunk: Optional callback receiving each chunk; return True to stop
+
+        Returns:
+            LLMResponse: Mock response with ttft_ms and stopped_early populated
+
+        Example:
+            >>> client = MockLLMClient(responses={"test": "Hello world"}, streaming_chunk_size=5)
+            >>> response = await client.stream_answer("test", on_chunk=lambda c: c == " worl")
+            >>> response.answer_text, response.stopped_early
+            ('Hello worl', True)
+        """
+        answer_text = self.responses.get(prompt, self.default_response)
+        chunk_size = self.streaming_chunk_size or 10
+        tracker = StreamTracker(on_chunk)
+
+        delay_ms = self.latency_sampler() if self.latency_sampler else self.latency_ms
+        if delay_ms > 0:
+            await asyncio.sleep(delay_ms / 1000.0)
+
+        for i in range(0, len(answer_text), chunk_size):
+            if tracker.add(answer_text[i : i + chunk_size]):
+                break
+            if self.streaming_delay_ms > 0 and i + chunk_size < len(answer_text):
+                await asyncio.sleep(self.streaming_delay_ms / 1000.0)
+
+        completion_tokens = self.tokens_per_response // 2
+        if tracker.stopped_early and answer_text:
+            completion_tokens = completion_tokens * len(tracker.text) // len(answer_text)
+
+        return LLMResponse(
+            answer_text=tracker.text,
+            tokens_used=self.tokens_per_response // 2 + completion_tokens,
+            prompt_tokens=self.tokens_per_response // 2,
+            completion_tokens=completion_tokens,
+            cost_usd=self.cost_per_response,
+            provider=self.provider,
+            model_name=self.model_name,
+            timestamp_utc=utc_timestamp(),
+            web_search_results=None,
+            web_search_count=0,
+            ttft_ms=tracker.ttft_ms,
+            tokens_per_second=tracker.tokens_per_second(completion_tokens),
+            stopped_early=tracker.stopped_early,
+        )
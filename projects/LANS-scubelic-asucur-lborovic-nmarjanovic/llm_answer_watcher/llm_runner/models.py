@@ -23,9 +23,22 @@ Example:
     >>> print(f"Cost: ${response.cost_usd:.4f}")
 """
 
+import os
 from dataclasses import dataclass
 from typing import Protocol
 
+# Environment variables that override each provider's API base URL when the
+# model config does not set base_url (e.g., to route through a gateway or
+# the local stand-in server in llm_runner.standin_server)
+BASE_URL_ENV_VARS = {
+    "openai": "OPENAI_BASE_URL",
+    "anthropic": "ANTHROPIC_BASE_URL",
+    "mistral": "MISTRAL_BASE_URL",
+    "grok": "XAI_BASE_URL",
+    "google": "GEMINI_BASE_URL",
+    "perplexity": "PERPLEXITY_BASE_URL",
+}
+
 
 @dataclass
 class LLMResponse:
@@ -47,6 +60,15 @@ class LLMResponse:
         timestamp_utc: ISO 8601 timestamp with 'Z' suffix when response was received
         web_search_results: Optional list of web search results if tools were used
         web_search_count: Number of web searches performed (0 if no web search)
+        ttft_ms: Time to first token in ms (streamed responses only)
+        tokens_per_second: Completion tokens per second after the first token
+            (streamed responses only)
+        stopped_early: True if a stream was stopped before the model finished
+            (answer_text is then truncated)
+        cached_tokens: Prompt tokens served from the provider's prompt cache
+            (included in prompt_tokens, billed at the cached input rate)
+        coalesced: True if this response was shared from an identical
+            in-flight request (cost_usd is then 0.0; see llm_runner.coalescing)
 
     Example:
         >>> response = LLMResponse(
@@ -77,6 +99,11 @@ class LLMResponse:
     completion_tokens: int = 0
     web_search_results: list[dict] | None = None
     web_search_count: int = 0
+    ttft_ms: float | None = None
+    tokens_per_second: float | None = None
+    stopped_early: bool = False
+    cached_tokens: int = 0
+    coalesced: bool = False
 
 
 class LLMClient(Protocol):
@@ -92,6 +119,10 @@ class LLMClient(Protocol):
     Methods:
         generate_answer: Execute LLM query asynchronously and return structured response
 
+    Clients may additionally implement stream_answer() (see
+    llm_runner.streaming.StreamingLLMClient) to deliver text deltas as they
+    are generated.
+
     Example implementation:
         >>> class OpenAIClient:
         ...     def __init__(self, model_name: str, api_key: str):
@@ -151,6 +182,35 @@ class LLMClient(Protocol):
         ...
 
 
+def resolve_base_url(provider: str, base_url: str | None = None) -> str | None:
+    """
+    Resolve the API base URL for a provider.
+
+    Args:
+        provider: Provider identifier (e.g., "openai")
+        base_url: Explicit base URL from config (takes precedence)
+
+    Returns:
+        str | None: Base URL override, or None to use the provider default
+
+    Example:
+        >>> os.environ["OPENAI_BASE_URL"] = "http://127.0.0.1:8900/openai/v1"
+        >>> resolve_base_url("openai")
+        'http://127.0.0.1:8900/openai/v1'
+    """
+    if base_url:
+        return base_url
+    env_var = BASE_URL_ENV_VARS.get(provider)
+    if env_var is None:
+        return None
+    return os.environ.get(env_var) or None
+
+
+def has_function_tools(tools: list[dict] | None) -> bool:
+    """Whether a model's tools include function calling (as opposed to web search)."""
+    return any(tool.get("type") == "function" for tool in tools or [])
+
+
 def build_client(
     provider: str,
     model_name: str,
@@ -158,6 +218,8 @@ def build_client(
     system_prompt: str,
     tools: list[dict] | None = None,
     tool_choice: str = "auto",
+    *,
+    base_url: str | None = None,
 ) -> LLMClient:
     """
     Factory function to create appropriate LLM client based on provider.
@@ -181,6 +243,9 @@ def build_client(
         system_prompt: System message for context/instructions sent with requests
         tools: Optional list of tool configurations (e.g., [{"type": "web_search"}])
         tool_choice: Tool selection mode ("auto", "required", "none"). Default: "auto"
+        base_url: Optional API base URL override. If None, the provider's
+            environment variable from BASE_URL_ENV_VARS is used, falling back
+            to the public API URL.
 
     Returns:
         LLMClient: Provider-specific client implementing LLMClient protocol
@@ -211,6 +276,8 @@ def build_client(
         As new providers are added, register them here to maintain the
         stable internal contract for the Cloud product API.
     """
+    base_url = resolve_base_url(provider, base_url)
+
     if provider == "openai":
         # Import here to avoid circular dependencies and keep imports lazy
         from llm_answer_watcher.llm_runner.openai_client import (
@@ -223,6 +290,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     if provider == "anthropic":
@@ -237,6 +305,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     if provider == "mistral":
@@ -251,6 +320,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     if provider == "grok":
@@ -265,6 +335,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     if provider == "google":
@@ -279,6 +350,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     if provider == "perplexity":
@@ -293,6 +365,7 @@ def build_client(
             system_prompt=system_prompt,
             tools=tools,
             tool_choice=tool_choice,
+            base_url=base_url,
         )
 
     # Unknown provider - clear error message
@@ -8,7 +8,8 @@ Key features:
 - Async HTTP client for parallel execution (httpx.AsyncClient)
 - Retry on transient failures (429, 5xx) with exponential backoff
 - Fail fast on permanent errors (401, 400, 404)
-- Automatic cost estimation based on token usage
+- Automatic cost estimation based on token usage (cached prompt tokens are
+  billed at the cached input rate)
 - UTC timestamp tracking
 - Configurable system message per model
 - Security: NEVER logs API keys
@@ -22,6 +23,7 @@ Example:
     >>> print(f"Cost: ${response.cost_usd:.6f}")
 """
 
+import json
 import logging
 from typing import Any
 
@@ -29,12 +31,19 @@ import httpx
 
 from llm_answer_watcher.config.capabilities import get_model_capabilities
 from llm_answer_watcher.config.constants import MAX_PROMPT_LENGTH
+from llm_answer_watcher.llm_runner.batch import BatchStatus
+from llm_answer_watcher.llm_runner.http_pool import pooled_client
 from llm_answer_watcher.llm_runner.models import LLMResponse
 from llm_answer_watcher.llm_runner.retry_config import (
     NO_RETRY_STATUS_CODES,
-    REQUEST_TIMEOUT,
     create_retry_decorator,
 )
+from llm_answer_watcher.llm_runner.streaming import (
+    ChunkCallback,
+    StreamTracker,
+    estimate_tokens,
+    iter_sse_json,
+)
 from llm_answer_watcher.utils.time import utc_timestamp
 
 # Default temperature for models that support it
@@ -45,7 +54,8 @@ httpx_logger = logging.getLogger("httpx")
 httpx_logger.setLevel(logging.WARNING)
 
 # OpenAI API endpoint
-OPENAI_API_URL = "https://api.openai.com/v1/responses"
+OPENAI_API_BASE_URL = "https://api.openai.com/v1"
+OPENAI_API_URL = f"{OPENAI_API_BASE_URL}/responses"
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -86,7 +96,9 @@ class OpenAIClient:
 
     Note:
         This implementation uses async/await for parallel execution.
-        Streaming is not supported in v1.
+        stream_answer() streams the same request as server-sent events.
+        submit_batch() and friends run prompts through the provider Batch API
+        (see llm_runner.batch).
     """
 
     def __init__(
@@ -96,6 +108,8 @@ class OpenAIClient:
         system_prompt: str,
         tools: list[dict] | None = None,
         tool_choice: str = "auto",
+        *,
+        base_url: str | None = None,
     ):
         """
         Initialize OpenAI client with model, API key, system prompt, and optional tools.
@@ -106,6 +120,8 @@ class OpenAIClient:
             system_prompt: System message for context/instructions
             tools: Optional list of tool configurations (e.g., [{"type": "web_search"}])
             tool_choice: Tool selection mode ("auto", "required", "none"). Default: "auto"
+            base_url: Optional API base URL override for proxies or the local
+                stand-in server. Default: https://api.openai.com/v1
 
         Raises:
             ValueError: If model_name, api_key, or system_prompt is empty
@@ -138,6 +154,7 @@ class OpenAIClient:
         self.system_prompt = system_prompt
         self.tools = tools
         self.tool_choice = tool_choice
+        self.base_url = (base_url or OPENAI_API_BASE_URL).rstrip("/")
 
         # Log initialization (never log api_key)
         tools_enabled = "with tools" if tools else "without tools"
@@ -195,74 +212,18 @@ class OpenAIClient:
             If a non-retryable error occurs (e.g., 401), it checks the status
             code and raises immediately without retry.
         """
-        # Validate prompt is not empty
-        if not prompt or prompt.isspace():
-            raise ValueError("Prompt cannot be empty")
-
-        # Validate prompt length to prevent excessive API costs
-        if len(prompt) > MAX_PROMPT_LENGTH:
-            raise ValueError(
-                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
-                f"(received {len(prompt):,} characters). "
-                f"Please shorten your prompt to stay within the limit."
-            )
-
-        # Build request payload with model-specific parameters
-        # Responses API uses 'input' array with typed message objects
-        # Each message requires: type="message", role, and content array
-        payload = {
-            "model": self.model_name,
-            "input": [
-                {
-                    "type": "message",
-                    "role": "developer",
-                    "content": [{"type": "input_text", "text": self.system_prompt}],
-                },
-                {
-                    "type": "message",
-                    "role": "user",
-                    "content": [{"type": "input_text", "text": prompt}],
-                },
-            ],
-        }
-
-        # Add temperature parameter only if model supports it
-        # Load model capabilities from config
-        capabilities = get_model_capabilities()
-        if capabilities.supports_temperature("openai", self.model_name):
-            payload["temperature"] = DEFAULT_TEMPERATURE
-            logger.debug(f"Using temperature {DEFAULT_TEMPERATURE} for model: {self.model_name}")
-        else:
-            logger.debug(f"Using default temperature for model: {self.model_name} (custom temperature not supported)")
-
-        # Add tools configuration if provided (direct passthrough to OpenAI API)
-        # OpenAI format: [{"type": "web_search"}] with tool_choice control
-        # This differs from Google's format: [{"google_search": {}}] (no tool_choice)
-        # Config schema uses generic list[dict] to support provider-specific formats
-        if self.tools:
-            payload["tools"] = self.tools
-            payload["tool_choice"] = self.tool_choice
-            logger.debug(
-                f"Enabled tools: {self.tools} with tool_choice={self.tool_choice}"
-            )
-
-        # GPT-5 models don't support max_tokens parameter, but we generally don't use it anyway
-        # This is just for documentation - no changes needed since we don't set max_tokens
-
-        # Build headers (NEVER log api_key)
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
+        headers = self._build_headers()
 
         # Log request (NEVER log api_key or headers)
         logger.debug(f"Sending request to OpenAI: model={self.model_name}")
 
-        # Make async HTTP request with context manager for proper cleanup
+        # Make async HTTP request over the shared connection pool
         try:
-            async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT) as client:
+            async with pooled_client() as client:
                 response = await client.post(
-                    OPENAI_API_URL,
+                    f"{self.base_url}/responses",
                     json=payload,
                     headers=headers,
                 )
@@ -311,6 +272,280 @@ class OpenAIClient:
         except Exception as e:
             raise RuntimeError(f"Failed to parse OpenAI response JSON: {e}") from e
 
+        return self._parse_response_data(data)
+
+    @create_retry_decorator()
+    async def stream_answer(
+        self, prompt: str, on_chunk: ChunkCallback | None = None
+    ) -> LLMResponse:
+        """
+        Stream an answer over server-sent events, calling on_chunk per text delta.
+
+        Sends the same request as generate_answer() with "stream": true and
+        reads response.output_text.delta events. The final response.completed
+        event carries usage and web search items, parsed exactly like a
+        non-streamed response.
+
+        Args:
+            prompt: User intent prompt to send to the LLM
+            on_chunk: Optional callback receiving each text delta; return True
+                to stop generation early (see llm_runner.streaming)
+
+        Returns:
+            LLMResponse: Same as generate_answer(), plus ttft_ms,
+                tokens_per_second and stopped_early
+
+        Raises:
+            ValueError: If prompt is empty or too long
+            RuntimeError: On permanent failures, stream error events, or
+                transport errors after the first delta
+            httpx.HTTPStatusError: On retryable HTTP errors after retries exhausted
+        """
+        self._validate_prompt(prompt)
+        payload = self._build_payload(prompt)
+        payload["stream"] = True
+        headers = self._build_headers()
+        tracker = StreamTracker(on_chunk)
+        final: dict[str, Any] | None = None
+
+        logger.debug(f"Streaming request to OpenAI: model={self.model_name}")
+
+        try:
+            async with (
+                pooled_client() as client,
+                client.stream(
+                    "POST", f"{self.base_url}/responses", json=payload, headers=headers
+                ) as response,
+            ):
+                if response.status_code >= 400:
+                    await response.aread()
+                    if response.status_code in NO_RETRY_STATUS_CODES:
+                        raise RuntimeError(
+                            f"OpenAI API error (non-retryable): "
+                            f"status={response.status_code}, "
+                            f"model={self.model_name}, "
+                            f"detail={self._extract_error_detail(response)}"
+                        )
+                    response.raise_for_status()
+
+                async for event, data in iter_sse_json(response):
+                    event_type = data.get("type") or event
+                    if event_type == "response.output_text.delta":
+                        if tracker.add(data.get("delta", "")):
+                            break
+                    elif event_type == "response.completed":
+                        final = data.get("response") or {}
+                    elif event_type in ("response.failed", "error"):
+                        detail = (data.get("response") or data).get("error") or data
+                        raise RuntimeError(
+                            f"OpenAI stream failed: model={self.model_name}, detail={detail}"
+                        )
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"OpenAI API HTTP error: "
+                f"status={e.response.status_code}, "
+                f"model={self.model_name}, "
+                f"detail={self._extract_error_detail(e.response)}"
+            )
+            raise
+
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            logger.error(f"OpenAI stream error: model={self.model_name}, error={e}")
+            raise tracker.interrupted("OpenAI", self.model_name, e) from e
+
+        if final is not None:
+            # Completed stream: the final event holds the full response object
+            answer_text = tracker.text or self._extract_answer_text(final)
+            tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(final)
+            cached_tokens = self._extract_cached_tokens(final)
+            web_search_results, web_search_count = self._extract_web_search_results(final)
+        else:
+            # Stopped early (or stream ended without a completed event):
+            # provider usage is unavailable, so estimate from text length
+            answer_text = tracker.text
+            prompt_tokens = estimate_tokens(self.system_prompt + prompt)
+            completion_tokens = estimate_tokens(answer_text)
+            tokens_used = prompt_tokens + completion_tokens
+            cached_tokens = 0
+            web_search_results, web_search_count = None, 0
+
+        llm_response = self._build_llm_response(
+            answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+        llm_response.ttft_ms = tracker.ttft_ms
+        llm_response.tokens_per_second = tracker.tokens_per_second(completion_tokens)
+        llm_response.stopped_early = tracker.stopped_early
+        return llm_response
+
+    @create_retry_decorator()
+    async def submit_batch(self, prompts: dict[str, str]) -> str:
+        """
+        Submit prompts as one Batch API job against /v1/responses.
+
+        Uploads a JSONL file (one request per prompt, same payload as
+        generate_answer()) with purpose "batch", then creates the batch with
+        a 24h completion window.
+
+        Args:
+            prompts: Prompts keyed by custom ID
+
+        Returns:
+            str: Batch ID for get_batch_status()
+
+        Raises:
+            ValueError: If any prompt is empty or too long
+            RuntimeError: On permanent failures (auth errors, invalid requests)
+            httpx.HTTPStatusError: On retryable HTTP errors after retries exhausted
+        """
+        lines = []
+        for custom_id, prompt in prompts.items():
+            self._validate_prompt(prompt)
+            request = {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/responses",
+                "body": self._build_payload(prompt),
+            }
+            lines.append(json.dumps(request))
+        content = ("\n".join(lines) + "\n").encode("utf-8")
+
+        logger.debug(
+            f"Submitting OpenAI batch: model={self.model_name}, requests={len(prompts)}"
+        )
+
+        async with pooled_client() as client:
+            # Multipart upload sets its own Content-Type (NEVER log headers)
+            upload = await client.post(
+                f"{self.base_url}/files",
+                data={"purpose": "batch"},
+                files={"file": ("batch.jsonl", content, "application/jsonl")},
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            self._raise_for_batch_status(upload, "file upload")
+
+            created = await client.post(
+                f"{self.base_url}/batches",
+                json={
+                    "input_file_id": upload.json()["id"],
+                    "endpoint": "/v1/responses",
+                    "completion_window": "24h",
+                },
+                headers=self._build_headers(),
+            )
+            self._raise_for_batch_status(created, "batch create")
+
+        return str(created.json()["id"])
+
+    @create_retry_decorator()
+    async def get_batch_status(self, batch_id: str) -> BatchStatus:
+        """
+        Fetch the state of a Batch API job.
+
+        Args:
+            batch_id: ID returned by submit_batch()
+
+        Returns:
+            BatchStatus: "completed" with the output/error file IDs,
+                "failed" for failed, expired or cancelled jobs, else "pending"
+        """
+        async with pooled_client() as client:
+            response = await client.get(
+                f"{self.base_url}/batches/{batch_id}", headers=self._build_headers()
+            )
+            self._raise_for_batch_status(response, "batch status")
+
+        data = response.json()
+        status = data.get("status")
+        if status == "completed":
+            state = "completed"
+        elif status in ("failed", "expired", "cancelled"):
+            state = "failed"
+        else:
+            state = "pending"
+
+        errors = (data.get("errors") or {}).get("data") or []
+        error_message = (
+            "; ".join(str(e.get("message", e)) for e in errors) if errors else status
+        )
+        return BatchStatus(
+            batch_id=batch_id,
+            state=state,
+            output_ref=data.get("output_file_id"),
+            error_ref=data.get("error_file_id"),
+            error_message=error_message if state == "failed" else None,
+        )
+
+    @create_retry_decorator()
+    async def get_batch_results(
+        self, status: BatchStatus
+    ) -> dict[str, LLMResponse | Exception]:
+        """
+        Download and parse the output and error files of a finished job.
+
+        Args:
+            status: Finished status from get_batch_status()
+
+        Returns:
+            dict: Custom ID -> LLMResponse, or RuntimeError for failed requests
+        """
+        results: dict[str, LLMResponse | Exception] = {}
+
+        async with pooled_client() as client:
+            for file_id in (status.output_ref, status.error_ref):
+                if not file_id:
+                    continue
+                response = await client.get(
+                    f"{self.base_url}/files/{file_id}/content",
+                    headers=self._build_headers(),
+                )
+                self._raise_for_batch_status(response, "batch results")
+
+                for line in response.text.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    custom_id = item.get("custom_id")
+                    results[custom_id] = self._parse_batch_item(item)
+
+        return results
+
+    def _parse_batch_item(self, item: dict[str, Any]) -> LLMResponse | Exception:
+        """Convert one batch output line into an LLMResponse or error."""
+        response = item.get("response") or {}
+        status_code = response.get("status_code", 0)
+        if item.get("error") or not 200 <= status_code < 300:
+            detail = item.get("error") or (response.get("body") or {}).get("error")
+            return RuntimeError(
+                f"OpenAI batch request failed: status={status_code}, "
+                f"model={self.model_name}, custom_id={item.get('custom_id')}, "
+                f"detail={detail}"
+            )
+        try:
+            return self._parse_response_data(response.get("body") or {})
+        except RuntimeError as e:
+            return e
+
+    def _raise_for_batch_status(self, response: httpx.Response, action: str) -> None:
+        """Fail fast on permanent errors; raise retryable HTTP errors for @retry."""
+        if response.status_code in NO_RETRY_STATUS_CODES:
+            raise RuntimeError(
+                f"OpenAI API error (non-retryable): "
+                f"status={response.status_code}, "
+                f"model={self.model_name}, "
+                f"action={action}, "
+                f"detail={self._extract_error_detail(response)}"
+            )
+        response.raise_for_status()
+
+    def _parse_response_data(self, data: dict[str, Any]) -> LLMResponse:
+        """Build an LLMResponse from a Responses API response body."""
         # Debug: Log the entire response structure to understand token usage format
         logger.debug(f"OpenAI Responses API response keys: {data.keys()}")
         logger.debug(f"OpenAI usage field content: {data.get('usage', 'MISSING')}")
@@ -321,15 +556,111 @@ class OpenAIClient:
         # Extract token usage (total, prompt, completion)
         tokens_used, prompt_tokens, completion_tokens = self._extract_token_usage(data)
 
+        # Prompt tokens served from OpenAI's automatic prompt cache
+        cached_tokens = self._extract_cached_tokens(data)
+
         # Extract web search results (if tools were used)
         web_search_results, web_search_count = self._extract_web_search_results(data)
 
+        return self._build_llm_response(
+            answer_text,
+            tokens_used=tokens_used,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cached_tokens=cached_tokens,
+            web_search_results=web_search_results,
+            web_search_count=web_search_count,
+        )
+
+    def _validate_prompt(self, prompt: str) -> None:
+        """Reject empty prompts and prompts over MAX_PROMPT_LENGTH."""
+        # Validate prompt is not empty
+        if not prompt or prompt.isspace():
+            raise ValueError("Prompt cannot be empty")
+
+        # Validate prompt length to prevent excessive API costs
+        if len(prompt) > MAX_PROMPT_LENGTH:
+            raise ValueError(
+                f"Prompt exceeds maximum length of {MAX_PROMPT_LENGTH:,} characters "
+                f"(received {len(prompt):,} characters). "
+                f"Please shorten your prompt to stay within the limit."
+            )
+
+    def _build_payload(self, prompt: str) -> dict[str, Any]:
+        """Build the Responses API request payload for a prompt."""
+        # Build request payload with model-specific parameters
+        # Responses API uses 'input' array with typed message objects
+        # Each message requires: type="message", role, and content array
+        # The developer message (and tools) form a prefix shared by every query
+        # for this model, so OpenAI's automatic prompt caching can reuse it;
+        # only the trailing user message varies between requests.
+        payload = {
+            "model": self.model_name,
+            "input": [
+                {
+                    "type": "message",
+                    "role": "developer",
+                    "content": [{"type": "input_text", "text": self.system_prompt}],
+                },
+                {
+                    "type": "message",
+                    "role": "user",
+                    "content": [{"type": "input_text", "text": prompt}],
+                },
+            ],
+        }
+
+        # Add temperature parameter only if model supports it
+        # Load model capabilities from config
+        capabilities = get_model_capabilities()
+        if capabilities.supports_temperature("openai", self.model_name):
+            payload["temperature"] = DEFAULT_TEMPERATURE
+            logger.debug(f"Using temperature {DEFAULT_TEMPERATURE} for model: {self.model_name}")
+        else:
+            logger.debug(f"Using default temperature for model: {self.model_name} (custom temperature not supported)")
+
+        # Add tools configuration if provided (direct passthrough to OpenAI API)
+        # OpenAI format: [{"type": "web_search"}] with tool_choice control
+        # This differs from Google's format: [{"google_search": {}}] (no tool_choice)
+        # Config schema uses generic list[dict] to support provider-specific formats
+        if self.tools:
+            payload["tools"] = self.tools
+            payload["tool_choice"] = self.tool_choice
+            logger.debug(
+                f"Enabled tools: {self.tools} with tool_choice={self.tool_choice}"
+            )
+
+        # GPT-5 models don't support max_tokens parameter, but we generally don't use it anyway
+        # This is just for documentation - no changes needed since we don't set max_tokens
+
+        return payload
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build request headers (NEVER log the result)."""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _build_llm_response(
+        self,
+        answer_text: str,
+        *,
+        tokens_used: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        web_search_results: list[dict] | None,
+        web_search_count: int,
+        cached_tokens: int = 0,
+    ) -> LLMResponse:
+        """Estimate cost and assemble the LLMResponse."""
         # Calculate cost (including web search if applicable)
         # Build usage_meta in the format expected by cost estimation functions
         usage_meta = {
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": tokens_used,
+            "cached_tokens": cached_tokens,
         }
 
         # Detect web search version for pricing
@@ -376,6 +707,7 @@ class OpenAIClient:
             timestamp_utc=timestamp,
             web_search_results=web_search_results,
             web_search_count=web_search_count,
+            cached_tokens=cached_tokens,
         )
 
     def _extract_answer_text(self, data: dict[str, Any]) -> str:
@@ -535,6 +867,25 @@ class OpenAIClient:
             int(completion_tokens) if completion_tokens else 0,
         )
 
+    def _extract_cached_tokens(self, data: dict[str, Any]) -> int:
+        """
+        Extract prompt tokens served from OpenAI's prompt cache.
+
+        OpenAI caches prompt prefixes of 1024+ tokens automatically; cache
+        reads are reported in usage.input_tokens_details.cached_tokens
+        (prompt_tokens_details in the older Chat Completions format).
+
+        Returns:
+            int: Cached prompt tokens (0 if not reported)
+        """
+        usage = data.get("usage")
+        if not isinstance(usage, dict):
+            return 0
+        details = usage.get("input_tokens_details") or usage.get("prompt_tokens_details")
+        if not isinstance(details, dict):
+            return 0
+        return int(details.get("cached_tokens") or 0)
+
     def _extract_web_search_results(
         self, data: dict[str, Any]
     ) -> tuple[list[dict] | None, int]:
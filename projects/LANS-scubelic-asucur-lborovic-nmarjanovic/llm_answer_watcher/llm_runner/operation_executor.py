@@ -19,8 +19,8 @@ Key responsibilities:
 Architecture:
     OperationContext: Data container for template rendering
     OperationResult: Structured result from operation execution
-    render_template(): Template variable substitution
-    evaluate_condition(): Conditional execution logic
+    render_template(): Template variable substitution (compiled templates)
+    evaluate_condition(): Conditional execution logic (compiled predicates)
     execute_operation(): Execute single operation
     execute_operations_with_dependencies(): Execute multiple operations with DAG resolution
 
@@ -35,12 +35,21 @@ Example:
 """
 
 import logging
-import re
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
 from ..config.schema import RuntimeConfig, RuntimeOperation
+from ..config.templates import (
+    OPERATION_VARIABLE_PREFIX,
+    RANK_NOT_FOUND,
+    CompiledCondition,
+    CompiledTemplate,
+    compile_condition,
+    compile_template,
+)
+from ..llm_runner.coalescing import generate_coalesced
 from ..llm_runner.models import LLMResponse, build_client
 from ..utils.time import utc_timestamp
 
@@ -134,7 +143,55 @@ class OperationResult:
     error: str | None = None
 
 
-def render_template(template: str, context: OperationContext) -> str:
+def _join(values: list[str] | None) -> str:
+    return ", ".join(values or [])
+
+
+# Value of each template variable in an OperationContext
+_CONTEXT_VALUES: dict[str, Callable[[OperationContext], str]] = {
+    "brand:mine": lambda c: c.extraction_data.get("my_brand", "unknown"),
+    "brand:mine_all": lambda c: _join(c.extraction_data.get("my_brand_aliases")),
+    "brand:competitors": lambda c: _join(c.extraction_data.get("competitors")),
+    "competitors:mentioned": lambda c: _join(c.extraction_data.get("competitors_mentioned")),
+    "intent:id": lambda c: c.intent_data.get("id", ""),
+    "intent:prompt": lambda c: c.intent_data.get("prompt", ""),
+    "intent:response": lambda c: c.intent_data.get("response", ""),
+    "rank:mine": lambda c: (
+        RANK_NOT_FOUND
+        if c.extraction_data.get("my_rank") is None
+        else str(c.extraction_data["my_rank"])
+    ),
+    "mentions:mine": lambda c: _join(c.extraction_data.get("my_mentions")),
+    "mentions:competitors": lambda c: _join(c.extraction_data.get("competitor_mentions")),
+    "model:provider": lambda c: c.model_info.get("provider", ""),
+    "model:name": lambda c: c.model_info.get("name", ""),
+    "run:id": lambda c: c.run_metadata.get("run_id", ""),
+    "run:timestamp": lambda c: c.run_metadata.get("timestamp", ""),
+}
+
+
+def context_resolver(context: OperationContext) -> Callable[[str], str | None]:
+    """
+    Build the slot resolver of compiled templates for a context.
+
+    Args:
+        context: Operation context with data for substitution
+
+    Returns:
+        Callable returning a variable's value, or None for an
+        {operation:<id>} without a result (the placeholder is kept)
+    """
+
+    def resolve(name: str) -> str | None:
+        value = _CONTEXT_VALUES.get(name)
+        if value is not None:
+            return value(context)
+        return context.operation_results.get(name.removeprefix(OPERATION_VARIABLE_PREFIX))
+
+    return resolve
+
+
+def render_template(template: str | CompiledTemplate, context: OperationContext) -> str:
     """
     Render operation prompt template with variable substitution.
 
@@ -156,7 +213,8 @@ def render_template(template: str, context: OperationContext) -> str:
         {run:timestamp} - UTC timestamp
 
     Args:
-        template: Prompt template with variable placeholders
+        template: Prompt template, as text or compiled (see
+            RuntimeOperation.compiled_prompt)
         context: Operation context with data for substitution
 
     Returns:
@@ -168,63 +226,12 @@ def render_template(template: str, context: OperationContext) -> str:
         >>> print(rendered)
         Analyze Instantly.ai (rank 3) in: Here are the top tools...
     """
-    rendered = template
-
-    # Brand variables
-    my_brand = context.extraction_data.get("my_brand", "unknown")
-    my_brand_aliases = context.extraction_data.get("my_brand_aliases", [])
-    competitors = context.extraction_data.get("competitors", [])
-    competitors_mentioned = context.extraction_data.get("competitors_mentioned", [])
-
-    rendered = rendered.replace("{brand:mine}", my_brand)
-    rendered = rendered.replace("{brand:mine_all}", ", ".join(my_brand_aliases))
-    rendered = rendered.replace("{brand:competitors}", ", ".join(competitors))
-    rendered = rendered.replace(
-        "{competitors:mentioned}", ", ".join(competitors_mentioned)
-    )
+    if isinstance(template, str):
+        template = compile_template(template)
+    return template.render(context_resolver(context))
 
-    # Intent variables
-    rendered = rendered.replace("{intent:id}", context.intent_data.get("id", ""))
-    rendered = rendered.replace(
-        "{intent:prompt}", context.intent_data.get("prompt", "")
-    )
-    rendered = rendered.replace(
-        "{intent:response}", context.intent_data.get("response", "")
-    )
 
-    # Rank and mention variables
-    my_rank = context.extraction_data.get("my_rank")
-    rank_str = str(my_rank) if my_rank is not None else "not found"
-    rendered = rendered.replace("{rank:mine}", rank_str)
-
-    my_mentions = context.extraction_data.get("my_mentions", [])
-    competitor_mentions = context.extraction_data.get("competitor_mentions", [])
-    rendered = rendered.replace("{mentions:mine}", ", ".join(my_mentions))
-    rendered = rendered.replace(
-        "{mentions:competitors}", ", ".join(competitor_mentions)
-    )
-
-    # Model variables
-    rendered = rendered.replace(
-        "{model:provider}", context.model_info.get("provider", "")
-    )
-    rendered = rendered.replace("{model:name}", context.model_info.get("name", ""))
-
-    # Run metadata variables
-    rendered = rendered.replace("{run:id}", context.run_metadata.get("run_id", ""))
-    rendered = rendered.replace(
-        "{run:timestamp}", context.run_metadata.get("timestamp", "")
-    )
-
-    # Operation chaining variables
-    for op_id, op_result in context.operation_results.items():
-        placeholder = f"{{operation:{op_id}}}"
-        rendered = rendered.replace(placeholder, op_result)
-
-    return rendered
-
-
-def evaluate_condition(condition: str, context: OperationContext) -> bool:
+def evaluate_condition(condition: str | CompiledCondition, context: OperationContext) -> bool:
     """
     Evaluate conditional expression for operation execution.
 
@@ -235,11 +242,13 @@ def evaluate_condition(condition: str, context: OperationContext) -> bool:
         {competitors:mentioned} contains "HubSpot"
 
     Args:
-        condition: Condition string with variables
+        condition: Condition, as text or compiled (see
+            RuntimeOperation.compiled_condition)
         context: Operation context for variable substitution
 
     Returns:
-        True if condition evaluates to true, False otherwise
+        True if condition evaluates to true, False otherwise. Conditions
+        that cannot be evaluated return True (the operation runs).
 
     Example:
         >>> condition = "{rank:mine} > 3"
@@ -247,46 +256,9 @@ def evaluate_condition(condition: str, context: OperationContext) -> bool:
         >>> print(result)
         True
     """
-    # First render the condition template
-    rendered = render_template(condition, context)
-
-    # Handle null checks
-    if "== null" in rendered:
-        return "not found == null" in rendered
-
-    # Handle numeric comparisons
-    match = re.match(r"(\d+|not found)\s*(==|!=|>|<|>=|<=)\s*(\d+)", rendered)
-    if match:
-        left, op, right = match.groups()
-        if left == "not found":
-            return False  # Can't compare non-numeric
-
-        left_val = int(left)
-        right_val = int(right)
-
-        # Use operator mapping to reduce return statements
-        comparisons = {
-            "==": lambda left, right: left == right,
-            "!=": lambda left, right: left != right,
-            ">": lambda left, right: left > right,
-            "<": lambda left, right: left < right,
-            ">=": lambda left, right: left >= right,
-            "<=": lambda left, right: left <= right,
-        }
-        if op in comparisons:
-            return comparisons[op](left_val, right_val)
-
-    # Handle string contains checks
-    if " contains " in rendered:
-        parts = rendered.split(" contains ")
-        if len(parts) == 2:
-            haystack = parts[0].strip()
-            needle = parts[1].strip().strip('"').strip("'")
-            return needle in haystack
-
-    # Default: condition not understood, don't skip
-    logger.warning(f"Could not evaluate condition: {condition} (rendered: {rendered})")
-    return True
+    if isinstance(condition, str):
+        condition = compile_condition(condition)
+    return condition.evaluate(context_resolver(context))
 
 
 async def execute_operation(
@@ -342,7 +314,8 @@ async def execute_operation(
         )
 
     # Evaluate condition if specified
-    if operation.condition and not evaluate_condition(operation.condition, context):
+    condition = operation.compiled_condition
+    if condition is not None and not evaluate_condition(condition, context):
         logger.info(
             f"Operation '{operation.id}' condition not met, skipping: {operation.condition}"
         )
@@ -360,7 +333,7 @@ async def execute_operation(
         )
 
     # Render template
-    rendered_prompt = render_template(operation.prompt, context)
+    rendered_prompt = render_template(operation.compiled_prompt, context)
 
     # Select model (priority: explicit override > operation_models > models)
     if operation.runtime_model:
@@ -438,10 +411,11 @@ async def execute_operation(
             system_prompt=model.system_prompt,
             tools=tools,  # None for standard, schema for structured
             tool_choice=tool_choice,  # "auto" for standard, "required" for structured
+            base_url=model.base_url,
         )
 
         # Execute
-        response: LLMResponse = await client.generate_answer(rendered_prompt)
+        response: LLMResponse = await generate_coalesced(client, rendered_prompt)
 
         # Parse response based on operation type
         result_text = response.answer_text
@@ -557,6 +531,9 @@ async def execute_operations_with_dependencies(
     operations: list[RuntimeOperation],
     context: OperationContext,
     runtime_config: RuntimeConfig,
+    *,
+    can_continue: Callable[[], bool] | None = None,
+    on_result: Callable[[OperationResult], None] | None = None,
 ) -> dict[str, OperationResult]:
     """
     Execute operations in dependency order (topological sort).
@@ -571,9 +548,14 @@ async def execute_operations_with_dependencies(
         operations: List of operations to execute
         context: Template rendering context
         runtime_config: Runtime configuration
+        can_continue: Checked before each operation; False stops the chain
+            (e.g. CostLedger.allows for the intent)
+        on_result: Called with each result as soon as its operation
+            finishes (e.g. to charge its cost to the CostLedger)
 
     Returns:
-        Dictionary mapping operation ID to OperationResult
+        Dictionary mapping operation ID to OperationResult, for the
+        operations that ran
 
     Example:
         >>> results = execute_operations_with_dependencies(ops, context, runtime_config)
@@ -594,9 +576,18 @@ async def execute_operations_with_dependencies(
     results: dict[str, OperationResult] = {}
 
     for operation in sorted_operations:
+        if can_continue is not None and not can_continue():
+            logger.info(
+                f"Operations stopped before '{operation.id}': "
+                f"{len(sorted_operations) - len(results)} not run"
+            )
+            break
+
         # Execute operation
         result = await execute_operation(operation, context, runtime_config)
         results[operation.id] = result
+        if on_result is not None:
+            on_result(result)
 
         # Update context with result for chaining
         if not result.skipped and not result.error:
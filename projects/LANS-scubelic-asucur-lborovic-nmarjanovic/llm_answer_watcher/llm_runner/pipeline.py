@@ -0,0 +1,100 @@
+"""
+Bounded producer/consumer execution for large runs.
+
+Creating one task per (intent x model) up front and gathering them all holds
+every coroutine and every result in memory until the run ends. run_bounded()
+instead pulls work items lazily from an iterable or async iterable, keeps at
+most max_in_flight tasks running, and hands each result to a callback as soon
+as it completes, so callers can fold results into running totals. Memory is
+bounded by the window size, not by the number of work items.
+
+Tasks are created in the caller's context, so context variables set around
+run_bounded() (e.g. the request coalescer) are visible to every worker.
+
+Example:
+    >>> totals = {"ok": 0, "failed": 0}
+    >>> def on_result(item, result):
+    ...     totals["failed" if isinstance(result, Exception) else "ok"] += 1
+    >>> await run_bounded(work_items(), execute_query, 20, on_result)
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
+
+# Window of queued work per concurrent request slot: enough that a freed slot
+# is refilled immediately without materializing the whole run
+QUEUE_DEPTH_PER_SLOT = 2
+
+
+async def _aiter(items: Iterable | AsyncIterable):
+    """Iterate a sync or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+async def run_bounded[ItemT, ResultT](
+    items: Iterable[ItemT] | AsyncIterable[ItemT],
+    worker: Callable[[ItemT], Awaitable[ResultT]],
+    max_in_flight: int,
+    on_result: Callable[[ItemT, ResultT | Exception], None],
+) -> int:
+    """
+    Run worker(item) for every item with at most max_in_flight running.
+
+    The next item is only pulled from items when a slot is free, so a lazy
+    producer (generator) is never more than max_in_flight items ahead.
+    Exceptions raised by a worker are passed to on_result instead of the
+    result; they do not stop the remaining work. If run_bounded() itself is
+    cancelled, the running tasks are cancelled too.
+
+    Args:
+        items: Work items (generator, async generator or any iterable)
+        worker: Coroutine function executed per item
+        max_in_flight: Maximum number of concurrently running workers
+        on_result: Called with (item, result or exception) as each finishes
+
+    Returns:
+        int: Number of items processed
+
+    Raises:
+        ValueError: If max_in_flight is less than 1
+    """
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be at least 1 (got: {max_in_flight})")
+
+    source = _aiter(items)
+    in_flight: dict[asyncio.Task, ItemT] = {}
+    exhausted = False
+    processed = 0
+    try:
+        while True:
+            while not exhausted and len(in_flight) < max_in_flight:
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                in_flight[asyncio.ensure_future(worker(item))] = item
+
+            if not in_flight:
+                return processed
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = in_flight.pop(task)
+                try:
+                    result = task.result()
+                except Exception as e:
+                    result = e
+                processed += 1
+                on_result(item, result)
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        await source.aclose()
@@ -34,6 +34,8 @@ from tenacity import (
     wait_exponential,
 )
 
+from .circuit_breaker import current_circuit_open
+
 # ============================================================================
 # RETRY CONSTANTS
 # ============================================================================
@@ -67,6 +69,7 @@ NO_RETRY_STATUS_CODES = frozenset([401, 400, 404])
 # Applies to each individual request attempt
 # Protects against hung connections
 # Increased for GPT-5 models which may take longer to respond
+# Also the upper bound for adaptive per-model timeouts (see hedging.py)
 REQUEST_TIMEOUT = 120.0
 
 # ============================================================================
@@ -74,13 +77,18 @@ REQUEST_TIMEOUT = 120.0
 # ============================================================================
 
 
+def _stop_if_circuit_open(retry_state) -> bool:
+    """tenacity stop condition: the current provider/model circuit is open."""
+    return current_circuit_open()
+
+
 def create_retry_decorator():
     """
     Create a tenacity retry decorator for LLM API calls.
 
     Returns a configured retry decorator with:
     - Exponential backoff (1s min, 60s max)
-    - Max 3 attempts total
+    - Max 3 attempts total, or fewer if the provider's circuit breaker opens
     - Retry on: httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException
     - Caller must check status codes to fail fast on permanent errors
 
@@ -111,9 +119,11 @@ def create_retry_decorator():
         - Starts at MIN_WAIT_SECONDS (1s) to give servers time to recover
         - Caps at MAX_WAIT_SECONDS (60s) to prevent excessive waiting
         - Reraises exception after all attempts to preserve stack trace
+        - Stops early when the call's circuit breaker is open (provider
+          outage), so queued and in-flight queries fail fast
     """
     return retry(
-        stop=stop_after_attempt(MAX_ATTEMPTS),
+        stop=stop_after_attempt(MAX_ATTEMPTS) | _stop_if_circuit_open,
         wait=wait_exponential(
             multiplier=1,
             min=MIN_WAIT_SECONDS,
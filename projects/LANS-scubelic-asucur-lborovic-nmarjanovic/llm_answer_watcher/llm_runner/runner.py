@@ -33,42 +33,105 @@ Architecture:
 """
 
 import asyncio
+import heapq
 import json
 import logging
 import sqlite3
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Collection
 from dataclasses import asdict, dataclass
 
 from ..config.schema import RuntimeConfig
 from ..exceptions import BudgetExceededError
 from ..extractor.intent_classifier import classify_intent
 from ..extractor.parser import parse_answer
+from ..extractor.stream_matcher import IncrementalMentionMatcher
 from ..storage.db import (
     insert_answer_raw,
     insert_intent_classification,
     insert_mention,
     insert_operation,
+    insert_query_timing,
     insert_run,
+    insert_visibility_estimate,
+    update_run_cost,
+    update_run_status,
 )
 from ..storage.writer import (
+    append_error_log,
     create_run_directory,
     write_error,
     write_operation_result,
     write_parsed_answer,
     write_raw_answer,
     write_run_meta,
+    write_timings_otel,
 )
+from ..utils.cost import prompt_cache_report, tally_prompt_cache
+from ..utils.fingerprint import CHANGE_MAJOR, CHANGE_MINOR, CHANGE_NEW, CHANGE_UNCHANGED
 from ..utils.time import run_id_from_timestamp, utc_timestamp
+from .batch import collect_batch_responses
+from .circuit_breaker import CircuitBreakers
+from .coalescing import RequestCoalescer, reset_current_coalescer
+from .estimator import QueryHistory, predict_makespan
+from .fanout import (
+    SharedAnswerPool,
+    plan_queries,
+    release_answer,
+    reset_current_pool,
+    share_answer,
+)
+from .freshness import carry_forward_answers, find_fresh_answers, reuse_extraction
+from .hedging import LatencyController
+from .http_pool import count_attempts, request_timeout
 from .intent_runner import IntentResult
-from .models import build_client
+from .ledger import (
+    COST_ANSWERS,
+    COST_CLASSIFICATION,
+    COST_EXTRACTION,
+    COST_HEDGING,
+    COST_OPERATIONS,
+    COST_SAMPLING,
+    RUN_BUDGET_TRUNCATED,
+    CostLedger,
+)
+from .models import build_client, has_function_tools
 from .operation_executor import (
     OperationContext,
     execute_operations_with_dependencies,
 )
+from .pipeline import QUEUE_DEPTH_PER_SLOT, run_bounded
 from .plugin_registry import RunnerRegistry
+from .sampling import STOP_BUDGET, STOP_PRECISE, my_rank, sample_visibility
+from .streaming import supports_streaming
+from .timing import (
+    STAGE_ARTIFACT_WRITE,
+    STAGE_DB_WRITE,
+    STAGE_EXTRACTION,
+    STAGE_LLM_CALL,
+    STAGE_OPERATIONS,
+    STAGE_SEMAPHORE_WAIT,
+    LatencyAccumulator,
+    QueryTimer,
+    build_otel_trace,
+    reset_current_timer,
+)
 
 logger = logging.getLogger(__name__)
 
+# Finished query timings are written to the database in batches of this size
+TIMING_FLUSH_SIZE = 200
+
+# Errors listed in the run summary; all errors are appended to errors.jsonl
+MAX_REPORTED_ERRORS = 100
+
+# Changed answers (minor/major) listed in the run summary
+MAX_REPORTED_CHANGES = 100
+
+# Queries held for longest-first ordering; larger runs are ordered within a
+# sliding window of this many queries, so ordering memory stays bounded
+QUERY_ORDER_WINDOW = 1000
+
 
 @dataclass
 class RawAnswerRecord:
@@ -229,19 +292,34 @@ def intent_result_to_raw_record(
     )
 
 
-def estimate_run_cost(config: RuntimeConfig) -> dict:
+def estimate_run_cost(
+    config: RuntimeConfig,
+    history: QueryHistory | None = None,
+    fresh: Collection[tuple[str, str, str]] | None = None,
+) -> dict:
     """
-    Estimate total cost for a run before execution.
+    Estimate total cost and wall time for a run before execution.
 
-    Uses conservative estimates for token usage:
+    Each (intent, model) query is predicted from earlier runs in the
+    database (see estimator.QueryHistory): token usage and duration of the
+    same intent on the same model, else the model's average, else
+    conservative defaults:
     - Input tokens: 150 per query (prompt + system)
     - Output tokens: 500 per query (answer)
     - Web search: $0.01 per call if tools enabled
 
-    Adds 20% buffer for safety.
+    Adds 20% buffer for safety. The wall time assumes queries run
+    longest-first with max_concurrent_requests slots, as run_all() does.
+    Queries whose earlier answer is still fresh (see freshness) are carried
+    forward without an API call and cost nothing. With adaptive sampling,
+    every API query is budgeted at max_samples samples (the worst case).
 
     Args:
         config: Runtime configuration with intents and models
+        history: Query history to predict from (loaded from
+            run_settings.sqlite_db_path if omitted)
+        fresh: (intent_id, provider, model_name) of queries that will be
+            reused (looked up with find_fresh_answers() if omitted)
 
     Returns:
         dict: Cost estimate with breakdown:
@@ -250,6 +328,10 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
             - per_model_costs: List of dicts with per-model breakdown
             - total_queries: Total number of queries
             - buffer_percentage: Safety buffer applied (20%)
+            - predicted_duration_s: Predicted wall time of the queries
+            - history_coverage: Fraction of queries predicted from history
+            - reused_queries: Number of queries reused while fresh
+            - max_samples_per_query: Samples budgeted per API query
 
     Example:
         >>> estimate = estimate_run_cost(config)
@@ -260,78 +342,91 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
     """
     from ..utils.pricing import PricingNotAvailableError, get_pricing
 
-    # Conservative token estimates
-    AVG_INPUT_TOKENS = 150  # Prompt + system message
-    AVG_OUTPUT_TOKENS = 500  # Response
     BUFFER_PERCENTAGE = 0.20  # 20% safety buffer
+    WEB_SEARCH_COST = 0.01  # $10/1k = $0.01 per call, assume 1 per query
+
+    if history is None:
+        history = QueryHistory.load(config.run_settings.sqlite_db_path)
+    if fresh is None:
+        fresh = find_fresh_answers(config)
+
+    # Look up per-token rates once per model, not once per query
+    rates = {}
+    for model in config.models:
+        try:
+            pricing = get_pricing(model.provider, model.model_name)
+            rates[model.provider, model.model_name] = (
+                pricing.input / 1_000_000,  # Convert to per-token
+                pricing.output / 1_000_000,
+            )
+        except (PricingNotAvailableError, Exception) as e:
+            logger.warning(
+                f"Cannot estimate cost for {model.provider}/{model.model_name}: {e}. "
+                "Using $0.002 fallback."
+            )
+            # Fallback: assume ~$0.002 per query (gpt-4o-mini ballpark)
+            rates[model.provider, model.model_name] = (0.00000015, 0.0000006)
 
     total_cost = 0.0
     per_intent_costs = {}
-    per_model_costs = []
+    model_totals = {
+        (model.provider, model.model_name): {"cost": 0.0, "duration_s": 0.0}
+        for model in config.models
+    }
+    durations = []
+    from_history = 0
+    sampling = config.run_settings.sampling
+    samples_per_query = sampling.max_samples if sampling else 1
 
     for intent in config.intents:
         intent_cost = 0.0
 
         for model in config.models:
-            # Get pricing for this model
-            try:
-                pricing = get_pricing(model.provider, model.model_name)
-                input_rate = pricing.input / 1_000_000  # Convert to per-token
-                output_rate = pricing.output / 1_000_000
-            except (PricingNotAvailableError, Exception) as e:
-                logger.warning(
-                    f"Cannot estimate cost for {model.provider}/{model.model_name}: {e}. "
-                    "Using $0.002 fallback."
-                )
-                # Fallback: assume ~$0.002 per query (gpt-4o-mini ballpark)
-                input_rate = 0.00000015  # $0.15/1M
-                output_rate = 0.0000006  # $0.60/1M
-
-            # Calculate token cost
-            query_cost = (AVG_INPUT_TOKENS * input_rate) + (
-                AVG_OUTPUT_TOKENS * output_rate
+            if (intent.id, model.provider, model.model_name) in fresh:
+                continue
+            prediction = history.predict(intent.id, model.provider, model.model_name)
+            input_rate, output_rate = rates[model.provider, model.model_name]
+            query_cost = (
+                prediction.input_tokens * input_rate + prediction.output_tokens * output_rate
             )
-
-            # Add web search cost if tools enabled
             if model.tools:
-                # Assume 1 web search per query
-                web_search_cost = 0.01  # $10/1k = $0.01 per call
-                query_cost += web_search_cost
+                query_cost += WEB_SEARCH_COST
+            query_cost *= samples_per_query
+            duration_s = prediction.duration_s * samples_per_query
 
             intent_cost += query_cost
+            totals = model_totals[model.provider, model.model_name]
+            totals["cost"] += query_cost
+            totals["duration_s"] += duration_s
+            durations.append(duration_s)
+            from_history += prediction.source != "default"
+
+        for runner_config in config.runner_configs or []:
+            prediction = history.predict(
+                intent.id, runner_config.runner_plugin, "runner", runner=True
+            )
+            durations.append(prediction.duration_s)
+            from_history += prediction.source != "default"
 
         per_intent_costs[intent.id] = round(intent_cost, 6)
         total_cost += intent_cost
 
-    # Calculate per-model breakdown (cost across all intents)
+    # Per-model breakdown (cost across all intents)
+    num_intents = len(config.intents)
+    per_model_costs = []
     for model in config.models:
-        # Get pricing for this model
-        try:
-            pricing = get_pricing(model.provider, model.model_name)
-            input_rate = pricing.input / 1_000_000
-            output_rate = pricing.output / 1_000_000
-        except (PricingNotAvailableError, Exception):
-            input_rate = 0.00000015
-            output_rate = 0.0000006
-
-        # Calculate cost per query
-        query_cost = (AVG_INPUT_TOKENS * input_rate) + (AVG_OUTPUT_TOKENS * output_rate)
-
-        # Add web search cost if tools enabled
-        if model.tools:
-            query_cost += 0.01
-
-        # Total cost for this model across all intents
-        model_total = query_cost * len(config.intents)
-
+        totals = model_totals[model.provider, model.model_name]
         per_model_costs.append(
             {
                 "provider": model.provider,
                 "model_name": model.model_name,
-                "cost_per_query": round(query_cost, 6),
-                "total_cost": round(model_total, 6),
-                "num_queries": len(config.intents),
+                "cost_per_query": round(totals["cost"] / num_intents, 6) if num_intents else 0.0,
+                "total_cost": round(totals["cost"], 6),
+                "num_queries": num_intents,
                 "has_web_search": bool(model.tools),
+                "avg_duration_s": (
+                    round(totals["duration_s"] / num_intents, 3) if num_intents else 0.0
+                ),
             }
         )
 
@@ -401,6 +496,12 @@ def estimate_run_cost(config: RuntimeConfig) -> dict:
         "per_operation_model_costs": per_operation_model_costs,
         "buffer_percentage": BUFFER_PERCENTAGE,
         "base_cost": round(total_cost, 6),
+        "predicted_duration_s": round(
+            predict_makespan(durations, config.run_settings.max_concurrent_requests), 1
+        ),
+        "history_coverage": round(from_history / len(durations), 3) if durations else 0.0,
+        "reused_queries": len(fresh),
+        "max_samples_per_query": samples_per_query,
     }
 
 
@@ -469,6 +570,7 @@ async def run_all(
     config: RuntimeConfig,
     progress_callback: Callable[[], None] | None = None,
     config_filename: str | None = None,
+    run_id: str | None = None,
 ) -> dict:
     """
     Execute complete LLM query workflow with parallel execution and return results.
@@ -484,6 +586,8 @@ async def run_all(
         config: Runtime configuration with intents, models, API keys, paths
         progress_callback: Optional callback function to call after each query
             completes (successful or failed). Used by CLI to update progress bar.
+        config_filename: Config file name recorded in run_meta.json
+        run_id: Run identifier (default: derived from the current UTC time)
 
     Returns:
         Summary dictionary with structure:
@@ -491,12 +595,16 @@ async def run_all(
             "run_id": "2025-11-02T08-00-00Z",
             "timestamp_utc": "2025-11-02T08:00:00Z",
             "output_dir": "./output/2025-11-02T08-00-00Z",
+            "status": "complete",
             "total_intents": 3,
             "total_models": 2,
             "total_queries": 6,
             "success_count": 5,
             "error_count": 1,
+            "reused_count": 0,
             "total_cost_usd": 0.0123,
+            "answer_changes": {"new": 0, "unchanged": 4, "minor": 1, "major": 0},
+            "budget": {"spent_usd": 0.0123, "skipped_count": 0, ...},
             "errors": [
                 {
                     "intent_id": "sales-tools",
@@ -504,7 +612,9 @@ async def run_all(
                     "model_name": "gpt-4o",
                     "error_message": "API rate limit exceeded"
                 }
-            ]
+            ],
+            "failed_queries": [("sales-tools", "openai", "gpt-4o")],
+            "skipped_queries": []
         }
 
     Raises:
@@ -526,14 +636,37 @@ async def run_all(
     Implementation notes:
         - Queries are executed in parallel with semaphore rate limiting
         - Concurrency controlled by config.run_settings.max_concurrent_requests
-        - Intent classification runs sequentially per intent before parallel execution
+        - Queries are generated lazily and results folded in as they complete,
+          so memory does not grow with the number of queries
+        - Queries whose earlier answer is still fresh under a freshness policy
+          are carried forward by reference (no API call) and counted as
+          successes; "reused_count" reports how many
+        - With run_settings.sampling, each API query is repeated until the
+          intervals on my brand's appearance rate and mean rank are narrow
+          enough (see sampling); estimates go to the parsed JSON and the
+          visibility_estimates table, totals to run_meta.json
+        - Each answer is compared with the previous answer for the same intent
+          and model by SimHash; "answer_changes" counts new, unchanged, minor
+          and major changes. With reuse_unchanged_extractions, unchanged
+          answers keep the previous extraction and skip operations
+        - Intent classification runs just before each intent's queries are queued
+        - The returned "errors" lists at most MAX_REPORTED_ERRORS entries; every
+          error is appended to errors.jsonl in the run directory, and
+          "failed_queries" lists the (intent_id, provider, model_name) of every
+          failed query, for building per-query statuses
+        - Actual spend is charged to a CostLedger as each response arrives;
+          with budget limits, queries, samples and operations that have not
+          started when a limit is reached are skipped (in-flight requests
+          finish) and the run's status is "budget-truncated". The budget
+          account lists at most MAX_REPORTED_SKIPS skips; "skipped_queries"
+          lists every query skipped for budget
         - Each query failure is logged but doesn't stop execution
         - Error files are written for failed queries
         - Database operations remain synchronous (SQLite is fast for local ops)
         - Cost is estimated, not exact (depends on provider pricing)
     """
     # Generate run identifier from current UTC timestamp
-    run_id = run_id_from_timestamp()
+    run_id = run_id or run_id_from_timestamp()
     timestamp_utc = utc_timestamp()
 
     # Count execution units (models + runners)
@@ -547,12 +680,17 @@ async def run_all(
         f"{num_runners} runners, output_dir={config.run_settings.output_dir}"
     )
 
-    # Estimate cost and validate budget (if configured)
-    cost_estimate = estimate_run_cost(config)
+    # Estimate cost and validate budget (if configured); predictions come
+    # from earlier runs and also decide the execution order below. Queries
+    # whose earlier answer is still fresh are carried forward, not executed.
+    history = QueryHistory.load(config.run_settings.sqlite_db_path)
+    fresh = find_fresh_answers(config)
+    cost_estimate = estimate_run_cost(config, history, fresh)
     logger.info(
         f"Estimated cost: ${cost_estimate['total_estimated_cost']:.4f} "
         f"for {cost_estimate['total_queries']} queries "
-        f"(includes {int(cost_estimate['buffer_percentage'] * 100)}% buffer)"
+        f"(includes {int(cost_estimate['buffer_percentage'] * 100)}% buffer), "
+        f"predicted wall time {cost_estimate['predicted_duration_s']:.0f}s"
     )
 
     try:
@@ -572,6 +710,7 @@ async def run_all(
     total_cost_usd = 0.0
     total_operations_cost_usd = 0.0  # Track operations cost separately
     errors = []
+    failed_queries: set[tuple[str, str, str]] = set()
 
     # Insert run record into database
     try:
@@ -589,9 +728,161 @@ async def run_all(
         logger.error(f"Failed to insert run record into database: {e}", exc_info=True)
         # Continue execution - database is not critical
 
+    # Carry fresh answers forward by reference; anything that cannot be
+    # carried (e.g. the earlier answer was deleted) is queried as usual
+    reused = carry_forward_answers(config, fresh, run_id, timestamp_utc, run_dir)
+    success_count += len(reused)
+    if reused:
+        logger.info(f"Reused {len(reused)} fresh answers from earlier runs")
+        # Under run_many(), answers other configs share are not kept for these
+        for intent in config.intents:
+            for model_config in config.models or []:
+                if (intent.id, model_config.provider, model_config.model_name) in reused:
+                    release_answer(model_config, intent.prompt)
+        for intent_id, provider, model_name in reused:
+            if progress_callback:
+                if hasattr(progress_callback, "complete_query"):
+                    await progress_callback.complete_query(
+                        f"{intent_id}_{provider}_{model_name}", success=True
+                    )
+                else:
+                    progress_callback()
+
+    # Batch mode: run OpenAI/Anthropic queries as provider batch jobs first;
+    # their responses then go through the normal per-query pipeline below
+    batch_responses = {}
+    if config.run_settings.execution_mode == "batch" and config.models:
+        logger.info("Batch execution mode: submitting provider batch jobs")
+        batch_responses = await collect_batch_responses(
+            config.models,
+            config.intents,
+            poll_interval=config.run_settings.batch_poll_interval_seconds,
+            skip=reused,
+        )
+
     # Initialize semaphore for rate limiting concurrent requests
     max_concurrent = config.run_settings.max_concurrent_requests
     semaphore = asyncio.Semaphore(max_concurrent)
+    # Per-model latency histograms (persisted across runs) drive adaptive
+    # request timeouts and, if enabled, hedged requests
+    latency_controller = LatencyController.load(
+        config.run_settings.sqlite_db_path,
+        adaptive_timeouts=config.run_settings.adaptive_timeouts,
+        hedge=config.run_settings.hedge_requests,
+        max_extra_cost_usd=config.run_settings.hedge_max_extra_cost_usd,
+    )
+    # Per-provider/model circuit breakers: during an outage the remaining
+    # queries fail fast instead of each exhausting its retries
+    circuit_breakers = CircuitBreakers(config.run_settings.circuit_breaker)
+    # Actual spend, charged as responses arrive; budget limits are enforced
+    # live by skipping work that has not started yet
+    ledger = CostLedger(config.run_settings.budget)
+
+    # Finished queries are folded into running aggregates so memory does not
+    # grow with the number of queries; timing rows are written in batches
+    latency = LatencyAccumulator()
+    pending_timings: list[QueryTimer] = []
+    otel_timers: list[QueryTimer] = []  # Only kept when exporting spans
+    # Token usage totals of all LLM calls by "provider/model", for prompt cache stats
+    prompt_cache_totals: dict[str, dict[str, int]] = {}
+
+    def record_extraction_usage(extraction_result) -> None:
+        usage = extraction_result.extraction_usage
+        if usage and config.extraction_settings:
+            extraction_model = config.extraction_settings.extraction_model
+            key = f"{extraction_model.provider}/{extraction_model.model_name}"
+            tally_prompt_cache(prompt_cache_totals, key, usage)
+
+    def flush_timings() -> None:
+        try:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                for timer in pending_timings:
+                    insert_query_timing(
+                        conn=conn,
+                        run_id=run_id,
+                        intent_id=timer.intent_id,
+                        model_provider=timer.model_provider,
+                        model_name=timer.model_name,
+                        status=timer.status,
+                        total_ms=timer.total_ms,
+                        stage_ms=timer.stage_totals(),
+                        http_attempts=timer.http_attempts,
+                        timestamp_utc=timestamp_utc,
+                        spans_json=json.dumps([asdict(span) for span in timer.spans]),
+                        ttft_ms=timer.ttft_ms,
+                        tokens_per_sec=timer.tokens_per_sec,
+                        first_mention_ms=timer.first_mention_ms,
+                        stopped_early=timer.stopped_early,
+                    )
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to insert query timings into database: {e}", exc_info=True)
+        pending_timings.clear()
+
+    # Run-over-run answer changes (SimHash distance to the previous answer)
+    answer_changes = dict.fromkeys(
+        (CHANGE_NEW, CHANGE_UNCHANGED, CHANGE_MINOR, CHANGE_MAJOR), 0
+    )
+    answer_changes[CHANGE_UNCHANGED] = len(reused)
+    changed_answers: list[dict] = []
+
+    def record_change(
+        intent_id: str, provider: str, model_name: str, change_status: str | None
+    ) -> None:
+        if change_status is None:
+            return
+        answer_changes[change_status] += 1
+        if change_status in (CHANGE_MINOR, CHANGE_MAJOR) and (
+            len(changed_answers) < MAX_REPORTED_CHANGES
+        ):
+            changed_answers.append(
+                {
+                    "intent_id": intent_id,
+                    "model_provider": provider,
+                    "model_name": model_name,
+                    "change": change_status,
+                }
+            )
+
+    # Adaptive sampling totals (run_settings.sampling)
+    sampling_totals = {"sampled_queries": 0, "samples": 0, "stopped_early": 0, "cost_usd": 0.0}
+
+    def record_sampling(visibility: dict) -> None:
+        sampling_totals["sampled_queries"] += 1
+        sampling_totals["samples"] += visibility["samples"]
+        sampling_totals["stopped_early"] += visibility["stop_reason"] == STOP_PRECISE
+        sampling_totals["cost_usd"] += visibility["sampling_cost_usd"]
+
+    def budget_allows(intent, model_config) -> bool:
+        # Batch answers are already paid for, so they are always ingested
+        if model_config and (
+            (intent.id, model_config.provider, model_config.model_name) in batch_responses
+        ):
+            return True
+        return ledger.allows(intent.id)
+
+    async def skip_query(intent, model_config, runner_config) -> None:
+        provider = model_config.provider if model_config else runner_config.runner_plugin
+        model_name = model_config.model_name if model_config else "runner"
+        ledger.skip(intent.id, provider, model_name)
+        if model_config:
+            release_answer(model_config, intent.prompt)
+        if progress_callback:
+            if hasattr(progress_callback, "complete_query"):
+                await progress_callback.complete_query(
+                    f"{intent.id}_{provider}_{model_name}", success=False
+                )
+            else:
+                progress_callback()
+
+    def record_timer(timer: QueryTimer) -> None:
+        latency.add(timer)
+        if config.run_settings.export_otel_timings:
+            otel_timers.append(timer)
+        pending_timings.append(timer)
+        if len(pending_timings) >= TIMING_FLUSH_SIZE:
+            flush_timings()
+
     logger.info(f"Parallelization enabled: max {max_concurrent} concurrent requests")
 
     # Define async wrapper for executing single query with semaphore
@@ -604,9 +895,26 @@ async def run_all(
         Execute single query with semaphore rate limiting.
 
         Returns:
-            tuple: (success: bool, cost_usd: float, error_dict: dict | None)
+            tuple: (success: bool, cost_usd: float, error_dict: dict | None),
+                or None if the budget was reached while the query waited
         """
+        # Timer starts before acquiring the semaphore to capture wait time
+        timer = QueryTimer(
+            run_id=run_id,
+            intent_id=intent.id,
+            model_provider=model_config.provider
+            if model_config
+            else runner_config.runner_plugin,
+            model_name=model_config.model_name if model_config else "runner",
+        )
+
         async with semaphore:
+            if not budget_allows(intent, model_config):
+                await skip_query(intent, model_config, runner_config)
+                return None
+            timer.mark_since_start(STAGE_SEMAPHORE_WAIT)
+            timer_token = timer.activate()
+
             # Determine if this is an API model or runner
             if model_config:
                 provider = model_config.provider
@@ -628,6 +936,9 @@ async def run_all(
             if progress_callback and hasattr(progress_callback, "start_query"):
                 await progress_callback.start_query(intent.id, provider, model_name)
 
+            # Whether the query still holds a planned share_answer() copy:
+            # batch answers, an open circuit or an earlier error give it up
+            share_pending = model_config is not None
             try:
                 # Process API model
                 if model_config:
@@ -639,21 +950,103 @@ async def run_all(
                         system_prompt=model_config.system_prompt,
                         tools=model_config.tools,
                         tool_choice=model_config.tool_choice,
+                        base_url=model_config.base_url,
                     )
 
-                    # Generate answer with retry logic (await the async call)
-                    response = await client.generate_answer(intent.prompt)
+                    # Generate answer with retry logic (await the async call),
+                    # unless batch mode already fetched it. Streaming is skipped
+                    # for function tools, whose output is a JSON call rather
+                    # than answer text.
+                    batch_response = batch_responses.get(
+                        (intent.id, model_config.provider, model_config.model_name)
+                    )
+                    stream = (
+                        batch_response is None
+                        and config.run_settings.stream_responses
+                        and supports_streaming(client)
+                        and not has_function_tools(model_config.tools)
+                    )
+                    with timer.span(STAGE_LLM_CALL):
+                        if isinstance(batch_response, Exception):
+                            raise batch_response
+                        if batch_response is not None:
+                            response = batch_response
+                        else:
+
+                            async def fetch_answer():
+                                if stream:
+                                    matcher = IncrementalMentionMatcher(
+                                        our_brands=config.brands.mine,
+                                        competitor_brands=config.brands.competitors,
+                                        stop_after_ranked_items=(
+                                            config.run_settings.stream_stop_after_ranked_items
+                                        ),
+                                    )
+                                    stream_start = time.perf_counter()
+                                    with (
+                                        request_timeout(
+                                            latency_controller.timeout_for(
+                                                model_config.provider, model_config.model_name
+                                            )
+                                        ),
+                                        count_attempts() as counter,
+                                    ):
+                                        streamed = await client.stream_answer(
+                                            intent.prompt, on_chunk=matcher.feed
+                                        )
+                                    # Truncated and retried streams would skew
+                                    # the latency histogram
+                                    if not streamed.stopped_early and counter.attempts <= 1:
+                                        latency_controller.record(
+                                            model_config.provider,
+                                            model_config.model_name,
+                                            (time.perf_counter() - stream_start) * 1000,
+                                        )
+                                    matcher.finish()
+                                    timer.first_mention_ms = matcher.first_mention_ms
+                                    return streamed
+                                return await latency_controller.generate(
+                                    client,
+                                    intent.prompt,
+                                    model_config.provider,
+                                    model_config.model_name,
+                                    can_hedge=lambda: ledger.allows(intent.id),
+                                    on_hedge_cost=lambda cost: ledger.charge(
+                                        intent.id, cost, COST_HEDGING
+                                    ),
+                                )
+
+                            # Fails fast with LLMCircuitOpenError while the
+                            # provider's circuit is open. Under run_many(),
+                            # configs asking the same question share one call
+                            with circuit_breakers.guard(
+                                model_config.provider, model_config.model_name
+                            ):
+                                share_pending = False
+                                response = await share_answer(
+                                    model_config, intent.prompt, fetch_answer
+                                )
+                    timer.ttft_ms = response.ttft_ms
+                    timer.tokens_per_sec = response.tokens_per_second
+                    timer.stopped_early = response.stopped_early
 
                     # Extract response data
                     answer_text = response.answer_text
                     cost_usd = response.cost_usd
+                    ledger.charge(intent.id, cost_usd, COST_ANSWERS)
 
                     # Create usage metadata for storage with actual token breakdown
                     usage_meta = {
                         "prompt_tokens": response.prompt_tokens,
                         "completion_tokens": response.completion_tokens,
                         "total_tokens": response.tokens_used,
+                        "cached_tokens": response.cached_tokens,
                     }
+                    tally_prompt_cache(
+                        prompt_cache_totals,
+                        f"{model_config.provider}/{model_config.model_name}",
+                        usage_meta,
+                    )
 
                     # Create raw answer record
                     raw_record = RawAnswerRecord(
@@ -671,57 +1064,154 @@ async def run_all(
                     )
 
                     # Write raw answer JSON
-                    write_raw_answer(
-                        run_dir=run_dir,
-                        intent_id=intent.id,
-                        provider=model_config.provider,
-                        model=model_config.model_name,
-                        data=asdict(raw_record),
-                    )
+                    with timer.span(STAGE_ARTIFACT_WRITE):
+                        write_raw_answer(
+                            run_dir=run_dir,
+                            intent_id=intent.id,
+                            provider=model_config.provider,
+                            model=model_config.model_name,
+                            data=asdict(raw_record),
+                        )
 
                     # Insert raw answer into database
-                    try:
-                        # Serialize web search results to JSON if present
-                        web_search_json = None
-                        if response.web_search_results:
-                            web_search_json = json.dumps(response.web_search_results)
+                    change_status = None
+                    with timer.span(STAGE_DB_WRITE):
+                        try:
+                            # Serialize web search results to JSON if present
+                            web_search_json = None
+                            if response.web_search_results:
+                                web_search_json = json.dumps(response.web_search_results)
 
-                        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-                            insert_answer_raw(
-                                conn=conn,
-                                run_id=run_id,
+                            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                                change_status = insert_answer_raw(
+                                    conn=conn,
+                                    run_id=run_id,
+                                    intent_id=intent.id,
+                                    model_provider=model_config.provider,
+                                    model_name=model_config.model_name,
+                                    timestamp_utc=raw_record.timestamp_utc,
+                                    prompt=intent.prompt,
+                                    answer_text=answer_text,
+                                    usage_meta_json=json.dumps(usage_meta),
+                                    estimated_cost_usd=cost_usd,
+                                    web_search_count=response.web_search_count,
+                                    web_search_results_json=web_search_json,
+                                    runner_type=raw_record.runner_type,
+                                    runner_name=raw_record.runner_name,
+                                    screenshot_path=raw_record.screenshot_path,
+                                    html_snapshot_path=raw_record.html_snapshot_path,
+                                    session_id=raw_record.session_id,
+                                    system_prompt=model_config.system_prompt,
+                                )
+                                conn.commit()
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to insert answer into database: {e}", exc_info=True
+                            )
+                    record_change(
+                        intent.id, model_config.provider, model_config.model_name, change_status
+                    )
+
+                    # An answer unchanged since the previous run keeps that
+                    # run's extraction: no re-extraction and no operations
+                    if (
+                        change_status == CHANGE_UNCHANGED
+                        and config.run_settings.reuse_unchanged_extractions
+                    ):
+                        with timer.span(STAGE_DB_WRITE):
+                            extraction_reused = reuse_extraction(
+                                config,
+                                run_id,
+                                raw_record.timestamp_utc,
+                                run_dir,
+                                (intent.id, model_config.provider, model_config.model_name),
+                            )
+                        if extraction_reused:
+                            logger.info(
+                                f"Success: intent={intent.id}, provider={model_config.provider}, "
+                                f"model={model_config.model_name}, cost=${cost_usd:.6f}, "
+                                f"answer unchanged (extraction reused)"
+                            )
+                            if progress_callback:
+                                if hasattr(progress_callback, "complete_query"):
+                                    await progress_callback.complete_query(query_key, success=True)
+                                else:
+                                    progress_callback()
+                            return (True, cost_usd, None, 0.0)
+
+                    # Parse answer to extract mentions and rankings
+                    with timer.span(STAGE_EXTRACTION):
+                        extraction_result = await parse_answer(
+                            answer_text=answer_text,
+                            brands=config.brands,
+                            intent_id=intent.id,
+                            provider=model_config.provider,
+                            model_name=model_config.model_name,
+                            timestamp_utc=raw_record.timestamp_utc,
+                            extraction_settings=config.extraction_settings,
+                        )
+                    record_extraction_usage(extraction_result)
+                    ledger.charge(intent.id, extraction_result.extraction_cost_usd, COST_EXTRACTION)
+
+                    # Adaptive sampling: repeat the query until the visibility
+                    # estimate is precise enough (not for batch answers)
+                    visibility = None
+                    if config.run_settings.sampling and batch_response is None:
+
+                        async def draw_sample():
+                            with circuit_breakers.guard(
+                                model_config.provider, model_config.model_name
+                            ):
+                                # Each draw must be its own answer: a coalesced
+                                # copy would enter the intervals twice
+                                sample = await latency_controller.generate(
+                                    client,
+                                    intent.prompt,
+                                    model_config.provider,
+                                    model_config.model_name,
+                                    coalesce=False,
+                                    can_hedge=lambda: ledger.allows(intent.id),
+                                    on_hedge_cost=lambda cost: ledger.charge(
+                                        intent.id, cost, COST_HEDGING
+                                    ),
+                                )
+                            sample_extraction = await parse_answer(
+                                answer_text=sample.answer_text,
+                                brands=config.brands,
                                 intent_id=intent.id,
-                                model_provider=model_config.provider,
+                                provider=model_config.provider,
                                 model_name=model_config.model_name,
-                                timestamp_utc=raw_record.timestamp_utc,
-                                prompt=intent.prompt,
-                                answer_text=answer_text,
-                                usage_meta_json=json.dumps(usage_meta),
-                                estimated_cost_usd=cost_usd,
-                                web_search_count=response.web_search_count,
-                                web_search_results_json=web_search_json,
-                                runner_type=raw_record.runner_type,
-                                runner_name=raw_record.runner_name,
-                                screenshot_path=raw_record.screenshot_path,
-                                html_snapshot_path=raw_record.html_snapshot_path,
-                                session_id=raw_record.session_id,
+                                timestamp_utc=utc_timestamp(),
+                                extraction_settings=config.extraction_settings,
+                            )
+                            record_extraction_usage(sample_extraction)
+                            sample_cost_usd = (
+                                sample.cost_usd + sample_extraction.extraction_cost_usd
+                            )
+                            ledger.charge(intent.id, sample_cost_usd, COST_SAMPLING)
+                            return (
+                                sample_extraction.appeared_mine,
+                                my_rank(sample_extraction),
+                                sample_cost_usd,
                             )
-                            conn.commit()
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to insert answer into database: {e}", exc_info=True
-                        )
 
-                    # Parse answer to extract mentions and rankings
-                    extraction_result = await parse_answer(
-                        answer_text=answer_text,
-                        brands=config.brands,
-                        intent_id=intent.id,
-                        provider=model_config.provider,
-                        model_name=model_config.model_name,
-                        timestamp_utc=raw_record.timestamp_utc,
-                        extraction_settings=config.extraction_settings,
-                    )
+                        with timer.span(STAGE_LLM_CALL):
+                            estimate = await sample_visibility(
+                                config.run_settings.sampling,
+                                (extraction_result.appeared_mine, my_rank(extraction_result)),
+                                draw_sample,
+                                can_continue=lambda: ledger.allows(intent.id),
+                            )
+                        if estimate.stop_reason == STOP_BUDGET:
+                            ledger.skip(
+                                intent.id,
+                                model_config.provider,
+                                model_config.model_name,
+                                stage="sampling",
+                            )
+                        visibility = estimate.summary()
+                        cost_usd += estimate.cost_usd
+                        record_sampling(visibility)
 
                     # Write parsed answer JSON
                     parsed_data = {
@@ -756,60 +1246,92 @@ async def run_all(
                         "rank_confidence": extraction_result.rank_confidence,
                         "extraction_cost_usd": extraction_result.extraction_cost_usd,
                     }
+                    if visibility:
+                        parsed_data["sampling"] = visibility
 
-                    write_parsed_answer(
-                        run_dir=run_dir,
-                        intent_id=intent.id,
-                        provider=model_config.provider,
-                        model=model_config.model_name,
-                        data=parsed_data,
-                    )
+                    with timer.span(STAGE_ARTIFACT_WRITE):
+                        write_parsed_answer(
+                            run_dir=run_dir,
+                            intent_id=intent.id,
+                            provider=model_config.provider,
+                            model=model_config.model_name,
+                            data=parsed_data,
+                        )
 
                     # Insert mentions into database
-                    all_mentions = (
-                        extraction_result.my_mentions
-                        + extraction_result.competitor_mentions
-                    )
-                    for mention in all_mentions:
-                        try:
-                            # Determine if this is my brand
-                            is_mine = mention.brand_category == "mine"
+                    with timer.span(STAGE_DB_WRITE):
+                        all_mentions = (
+                            extraction_result.my_mentions
+                            + extraction_result.competitor_mentions
+                        )
+                        for mention in all_mentions:
+                            try:
+                                # Determine if this is my brand
+                                is_mine = mention.brand_category == "mine"
 
-                            # Find rank position if this brand is in ranked list
-                            rank_position = None
-                            for ranked in extraction_result.ranked_list:
-                                if ranked.brand_name == mention.normalized_name:
-                                    rank_position = ranked.rank_position
-                                    break
+                                # Find rank position if this brand is in ranked list
+                                rank_position = None
+                                for ranked in extraction_result.ranked_list:
+                                    if ranked.brand_name == mention.normalized_name:
+                                        rank_position = ranked.rank_position
+                                        break
 
-                            with sqlite3.connect(
-                                config.run_settings.sqlite_db_path
-                            ) as conn:
-                                insert_mention(
-                                    conn=conn,
-                                    run_id=run_id,
-                                    timestamp_utc=raw_record.timestamp_utc,
-                                    intent_id=intent.id,
-                                    model_provider=model_config.provider,
-                                    model_name=model_config.model_name,
-                                    brand_name=mention.original_text,
-                                    normalized_name=mention.normalized_name,
-                                    is_mine=is_mine,
-                                    rank_position=rank_position,
-                                    match_type="exact",
-                                    sentiment=mention.sentiment,
-                                    mention_context=mention.mention_context,
+                                with sqlite3.connect(
+                                    config.run_settings.sqlite_db_path
+                                ) as conn:
+                                    insert_mention(
+                                        conn=conn,
+                                        run_id=run_id,
+                                        timestamp_utc=raw_record.timestamp_utc,
+                                        intent_id=intent.id,
+                                        model_provider=model_config.provider,
+                                        model_name=model_config.model_name,
+                                        brand_name=mention.original_text,
+                                        normalized_name=mention.normalized_name,
+                                        is_mine=is_mine,
+                                        rank_position=rank_position,
+                                        match_type="exact",
+                                        sentiment=mention.sentiment,
+                                        mention_context=mention.mention_context,
+                                    )
+                                    conn.commit()
+                            except Exception as e:
+                                logger.error(
+                                    f"Failed to insert mention into database: {e}",
+                                    exc_info=True,
+                                )
+                        if visibility:
+                            try:
+                                with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                                    insert_visibility_estimate(
+                                        conn=conn,
+                                        run_id=run_id,
+                                        intent_id=intent.id,
+                                        model_provider=model_config.provider,
+                                        model_name=model_config.model_name,
+                                        timestamp_utc=raw_record.timestamp_utc,
+                                        estimate=visibility,
+                                        confidence=config.run_settings.sampling.confidence,
+                                    )
+                                    conn.commit()
+                            except Exception as e:
+                                logger.error(
+                                    f"Failed to insert visibility estimate into database: {e}",
+                                    exc_info=True,
                                 )
-                                conn.commit()
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to insert mention into database: {e}",
-                                exc_info=True,
-                            )
 
-                    # Execute operations if configured
+                    # Execute operations if configured (and the budget allows)
                     operations_cost_usd = 0.0
-                    if intent.operations or config.global_operations:
+                    has_operations = bool(intent.operations or config.global_operations)
+                    if has_operations and not ledger.allows(intent.id):
+                        ledger.skip(
+                            intent.id,
+                            model_config.provider,
+                            model_config.model_name,
+                            stage="operations",
+                        )
+                        has_operations = False
+                    if has_operations:
                         logger.info(f"Executing operations for intent={intent.id}")
 
                         # Combine intent-specific and global operations
@@ -856,12 +1378,25 @@ async def run_all(
                             },
                         )
 
-                        # Execute operations
-                        operation_results = await execute_operations_with_dependencies(
-                            operations=all_operations,
-                            context=operation_context,
-                            runtime_config=config,
-                        )
+                        # Execute operations, charging each as it finishes so
+                        # the budget can stop the chain part-way
+                        with timer.span(STAGE_OPERATIONS):
+                            operation_results = await execute_operations_with_dependencies(
+                                operations=all_operations,
+                                context=operation_context,
+                                runtime_config=config,
+                                can_continue=lambda: ledger.allows(intent.id),
+                                on_result=lambda result: ledger.charge(
+                                    intent.id, result.cost_usd, COST_OPERATIONS
+                                ),
+                            )
+                        if len(operation_results) < len({op.id for op in all_operations}):
+                            ledger.skip(
+                                intent.id,
+                                model_config.provider,
+                                model_config.model_name,
+                                stage="operations",
+                            )
 
                         # Store operation results
                         for execution_order, (op_id, op_result) in enumerate(
@@ -871,52 +1406,54 @@ async def run_all(
 
                             # Write JSON artifact
                             operation_data = asdict(op_result)
-                            write_operation_result(
-                                run_dir=run_dir,
-                                intent_id=intent.id,
-                                operation_id=op_id,
-                                provider=op_result.model_provider,
-                                model=op_result.model_name,
-                                data=operation_data,
-                            )
+                            with timer.span(STAGE_ARTIFACT_WRITE):
+                                write_operation_result(
+                                    run_dir=run_dir,
+                                    intent_id=intent.id,
+                                    operation_id=op_id,
+                                    provider=op_result.model_provider,
+                                    model=op_result.model_name,
+                                    data=operation_data,
+                                )
 
                             # Insert into database
-                            try:
-                                operation = next(
-                                    (o for o in all_operations if o.id == op_id), None
-                                )
-                                with sqlite3.connect(
-                                    config.run_settings.sqlite_db_path
-                                ) as conn:
-                                    insert_operation(
-                                        conn=conn,
-                                        run_id=run_id,
-                                        intent_id=intent.id,
-                                        model_provider=op_result.model_provider,
-                                        model_name=op_result.model_name,
-                                        operation_id=op_id,
-                                        operation_description=operation.description
-                                        if operation
-                                        else None,
-                                        operation_prompt=op_result.rendered_prompt,
-                                        result_text=op_result.result_text,
-                                        tokens_used_input=op_result.tokens_used_input,
-                                        tokens_used_output=op_result.tokens_used_output,
-                                        cost_usd=op_result.cost_usd,
-                                        timestamp_utc=op_result.timestamp_utc,
-                                        depends_on=operation.depends_on
-                                        if operation
-                                        else [],
-                                        execution_order=execution_order,
-                                        skipped=op_result.skipped,
-                                        error=op_result.error,
+                            with timer.span(STAGE_DB_WRITE):
+                                try:
+                                    operation = next(
+                                        (o for o in all_operations if o.id == op_id), None
+                                    )
+                                    with sqlite3.connect(
+                                        config.run_settings.sqlite_db_path
+                                    ) as conn:
+                                        insert_operation(
+                                            conn=conn,
+                                            run_id=run_id,
+                                            intent_id=intent.id,
+                                            model_provider=op_result.model_provider,
+                                            model_name=op_result.model_name,
+                                            operation_id=op_id,
+                                            operation_description=operation.description
+                                            if operation
+                                            else None,
+                                            operation_prompt=op_result.rendered_prompt,
+                                            result_text=op_result.result_text,
+                                            tokens_used_input=op_result.tokens_used_input,
+                                            tokens_used_output=op_result.tokens_used_output,
+                                            cost_usd=op_result.cost_usd,
+                                            timestamp_utc=op_result.timestamp_utc,
+                                            depends_on=operation.depends_on
+                                            if operation
+                                            else [],
+                                            execution_order=execution_order,
+                                            skipped=op_result.skipped,
+                                            error=op_result.error,
+                                        )
+                                        conn.commit()
+                                except Exception as e:
+                                    logger.error(
+                                        f"Failed to insert operation into database: {e}",
+                                        exc_info=True,
                                     )
-                                    conn.commit()
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to insert operation into database: {e}",
-                                    exc_info=True,
-                                )
 
                         logger.info(
                             f"Completed {len(operation_results)} operations, cost=${operations_cost_usd:.6f}"
@@ -960,7 +1497,8 @@ async def run_all(
                 )
 
                 # Execute intent via runner
-                result = runner.run_intent(intent.prompt)
+                with timer.span(STAGE_LLM_CALL):
+                    result = runner.run_intent(intent.prompt)
 
                 # Check if execution was successful
                 if not result.success:
@@ -974,109 +1512,119 @@ async def run_all(
                 )
 
                 # Write raw answer JSON
-                write_raw_answer(
-                    run_dir=run_dir,
-                    intent_id=intent.id,
-                    provider=result.provider,
-                    model=result.model_name,
-                    data=asdict(raw_record),
-                )
-
-                # Insert raw answer into database
-                try:
-                    # Serialize web search results to JSON if present
-                    web_search_json = None
-                    if result.web_search_results:
-                        web_search_json = json.dumps(result.web_search_results)
-
-                    with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-                        insert_answer_raw(
-                            conn=conn,
-                            run_id=run_id,
-                            intent_id=intent.id,
-                            model_provider=result.provider,
-                            model_name=result.model_name,
-                            timestamp_utc=raw_record.timestamp_utc,
-                            prompt=intent.prompt,
-                            answer_text=result.answer_text,
-                            usage_meta_json=json.dumps(raw_record.usage_meta),
-                            estimated_cost_usd=result.cost_usd,
-                            web_search_count=raw_record.web_search_count,
-                            web_search_results_json=web_search_json,
-                            runner_type=result.runner_type,
-                            runner_name=result.runner_name,
-                            screenshot_path=result.screenshot_path,
-                            html_snapshot_path=result.html_snapshot_path,
-                            session_id=result.session_id,
-                        )
-                        conn.commit()
-                except Exception as e:
-                    logger.error(
-                        f"Failed to insert runner answer into database: {e}",
-                        exc_info=True,
+                with timer.span(STAGE_ARTIFACT_WRITE):
+                    write_raw_answer(
+                        run_dir=run_dir,
+                        intent_id=intent.id,
+                        provider=result.provider,
+                        model=result.model_name,
+                        data=asdict(raw_record),
                     )
 
-                # Parse answer to extract mentions and rankings
-                extraction_result = await parse_answer(
-                    answer_text=result.answer_text,
-                    brands=config.brands,
-                    intent_id=intent.id,
-                    provider=result.provider,
-                    model_name=result.model_name,
-                    timestamp_utc=raw_record.timestamp_utc,
-                    extraction_settings=config.extraction_settings,
-                )
-
-                # Write parsed answer JSON
-                write_parsed_answer(
-                    run_dir=run_dir,
-                    intent_id=intent.id,
-                    provider=result.provider,
-                    model=result.model_name,
-                    data=asdict(extraction_result),
-                )
-
-                # Insert mentions into database
-                all_mentions = (
-                    extraction_result.my_mentions
-                    + extraction_result.competitor_mentions
-                )
-                for mention in all_mentions:
+                # Insert raw answer into database
+                with timer.span(STAGE_DB_WRITE):
+                    change_status = None
                     try:
-                        # Determine if this is my brand
-                        is_mine = mention.brand_category == "mine"
-
-                        # Find rank position if this brand is in ranked list
-                        rank_position = None
-                        for ranked in extraction_result.ranked_list:
-                            if ranked.brand_name == mention.normalized_name:
-                                rank_position = ranked.rank_position
-                                break
-
-                        with sqlite3.connect(
-                            config.run_settings.sqlite_db_path
-                        ) as conn:
-                            insert_mention(
+                        # Serialize web search results to JSON if present
+                        web_search_json = None
+                        if result.web_search_results:
+                            web_search_json = json.dumps(result.web_search_results)
+
+                        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                            change_status = insert_answer_raw(
                                 conn=conn,
                                 run_id=run_id,
-                                timestamp_utc=raw_record.timestamp_utc,
                                 intent_id=intent.id,
                                 model_provider=result.provider,
                                 model_name=result.model_name,
-                                brand_name=mention.original_text,
-                                normalized_name=mention.normalized_name,
-                                is_mine=is_mine,
-                                rank_position=rank_position,
-                                match_type="exact",
-                                sentiment=mention.sentiment,
-                                mention_context=mention.mention_context,
+                                timestamp_utc=raw_record.timestamp_utc,
+                                prompt=intent.prompt,
+                                answer_text=result.answer_text,
+                                usage_meta_json=json.dumps(raw_record.usage_meta),
+                                estimated_cost_usd=result.cost_usd,
+                                web_search_count=raw_record.web_search_count,
+                                web_search_results_json=web_search_json,
+                                runner_type=result.runner_type,
+                                runner_name=result.runner_name,
+                                screenshot_path=result.screenshot_path,
+                                html_snapshot_path=result.html_snapshot_path,
+                                session_id=result.session_id,
                             )
                             conn.commit()
                     except Exception as e:
                         logger.error(
-                            f"Failed to insert runner mention into database: {e}",
+                            f"Failed to insert runner answer into database: {e}",
                             exc_info=True,
                         )
+                record_change(intent.id, result.provider, result.model_name, change_status)
+
+                # Parse answer to extract mentions and rankings
+                with timer.span(STAGE_EXTRACTION):
+                    extraction_result = await parse_answer(
+                        answer_text=result.answer_text,
+                        brands=config.brands,
+                        intent_id=intent.id,
+                        provider=result.provider,
+                        model_name=result.model_name,
+                        timestamp_utc=raw_record.timestamp_utc,
+                        extraction_settings=config.extraction_settings,
+                    )
+                record_extraction_usage(extraction_result)
+                ledger.charge(intent.id, result.cost_usd, COST_ANSWERS)
+                ledger.charge(intent.id, extraction_result.extraction_cost_usd, COST_EXTRACTION)
+
+                # Write parsed answer JSON
+                with timer.span(STAGE_ARTIFACT_WRITE):
+                    write_parsed_answer(
+                        run_dir=run_dir,
+                        intent_id=intent.id,
+                        provider=result.provider,
+                        model=result.model_name,
+                        data=asdict(extraction_result),
+                    )
+
+                # Insert mentions into database
+                with timer.span(STAGE_DB_WRITE):
+                    all_mentions = (
+                        extraction_result.my_mentions
+                        + extraction_result.competitor_mentions
+                    )
+                    for mention in all_mentions:
+                        try:
+                            # Determine if this is my brand
+                            is_mine = mention.brand_category == "mine"
+
+                            # Find rank position if this brand is in ranked list
+                            rank_position = None
+                            for ranked in extraction_result.ranked_list:
+                                if ranked.brand_name == mention.normalized_name:
+                                    rank_position = ranked.rank_position
+                                    break
+
+                            with sqlite3.connect(
+                                config.run_settings.sqlite_db_path
+                            ) as conn:
+                                insert_mention(
+                                    conn=conn,
+                                    run_id=run_id,
+                                    timestamp_utc=raw_record.timestamp_utc,
+                                    intent_id=intent.id,
+                                    model_provider=result.provider,
+                                    model_name=result.model_name,
+                                    brand_name=mention.original_text,
+                                    normalized_name=mention.normalized_name,
+                                    is_mine=is_mine,
+                                    rank_position=rank_position,
+                                    match_type="exact",
+                                    sentiment=mention.sentiment,
+                                    mention_context=mention.mention_context,
+                                )
+                                conn.commit()
+                        except Exception as e:
+                            logger.error(
+                                f"Failed to insert runner mention into database: {e}",
+                                exc_info=True,
+                            )
 
                 # Calculate total cost for this query
                 total_query_cost = result.cost_usd + extraction_result.extraction_cost_usd
@@ -1108,6 +1656,7 @@ async def run_all(
 
             except Exception as e:
                 # Query failed - write error file and track
+                timer.status = "error"
                 error_message = str(e)
 
                 if model_config:
@@ -1164,103 +1713,220 @@ async def run_all(
 
                 return (False, 0.0, error_dict, 0.0)
 
-    # Build list of tasks for all (intent x model) and (intent x runner) combinations
-    tasks = []
-
-    for intent in config.intents:
-        # Classify intent before running queries (if enabled)
-        intent_classification_cost = 0.0
-        if (
-            config.extraction_settings
-            and config.extraction_settings.enable_intent_classification
-        ):
-            try:
-                logger.info(f"Classifying intent: {intent.id}")
-                classification_result = await classify_intent(
-                    query=intent.prompt,
-                    extraction_settings=config.extraction_settings,
-                    intent_id=intent.id,
-                    db_path=config.run_settings.sqlite_db_path,
+            finally:
+                if share_pending:
+                    release_answer(model_config, intent.prompt)
+                timer.finish()
+                reset_current_timer(timer_token)
+                record_timer(timer)
+
+    def _predicted_queries():
+        for intent in config.intents:
+            for model_config in config.models or []:
+                if (intent.id, model_config.provider, model_config.model_name) in reused:
+                    continue
+                prediction = history.predict(
+                    intent.id, model_config.provider, model_config.model_name
                 )
+                yield prediction.duration_s, (intent, model_config, None)
+            for runner_config in config.runner_configs or []:
+                prediction = history.predict(
+                    intent.id, runner_config.runner_plugin, "runner", runner=True
+                )
+                yield prediction.duration_s, (intent, None, runner_config)
 
-                # Store classification in database
+    def _query_order():
+        """
+        Yield (intent, model_config, runner_config) for every query, longest first.
+
+        Longest-expected-first (LPT) ordering keeps slow queries from becoming
+        the tail of the run. Queries are read in config order into a heap of
+        at most QUERY_ORDER_WINDOW and the longest one in the heap goes next,
+        so runs up to that size are ordered exactly and larger runs are not
+        held in memory. Queries without history share their model's default
+        duration, so ties keep config order.
+        """
+        window: list[tuple] = []
+        for position, (duration_s, query) in enumerate(_predicted_queries()):
+            heapq.heappush(window, (-duration_s, position, query))
+            if len(window) > QUERY_ORDER_WINDOW:
+                yield heapq.heappop(window)[2]
+        while window:
+            yield heapq.heappop(window)[2]
+
+    async def _work_items():
+        """
+        Yield (intent, model_config, runner_config) for every query, lazily.
+
+        Each intent is classified (if enabled) just before its first query is
+        yielded, so classification overlaps with queries already running.
+        """
+        nonlocal total_cost_usd
+        classified = set()
+        for intent, model_config, runner_config in _query_order():
+            if not budget_allows(intent, model_config):
+                await skip_query(intent, model_config, runner_config)
+                continue
+            if intent.id in classified:
+                yield intent, model_config, runner_config
+                continue
+            classified.add(intent.id)
+            # Classify intent before running queries (if enabled)
+            intent_classification_cost = 0.0
+            if (
+                config.extraction_settings
+                and config.extraction_settings.enable_intent_classification
+            ):
                 try:
-                    with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
-                        insert_intent_classification(
-                            conn=conn,
-                            run_id=run_id,
-                            intent_id=intent.id,
-                            intent_type=classification_result.intent_type,
-                            buyer_stage=classification_result.buyer_stage,
-                            urgency_signal=classification_result.urgency_signal,
-                            classification_confidence=classification_result.classification_confidence,
-                            timestamp_utc=utc_timestamp(),
-                            reasoning=classification_result.reasoning,
-                            extraction_cost_usd=classification_result.extraction_cost_usd,
-                        )
-                        conn.commit()
-                    logger.info(
-                        f"Intent classification stored: {intent.id} -> "
-                        f"{classification_result.intent_type}/{classification_result.buyer_stage}/"
-                        f"{classification_result.urgency_signal} "
-                        f"(confidence={classification_result.classification_confidence:.2f})"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to insert intent classification into database: {e}",
-                        exc_info=True,
+                    logger.info(f"Classifying intent: {intent.id}")
+                    classification_result = await classify_intent(
+                        query=intent.prompt,
+                        extraction_settings=config.extraction_settings,
+                        intent_id=intent.id,
+                        db_path=config.run_settings.sqlite_db_path,
                     )
 
-                # Track classification cost
-                intent_classification_cost = classification_result.extraction_cost_usd
-                total_cost_usd += intent_classification_cost
-
-            except Exception as e:
-                logger.warning(
-                    f"Intent classification failed for {intent.id}: {e}",
-                    exc_info=True,
-                )
-                # Continue execution - classification is not critical
-
-        # Create tasks for API models (if configured)
-        if config.models:
-            for model_config in config.models:
-                task = _execute_query_with_semaphore(
-                    intent=intent,
-                    model_config=model_config,
-                    runner_config=None,
-                )
-                tasks.append(task)
-
-        # Create tasks for browser/custom runners (if configured)
-        if config.runner_configs:
-            for runner_config in config.runner_configs:
-                task = _execute_query_with_semaphore(
-                    intent=intent,
-                    model_config=None,
-                    runner_config=runner_config,
-                )
-                tasks.append(task)
+                    # Store classification in database
+                    try:
+                        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                            insert_intent_classification(
+                                conn=conn,
+                                run_id=run_id,
+                                intent_id=intent.id,
+                                intent_type=classification_result.intent_type,
+                                buyer_stage=classification_result.buyer_stage,
+                                urgency_signal=classification_result.urgency_signal,
+                                classification_confidence=classification_result.classification_confidence,
+                                timestamp_utc=utc_timestamp(),
+                                reasoning=classification_result.reasoning,
+                                extraction_cost_usd=classification_result.extraction_cost_usd,
+                            )
+                            conn.commit()
+                        logger.info(
+                            f"Intent classification stored: {intent.id} -> "
+                            f"{classification_result.intent_type}/{classification_result.buyer_stage}/"
+                            f"{classification_result.urgency_signal} "
+                            f"(confidence={classification_result.classification_confidence:.2f})"
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to insert intent classification into database: {e}",
+                            exc_info=True,
+                        )
 
-    # Execute all tasks in parallel with semaphore limiting concurrency
-    logger.info(f"Executing {len(tasks)} queries in parallel...")
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    # Track classification cost
+                    intent_classification_cost = classification_result.extraction_cost_usd
+                    total_cost_usd += intent_classification_cost
+                    ledger.charge(intent.id, intent_classification_cost, COST_CLASSIFICATION)
 
-    # Process results
-    for i, result in enumerate(results):
+                except Exception as e:
+                    logger.warning(
+                        f"Intent classification failed for {intent.id}: {e}",
+                        exc_info=True,
+                    )
+                    # Continue execution - classification is not critical
+
+            yield intent, model_config, runner_config
+
+    def _fold_result(item, result) -> None:
+        nonlocal success_count, error_count, total_cost_usd, total_operations_cost_usd
+        intent, model_config, runner_config = item
+        if result is None:  # Skipped for budget, recorded in the ledger
+            return
+        if model_config:
+            query_key = (intent.id, model_config.provider, model_config.model_name)
+        else:
+            query_key = (intent.id, runner_config.runner_plugin, "runner")
         if isinstance(result, Exception):
-            logger.error(f"Task {i} failed with exception: {result}")
+            logger.error(f"Query {intent.id}/{query_key[1]} failed with exception: {result}")
             error_count += 1
-        elif result[0]:  # Success
+            failed_queries.add(query_key)
+            return
+        success, cost_usd, error_dict, operations_cost_usd = result
+        total_cost_usd += cost_usd
+        total_operations_cost_usd += operations_cost_usd  # Tracked even on error
+        if success:
             success_count += 1
-            total_cost_usd += result[1]
-            total_operations_cost_usd += result[3]  # Track operations cost separately
-        else:  # Returned error
-            error_count += 1
-            total_cost_usd += result[1]
-            total_operations_cost_usd += result[3]  # Track operations cost even on error
-            if result[2]:
-                errors.append(result[2])
+            return
+        error_count += 1
+        failed_queries.add(query_key)
+        if error_dict:
+            try:
+                append_error_log(run_dir, error_dict)
+            except OSError as e:
+                logger.error(f"Failed to append to error log: {e}")
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(error_dict)
+
+    # Execute queries as a bounded producer/consumer pipeline: work items are
+    # generated lazily, at most a small multiple of max_concurrent_requests
+    # are pending at once, and results are folded in as they complete
+    logger.info(f"Executing {total_queries} queries (max {max_concurrent} concurrent)...")
+    # Identical concurrent requests (answers, extractions, operations) share
+    # one in-flight API call; tasks inherit the coalescer from this context
+    coalescer = RequestCoalescer()
+    coalescer_token = coalescer.activate() if config.run_settings.coalesce_requests else None
+    try:
+        await run_bounded(
+            _work_items(),
+            lambda item: _execute_query_with_semaphore(*item),
+            max_in_flight=max_concurrent * QUEUE_DEPTH_PER_SLOT,
+            on_result=_fold_result,
+        )
+    finally:
+        if coalescer_token is not None:
+            reset_current_coalescer(coalescer_token)
+    if coalescer.coalesced_count:
+        logger.info(
+            f"Coalesced {coalescer.coalesced_count} duplicate requests, "
+            f"saved ${coalescer.saved_cost_usd:.6f}"
+        )
+    if latency_controller.hedged:
+        logger.info(
+            f"Hedged {latency_controller.hedged} slow requests "
+            f"({latency_controller.hedge_wins} hedges won), "
+            f"estimated extra cost ${latency_controller.extra_cost_usd:.6f}"
+        )
+    # Charged to the ledger under "hedging" as each hedged call resolved
+    total_cost_usd += latency_controller.extra_cost_usd
+    short_circuited = sum(circuit_breakers.summary()["short_circuited"].values())
+    if short_circuited:
+        logger.warning(
+            f"Circuit breakers short-circuited {short_circuited} queries "
+            f"({len(circuit_breakers.transitions)} state transitions, see run_meta.json)"
+        )
+    try:
+        latency_controller.save(config.run_settings.sqlite_db_path)
+    except sqlite3.Error as e:
+        logger.error(f"Failed to save latency histograms: {e}", exc_info=True)
+    if error_count > len(errors):
+        logger.warning(
+            f"{error_count} queries failed; summary lists the first {len(errors)}, "
+            f"see errors.jsonl for all"
+        )
+
+    # Persist remaining per-query timing spans
+    flush_timings()
+
+    status = ledger.status
+    if status == RUN_BUDGET_TRUNCATED:
+        logger.warning(
+            f"Run budget-truncated: spent ${ledger.spent_usd:.6f}, skipped "
+            f"{ledger.skipped_count} queries/samples/operations ({ledger.limit_reached})"
+        )
+    try:
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            update_run_cost(conn, run_id, round(total_cost_usd, 6))
+            update_run_status(conn, run_id, status)
+            conn.commit()
+    except Exception as e:
+        logger.error(f"Failed to record run status in database: {e}", exc_info=True)
+
+    if config.run_settings.export_otel_timings:
+        try:
+            write_timings_otel(run_dir, build_otel_trace(run_id, otel_timers))
+        except Exception as e:
+            logger.error(f"Failed to write OpenTelemetry timings: {e}", exc_info=True)
 
     # Generate run metadata summary
     run_meta = {
@@ -1268,18 +1934,33 @@ async def run_all(
         "timestamp_utc": timestamp_utc,
         "config_filename": config_filename,
         "output_dir": run_dir,
+        "status": status,
         "total_intents": len(config.intents),
         "total_models": len(config.models),
         "total_queries": total_queries,
         "success_count": success_count,
         "error_count": error_count,
+        "reused_count": len(reused),
         "total_cost_usd": round(total_cost_usd, 6),
         "total_llm_cost_usd": round(total_cost_usd - total_operations_cost_usd, 6),
         "total_operations_cost_usd": round(total_operations_cost_usd, 6),
         "my_brands": config.brands.mine,
         "competitors": config.brands.competitors,
         "database_path": config.run_settings.sqlite_db_path,
+        "latency": latency.summary(),
+        "prompt_cache": prompt_cache_report(prompt_cache_totals),
+        "coalescing": coalescer.summary(),
+        "latency_control": latency_controller.summary(),
+        "circuit_breakers": circuit_breakers.summary(),
+        "answer_changes": {**answer_changes, "changed": changed_answers},
+        "budget": ledger.summary(),
     }
+    if config.run_settings.sampling:
+        run_meta["sampling"] = {
+            **sampling_totals,
+            "cost_usd": round(sampling_totals["cost_usd"], 6),
+            "max_samples": config.run_settings.sampling.max_samples,
+        }
 
     # Write run metadata JSON
     write_run_meta(run_dir=run_dir, meta=run_meta)
@@ -1294,13 +1975,128 @@ async def run_all(
         "run_id": run_id,
         "timestamp_utc": timestamp_utc,
         "output_dir": run_dir,
+        "status": status,
         "total_intents": len(config.intents),
         "total_models": len(config.models),
         "total_queries": total_queries,
         "success_count": success_count,
         "error_count": error_count,
+        "reused_count": len(reused),
         "total_cost_usd": round(total_cost_usd, 6),
         "total_llm_cost_usd": round(total_cost_usd - total_operations_cost_usd, 6),
         "total_operations_cost_usd": round(total_operations_cost_usd, 6),
+        "answer_changes": answer_changes,
+        "budget": ledger.summary(),
+        "errors": errors,
+        "failed_queries": sorted(failed_queries),
+        "skipped_queries": ledger.skipped_queries,
+    }
+
+
+def _distinct_run_ids(configs: list[RuntimeConfig], base_run_id: str) -> list[str]:
+    """
+    Run IDs for configs started together.
+
+    Configs share base_run_id unless they write to the same database or
+    output directory, in which case later ones get a "-2", "-3", ... suffix.
+    """
+    used: set[tuple[str, str, str]] = set()
+    run_ids = []
+    for config in configs:
+        locations = [
+            ("db", config.run_settings.sqlite_db_path),
+            ("dir", config.run_settings.output_dir),
+        ]
+        run_id, suffix = base_run_id, 1
+        while any((*location, run_id) in used for location in locations):
+            suffix += 1
+            run_id = f"{base_run_id}-{suffix}"
+        used.update((*location, run_id) for location in locations)
+        run_ids.append(run_id)
+    return run_ids
+
+
+async def run_many(
+    configs: list[RuntimeConfig],
+    config_filenames: list[str] | None = None,
+    max_concurrent_requests: int | None = None,
+) -> dict:
+    """
+    Run several configs in one process, sending each unique query once.
+
+    The configs' queries are planned together (see fanout): identical
+    queries (same prompt, model, system prompt, tools and base URL) are
+    fetched once and the answer is fanned out to every config that asks.
+    Each config still gets its own run: extraction with its own brands, its
+    own run directory, database rows, budget and run_meta.json.
+
+    Args:
+        configs: Configs to run
+        config_filenames: Config file names for run_meta.json, in order
+        max_concurrent_requests: Limit on API calls in flight across all
+            configs (default: the largest max_concurrent_requests of the
+            configs); each config's own limit still applies
+
+    Returns:
+        Summary dictionary with structure:
+        {
+            "plan": {"total_queries": 12, "unique_queries": 7, "shared_queries": 5},
+            "sharing": {"api_calls": 7, "shared_answers": 5, "saved_cost_usd": 0.004},
+            "results": [<run_all() summary or None>, ...],
+            "errors": [None, "Budget exceeded: ...", ...]
+        }
+        results and errors are in the order of configs; a config whose run
+        raised has result None and its error message.
+    """
+    if not configs:
+        raise ValueError("run_many requires at least one config")
+    filenames = config_filenames or [None] * len(configs)
+
+    plan = plan_queries(configs)
+    logger.info(
+        f"Planned {plan.total_queries} queries across {len(configs)} configs: "
+        f"{plan.unique_queries} unique"
+    )
+    pool = SharedAnswerPool(
+        plan,
+        max_concurrent_requests=max_concurrent_requests
+        or max(config.run_settings.max_concurrent_requests for config in configs),
+    )
+    run_ids = _distinct_run_ids(configs, run_id_from_timestamp())
+
+    # Runs are tasks of this context, so they all see the pool
+    token = pool.activate()
+    try:
+        outcomes = await asyncio.gather(
+            *(
+                run_all(config, config_filename=filename, run_id=run_id)
+                for config, filename, run_id in zip(configs, filenames, run_ids, strict=True)
+            ),
+            return_exceptions=True,
+        )
+    finally:
+        reset_current_pool(token)
+
+    results, errors = [], []
+    for outcome, filename in zip(outcomes, filenames, strict=True):
+        if isinstance(outcome, Exception):
+            logger.error(f"Run of {filename or 'config'} failed: {outcome}")
+            results.append(None)
+            errors.append(str(outcome))
+        elif isinstance(outcome, BaseException):  # e.g. cancellation
+            raise outcome
+        else:
+            results.append(outcome)
+            errors.append(None)
+
+    logger.info(
+        f"Run-many complete: {pool.fetched_count} API calls for {plan.total_queries} "
+        f"planned queries, {pool.shared_count} answers shared, "
+        f"saved ${pool.saved_cost_usd:.6f}"
+    )
+    return {
+        "plan": plan.summary(),
+        "sharing": pool.summary(),
+        "results": results,
         "errors": errors,
     }
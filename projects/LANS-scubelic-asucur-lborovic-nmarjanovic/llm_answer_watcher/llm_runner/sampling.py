@@ -0,0 +1,224 @@
+"""
+Adaptive multi-sampling of queries for visibility estimates.
+
+LLM answers are stochastic: asking the same question twice can rank brands
+differently or leave one out. One sample per (intent, model) therefore gives
+a noisy "did my brand appear" bit. Fixed-N sampling fixes that but multiplies
+cost by N. With SamplingConfig, each API query is instead repeated
+sequentially and stops as soon as the estimate is precise enough:
+
+1. At least min_samples answers are collected
+2. After each further answer, the intervals are recomputed:
+   - Appearance rate: Wilson score interval of appeared/samples
+   - Mean rank of my brand: mean +/- z * stdev / sqrt(n) over the samples
+     that ranked it (needs two ranked samples; unranked brands have none)
+3. Sampling stops once both intervals are narrower than configured, or at
+   max_samples
+
+Stable answers (my brand always or never appears, at the same rank) stop at
+a few samples; only queries whose answers actually vary use the full budget.
+The intervals are recomputed after every sample and use a normal quantile,
+so they are a precision target for reporting rather than a hypothesis test.
+
+Example:
+    >>> estimate = VisibilityEstimate(SamplingConfig())
+    >>> for _ in range(5):
+    ...     estimate.add(appeared=True, rank=2)
+    >>> estimate.needs_more_samples()
+    False
+    >>> estimate.summary()["appearance_rate"]
+    1.0
+"""
+
+import logging
+import math
+import statistics
+from collections.abc import Awaitable, Callable
+
+from ..config.schema import SamplingConfig
+
+logger = logging.getLogger(__name__)
+
+STOP_PRECISE = "precise"  # Both intervals narrow enough
+STOP_MAX_SAMPLES = "max_samples"  # Sample cap reached first
+STOP_ERROR = "error"  # A repeated query failed; estimate uses samples so far
+STOP_BUDGET = "budget"  # The run's budget ledger refused further samples
+
+
+def wilson_interval(successes: int, samples: int, z: float) -> tuple[float, float]:
+    """
+    Wilson score interval for a binomial proportion.
+
+    Unlike the normal approximation, it stays inside [0, 1] and does not
+    collapse to zero width when every sample agrees.
+
+    Args:
+        successes: Samples in which the event occurred
+        samples: Total samples
+        z: Standard normal quantile for the confidence level
+
+    Returns:
+        tuple: (low, high); (0.0, 1.0) without samples
+    """
+    if samples == 0:
+        return 0.0, 1.0
+    p = successes / samples
+    z2 = z * z
+    denominator = 1 + z2 / samples
+    center = (p + z2 / (2 * samples)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / samples + z2 / (4 * samples**2)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def mean_interval(values: list[float], z: float) -> tuple[float, float] | None:
+    """
+    Normal-approximation interval for the mean of values.
+
+    Returns:
+        tuple | None: (low, high), or None with fewer than two values
+    """
+    if len(values) < 2:
+        return None
+    mean = statistics.fmean(values)
+    half_width = z * statistics.stdev(values) / math.sqrt(len(values))
+    return mean - half_width, mean + half_width
+
+
+def my_rank(extraction_result) -> int | None:
+    """
+    Best rank of any of my brands in an extraction result.
+
+    Returns:
+        int | None: Lowest rank_position of my brands, None if unranked
+    """
+    mine = {mention.normalized_name for mention in extraction_result.my_mentions}
+    return min(
+        (
+            ranked.rank_position
+            for ranked in extraction_result.ranked_list
+            if ranked.brand_name in mine
+        ),
+        default=None,
+    )
+
+
+class VisibilityEstimate:
+    """
+    Running visibility estimate of one (intent, model) query.
+
+    Attributes:
+        settings: Sampling settings
+        samples: Answers collected
+        appeared: Answers in which my brand appeared
+        ranks: My brand's rank in each answer that ranked it
+        cost_usd: Cost of the repeated queries (the first answer excluded)
+        stop_reason: STOP_PRECISE, STOP_MAX_SAMPLES, STOP_ERROR or
+            STOP_BUDGET once done
+    """
+
+    def __init__(self, settings: SamplingConfig):
+        self.settings = settings
+        self.samples = 0
+        self.appeared = 0
+        self.ranks: list[int] = []
+        self.cost_usd = 0.0
+        self.stop_reason: str | None = None
+        self._z = statistics.NormalDist().inv_cdf(0.5 + settings.confidence / 2)
+
+    def add(self, appeared: bool, rank: int | None) -> None:
+        """Add one answer's outcome."""
+        self.samples += 1
+        self.appeared += bool(appeared)
+        if rank is not None:
+            self.ranks.append(rank)
+
+    def appearance_interval(self) -> tuple[float, float]:
+        """Confidence interval of the appearance rate."""
+        return wilson_interval(self.appeared, self.samples, self._z)
+
+    def rank_interval(self) -> tuple[float, float] | None:
+        """Confidence interval of my brand's mean rank (None if < 2 ranks)."""
+        return mean_interval(self.ranks, self._z)
+
+    def is_precise(self) -> bool:
+        """Whether both intervals are narrower than configured."""
+        low, high = self.appearance_interval()
+        if high - low > self.settings.max_appearance_interval_width:
+            return False
+        if not self.ranks:
+            return True
+        rank_interval = self.rank_interval()
+        return (
+            rank_interval is not None
+            and rank_interval[1] - rank_interval[0] <= self.settings.max_rank_interval_width
+        )
+
+    def needs_more_samples(self) -> bool:
+        """Whether another sample should be drawn (sets stop_reason if not)."""
+        if self.samples < self.settings.min_samples:
+            return True
+        if self.samples >= self.settings.max_samples:
+            self.stop_reason = STOP_MAX_SAMPLES
+            return False
+        if self.is_precise():
+            self.stop_reason = STOP_PRECISE
+            return False
+        return True
+
+    def summary(self) -> dict:
+        """Sample counts and intervals, as stored and reported."""
+        appearance_low, appearance_high = self.appearance_interval()
+        rank_interval = self.rank_interval()
+        return {
+            "samples": self.samples,
+            "appeared_count": self.appeared,
+            "appearance_rate": round(self.appeared / self.samples, 4) if self.samples else 0.0,
+            "appearance_low": round(appearance_low, 4),
+            "appearance_high": round(appearance_high, 4),
+            "ranked_count": len(self.ranks),
+            "mean_rank": round(statistics.fmean(self.ranks), 3) if self.ranks else None,
+            "rank_low": round(rank_interval[0], 3) if rank_interval else None,
+            "rank_high": round(rank_interval[1], 3) if rank_interval else None,
+            "stop_reason": self.stop_reason,
+            "sampling_cost_usd": round(self.cost_usd, 6),
+        }
+
+
+async def sample_visibility(
+    settings: SamplingConfig,
+    first: tuple[bool, int | None],
+    draw: Callable[[], Awaitable[tuple[bool, int | None, float]]],
+    can_continue: Callable[[], bool] | None = None,
+) -> VisibilityEstimate:
+    """
+    Repeat a query until its visibility estimate is precise enough.
+
+    A failed repeat ends sampling with STOP_ERROR; the estimate keeps the
+    samples collected so far, and the query itself still succeeds.
+
+    Args:
+        settings: Sampling settings
+        first: (appeared, rank) of the query's regular answer
+        draw: Queries and extracts one more answer, returning
+            (appeared, rank, cost_usd)
+        can_continue: Checked before each repeat; False ends sampling with
+            STOP_BUDGET (e.g. CostLedger.allows for the query's intent)
+
+    Returns:
+        VisibilityEstimate: Estimate over all samples, including the first
+    """
+    estimate = VisibilityEstimate(settings)
+    estimate.add(*first)
+    while estimate.needs_more_samples():
+        if can_continue is not None and not can_continue():
+            estimate.stop_reason = STOP_BUDGET
+            break
+        try:
+            appeared, rank, cost_usd = await draw()
+        except Exception as e:
+            logger.warning(f"Sampling stopped after {estimate.samples} samples: {e}")
+            estimate.stop_reason = STOP_ERROR
+            break
+        estimate.cost_usd += cost_usd
+        estimate.add(appeared, rank)
+    return estimate
@@ -0,0 +1,977 @@
+"""
+Local stand-in server emulating every provider API.
+
+Speaks the request/response formats of all supported providers so the real
+provider clients can be exercised over real HTTP (connection pooling,
+timeouts, retries, 429 handling) without network access or API keys.
+
+Routes (prefix is the base_url to configure for each provider):
+
+    openai      POST /openai/v1/responses
+    anthropic   POST /anthropic/v1/messages
+    google      POST /gemini/v1beta/models/{model}:generateContent
+                POST /gemini/v1beta/models/{model}:streamGenerateContent
+    mistral     POST /mistral/v1/chat/completions
+    grok        POST /grok/v1/chat/completions
+    perplexity  POST /perplexity/chat/completions
+
+Batch APIs (jobs complete after StandinBehavior.batch_pending_polls polls):
+
+    openai      POST /openai/v1/files, POST /openai/v1/batches,
+                GET /openai/v1/batches/{id}, GET /openai/v1/files/{id}/content
+    anthropic   POST /anthropic/v1/messages/batches,
+                GET /anthropic/v1/messages/batches/{id}[/results]
+
+Responses include usage fields, web search annotations (OpenAI web_search_call
+items, Gemini groundingMetadata, Perplexity citations) when web search tools
+are requested or StandinBehavior.web_search is set, and OpenAI function calls
+when function tools are requested. Requests with "stream": true (or Gemini's
+streamGenerateContent) get server-sent events in the provider's format.
+
+Behavior is programmable via StandinBehavior: latency, rate limiting (429
+with Retry-After), scripted failures, streaming chunk size/delay, and prompt
+caching (system prompts reported as cached tokens on repeat requests).
+
+Example:
+    >>> async with StandinServer(StandinBehavior(latency_ms=200)) as server:
+    ...     client = build_client(
+    ...         "openai", "gpt-4o-mini", "sk-test", "You are helpful.",
+    ...         base_url=server.base_url("openai"),
+    ...     )
+    ...     response = await client.generate_answer("best CRM tools?")
+
+Command line (for manual or external load testing):
+    $ python -m llm_answer_watcher.llm_runner.standin_server --port 8900 --latency-ms 300
+    $ export OPENAI_BASE_URL=http://127.0.0.1:8900/openai/v1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+from email.parser import BytesParser
+from email.policy import HTTP
+
+from ..utils.http_server import HTTPRequest, HTTPResponse, LocalHTTPServer
+from .models import BASE_URL_ENV_VARS
+
+logger = logging.getLogger(__name__)
+
+# Base URL path for each provider (append to the server URL)
+PROVIDER_PREFIXES = {
+    "openai": "/openai/v1",
+    "anthropic": "/anthropic/v1",
+    "google": "/gemini/v1beta",
+    "mistral": "/mistral/v1",
+    "grok": "/grok/v1",
+    "perplexity": "/perplexity",
+}
+
+DEFAULT_ANSWER = (
+    "Here are the top options to consider:\n\n"
+    "1. **HubSpot** - all-in-one CRM with a generous free tier.\n"
+    "2. **Salesforce** - the enterprise standard with deep customization.\n"
+    "3. **Pipedrive** - simple pipeline management for small sales teams.\n\n"
+    "The right choice depends on team size, budget and existing integrations."
+)
+
+DEFAULT_SOURCES = [
+    {"url": "https://example.com/crm-comparison", "title": "CRM comparison 2025"},
+    {"url": "https://example.com/best-crm-tools", "title": "Best CRM tools"},
+]
+
+
+@dataclass
+class StandinBehavior:
+    """
+    Programmable behavior for the stand-in server.
+
+    Attributes:
+        answer: Answer text, or callable (provider, prompt) -> answer text
+        latency_ms: Delay before responding (or before the first stream chunk)
+        latency_sampler: Optional callable returning a delay in ms per
+            request; overrides latency_ms
+        max_requests_per_second: Token-bucket rate limit across all routes;
+            excess requests get 429 with Retry-After (None = unlimited)
+        fail_every: Return fail_status for every Nth request (0 = never)
+        fail_status: Status code for scripted failures (e.g., 500, 503, 429)
+        web_search: Always include web search annotations (otherwise only
+            when the request enables a web search tool)
+        stream_chunk_size: Characters per streamed text delta
+        stream_delay_ms: Delay between streamed deltas
+        function_arguments: Optional callable (function_name, prompt) -> dict
+            for OpenAI function calls; default fills the schema with empty values
+        require_auth: Reject requests without provider credentials (401)
+        batch_pending_polls: Status polls that report a batch job as still
+            processing before it completes
+        batch_error_every: Fail every Nth request inside a batch job (0 = never)
+        prompt_cache: Emulate provider prompt caching. System prompt tokens
+            count as input, and repeat requests with the same model and
+            system prompt report them as cached (Anthropic: only system
+            blocks marked with cache_control; the first request reports a
+            cache write)
+    """
+
+    answer: str | Callable[[str, str], str] = DEFAULT_ANSWER
+    latency_ms: float = 0.0
+    latency_sampler: Callable[[], float] | None = None
+    max_requests_per_second: float | None = None
+    fail_every: int = 0
+    fail_status: int = 500
+    web_search: bool = False
+    stream_chunk_size: int = 16
+    stream_delay_ms: float = 0.0
+    function_arguments: Callable[[str, str], dict] | None = None
+    require_auth: bool = True
+    batch_pending_polls: int = 1
+    batch_error_every: int = 0
+    prompt_cache: bool = False
+
+    def answer_for(self, provider: str, prompt: str) -> str:
+        if callable(self.answer):
+            return self.answer(provider, prompt)
+        return self.answer
+
+    def delay_seconds(self) -> float:
+        delay_ms = self.latency_sampler() if self.latency_sampler else self.latency_ms
+        return max(delay_ms, 0.0) / 1000
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token, minimum 1)."""
+    return max(1, len(text) // 4)
+
+
+def _schema_defaults(schema: dict) -> object:
+    """Build a minimal value satisfying a JSON schema (empty/zero values)."""
+    schema_type = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][0]
+    if schema_type == "object":
+        properties = schema.get("properties", {})
+        required = schema.get("required", list(properties))
+        return {name: _schema_defaults(properties[name]) for name in required if name in properties}
+    if schema_type == "array":
+        return []
+    if schema_type in ("number", "integer"):
+        return 0
+    if schema_type == "boolean":
+        return False
+    return ""
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    size = max(size, 1)
+    return [text[i : i + size] for i in range(0, len(text), size)] or [""]
+
+
+def _sse(data: dict | str, event: str | None = None) -> bytes:
+    """Encode one server-sent event."""
+    payload = data if isinstance(data, str) else json.dumps(data)
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {payload}\n\n".encode()
+
+
+class _TokenBucket:
+    """Token bucket allowing `rate` requests per second with burst `rate`."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token; return 0.0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+@dataclass
+class _ParsedRequest:
+    provider: str
+    model: str
+    prompt: str
+    stream: bool
+    web_search: bool
+    function_tool: dict | None = None
+    cache_prefix: str = ""
+
+
+class StandinServer:
+    """
+    Async stand-in for all provider APIs on one local port.
+
+    Attributes:
+        behavior: Programmable behavior (mutable between requests)
+        request_counts: Requests received per provider
+        requests: Recent parsed requests (provider, model, prompt, stream), newest last
+        batches: Batch jobs by ID (provider, requests, polls, results)
+    """
+
+    def __init__(
+        self,
+        behavior: StandinBehavior | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.behavior = behavior or StandinBehavior()
+        self.request_counts: Counter[str] = Counter()
+        self.requests: list[dict] = []
+        self.batches: dict[str, dict] = {}
+        self._files: dict[str, bytes] = {}
+        self._cached_prefixes: set[tuple[str, str, str]] = set()
+        self._total_requests = 0
+        self._bucket = (
+            _TokenBucket(self.behavior.max_requests_per_second)
+            if self.behavior.max_requests_per_second
+            else None
+        )
+        self._server = LocalHTTPServer(self._handle, host=host, port=port)
+
+    @property
+    def url(self) -> str:
+        return self._server.url
+
+    def base_url(self, provider: str) -> str:
+        """Base URL to configure for a provider (ModelConfig.base_url)."""
+        return f"{self.url}{PROVIDER_PREFIXES[provider]}"
+
+    def environment(self) -> dict[str, str]:
+        """Environment variables pointing every provider at this server."""
+        return {env_var: self.base_url(provider) for provider, env_var in BASE_URL_ENV_VARS.items()}
+
+    async def start(self) -> None:
+        await self._server.start()
+
+    async def stop(self) -> None:
+        await self._server.stop()
+
+    async def __aenter__(self) -> "StandinServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    async def _handle(self, request: HTTPRequest) -> HTTPResponse:
+        batch_provider = self._batch_provider(request.path)
+        if batch_provider is not None:
+            return self._handle_batch(batch_provider, request)
+        return await self._handle_single(request)
+
+    async def _handle_single(self, request: HTTPRequest) -> HTTPResponse:
+        if request.method != "POST":
+            return HTTPResponse.json({"error": {"message": "method not allowed"}}, status=405)
+
+        parsed = self._parse(request)
+        if parsed is None:
+            return HTTPResponse.json(
+                {"error": {"message": f"unknown route {request.path}"}}, status=404
+            )
+
+        if self.behavior.require_auth and not self._has_credentials(parsed.provider, request):
+            return HTTPResponse.json({"error": {"message": "missing API key"}}, status=401)
+
+        self._total_requests += 1
+        self.request_counts[parsed.provider] += 1
+        self.requests.append(
+            {
+                "provider": parsed.provider,
+                "model": parsed.model,
+                "prompt": parsed.prompt,
+                "stream": parsed.stream,
+            }
+        )
+
+        if self._bucket is not None:
+            retry_after = self._bucket.take()
+            if retry_after:
+                return HTTPResponse.json(
+                    {"error": {"message": "rate limit exceeded", "type": "rate_limit_error"}},
+                    status=429,
+                    headers={"Retry-After": f"{retry_after:.3f}"},
+                )
+
+        if self.behavior.fail_every and self._total_requests % self.behavior.fail_every == 0:
+            return HTTPResponse.json(
+                {"error": {"message": "scripted failure", "type": "server_error"}},
+                status=self.behavior.fail_status,
+            )
+
+        delay = self.behavior.delay_seconds()
+        if delay:
+            await asyncio.sleep(delay)
+
+        return self._respond(parsed)
+
+    def _respond(self, parsed: _ParsedRequest) -> HTTPResponse:
+        answer = self.behavior.answer_for(parsed.provider, parsed.prompt)
+        builders = {
+            "openai": self._openai,
+            "anthropic": self._anthropic,
+            "google": self._gemini,
+            "mistral": self._chat_completions,
+            "grok": self._chat_completions,
+            "perplexity": self._chat_completions,
+        }
+        return builders[parsed.provider](parsed, answer)
+
+    def _parse(self, request: HTTPRequest) -> _ParsedRequest | None:
+        """Identify the provider route and extract prompt/model/tool flags."""
+        try:
+            body = request.json() or {}
+        except json.JSONDecodeError:
+            body = {}
+        path = request.path
+        tools = body.get("tools") or []
+
+        if path == "/openai/v1/responses":
+            prompt = body.get("input", "")
+            cache_prefix = str(body.get("instructions") or "")
+            if isinstance(prompt, list):
+                cache_prefix = self._message_text(prompt, ("developer", "system"))
+                prompt = self._last_user_message(prompt)
+            function_tool = next(
+                (t for t in tools if isinstance(t, dict) and t.get("type") == "function"), None
+            )
+            return _ParsedRequest(
+                provider="openai",
+                model=body.get("model", ""),
+                prompt=str(prompt),
+                stream=bool(body.get("stream")),
+                web_search=any(
+                    isinstance(t, dict) and str(t.get("type", "")).startswith("web_search")
+                    for t in tools
+                ),
+                function_tool=function_tool,
+                cache_prefix=cache_prefix,
+            )
+
+        if path == "/anthropic/v1/messages":
+            return _ParsedRequest(
+                provider="anthropic",
+                model=body.get("model", ""),
+                prompt=self._last_user_message(body.get("messages", [])),
+                stream=bool(body.get("stream")),
+                web_search=False,
+                cache_prefix=self._anthropic_cache_prefix(body.get("system")),
+            )
+
+        prefix = PROVIDER_PREFIXES["google"] + "/models/"
+        if path.startswith(prefix) and ":" in path:
+            model, _, action = path[len(prefix) :].partition(":")
+            if action not in ("generateContent", "streamGenerateContent"):
+                return None
+            parts = []
+            for content in body.get("contents", []):
+                parts.extend(p.get("text", "") for p in content.get("parts", []))
+            return _ParsedRequest(
+                provider="google",
+                model=model,
+                prompt=" ".join(parts),
+                stream=action == "streamGenerateContent",
+                web_search=any(isinstance(t, dict) and "google_search" in t for t in tools),
+                cache_prefix=" ".join(
+                    p.get("text", "")
+                    for p in (body.get("systemInstruction") or {}).get("parts", [])
+                ),
+            )
+
+        for provider in ("mistral", "grok", "perplexity"):
+            if path == f"{PROVIDER_PREFIXES[provider]}/chat/completions":
+                return _ParsedRequest(
+                    provider=provider,
+                    model=body.get("model", ""),
+                    prompt=self._last_user_message(body.get("messages", [])),
+                    stream=bool(body.get("stream")),
+                    # Perplexity always searches the web
+                    web_search=provider == "perplexity",
+                )
+        return None
+
+    # ------------------------------------------------------------------
+    # Batch APIs
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _batch_provider(path: str) -> str | None:
+        """Provider whose batch API serves this path (None for other routes)."""
+        openai = PROVIDER_PREFIXES["openai"]
+        if path.startswith((f"{openai}/files", f"{openai}/batches")):
+            return "openai"
+        if path.startswith(f"{PROVIDER_PREFIXES['anthropic']}/messages/batches"):
+            return "anthropic"
+        return None
+
+    def _handle_batch(self, provider: str, request: HTTPRequest) -> HTTPResponse:
+        if self.behavior.require_auth and not self._has_credentials(provider, request):
+            return HTTPResponse.json({"error": {"message": "missing API key"}}, status=401)
+
+        response = None
+        if request.method == "POST":
+            if request.path.endswith("/files"):
+                response = self._openai_upload(request)
+            elif request.path.endswith("/batches"):
+                response = self._create_batch(provider, request)
+        elif request.method == "GET":
+            response = self._batch_get(request.path)
+
+        return response or HTTPResponse.json(
+            {"error": {"message": f"unknown route {request.path}"}}, status=404
+        )
+
+    def _batch_get(self, path: str) -> HTTPResponse | None:
+        """Serve batch status, OpenAI file content or Anthropic results."""
+        parts = path.rstrip("/").split("/")
+        if parts[-1] == "content" and parts[-2] in self._files:
+            return HTTPResponse(
+                body=self._files[parts[-2]], headers={"Content-Type": "application/jsonl"}
+            )
+        if parts[-1] == "results" and parts[-2] in self.batches:
+            results = self.batches[parts[-2]]["results"]
+            if results is None:
+                return None
+            body = "".join(json.dumps(item) + "\n" for item in results)
+            return HTTPResponse(body=body.encode(), headers={"Content-Type": "application/jsonl"})
+        if parts[-1] in self.batches:
+            return self._batch_status(self.batches[parts[-1]])
+        return None
+
+    def _openai_upload(self, request: HTTPRequest) -> HTTPResponse:
+        """Store the "file" part of a multipart upload."""
+        content_type = request.headers.get("content-type", "")
+        message = BytesParser(policy=HTTP).parsebytes(
+            f"Content-Type: {content_type}\r\n\r\n".encode() + request.body
+        )
+        content = None
+        for part in message.iter_parts():
+            if part.get_param("name", header="content-disposition") == "file":
+                content = part.get_payload(decode=True)
+        if content is None:
+            return HTTPResponse.json({"error": {"message": "missing file part"}}, status=400)
+
+        file_id = f"file-{uuid.uuid4().hex[:16]}"
+        self._files[file_id] = content
+        return HTTPResponse.json(
+            {"id": file_id, "object": "file", "purpose": "batch", "bytes": len(content)}
+        )
+
+    def _create_batch(self, provider: str, request: HTTPRequest) -> HTTPResponse:
+        """Record a batch job; its requests are answered when it completes."""
+        body = request.json() or {}
+        if provider == "openai":
+            content = self._files.get(body.get("input_file_id", ""))
+            if content is None:
+                return HTTPResponse.json({"error": {"message": "unknown input file"}}, status=404)
+            lines = [json.loads(line) for line in content.decode().splitlines() if line.strip()]
+            requests = [(line["custom_id"], line["body"]) for line in lines]
+            batch_id = f"batch_{uuid.uuid4().hex[:16]}"
+        else:
+            requests = [(item["custom_id"], item["params"]) for item in body.get("requests", [])]
+            batch_id = f"msgbatch_{uuid.uuid4().hex[:16]}"
+
+        batch = {
+            "id": batch_id,
+            "provider": provider,
+            "requests": requests,
+            "input_file_id": body.get("input_file_id"),
+            "polls": 0,
+            "results": None,
+        }
+        self.batches[batch_id] = batch
+        return self._batch_status(batch, poll=False)
+
+    def _batch_status(self, batch: dict, poll: bool = True) -> HTTPResponse:
+        if poll:
+            batch["polls"] += 1
+            if batch["results"] is None and batch["polls"] > self.behavior.batch_pending_polls:
+                self._complete_batch(batch)
+        done = batch["results"] is not None
+        total = len(batch["requests"])
+
+        if batch["provider"] == "anthropic":
+            succeeded = sum(r["result"]["type"] == "succeeded" for r in batch["results"] or [])
+            return HTTPResponse.json(
+                {
+                    "id": batch["id"],
+                    "type": "message_batch",
+                    "processing_status": "ended" if done else "in_progress",
+                    "request_counts": {
+                        "processing": 0 if done else total,
+                        "succeeded": succeeded,
+                        "errored": total - succeeded if done else 0,
+                        "canceled": 0,
+                        "expired": 0,
+                    },
+                    "results_url": (
+                        f"{self.base_url('anthropic')}/messages/batches/{batch['id']}/results"
+                        if done
+                        else None
+                    ),
+                }
+            )
+
+        return HTTPResponse.json(
+            {
+                "id": batch["id"],
+                "object": "batch",
+                "endpoint": "/v1/responses",
+                "completion_window": "24h",
+                "status": "completed" if done else "in_progress",
+                "input_file_id": batch["input_file_id"],
+                "output_file_id": batch.get("output_file_id"),
+                "error_file_id": batch.get("error_file_id"),
+                "request_counts": {
+                    "total": total,
+                    "completed": batch.get("completed", 0),
+                    "failed": batch.get("failed", 0),
+                },
+            }
+        )
+
+    def _complete_batch(self, batch: dict) -> None:
+        """Answer every request in a batch through the synchronous builders."""
+        provider = batch["provider"]
+        path = (
+            f"{PROVIDER_PREFIXES['openai']}/responses"
+            if provider == "openai"
+            else f"{PROVIDER_PREFIXES['anthropic']}/messages"
+        )
+        succeeded, failed = [], []
+
+        for index, (custom_id, body) in enumerate(batch["requests"], start=1):
+            parsed = self._parse(
+                HTTPRequest(method="POST", path=path, body=json.dumps(body).encode())
+            )
+            self.request_counts[provider] += 1
+            self.requests.append(
+                {
+                    "provider": provider,
+                    "model": parsed.model,
+                    "prompt": parsed.prompt,
+                    "stream": False,
+                    "batch_id": batch["id"],
+                }
+            )
+            error_every = self.behavior.batch_error_every
+            if error_every and index % error_every == 0:
+                failed.append(custom_id)
+                continue
+            response = self._respond(replace(parsed, stream=False))
+            succeeded.append((custom_id, json.loads(response.body)))
+
+        error = {"type": "api_error", "message": "scripted batch failure"}
+        if provider == "anthropic":
+            batch["results"] = [
+                {"custom_id": cid, "result": {"type": "succeeded", "message": message}}
+                for cid, message in succeeded
+            ] + [
+                {"custom_id": cid, "result": {"type": "errored", "error": {"error": error}}}
+                for cid in failed
+            ]
+            return
+
+        def line(custom_id: str, status_code: int, body: dict) -> dict:
+            return {
+                "id": f"batch_req_{uuid.uuid4().hex[:16]}",
+                "custom_id": custom_id,
+                "response": {"status_code": status_code, "body": body},
+                "error": None,
+            }
+
+        batch["results"] = [line(cid, 200, body) for cid, body in succeeded]
+        batch["completed"], batch["failed"] = len(succeeded), len(failed)
+        for key, lines in (
+            ("output_file_id", batch["results"]),
+            ("error_file_id", [line(cid, 500, {"error": error}) for cid in failed]),
+        ):
+            if lines:
+                file_id = f"file-{uuid.uuid4().hex[:16]}"
+                self._files[file_id] = "".join(json.dumps(item) + "\n" for item in lines).encode()
+                batch[key] = file_id
+
+    @staticmethod
+    def _last_user_message(messages: list) -> str:
+        for message in reversed(messages):
+            if isinstance(message, dict) and message.get("role") == "user":
+                return StandinServer._content_text(message.get("content", ""))
+        return ""
+
+    @staticmethod
+    def _message_text(messages: list, roles: tuple[str, ...]) -> str:
+        """Concatenated text of all messages with the given roles."""
+        return " ".join(
+            StandinServer._content_text(message.get("content", ""))
+            for message in messages
+            if isinstance(message, dict) and message.get("role") in roles
+        )
+
+    @staticmethod
+    def _content_text(content: str | list) -> str:
+        if isinstance(content, list):
+            # Content parts (OpenAI input_text, Anthropic text blocks)
+            return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+        return str(content)
+
+    @staticmethod
+    def _anthropic_cache_prefix(system: str | list | None) -> str:
+        """System text up to the last block marked with cache_control."""
+        if not isinstance(system, list):
+            return ""
+        marked = [i for i, block in enumerate(system) if block.get("cache_control")]
+        if not marked:
+            return ""
+        return StandinServer._content_text(system[: marked[-1] + 1])
+
+    def _prompt_cache(self, request: _ParsedRequest) -> tuple[int, int, int]:
+        """
+        Emulated prompt cache accounting for one request.
+
+        Returns:
+            tuple[int, int, int]: (prefix_tokens, cache_read_tokens,
+                cache_write_tokens); all 0 unless StandinBehavior.prompt_cache
+                is set and the request has a cacheable prefix
+        """
+        if not self.behavior.prompt_cache or not request.cache_prefix:
+            return 0, 0, 0
+        prefix_tokens = _estimate_tokens(request.cache_prefix)
+        key = (request.provider, request.model, request.cache_prefix)
+        if key in self._cached_prefixes:
+            return prefix_tokens, prefix_tokens, 0
+        self._cached_prefixes.add(key)
+        return prefix_tokens, 0, prefix_tokens
+
+    @staticmethod
+    def _has_credentials(provider: str, request: HTTPRequest) -> bool:
+        if provider == "anthropic":
+            return bool(request.headers.get("x-api-key"))
+        if provider == "google":
+            return bool(request.query.get("key") or request.headers.get("x-goog-api-key"))
+        return request.headers.get("authorization", "").startswith("Bearer ")
+
+    def _stream(self, events: list[bytes]) -> AsyncIterator[bytes]:
+        delay = self.behavior.stream_delay_ms / 1000
+
+        async def iterate() -> AsyncIterator[bytes]:
+            for index, event in enumerate(events):
+                if delay and index:
+                    await asyncio.sleep(delay)
+                yield event
+
+        return iterate()
+
+    def _sse_response(self, events: list[bytes]) -> HTTPResponse:
+        return HTTPResponse(
+            headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+            stream=self._stream(events),
+        )
+
+    # ------------------------------------------------------------------
+    # Provider formats
+    # ------------------------------------------------------------------
+
+    def _openai(self, request: _ParsedRequest, answer: str) -> HTTPResponse:
+        output: list[dict] = []
+        web_search = request.web_search or self.behavior.web_search
+        if web_search:
+            output.append(
+                {
+                    "type": "web_search_call",
+                    "id": f"ws_{uuid.uuid4().hex[:12]}",
+                    "status": "completed",
+                    "action": {"type": "search", "query": request.prompt[:100]},
+                }
+            )
+
+        if request.function_tool is not None:
+            name = request.function_tool.get("name", "function")
+            if self.behavior.function_arguments:
+                arguments = self.behavior.function_arguments(name, request.prompt)
+            else:
+                arguments = _schema_defaults(request.function_tool.get("parameters", {}))
+            output.append(
+                {
+                    "type": "function_call",
+                    "id": f"fc_{uuid.uuid4().hex[:12]}",
+                    "call_id": f"call_{uuid.uuid4().hex[:12]}",
+                    "name": name,
+                    "arguments": json.dumps(arguments),
+                    "status": "completed",
+                }
+            )
+        else:
+            annotations = (
+                [
+                    {"type": "url_citation", "url": s["url"], "title": s["title"]}
+                    for s in DEFAULT_SOURCES
+                ]
+                if web_search
+                else []
+            )
+            output.append(
+                {
+                    "type": "message",
+                    "id": f"msg_{uuid.uuid4().hex[:12]}",
+                    "role": "assistant",
+                    "status": "completed",
+                    "content": [
+                        {"type": "output_text", "text": answer, "annotations": annotations}
+                    ],
+                }
+            )
+
+        prefix_tokens, cached_tokens, _ = self._prompt_cache(request)
+        input_tokens = _estimate_tokens(request.prompt) + prefix_tokens
+        output_tokens = _estimate_tokens(answer)
+        body = {
+            "id": f"resp_{uuid.uuid4().hex[:16]}",
+            "object": "response",
+            "created_at": int(time.time()),
+            "status": "completed",
+            "model": request.model,
+            "output": output,
+            "usage": {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_tokens_details": {"cached_tokens": cached_tokens},
+            },
+        }
+        if not request.stream:
+            return HTTPResponse.json(body)
+
+        events = [
+            _sse(
+                {
+                    "type": "response.created",
+                    "response": {**body, "status": "in_progress", "output": []},
+                },
+                "response.created",
+            )
+        ]
+        events += [
+            _sse(
+                {"type": "response.output_text.delta", "output_index": 0, "delta": chunk},
+                "response.output_text.delta",
+            )
+            for chunk in _chunks(answer, self.behavior.stream_chunk_size)
+        ]
+        events.append(_sse({"type": "response.completed", "response": body}, "response.completed"))
+        return self._sse_response(events)
+
+    def _anthropic(self, request: _ParsedRequest, answer: str) -> HTTPResponse:
+        # input_tokens excludes cache reads and writes, as in the real API
+        _, cache_read, cache_write = self._prompt_cache(request)
+        input_tokens = _estimate_tokens(request.prompt)
+        output_tokens = _estimate_tokens(answer)
+        cache_usage = (
+            {"cache_creation_input_tokens": cache_write, "cache_read_input_tokens": cache_read}
+            if request.cache_prefix and self.behavior.prompt_cache
+            else {}
+        )
+        message_id = f"msg_{uuid.uuid4().hex[:16]}"
+        body = {
+            "id": message_id,
+            "type": "message",
+            "role": "assistant",
+            "model": request.model,
+            "content": [{"type": "text", "text": answer}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens, **cache_usage},
+        }
+        if not request.stream:
+            return HTTPResponse.json(body)
+
+        start = {
+            **body,
+            "content": [],
+            "stop_reason": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": 1, **cache_usage},
+        }
+        events = [
+            _sse({"type": "message_start", "message": start}, "message_start"),
+            _sse(
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                },
+                "content_block_start",
+            ),
+        ]
+        events += [
+            _sse(
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": chunk},
+                },
+                "content_block_delta",
+            )
+            for chunk in _chunks(answer, self.behavior.stream_chunk_size)
+        ]
+        events += [
+            _sse({"type": "content_block_stop", "index": 0}, "content_block_stop"),
+            _sse(
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": output_tokens},
+                },
+                "message_delta",
+            ),
+            _sse({"type": "message_stop"}, "message_stop"),
+        ]
+        return self._sse_response(events)
+
+    def _gemini(self, request: _ParsedRequest, answer: str) -> HTTPResponse:
+        prefix_tokens, cached_tokens, _ = self._prompt_cache(request)
+        prompt_tokens = _estimate_tokens(request.prompt) + prefix_tokens
+        candidate_tokens = _estimate_tokens(answer)
+        usage = {
+            "promptTokenCount": prompt_tokens,
+            "candidatesTokenCount": candidate_tokens,
+            "totalTokenCount": prompt_tokens + candidate_tokens,
+        }
+        if cached_tokens:
+            usage["cachedContentTokenCount"] = cached_tokens
+        candidate: dict = {
+            "content": {"parts": [{"text": answer}], "role": "model"},
+            "finishReason": "STOP",
+            "index": 0,
+        }
+        if request.web_search or self.behavior.web_search:
+            candidate["groundingMetadata"] = {
+                "webSearchQueries": [request.prompt[:100]],
+                "groundingChunks": [
+                    {"web": {"uri": s["url"], "title": s["title"]}} for s in DEFAULT_SOURCES
+                ],
+                "groundingSupports": [],
+            }
+        body = {"candidates": [candidate], "usageMetadata": usage, "modelVersion": request.model}
+        if not request.stream:
+            return HTTPResponse.json(body)
+
+        chunks = _chunks(answer, self.behavior.stream_chunk_size)
+        events = [
+            _sse(
+                {
+                    "candidates": [
+                        {"content": {"parts": [{"text": chunk}], "role": "model"}, "index": 0}
+                    ]
+                }
+            )
+            for chunk in chunks[:-1]
+        ]
+        final = {**candidate, "content": {"parts": [{"text": chunks[-1]}], "role": "model"}}
+        events.append(
+            _sse({"candidates": [final], "usageMetadata": usage, "modelVersion": request.model})
+        )
+        return self._sse_response(events)
+
+    def _chat_completions(self, request: _ParsedRequest, answer: str) -> HTTPResponse:
+        prompt_tokens = _estimate_tokens(request.prompt)
+        completion_tokens = _estimate_tokens(answer)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:16]}"
+        created = int(time.time())
+        body: dict = {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": request.model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": answer},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+        if request.web_search or self.behavior.web_search:
+            body["citations"] = [s["url"] for s in DEFAULT_SOURCES]
+            body["search_results"] = [
+                {"title": s["title"], "url": s["url"]} for s in DEFAULT_SOURCES
+            ]
+        if not request.stream:
+            return HTTPResponse.json(body)
+
+        def chunk(delta: dict, finish_reason: str | None = None, **extra) -> bytes:
+            return _sse(
+                {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": request.model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                    **extra,
+                }
+            )
+
+        events = [chunk({"role": "assistant", "content": ""})]
+        events += [
+            chunk({"content": text}) for text in _chunks(answer, self.behavior.stream_chunk_size)
+        ]
+        events.append(chunk({}, "stop", usage=usage))
+        events.append(_sse("[DONE]"))
+        return self._sse_response(events)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the stand-in server until interrupted."""
+    parser = argparse.ArgumentParser(description="Local stand-in for all provider APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rps", type=float, default=None, help="Rate limit (requests/sec)")
+    parser.add_argument("--fail-every", type=int, default=0)
+    parser.add_argument("--fail-status", type=int, default=500)
+    parser.add_argument("--web-search", action="store_true")
+    parser.add_argument("--stream-delay-ms", type=float, default=0.0)
+    parser.add_argument("--prompt-cache", action="store_true")
+    args = parser.parse_args(argv)
+
+    behavior = StandinBehavior(
+        latency_ms=args.latency_ms,
+        max_requests_per_second=args.rps,
+        fail_every=args.fail_every,
+        fail_status=args.fail_status,
+        web_search=args.web_search,
+        stream_delay_ms=args.stream_delay_ms,
+        prompt_cache=args.prompt_cache,
+    )
+
+    async def serve() -> None:
+        async with StandinServer(behavior, host=args.host, port=args.port) as server:
+            print(f"Stand-in server listening on {server.url}")
+            for env_var, url in server.environment().items():
+                print(f"  export {env_var}={url}")
+            await asyncio.Event().wait()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+Streaming helpers shared by provider clients.
+
+Clients that support streaming expose:
+
+    async def stream_answer(
+        self, prompt: str, on_chunk: ChunkCallback | None = None
+    ) -> LLMResponse
+
+which sends the request with server-sent events enabled, calls on_chunk with
+each text delta as it arrives, and returns the same LLMResponse as
+generate_answer() (plus ttft_ms, tokens_per_second and stopped_early).
+
+If on_chunk returns True, the client stops reading and closes the
+connection, which ends generation on the provider side. The response then
+contains the text received so far, with completion tokens estimated from
+its length when the provider had not yet reported usage.
+
+Retries: failures before the first delta (connection errors, 429, 5xx) are
+retried like generate_answer(). Once text has been delivered to on_chunk,
+a transport failure raises RuntimeError instead, because a retry would
+replay deltas the caller has already consumed.
+
+Example:
+    >>> matcher = IncrementalMentionMatcher(["Warmly"], ["HubSpot"])
+    >>> response = await client.stream_answer(prompt, on_chunk=matcher.feed)
+    >>> response.ttft_ms
+    412.7
+"""
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from typing import Any, Protocol
+
+import httpx
+
+from .models import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+# Receives each text delta; return True to stop the stream early
+ChunkCallback = Callable[[str], bool | None]
+
+
+class StreamingLLMClient(Protocol):
+    """LLM client that can stream answers (OpenAI, Anthropic, Gemini, mock)."""
+
+    async def stream_answer(
+        self, prompt: str, on_chunk: ChunkCallback | None = None
+    ) -> LLMResponse:
+        """Stream an answer, calling on_chunk per text delta."""
+        ...
+
+
+def supports_streaming(client: Any) -> bool:
+    """Whether a client implements stream_answer()."""
+    return callable(getattr(client, "stream_answer", None))
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for truncated streams."""
+    return max(1, len(text) // 4) if text else 0
+
+
+async def iter_sse_events(
+    response: httpx.Response,
+) -> AsyncIterator[tuple[str | None, str]]:
+    """
+    Parse a server-sent events body into (event, data) pairs.
+
+    Multi-line data fields are joined with newlines; comments and unknown
+    fields are ignored.
+
+    Args:
+        response: Streaming httpx response
+
+    Yields:
+        tuple: (event name or None, data string)
+    """
+    event: str | None = None
+    data_lines: list[str] = []
+
+    async for line in response.aiter_lines():
+        if not line:
+            if data_lines:
+                yield event, "\n".join(data_lines)
+            event, data_lines = None, []
+            continue
+        if line.startswith(":"):
+            continue
+        name, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if name == "event":
+            event = value
+        elif name == "data":
+            data_lines.append(value)
+
+    if data_lines:
+        yield event, "\n".join(data_lines)
+
+
+async def iter_sse_json(response: httpx.Response) -> AsyncIterator[tuple[str | None, dict]]:
+    """Like iter_sse_events(), decoding each data payload as JSON (skips [DONE])."""
+    async for event, data in iter_sse_events(response):
+        if data == "[DONE]":
+            return
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            logger.debug(f"Skipping non-JSON stream event: {data[:100]}")
+            continue
+        if isinstance(payload, dict):
+            yield event, payload
+
+
+class StreamTracker:
+    """
+    Accumulates streamed text and measures time-to-first-token.
+
+    Attributes:
+        ttft_ms: Milliseconds from tracker creation to the first non-empty delta
+        stopped_early: Whether on_chunk asked to stop the stream
+    """
+
+    def __init__(self, on_chunk: ChunkCallback | None = None):
+        self.on_chunk = on_chunk
+        self.ttft_ms: float | None = None
+        self.stopped_early = False
+        self._parts: list[str] = []
+        self._start = time.perf_counter()
+        self._first: float | None = None
+        self._last: float | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether any text has been delivered to the caller."""
+        return self._first is not None
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def add(self, delta: str) -> bool:
+        """
+        Record a text delta and forward it to on_chunk.
+
+        Returns:
+            bool: True if the caller asked to stop the stream
+        """
+        if not delta:
+            return False
+        now = time.perf_counter()
+        if self._first is None:
+            self._first = now
+            self.ttft_ms = round((now - self._start) * 1000, 3)
+        self._last = now
+        self._parts.append(delta)
+        if self.on_chunk is not None and self.on_chunk(delta):
+            self.stopped_early = True
+        return self.stopped_early
+
+    def tokens_per_second(self, completion_tokens: int) -> float | None:
+        """Generation speed after the first delta (None if not measurable)."""
+        if self._first is None or self._last is None or completion_tokens <= 0:
+            return None
+        elapsed = self._last - self._first
+        if elapsed <= 0:
+            return None
+        return round(completion_tokens / elapsed, 3)
+
+    def interrupted(self, provider: str, model_name: str, error: Exception) -> Exception:
+        """
+        Map a transport error to the exception the client should raise.
+
+        Before any text was delivered the original (retryable) error is
+        returned; afterwards a RuntimeError, so the retry decorator does not
+        replay deltas the caller already consumed.
+        """
+        if not self.started:
+            return error
+        return RuntimeError(
+            f"{provider} stream interrupted after first token: model={model_name}, error={error}"
+        )
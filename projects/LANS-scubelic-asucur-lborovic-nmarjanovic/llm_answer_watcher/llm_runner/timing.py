@@ -0,0 +1,418 @@
+"""
+Per-query timing spans for LLM runs.
+
+Each (intent x model) query gets a QueryTimer that records named spans
+around the stages of its execution: waiting for a concurrency slot, the LLM
+call (including retries), brand extraction, artifact and database writes,
+and post-intent operations. The timers feed three outputs:
+
+- query_timings table: one row per query with per-stage totals
+- run_meta.json "latency": percentiles per provider/model
+- Optional OpenTelemetry-compatible JSON export (OTLP/JSON trace format)
+
+HTTP attempts are counted through a context variable: the runner activates
+the query's timer for the duration of the query, and the shared HTTP pool
+calls record_http_attempt() for every request it sends. Because asyncio
+tasks each run in their own context copy, concurrent queries never see each
+other's timers.
+
+Example:
+    >>> timer = QueryTimer("run-1", "crm-tools", "openai", "gpt-4o-mini")
+    >>> with timer.span(STAGE_LLM_CALL):
+    ...     response = await client.generate_answer(prompt)
+    >>> timer.finish()
+    >>> timer.stage_totals()["llm_call"]
+    812.4
+"""
+
+import contextvars
+import hashlib
+import os
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+# Stage names (also the *_ms column prefixes in the query_timings table)
+STAGE_SEMAPHORE_WAIT = "semaphore_wait"
+STAGE_LLM_CALL = "llm_call"
+STAGE_EXTRACTION = "extraction"
+STAGE_ARTIFACT_WRITE = "artifact_write"
+STAGE_DB_WRITE = "db_write"
+STAGE_OPERATIONS = "operations"
+
+STAGES = (
+    STAGE_SEMAPHORE_WAIT,
+    STAGE_LLM_CALL,
+    STAGE_EXTRACTION,
+    STAGE_ARTIFACT_WRITE,
+    STAGE_DB_WRITE,
+    STAGE_OPERATIONS,
+)
+
+# Percentiles reported in run_meta.json
+PERCENTILES = (50, 90, 95, 99)
+
+# Latency values kept per model for percentiles; beyond this a uniform
+# reservoir sample is used so memory stays bounded on very large runs
+LATENCY_SAMPLE_SIZE = 10_000
+
+_current_timer: contextvars.ContextVar["QueryTimer | None"] = contextvars.ContextVar(
+    "current_query_timer", default=None
+)
+
+
+@dataclass
+class TimingSpan:
+    """
+    One timed stage of a query.
+
+    Attributes:
+        name: Stage name (one of STAGES)
+        start_unix_ns: Wall-clock start time in nanoseconds since the epoch
+        duration_ms: Duration in milliseconds (monotonic clock)
+        http_attempts: HTTP requests sent while this span was active
+    """
+
+    name: str
+    start_unix_ns: int
+    duration_ms: float
+    http_attempts: int = 0
+
+
+@dataclass
+class QueryTimer:
+    """
+    Collects timing spans for one (intent x model) query.
+
+    Attributes:
+        run_id: Run identifier
+        intent_id: Intent identifier
+        model_provider: Provider (or runner plugin) name
+        model_name: Model name ("runner" for browser runners)
+        spans: Recorded spans in completion order
+        status: "success" or "error"
+        total_ms: Total query time, set by finish()
+        start_unix_ns: Wall-clock creation time in nanoseconds since the epoch
+        ttft_ms: Time to first streamed token (None if not streamed)
+        tokens_per_sec: Streamed generation speed (None if not streamed)
+        first_mention_ms: Time from stream start to first brand mention
+        stopped_early: Whether the stream was stopped after enough ranked items
+    """
+
+    run_id: str
+    intent_id: str
+    model_provider: str
+    model_name: str
+    spans: list[TimingSpan] = field(default_factory=list)
+    status: str = "success"
+    total_ms: float | None = None
+    start_unix_ns: int = field(default_factory=time.time_ns, repr=False)
+    ttft_ms: float | None = None
+    tokens_per_sec: float | None = None
+    first_mention_ms: float | None = None
+    stopped_early: bool = False
+    _start_perf: float = field(default_factory=time.perf_counter, repr=False)
+    _active: list[TimingSpan] = field(default_factory=list, repr=False)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[TimingSpan]:
+        """
+        Time a block of code as a named span.
+
+        Spans with the same name may be recorded several times per query
+        (e.g., one db_write per mention); stage_totals() sums them.
+        """
+        record = TimingSpan(name=name, start_unix_ns=time.time_ns(), duration_ms=0.0)
+        self._active.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.duration_ms = (time.perf_counter() - start) * 1000
+            self._active.remove(record)
+            self.spans.append(record)
+
+    def mark_since_start(self, name: str) -> None:
+        """
+        Record a span from timer creation until now.
+
+        Used for semaphore wait, where the timer is created just before
+        acquiring the semaphore and marked as soon as it is acquired.
+        """
+        self.spans.append(
+            TimingSpan(
+                name=name,
+                start_unix_ns=self.start_unix_ns,
+                duration_ms=(time.perf_counter() - self._start_perf) * 1000,
+            )
+        )
+
+    def record_http_attempt(self) -> None:
+        """Count one HTTP request against the innermost active span."""
+        if self._active:
+            self._active[-1].http_attempts += 1
+
+    def activate(self) -> contextvars.Token:
+        """Make this the current timer for HTTP attempt counting."""
+        return _current_timer.set(self)
+
+    def finish(self, status: str | None = None) -> None:
+        """Stop the timer and record the total query time."""
+        if status is not None:
+            self.status = status
+        self.total_ms = (time.perf_counter() - self._start_perf) * 1000
+
+    def stage_totals(self) -> dict[str, float]:
+        """Sum span durations per stage (ms, rounded to 3 decimals)."""
+        totals = dict.fromkeys(STAGES, 0.0)
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        return {name: round(value, 3) for name, value in totals.items()}
+
+    @property
+    def http_attempts(self) -> int:
+        """HTTP requests sent during the LLM call stage (1 + retries)."""
+        return sum(s.http_attempts for s in self.spans if s.name == STAGE_LLM_CALL)
+
+    @property
+    def model_key(self) -> str:
+        """Grouping key used in latency summaries ("provider/model")."""
+        return f"{self.model_provider}/{self.model_name}"
+
+
+def record_http_attempt() -> None:
+    """
+    Count an HTTP request against the current query's timer, if any.
+
+    Called from the shared HTTP pool's request hook; a no-op outside of a
+    timed query.
+    """
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.record_http_attempt()
+
+
+def reset_current_timer(token: contextvars.Token) -> None:
+    """Restore the previous current timer (pair with QueryTimer.activate())."""
+    _current_timer.reset(token)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Compute a percentile with linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile in [0, 100]
+
+    Returns:
+        float: Percentile value (0.0 for an empty sample)
+
+    Example:
+        >>> percentile([10.0, 20.0, 30.0, 40.0], 50)
+        25.0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class _ModelLatency:
+    """Running latency aggregates for one provider/model."""
+
+    count: int = 0
+    max_ms: float = 0.0
+    stage_sums: dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    http_retries: int = 0
+    totals: list[float] = field(default_factory=list)
+    ttft_count: int = 0
+    ttfts: list[float] = field(default_factory=list)
+    speed_sum: float = 0.0
+    speed_count: int = 0
+    stopped_early: int = 0
+
+
+class LatencyAccumulator:
+    """
+    Folds finished query timers into per-provider/model latency statistics.
+
+    Counts, maxima and stage means are exact. Percentiles are computed from
+    all values up to sample_size per model and from a uniform reservoir
+    sample beyond that, so memory does not grow with the number of queries.
+
+    Example:
+        >>> latency = LatencyAccumulator()
+        >>> for timer in finished_timers:
+        ...     latency.add(timer)
+        >>> latency.summary()["openai/gpt-4o-mini"]["p95_ms"]
+        1840.2
+    """
+
+    def __init__(self, sample_size: int = LATENCY_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._models: dict[str, _ModelLatency] = {}
+        # Fixed seed keeps summaries of identical runs reproducible
+        self._rng = random.Random(0)
+
+    def _sample(self, values: list[float], seen: int, value: float) -> None:
+        """Reservoir sampling (Algorithm R); seen includes value."""
+        if len(values) < self.sample_size:
+            values.append(value)
+            return
+        slot = self._rng.randrange(seen)
+        if slot < self.sample_size:
+            values[slot] = value
+
+    def add(self, timer: QueryTimer) -> None:
+        """Add one finished timer (unfinished timers are ignored)."""
+        if timer.total_ms is None:
+            return
+        model = self._models.setdefault(timer.model_key, _ModelLatency())
+        model.count += 1
+        model.max_ms = max(model.max_ms, timer.total_ms)
+        self._sample(model.totals, model.count, timer.total_ms)
+        for stage, value in timer.stage_totals().items():
+            model.stage_sums[stage] = model.stage_sums.get(stage, 0.0) + value
+        model.http_retries += max(timer.http_attempts - 1, 0)
+        if timer.ttft_ms is not None:
+            model.ttft_count += 1
+            self._sample(model.ttfts, model.ttft_count, timer.ttft_ms)
+            if timer.tokens_per_sec is not None:
+                model.speed_sum += timer.tokens_per_sec
+                model.speed_count += 1
+            model.stopped_early += int(timer.stopped_early)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """
+        Per-model summary in the run_meta.json "latency" format.
+
+        Returns:
+            dict: {"provider/model": {"count", "p50_ms", "p90_ms", "p95_ms",
+                "p99_ms", "max_ms", "mean_stage_ms": {stage: ms},
+                "http_retries"}} plus "ttft_p50_ms", "ttft_p95_ms",
+                "tokens_per_sec" and "stopped_early" for models with
+                streamed queries
+        """
+        summary = {}
+        for key, model in sorted(self._models.items()):
+            entry: dict[str, Any] = {"count": model.count}
+            for pct in PERCENTILES:
+                entry[f"p{pct}_ms"] = round(percentile(model.totals, pct), 3)
+            entry["max_ms"] = round(model.max_ms, 3)
+            entry["mean_stage_ms"] = {
+                stage: round(value / model.count, 3) for stage, value in model.stage_sums.items()
+            }
+            entry["http_retries"] = model.http_retries
+
+            if model.ttfts:
+                entry["ttft_p50_ms"] = round(percentile(model.ttfts, 50), 3)
+                entry["ttft_p95_ms"] = round(percentile(model.ttfts, 95), 3)
+                entry["tokens_per_sec"] = (
+                    round(model.speed_sum / model.speed_count, 3) if model.speed_count else None
+                )
+                entry["stopped_early"] = model.stopped_early
+            summary[key] = entry
+        return summary
+
+
+def _otel_attribute(key: str, value: Any) -> dict:
+    """Encode one attribute as an OTLP/JSON KeyValue."""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        # OTLP/JSON encodes 64-bit integers as strings
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _span_id() -> str:
+    return os.urandom(8).hex()
+
+
+def build_otel_trace(run_id: str, timers: list[QueryTimer]) -> dict:
+    """
+    Convert query timers into an OTLP/JSON trace document.
+
+    The run is one trace (trace ID derived from the run ID), each query is a
+    root span, and each stage is a child span. The output can be sent to an
+    OpenTelemetry collector's OTLP/HTTP JSON endpoint or loaded into tools
+    that read OTLP JSON.
+
+    Args:
+        run_id: Run identifier
+        timers: Finished query timers
+
+    Returns:
+        dict: {"resourceSpans": [...]} document
+    """
+    trace_id = hashlib.sha256(run_id.encode("utf-8")).hexdigest()[:32]
+    spans = []
+
+    for timer in timers:
+        if timer.total_ms is None:
+            continue
+        query_span_id = _span_id()
+        start_ns = timer.start_unix_ns
+        spans.append(
+            {
+                "traceId": trace_id,
+                "spanId": query_span_id,
+                "name": "query",
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(start_ns + int(timer.total_ms * 1_000_000)),
+                "attributes": [
+                    _otel_attribute("run.id", run_id),
+                    _otel_attribute("intent.id", timer.intent_id),
+                    _otel_attribute("llm.provider", timer.model_provider),
+                    _otel_attribute("llm.model", timer.model_name),
+                    _otel_attribute("http.attempts", timer.http_attempts),
+                    *(
+                        [_otel_attribute("llm.ttft_ms", timer.ttft_ms)]
+                        if timer.ttft_ms is not None
+                        else []
+                    ),
+                ],
+                # STATUS_CODE_OK = 1, STATUS_CODE_ERROR = 2
+                "status": {"code": 1 if timer.status == "success" else 2},
+            }
+        )
+        for span in timer.spans:
+            spans.append(
+                {
+                    "traceId": trace_id,
+                    "spanId": _span_id(),
+                    "parentSpanId": query_span_id,
+                    "name": span.name,
+                    "kind": 1,
+                    "startTimeUnixNano": str(span.start_unix_ns),
+                    "endTimeUnixNano": str(span.start_unix_ns + int(span.duration_ms * 1_000_000)),
+                    "attributes": [_otel_attribute("http.attempts", span.http_attempts)],
+                }
+            )
+
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_otel_attribute("service.name", "llm-answer-watcher")]},
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "llm_answer_watcher.llm_runner"},
+                        "spans": spans,
+                    }
+                ],
+            }
+        ]
+    }
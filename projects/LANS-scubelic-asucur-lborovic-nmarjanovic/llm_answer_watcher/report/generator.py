@@ -26,17 +26,43 @@ Example:
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import TYPE_CHECKING
 
 from ..config.schema import RuntimeConfig
 from ..storage.layout import get_parsed_answer_filename, get_raw_answer_filename
 from ..storage.writer import write_report_html
 from .cost_formatter import format_cost_usd
 
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
 logger = logging.getLogger(__name__)
 
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+
+@lru_cache(maxsize=1)
+def _get_environment() -> "Environment":
+    """
+    Get the shared Jinja2 environment, creating it on first use.
+
+    Jinja2 is imported here rather than at module level so that importing
+    the report package (e.g. from the CLI) does not pay for it until a
+    report is actually rendered. The environment is reused across reports,
+    which also keeps its compiled-template cache warm.
+
+    Returns:
+        Environment: Jinja2 environment with autoescaping enabled
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html", "xml", "j2"]),
+    )
+
 
 def generate_report(
     run_dir: str,
@@ -96,12 +122,8 @@ def generate_report(
 
     logger.info(f"Generating HTML report for run: {run_id}")
 
-    # Setup Jinja2 environment with autoescaping enabled (CRITICAL for security)
-    template_dir = Path(__file__).parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=select_autoescape(["html", "xml", "j2"]),
-    )
+    # Jinja2 environment with autoescaping enabled (CRITICAL for security)
+    env = _get_environment()
 
     # Load template
     try:
@@ -370,6 +392,7 @@ def _build_template_data(
     total_operations_cost = 0.0
     total_llm_cost = total_cost  # Default if run_meta doesn't exist
     config_filename = None
+    latency = {}
 
     # Try to load more accurate cost breakdown from run_meta.json
     run_meta_path = run_dir / "run_meta.json"
@@ -380,6 +403,7 @@ def _build_template_data(
                 total_operations_cost = run_meta.get("total_operations_cost_usd", 0.0)
                 total_llm_cost = run_meta.get("total_llm_cost_usd", total_cost)
                 config_filename = run_meta.get("config_filename")
+                latency = run_meta.get("latency", {})
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Failed to load run_meta.json for cost breakdown: {e}")
 
@@ -445,6 +469,7 @@ def _build_template_data(
         "models_used": models_used,
         "intents": intents_data,
         "visibility_scores": visibility_scores,
+        "latency": latency,
     }
 
 
@@ -518,6 +543,7 @@ def _load_model_result(
     ranked_list = parsed_data.get("ranked_list", [])
     rank_extraction_method = parsed_data.get("rank_extraction_method", "pattern")
     rank_confidence = parsed_data.get("rank_confidence", 0.0)
+    sampling = parsed_data.get("sampling")  # Adaptive sampling estimate, if enabled
 
     # Build a lookup map from ranked_list: brand_name -> rank_position
     rank_lookup = {item["brand_name"]: item["rank_position"] for item in ranked_list}
@@ -602,6 +628,7 @@ def _load_model_result(
         "ranked_list": ranked_list,
         "rank_extraction_method": rank_extraction_method,
         "rank_confidence": rank_confidence,
+        "sampling": sampling,
         "cost_formatted": cost_formatted,
         "answer_text": answer_text,
         "answer_length": answer_length,
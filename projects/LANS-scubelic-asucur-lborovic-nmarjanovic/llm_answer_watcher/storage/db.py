@@ -8,6 +8,10 @@ The database tracks:
 - runs: Each CLI execution with metadata and totals
 - answers_raw: Full LLM responses with usage and cost data
 - mentions: Exploded brand mentions for analytics
+- query_timings: Per-query stage timings for latency analysis
+- model_latency_histograms: Per-model latency histograms (adaptive timeouts)
+- answers_fts: FTS5 full-text index over answers_raw
+- blobs: Compressed answer/prompt texts keyed by content hash (deduplicated)
 
 Schema versioning ensures safe upgrades as features evolve.
 
@@ -23,16 +27,29 @@ Security:
     - Connection context managers ensure proper cleanup
 """
 
+import hashlib
+import json
 import logging
+import re
 import sqlite3
+import zlib
 from pathlib import Path
 
+from ..utils.fingerprint import (
+    CHANGE_UNCHANGED,
+    classify_change,
+    hamming_distance,
+    simhash,
+)
 from ..utils.time import utc_timestamp
 
 logger = logging.getLogger(__name__)
 
 # Current schema version - increment when migrations are added
-CURRENT_SCHEMA_VERSION = 5
+CURRENT_SCHEMA_VERSION = 14
+
+# Rows converted per batch when moving existing answers into the blob store
+BLOB_MIGRATION_BATCH_SIZE = 500
 
 
 def init_db_if_needed(db_path: str) -> None:
@@ -194,9 +211,30 @@ def apply_migrations(
                 _migrate_to_v4(conn)
             elif target_version == 5:
                 _migrate_to_v5(conn)
+            elif target_version == 6:
+                _migrate_to_v6(conn)
+            elif target_version == 7:
+                _migrate_to_v7(conn)
+            elif target_version == 8:
+                _migrate_to_v8(conn)
+            elif target_version == 9:
+                # v10 replaces the index with a contentless one and reindexes
+                # every answer, so building it here would be wasted work
+                if to_version < 10:
+                    _migrate_to_v9(conn)
+            elif target_version == 10:
+                _migrate_to_v10(conn)
+            elif target_version == 11:
+                _migrate_to_v11(conn)
+            elif target_version == 12:
+                _migrate_to_v12(conn)
+            elif target_version == 13:
+                _migrate_to_v13(conn)
+            elif target_version == 14:
+                _migrate_to_v14(conn)
             # Future migrations go here:
-            # elif target_version == 6:
-            #     _migrate_to_v6(conn)
+            # elif target_version == 15:
+            #     _migrate_to_v15(conn)
             else:
                 raise ValueError(f"No migration defined for version {target_version}")
 
@@ -657,6 +695,531 @@ def _migrate_to_v5(conn: sqlite3.Connection) -> None:
     logger.debug("Added browser runner metadata columns to answers_raw (schema v5)")
 
 
+def _migrate_to_v6(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 6.
+
+    Adds per-query timing so runs can be profiled stage by stage (semaphore
+    wait, LLM call, extraction, artifact writes, DB writes, operations).
+
+    Creates:
+    - query_timings table: One row per (run, intent, model) with total and
+      per-stage durations in milliseconds, HTTP attempt count, and the raw
+      spans as JSON
+    - Indexes on run_id and (model_provider, model_name) for latency trends
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS query_timings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            status TEXT NOT NULL CHECK(status IN ('success', 'error')),
+            total_ms REAL NOT NULL,
+            semaphore_wait_ms REAL NOT NULL DEFAULT 0.0,
+            llm_call_ms REAL NOT NULL DEFAULT 0.0,
+            extraction_ms REAL NOT NULL DEFAULT 0.0,
+            artifact_write_ms REAL NOT NULL DEFAULT 0.0,
+            db_write_ms REAL NOT NULL DEFAULT 0.0,
+            operations_ms REAL NOT NULL DEFAULT 0.0,
+            http_attempts INTEGER NOT NULL DEFAULT 0,
+            spans_json TEXT,
+            timestamp_utc TEXT NOT NULL,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            UNIQUE(run_id, intent_id, model_provider, model_name)
+        )
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_query_timings_run
+        ON query_timings(run_id)
+    """)
+
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_query_timings_model
+        ON query_timings(model_provider, model_name)
+    """)
+
+    logger.debug("Created query_timings table and indexes (schema v6)")
+
+
+def _migrate_to_v7(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 7.
+
+    Adds streaming metrics to query_timings so time-to-first-token and
+    generation speed can be compared across models.
+
+    Changes:
+    - ttft_ms: Time from request start to the first streamed text delta
+    - tokens_per_sec: Completion tokens per second after the first delta
+    - first_mention_ms: Time until the incremental matcher saw a brand
+    - stopped_early: 1 if the stream was cut after enough ranked items
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        All new columns are NULL (or 0) for non-streamed queries and for
+        rows written before this migration.
+    """
+    conn.execute("ALTER TABLE query_timings ADD COLUMN ttft_ms REAL")
+    conn.execute("ALTER TABLE query_timings ADD COLUMN tokens_per_sec REAL")
+    conn.execute("ALTER TABLE query_timings ADD COLUMN first_mention_ms REAL")
+    conn.execute(
+        "ALTER TABLE query_timings ADD COLUMN stopped_early INTEGER NOT NULL DEFAULT 0"
+    )
+
+    logger.debug("Added streaming metrics columns to query_timings (schema v7)")
+
+
+def _migrate_to_v8(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 8.
+
+    Persists per-model latency histograms across runs so request timeouts
+    and hedging thresholds can be derived from observed latency.
+
+    Creates:
+    - model_latency_histograms table: One row per (provider, model) with the
+      bucket counts as a JSON array (bucket layout defined in
+      llm_runner.hedging)
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS model_latency_histograms (
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            bucket_counts TEXT NOT NULL,
+            sample_count INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (model_provider, model_name)
+        )
+    """)
+
+    logger.debug("Created model_latency_histograms table (schema v8)")
+
+
+# Columns of answers_raw indexed by answers_fts (answer_text first: snippets)
+ANSWER_SEARCH_COLUMNS = ("answer_text", "prompt", "intent_id", "model_provider", "model_name")
+
+
+def _migrate_to_v9(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 9.
+
+    Adds a full-text index over stored answers, so searching historical
+    answers no longer needs LIKE scans over answers_raw.answer_text.
+
+    Creates:
+    - answers_fts: FTS5 external-content table over answers_raw (answer
+      text, prompt, intent and model), porter-stemmed
+    - Insert/update/delete triggers on answers_raw keeping it in sync
+    - Index contents for all existing answers (rebuild)
+
+    If SQLite was built without FTS5 the index is skipped with a warning;
+    search_answers() then raises sqlite3.OperationalError.
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+        apply_migrations() skips it when migrating on to v10 or later, which
+        drops this layout for a contentless index.
+    """
+    columns = ", ".join(ANSWER_SEARCH_COLUMNS)
+    new_values = ", ".join(f"new.{column}" for column in ANSWER_SEARCH_COLUMNS)
+    old_values = ", ".join(f"old.{column}" for column in ANSWER_SEARCH_COLUMNS)
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS answers_fts USING fts5(
+                {columns},
+                content='answers_raw',
+                content_rowid='id',
+                tokenize='porter unicode61'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, answers_fts not created: {e}")
+        return
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS answers_fts_insert AFTER INSERT ON answers_raw BEGIN
+            INSERT INTO answers_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS answers_fts_delete AFTER DELETE ON answers_raw BEGIN
+            INSERT INTO answers_fts(answers_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS answers_fts_update AFTER UPDATE ON answers_raw BEGIN
+            INSERT INTO answers_fts(answers_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO answers_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    conn.execute("INSERT INTO answers_fts(answers_fts) VALUES ('rebuild')")
+
+    logger.debug("Created answers_fts full-text index (schema v9)")
+
+
+def _migrate_to_v10(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 10.
+
+    Moves answer texts into a content-addressed blob store. Daily runs repeat
+    the same prompts and near-identical answers; storing each distinct text
+    once, compressed, shrinks the database and its page-cache footprint
+    several-fold.
+
+    Creates:
+    - blobs table: hash (SHA-256 of the text) -> codec, size, compressed data
+    - answers_raw.prompt_hash, answer_hash, web_search_results_hash columns
+    - answers_fts recreated contentless (index only, no copy of the text);
+      the v9 sync triggers are dropped because indexing now happens in
+      insert_answer_raw()
+
+    Existing answers are converted in batches of BLOB_MIGRATION_BATCH_SIZE:
+    texts move to blobs, the inline prompt/answer_text columns are emptied
+    and web_search_results_json is cleared. Run VACUUM afterwards to return
+    the freed pages to the filesystem.
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS blobs (
+            hash TEXT PRIMARY KEY,
+            codec TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            data BLOB NOT NULL
+        )
+    """)
+    for column in ("prompt_hash", "answer_hash", "web_search_results_hash"):
+        conn.execute(f"ALTER TABLE answers_raw ADD COLUMN {column} TEXT")
+
+    for trigger in ("answers_fts_insert", "answers_fts_delete", "answers_fts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    conn.execute("DROP TABLE IF EXISTS answers_fts")
+    try:
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE answers_fts USING fts5(
+                {", ".join(ANSWER_SEARCH_COLUMNS)},
+                content='',
+                tokenize='porter unicode61'
+            )
+        """)
+        fts_available = True
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Full-text search unavailable, answers_fts not created: {e}")
+        fts_available = False
+
+    converted = 0
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            """
+            SELECT id, prompt, answer_text, web_search_results_json,
+                   intent_id, model_provider, model_name
+            FROM answers_raw
+            WHERE id > ? AND answer_hash IS NULL
+            ORDER BY id
+            LIMIT ?
+            """,
+            (last_id, BLOB_MIGRATION_BATCH_SIZE),
+        ).fetchall()
+        if not rows:
+            break
+        for row_id, prompt, answer_text, web_json, intent_id, provider, model in rows:
+            conn.execute(
+                """
+                UPDATE answers_raw
+                SET prompt = '', answer_text = '', web_search_results_json = NULL,
+                    prompt_hash = ?, answer_hash = ?, web_search_results_hash = ?
+                WHERE id = ?
+                """,
+                (
+                    put_blob(conn, prompt),
+                    put_blob(conn, answer_text),
+                    put_blob(conn, web_json),
+                    row_id,
+                ),
+            )
+            if fts_available:
+                _index_answer(
+                    conn,
+                    row_id,
+                    answer_text,
+                    prompt,
+                    intent_id=intent_id,
+                    model_provider=provider,
+                    model_name=model,
+                )
+        converted += len(rows)
+        last_id = rows[-1][0]
+
+    logger.debug(f"Moved {converted} answers into the blob store (schema v10)")
+
+
+def _migrate_to_v11(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 11.
+
+    Adds what freshness policies need to reuse earlier answers.
+
+    Creates:
+    - answers_raw.system_prompt_hash: blobs.hash of the system prompt the
+      answer was generated with (NULL for runners and older answers)
+    - answers_raw.reused_from_run_id: run the answer was fetched in, for
+      answers carried forward without a new API call (NULL if fetched)
+    - idx_answers_freshness: (intent_id, model_provider, model_name,
+      timestamp_utc), so finding the latest answer per query is one index
+      range scan
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("ALTER TABLE answers_raw ADD COLUMN system_prompt_hash TEXT")
+    conn.execute("ALTER TABLE answers_raw ADD COLUMN reused_from_run_id TEXT")
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_answers_freshness
+        ON answers_raw(intent_id, model_provider, model_name, timestamp_utc)
+    """)
+
+    logger.debug("Added answer freshness columns and index (schema v11)")
+
+
+def _migrate_to_v12(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 12.
+
+    Adds answer fingerprints for run-over-run change detection.
+
+    Creates:
+    - answers_raw.simhash: 64-bit SimHash of the answer text (signed)
+    - answers_raw.change_status: "new", "unchanged", "minor" or "major"
+      compared with the previous answer for the same intent and model
+
+    The previous answer is found through idx_answers_freshness (v11).
+    Existing answers keep NULL values; comparisons start with the first
+    answer written after the migration.
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("ALTER TABLE answers_raw ADD COLUMN simhash INTEGER")
+    conn.execute("ALTER TABLE answers_raw ADD COLUMN change_status TEXT")
+
+    logger.debug("Added answer fingerprint columns (schema v12)")
+
+
+def _migrate_to_v13(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 13.
+
+    Stores visibility estimates of queries repeated by adaptive sampling
+    (run_settings.sampling).
+
+    Creates:
+    - visibility_estimates table: One row per sampled (run, intent, model)
+      with the sample count, the appearance rate of my brand and my brand's
+      mean rank, each with its confidence interval
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS visibility_estimates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            intent_id TEXT NOT NULL,
+            model_provider TEXT NOT NULL,
+            model_name TEXT NOT NULL,
+            timestamp_utc TEXT NOT NULL,
+            samples INTEGER NOT NULL,
+            appeared_count INTEGER NOT NULL,
+            appearance_rate REAL NOT NULL,
+            appearance_low REAL NOT NULL,
+            appearance_high REAL NOT NULL,
+            ranked_count INTEGER NOT NULL DEFAULT 0,
+            mean_rank REAL,
+            rank_low REAL,
+            rank_high REAL,
+            confidence REAL NOT NULL,
+            stop_reason TEXT,
+            sampling_cost_usd REAL NOT NULL DEFAULT 0.0,
+            FOREIGN KEY (run_id) REFERENCES runs(run_id),
+            UNIQUE(run_id, intent_id, model_provider, model_name)
+        )
+    """)
+
+    logger.debug("Created visibility_estimates table (schema v13)")
+
+
+def _migrate_to_v14(conn: sqlite3.Connection) -> None:
+    """
+    Migrate database schema to version 14.
+
+    Records how each run ended, so runs cut short by live budget
+    enforcement can be told apart from complete ones.
+
+    Creates:
+    - runs.status: "complete" or "budget-truncated" once the run finished
+      (see llm_runner.ledger); NULL while running and for older runs
+
+    Args:
+        conn: Active SQLite database connection in transaction
+
+    Note:
+        This migration is called automatically by apply_migrations().
+        Do NOT call directly - use apply_migrations() instead.
+    """
+    conn.execute("ALTER TABLE runs ADD COLUMN status TEXT")
+
+    logger.debug("Added runs.status column (schema v14)")
+
+
+# ============================================================================
+# Blob Store
+# ============================================================================
+
+
+def _encode_blob(raw: bytes) -> tuple[str, bytes]:
+    data = zlib.compress(raw, 6)
+    if len(data) >= len(raw):
+        return "none", raw  # Short texts do not compress
+    return "zlib", data
+
+
+def _decode_blob(codec: str, data: bytes) -> str:
+    if codec == "zlib":
+        data = zlib.decompress(data)
+    elif codec != "none":
+        raise ValueError(f"Unknown blob codec: {codec}")
+    return data.decode("utf-8")
+
+
+def content_hash_of(text: str) -> str:
+    """SHA-256 hex digest of a text, the key it has in the blob store."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def put_blob(conn: sqlite3.Connection, text: str | None) -> str | None:
+    """
+    Store a text in the blob store once, keyed by its content hash.
+
+    Texts already stored are not compressed or written again, so repeated
+    prompts and identical answers cost one row in total.
+
+    Args:
+        conn: Active SQLite database connection
+        text: Text to store (None is passed through)
+
+    Returns:
+        str | None: SHA-256 hex digest of the text, or None for None
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v10)
+
+    Example:
+        >>> content_hash = put_blob(conn, "What are the best CRMs?")
+        >>> get_blob(conn, content_hash)
+        'What are the best CRMs?'
+    """
+    if text is None:
+        return None
+    raw = text.encode("utf-8")
+    content_hash = content_hash_of(text)
+    if conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (content_hash,)).fetchone():
+        return content_hash
+    codec, data = _encode_blob(raw)
+    conn.execute(
+        "INSERT OR IGNORE INTO blobs (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+        (content_hash, codec, len(raw), data),
+    )
+    return content_hash
+
+
+def get_blob(conn: sqlite3.Connection, content_hash: str | None) -> str | None:
+    """
+    Read a text from the blob store.
+
+    Args:
+        conn: Active SQLite database connection
+        content_hash: Hash returned by put_blob() (None is passed through)
+
+    Returns:
+        str | None: The text, or None if the hash is None or unknown
+
+    Raises:
+        sqlite3.Error: If database operation fails
+        ValueError: If the blob uses an unknown codec
+    """
+    if content_hash is None:
+        return None
+    row = conn.execute(
+        "SELECT codec, data FROM blobs WHERE hash = ?", (content_hash,)
+    ).fetchone()
+    return _decode_blob(row[0], row[1]) if row else None
+
+
+def _index_answer(
+    conn: sqlite3.Connection,
+    row_id: int,
+    answer_text: str,
+    prompt: str,
+    *,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+) -> None:
+    """Add one answer to the full-text index (no-op without answers_fts)."""
+    try:
+        conn.execute(
+            f"INSERT INTO answers_fts (rowid, {', '.join(ANSWER_SEARCH_COLUMNS)}) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (row_id, answer_text, prompt, intent_id, model_provider, model_name),
+        )
+    except sqlite3.OperationalError as e:
+        if "no such table" not in str(e):
+            raise
+
+
 # ============================================================================
 # Database Operations (CRUD)
 # ============================================================================
@@ -752,13 +1315,24 @@ def insert_answer_raw(
     screenshot_path: str | None = None,
     html_snapshot_path: str | None = None,
     session_id: str | None = None,
-) -> None:
+    *,
+    system_prompt: str | None = None,
+) -> str | None:
     """
     Insert a raw LLM answer into the answers_raw table.
 
     Stores the complete LLM response with metadata for historical tracking.
     The answer_length is computed automatically from answer_text.
 
+    A SimHash fingerprint of the answer is stored with it and compared with
+    the previous answer for the same (intent_id, model_provider, model_name)
+    in another run, which sets change_status (see utils.fingerprint).
+
+    The prompt, answer text and web search results are stored in the blob
+    store (compressed, once per distinct text) and referenced by hash; the
+    inline prompt/answer_text columns are left empty. Read answers back with
+    load_answers_raw(). New answers are added to the full-text index.
+
     This function is idempotent - if an answer for the same (run_id, intent_id,
     model_provider, model_name) already exists, the insert is skipped (due to
     UNIQUE constraint).
@@ -781,6 +1355,12 @@ def insert_answer_raw(
         screenshot_path: Optional path to screenshot file (browser runners only)
         html_snapshot_path: Optional path to HTML snapshot file (browser runners only)
         session_id: Optional browser session ID (browser runners only)
+        system_prompt: System prompt the answer was generated with (API
+            models), stored in the blob store for freshness checks
+
+    Returns:
+        str | None: change_status of the answer ("new", "unchanged", "minor"
+            or "major"), or None if the answer already existed
 
     Raises:
         sqlite3.Error: If database operation fails
@@ -846,8 +1426,13 @@ def insert_answer_raw(
         raise ValueError("answer_text cannot be empty or whitespace")
 
     answer_length = len(answer_text)
+    fingerprint = simhash(answer_text)
+    previous = find_previous_answer(conn, run_id, intent_id, model_provider, model_name)
+    change_status = classify_change(
+        hamming_distance(fingerprint, previous["simhash"]) if previous else None
+    )
 
-    conn.execute(
+    cursor = conn.execute(
         """
         INSERT OR IGNORE INTO answers_raw (
             run_id,
@@ -866,8 +1451,14 @@ def insert_answer_raw(
             runner_name,
             screenshot_path,
             html_snapshot_path,
-            session_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            session_id,
+            prompt_hash,
+            answer_hash,
+            web_search_results_hash,
+            system_prompt_hash,
+            simhash,
+            change_status
+        ) VALUES (?, ?, ?, ?, ?, '', '', ?, ?, ?, ?, NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             run_id,
@@ -875,20 +1466,34 @@ def insert_answer_raw(
             model_provider,
             model_name,
             timestamp_utc,
-            prompt,
-            answer_text,
             answer_length,
             usage_meta_json,
             estimated_cost_usd,
             web_search_count,
-            web_search_results_json,
             runner_type,
             runner_name,
             screenshot_path,
             html_snapshot_path,
             session_id,
+            put_blob(conn, prompt),
+            put_blob(conn, answer_text),
+            put_blob(conn, web_search_results_json),
+            put_blob(conn, system_prompt),
+            fingerprint,
+            change_status,
         ),
     )
+    if cursor.rowcount != 1:
+        return None
+    _index_answer(
+        conn,
+        cursor.lastrowid,
+        answer_text,
+        prompt,
+        intent_id=intent_id,
+        model_provider=model_provider,
+        model_name=model_name,
+    )
 
     # Log with web search info if applicable
     if web_search_count > 0:
@@ -901,19 +1506,202 @@ def insert_answer_raw(
             f"Inserted answer for intent={intent_id}, model={model_provider}/{model_name}, "
             f"length={answer_length} chars"
         )
+    return change_status
 
 
-def insert_mention(
+def find_previous_answer(
     conn: sqlite3.Connection,
     run_id: str,
-    timestamp_utc: str,
     intent_id: str,
     model_provider: str,
     model_name: str,
-    brand_name: str,
-    normalized_name: str,
-    is_mine: bool,
-    first_position: int | None = None,
+) -> dict | None:
+    """
+    Latest fingerprinted answer for the same query in another run.
+
+    Served by idx_answers_freshness (one index range scan).
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Current run (its own answer is skipped)
+        intent_id: Intent query identifier
+        model_provider: LLM provider
+        model_name: Model identifier
+
+    Returns:
+        dict | None: {"run_id", "simhash", "change_status"}, or None if no
+            earlier answer has a fingerprint
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v12)
+    """
+    row = conn.execute(
+        """
+        SELECT run_id, simhash, change_status FROM answers_raw
+        WHERE intent_id = ? AND model_provider = ? AND model_name = ?
+          AND run_id != ? AND simhash IS NOT NULL
+        ORDER BY timestamp_utc DESC, id DESC
+        LIMIT 1
+        """,
+        (intent_id, model_provider, model_name, run_id),
+    ).fetchone()
+    if row is None:
+        return None
+    return {"run_id": row[0], "simhash": row[1], "change_status": row[2]}
+
+
+def carry_forward_answer(
+    conn: sqlite3.Connection,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    source_run_id: str,
+    run_id: str,
+    timestamp_utc: str,
+) -> bool:
+    """
+    Copy a fresh answer and its mentions from an earlier run into a new run.
+
+    The copy references the same blobs (no text is duplicated), costs
+    nothing (estimated_cost_usd = 0) and records the run the answer was
+    fetched in as reused_from_run_id; its change_status is "unchanged".
+    Mentions are copied with copy_mentions().
+
+    Args:
+        conn: Active SQLite database connection
+        intent_id: Intent query identifier
+        model_provider: LLM provider (runner plugin name for runners)
+        model_name: Model identifier ("runner" for runners)
+        source_run_id: Run the answer was fetched in
+        run_id: New run receiving the answer
+        timestamp_utc: Timestamp of the new run
+
+    Returns:
+        bool: True if the answer was copied, False if the source answer no
+            longer exists or the new run already has one
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v11)
+
+    Note:
+        Always call conn.commit() afterwards to persist changes.
+    """
+    key = (intent_id, model_provider, model_name)
+    answer_columns = [
+        row[1]
+        for row in conn.execute("PRAGMA table_info(answers_raw)")
+        if row[1]
+        not in (
+            "id",
+            "run_id",
+            "timestamp_utc",
+            "estimated_cost_usd",
+            "reused_from_run_id",
+            "change_status",
+        )
+    ]
+    cursor = conn.execute(
+        f"""
+        INSERT OR IGNORE INTO answers_raw (
+            run_id, timestamp_utc, estimated_cost_usd, reused_from_run_id, change_status,
+            {", ".join(answer_columns)}
+        )
+        SELECT ?, ?, 0.0, run_id, ?, {", ".join(answer_columns)}
+        FROM answers_raw
+        WHERE run_id = ? AND intent_id = ? AND model_provider = ? AND model_name = ?
+        """,
+        (run_id, timestamp_utc, CHANGE_UNCHANGED, source_run_id, *key),
+    )
+    if cursor.rowcount != 1:
+        return False
+    row_id = cursor.lastrowid
+    prompt_hash, answer_hash = conn.execute(
+        "SELECT prompt_hash, answer_hash FROM answers_raw WHERE id = ?", (row_id,)
+    ).fetchone()
+    _index_answer(
+        conn,
+        row_id,
+        get_blob(conn, answer_hash),
+        get_blob(conn, prompt_hash),
+        intent_id=intent_id,
+        model_provider=model_provider,
+        model_name=model_name,
+    )
+
+    copy_mentions(
+        conn, *key, source_run_id=source_run_id, run_id=run_id, timestamp_utc=timestamp_utc
+    )
+
+    logger.debug(
+        f"Carried forward answer for intent={intent_id}, model={model_provider}/{model_name} "
+        f"from run {source_run_id}"
+    )
+    return True
+
+
+def copy_mentions(
+    conn: sqlite3.Connection,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    source_run_id: str,
+    run_id: str,
+    timestamp_utc: str,
+) -> int:
+    """
+    Copy the mentions of one answer from an earlier run into a new run.
+
+    Mentions keep their ranks, sentiment and context but get the new run's
+    id and timestamp, so per-run trend queries see a complete run.
+
+    Args:
+        conn: Active SQLite database connection
+        intent_id: Intent query identifier
+        model_provider: LLM provider
+        model_name: Model identifier
+        source_run_id: Run whose mentions are copied
+        run_id: New run receiving the mentions
+        timestamp_utc: Timestamp of the new run
+
+    Returns:
+        int: Number of mentions copied
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() afterwards to persist changes.
+    """
+    mention_columns = [
+        row[1]
+        for row in conn.execute("PRAGMA table_info(mentions)")
+        if row[1] not in ("id", "run_id", "timestamp_utc")
+    ]
+    cursor = conn.execute(
+        f"""
+        INSERT OR IGNORE INTO mentions (run_id, timestamp_utc, {", ".join(mention_columns)})
+        SELECT ?, ?, {", ".join(mention_columns)}
+        FROM mentions
+        WHERE run_id = ? AND intent_id = ? AND model_provider = ? AND model_name = ?
+        """,
+        (run_id, timestamp_utc, source_run_id, intent_id, model_provider, model_name),
+    )
+    return cursor.rowcount
+
+
+def insert_mention(
+    conn: sqlite3.Connection,
+    run_id: str,
+    timestamp_utc: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    brand_name: str,
+    normalized_name: str,
+    is_mine: bool,
+    first_position: int | None = None,
     rank_position: int | None = None,
     match_type: str = "exact",
     sentiment: str | None = None,
@@ -1458,6 +2246,629 @@ def insert_operation(
         )
 
 
+def insert_query_timing(
+    conn: sqlite3.Connection,
+    run_id: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    status: str,
+    total_ms: float,
+    stage_ms: dict[str, float],
+    http_attempts: int,
+    timestamp_utc: str,
+    spans_json: str | None = None,
+    ttft_ms: float | None = None,
+    tokens_per_sec: float | None = None,
+    first_mention_ms: float | None = None,
+    stopped_early: bool = False,
+) -> None:
+    """
+    Insert per-query timing breakdown into the query_timings table.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Parent run identifier
+        intent_id: Intent identifier
+        model_provider: Provider (or runner plugin) name
+        model_name: Model name ("runner" for browser runners)
+        status: "success" or "error"
+        total_ms: Total query time in milliseconds
+        stage_ms: Per-stage totals in milliseconds, keyed by stage name
+            (semaphore_wait, llm_call, extraction, artifact_write, db_write,
+            operations); missing stages are stored as 0.0
+        http_attempts: HTTP requests sent for the LLM call (1 + retries)
+        timestamp_utc: ISO 8601 timestamp with 'Z' suffix
+        spans_json: Optional JSON-encoded list of individual spans
+        ttft_ms: Time to first streamed token (None if not streamed)
+        tokens_per_sec: Streamed generation speed (None if not streamed)
+        first_mention_ms: Time until the first brand mention was streamed
+        stopped_early: Whether the stream was stopped after enough ranked items
+
+    Raises:
+        ValueError: If required strings are empty or status is invalid
+        sqlite3.Error: If database operation fails
+
+    Example:
+        >>> insert_query_timing(
+        ...     conn, "2025-11-02T08-00-00Z", "crm-tools", "openai", "gpt-4o-mini",
+        ...     status="success", total_ms=1240.5,
+        ...     stage_ms={"semaphore_wait": 3.1, "llm_call": 1180.2},
+        ...     http_attempts=1, timestamp_utc="2025-11-02T08:00:02Z",
+        ... )
+        >>> conn.commit()
+
+    Security:
+        Uses parameterized query to prevent SQL injection.
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+        Uses INSERT OR IGNORE for idempotency (UNIQUE constraint on
+        run_id + intent_id + model_provider + model_name).
+    """
+    for name, value in (
+        ("run_id", run_id),
+        ("intent_id", intent_id),
+        ("model_provider", model_provider),
+        ("model_name", model_name),
+        ("timestamp_utc", timestamp_utc),
+    ):
+        if not value or value.isspace():
+            raise ValueError(f"{name} cannot be empty or whitespace")
+    if status not in ("success", "error"):
+        raise ValueError(f"status must be 'success' or 'error', got '{status}'")
+
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO query_timings (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            status,
+            total_ms,
+            semaphore_wait_ms,
+            llm_call_ms,
+            extraction_ms,
+            artifact_write_ms,
+            db_write_ms,
+            operations_ms,
+            http_attempts,
+            spans_json,
+            timestamp_utc,
+            ttft_ms,
+            tokens_per_sec,
+            first_mention_ms,
+            stopped_early
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            status,
+            total_ms,
+            stage_ms.get("semaphore_wait", 0.0),
+            stage_ms.get("llm_call", 0.0),
+            stage_ms.get("extraction", 0.0),
+            stage_ms.get("artifact_write", 0.0),
+            stage_ms.get("db_write", 0.0),
+            stage_ms.get("operations", 0.0),
+            http_attempts,
+            spans_json,
+            timestamp_utc,
+            ttft_ms,
+            tokens_per_sec,
+            first_mention_ms,
+            1 if stopped_early else 0,
+        ),
+    )
+    logger.debug(
+        f"Inserted query timing: {intent_id}/{model_provider}/{model_name} "
+        f"total={total_ms:.1f}ms"
+    )
+
+
+def insert_visibility_estimate(
+    conn: sqlite3.Connection,
+    run_id: str,
+    intent_id: str,
+    model_provider: str,
+    model_name: str,
+    *,
+    timestamp_utc: str,
+    estimate: dict,
+    confidence: float,
+) -> None:
+    """
+    Insert the sampled visibility estimate of one query.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Parent run identifier
+        intent_id: Intent identifier
+        model_provider: Provider name
+        model_name: Model name
+        timestamp_utc: ISO 8601 timestamp with 'Z' suffix
+        estimate: VisibilityEstimate.summary() from llm_runner.sampling
+        confidence: Confidence level of the intervals
+
+    Raises:
+        ValueError: If required strings are empty
+        sqlite3.Error: If database operation fails
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+        Uses INSERT OR IGNORE for idempotency (UNIQUE constraint on
+        run_id + intent_id + model_provider + model_name).
+    """
+    for name, value in (
+        ("run_id", run_id),
+        ("intent_id", intent_id),
+        ("model_provider", model_provider),
+        ("model_name", model_name),
+        ("timestamp_utc", timestamp_utc),
+    ):
+        if not value or value.isspace():
+            raise ValueError(f"{name} cannot be empty or whitespace")
+
+    conn.execute(
+        """
+        INSERT OR IGNORE INTO visibility_estimates (
+            run_id, intent_id, model_provider, model_name, timestamp_utc,
+            samples, appeared_count, appearance_rate, appearance_low, appearance_high,
+            ranked_count, mean_rank, rank_low, rank_high,
+            confidence, stop_reason, sampling_cost_usd
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            run_id,
+            intent_id,
+            model_provider,
+            model_name,
+            timestamp_utc,
+            estimate["samples"],
+            estimate["appeared_count"],
+            estimate["appearance_rate"],
+            estimate["appearance_low"],
+            estimate["appearance_high"],
+            estimate["ranked_count"],
+            estimate["mean_rank"],
+            estimate["rank_low"],
+            estimate["rank_high"],
+            confidence,
+            estimate["stop_reason"],
+            estimate["sampling_cost_usd"],
+        ),
+    )
+    logger.debug(
+        f"Inserted visibility estimate: {intent_id}/{model_provider}/{model_name} "
+        f"samples={estimate['samples']}"
+    )
+
+
+def upsert_latency_histogram(
+    conn: sqlite3.Connection,
+    model_provider: str,
+    model_name: str,
+    bucket_counts: list[int],
+) -> None:
+    """
+    Insert or replace the latency histogram of one model.
+
+    Args:
+        conn: Active SQLite database connection
+        model_provider: Provider name
+        model_name: Model name
+        bucket_counts: Observations per histogram bucket
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Example:
+        >>> upsert_latency_histogram(conn, "openai", "gpt-4o-mini", [0, 3, 12, 4])
+        >>> conn.commit()
+
+    Note:
+        Always call conn.commit() after upsert to persist changes.
+    """
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO model_latency_histograms (
+            model_provider, model_name, bucket_counts, sample_count, updated_at
+        ) VALUES (?, ?, ?, ?, ?)
+        """,
+        (
+            model_provider,
+            model_name,
+            json.dumps(bucket_counts),
+            sum(bucket_counts),
+            utc_timestamp(),
+        ),
+    )
+
+
+def load_latency_histograms(conn: sqlite3.Connection) -> dict[tuple[str, str], list[int]]:
+    """
+    Load all persisted latency histograms.
+
+    Args:
+        conn: Active SQLite database connection
+
+    Returns:
+        dict: (model_provider, model_name) -> bucket counts
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v8)
+
+    Example:
+        >>> load_latency_histograms(conn)[("openai", "gpt-4o-mini")]
+        [0, 3, 12, 4]
+    """
+    cursor = conn.execute(
+        "SELECT model_provider, model_name, bucket_counts FROM model_latency_histograms"
+    )
+    return {(row[0], row[1]): json.loads(row[2]) for row in cursor.fetchall()}
+
+
+def load_query_history(
+    conn: sqlite3.Connection, recent_runs: int = 20
+) -> dict[tuple[str, str, str], dict]:
+    """
+    Aggregate token usage and duration per query over recent runs.
+
+    Token averages come from answers_raw usage metadata of fetched answers
+    (answers carried forward by a freshness policy are not new samples);
+    durations are successful query timings without semaphore wait, so they
+    reflect the query's own work rather than how busy the run was.
+
+    Args:
+        conn: Active SQLite database connection
+        recent_runs: Number of most recent runs to aggregate
+
+    Returns:
+        dict: (intent_id, model_provider, model_name) -> {"samples",
+            "prompt_tokens", "completion_tokens", "duration_ms"}; averages
+            are None when not recorded
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v6)
+
+    Example:
+        >>> load_query_history(conn)[("crm-tools", "openai", "gpt-4o-mini")]
+        {'samples': 4, 'prompt_tokens': 182.0, 'completion_tokens': 640.5, 'duration_ms': 7310.2}
+    """
+    recent = "SELECT run_id FROM runs ORDER BY timestamp_utc DESC LIMIT ?"
+    history: dict[tuple[str, str, str], dict] = {}
+
+    cursor = conn.execute(
+        f"""
+        SELECT intent_id, model_provider, model_name, COUNT(*),
+               AVG(json_extract(usage_meta_json, '$.prompt_tokens')),
+               AVG(json_extract(usage_meta_json, '$.completion_tokens'))
+        FROM answers_raw
+        WHERE run_id IN ({recent}) AND reused_from_run_id IS NULL
+        GROUP BY intent_id, model_provider, model_name
+        """,
+        (recent_runs,),
+    )
+    for intent_id, provider, model_name, samples, prompt_tokens, completion_tokens in cursor:
+        history[(intent_id, provider, model_name)] = {
+            "samples": samples,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "duration_ms": None,
+        }
+
+    cursor = conn.execute(
+        f"""
+        SELECT intent_id, model_provider, model_name, COUNT(*),
+               AVG(total_ms - semaphore_wait_ms)
+        FROM query_timings
+        WHERE status = 'success' AND run_id IN ({recent})
+        GROUP BY intent_id, model_provider, model_name
+        """,
+        (recent_runs,),
+    )
+    for intent_id, provider, model_name, samples, duration_ms in cursor:
+        entry = history.setdefault(
+            (intent_id, provider, model_name),
+            {"samples": samples, "prompt_tokens": None, "completion_tokens": None},
+        )
+        entry["duration_ms"] = duration_ms
+    return history
+
+
+def find_latest_answers(
+    conn: sqlite3.Connection,
+    queries: list[tuple[str, str, str, str, str | None]],
+) -> dict[tuple[str, str, str], dict]:
+    """
+    Find the latest fetched answer of each query with an unchanged prompt.
+
+    One query over idx_answers_freshness: for every (intent_id,
+    model_provider, model_name) the most recent answer that was fetched
+    (not carried forward) with the same prompt and system prompt. Whether
+    that answer is still fresh enough is the caller's decision.
+
+    Args:
+        conn: Active SQLite database connection
+        queries: (intent_id, model_provider, model_name, prompt,
+            system_prompt) per query; system_prompt is None for runners
+
+    Returns:
+        dict: (intent_id, model_provider, model_name) -> {"run_id",
+            "timestamp_utc"} for queries with a matching answer
+
+    Raises:
+        sqlite3.Error: If database operation fails (e.g. schema < v11)
+
+    Example:
+        >>> find_latest_answers(conn, [("crm-tools", "openai", "gpt-4o-mini", "Best CRM?", "You are...")])
+        {('crm-tools', 'openai', 'gpt-4o-mini'): {'run_id': '2025-11-02T08-00-00Z', 'timestamp_utc': '2025-11-02T08:00:05Z'}}
+    """
+    if not queries:
+        return {}
+    wanted = json.dumps(
+        [
+            [
+                intent_id,
+                provider,
+                model_name,
+                content_hash_of(prompt),
+                content_hash_of(system_prompt) if system_prompt is not None else None,
+            ]
+            for intent_id, provider, model_name, prompt, system_prompt in queries
+        ]
+    )
+    cursor = conn.execute(
+        """
+        WITH wanted AS (
+            SELECT json_extract(value, '$[0]') AS intent_id,
+                   json_extract(value, '$[1]') AS model_provider,
+                   json_extract(value, '$[2]') AS model_name,
+                   json_extract(value, '$[3]') AS prompt_hash,
+                   json_extract(value, '$[4]') AS system_prompt_hash
+            FROM json_each(?)
+        )
+        SELECT a.intent_id, a.model_provider, a.model_name, a.run_id,
+               MAX(a.timestamp_utc)
+        FROM wanted w
+        JOIN answers_raw a
+          ON a.intent_id = w.intent_id
+         AND a.model_provider = w.model_provider
+         AND a.model_name = w.model_name
+        WHERE a.reused_from_run_id IS NULL
+          AND a.prompt_hash = w.prompt_hash
+          AND a.system_prompt_hash IS w.system_prompt_hash
+        GROUP BY a.intent_id, a.model_provider, a.model_name
+        """,
+        (wanted,),
+    )
+    return {
+        (intent_id, provider, model_name): {"run_id": run_id, "timestamp_utc": timestamp}
+        for intent_id, provider, model_name, run_id, timestamp in cursor
+    }
+
+
+def search_answers(
+    conn: sqlite3.Connection,
+    query: str,
+    *,
+    since: str | None = None,
+    until: str | None = None,
+    provider: str | None = None,
+    model_name: str | None = None,
+    brand: str | None = None,
+    order: str = "newest",
+    limit: int = 20,
+    highlight: tuple[str, str] = ("**", "**"),
+) -> list[dict]:
+    """
+    Full-text search over stored answers.
+
+    The query uses FTS5 syntax: words (porter-stemmed, so "mention" also
+    matches "mentioning"), "quoted phrases", AND/OR/NOT, NEAR(a b, 10) and
+    column filters such as intent_id:crm. Matching uses the answers_fts index
+    instead of scanning answers_raw. The index is contentless, so snippets
+    are built from the matched answers' texts in the blob store.
+
+    Args:
+        conn: Active SQLite database connection
+        query: FTS5 match expression (e.g. 'HubSpot AND Warmly')
+        since: Earliest timestamp or date (inclusive, e.g. "2025-11-01")
+        until: Latest timestamp or date (inclusive, e.g. "2025-11-30")
+        provider: Only answers from this provider
+        model_name: Only answers from this model
+        brand: Only answers in which this brand was detected (mentions
+            table, matched case-insensitively on brand or normalized name)
+        order: "newest", "oldest" or "rank" (BM25 relevance)
+        limit: Maximum number of results
+        highlight: Markers placed around matched terms in the snippet
+
+    Returns:
+        list[dict]: Matches with run_id, timestamp_utc, intent_id,
+            model_provider, model_name, snippet and score (BM25, lower is
+            more relevant)
+
+    Raises:
+        ValueError: If order is not "newest", "oldest" or "rank"
+        sqlite3.OperationalError: If the query syntax is invalid or the
+            full-text index does not exist (SQLite without FTS5)
+
+    Example:
+        >>> results = search_answers(conn, "HubSpot AND Warmly", order="oldest", limit=1)
+        >>> results[0]["timestamp_utc"]  # First answer mentioning both
+        '2025-11-03T08:00:00Z'
+    """
+    order_by = {
+        "newest": "a.timestamp_utc DESC",
+        "oldest": "a.timestamp_utc ASC",
+        "rank": "score ASC",
+    }
+    if order not in order_by:
+        raise ValueError(f"order must be 'newest', 'oldest' or 'rank' (got: {order!r})")
+
+    sql = """
+        SELECT a.run_id, a.timestamp_utc, a.intent_id, a.model_provider, a.model_name,
+               bm25(answers_fts) AS score, a.answer_hash, a.answer_text
+        FROM answers_fts
+        JOIN answers_raw a ON a.id = answers_fts.rowid
+        WHERE answers_fts MATCH ?
+    """
+    params: list = [query]
+    if since:
+        sql += " AND a.timestamp_utc >= ?"
+        params.append(since)
+    if until:
+        # Prefix comparison so a date includes that whole day
+        sql += " AND substr(a.timestamp_utc, 1, length(?)) <= ?"
+        params.extend([until, until])
+    if provider:
+        sql += " AND a.model_provider = ?"
+        params.append(provider)
+    if model_name:
+        sql += " AND a.model_name = ?"
+        params.append(model_name)
+    if brand:
+        sql += """
+            AND EXISTS (
+                SELECT 1 FROM mentions m
+                WHERE m.run_id = a.run_id AND m.intent_id = a.intent_id
+                  AND m.model_provider = a.model_provider AND m.model_name = a.model_name
+                  AND (m.normalized_name = ? COLLATE NOCASE OR m.brand_name = ? COLLATE NOCASE)
+            )
+        """
+        params.extend([brand, brand])
+    sql += f" ORDER BY {order_by[order]} LIMIT ?"
+    params.append(limit)
+
+    terms = _query_terms(query)
+    results = []
+    for row in conn.execute(sql, params).fetchall():
+        run_id, timestamp_utc, intent_id, provider_, model_name_, score, answer_hash, inline = row
+        answer_text = get_blob(conn, answer_hash) if answer_hash else inline
+        results.append(
+            {
+                "run_id": run_id,
+                "timestamp_utc": timestamp_utc,
+                "intent_id": intent_id,
+                "model_provider": provider_,
+                "model_name": model_name_,
+                "snippet": _snippet(answer_text or "", terms, highlight),
+                "score": score,
+            }
+        )
+    return results
+
+
+# FTS5 operators, not search terms
+_FTS_OPERATORS = frozenset({"AND", "OR", "NOT", "NEAR"})
+
+# Suffixes trimmed from query terms so highlighting approximates porter stemming
+_TERM_SUFFIXES = ("ing", "ed", "es", "s")
+
+# Words shown per snippet
+SNIPPET_WORDS = 24
+
+
+def _query_terms(query: str) -> list[str]:
+    """Words of an FTS5 query to highlight (operators and column names skipped)."""
+    terms = []
+    for word, is_column in re.findall(r"(\w+)\*?(\s*:)?", query):
+        if is_column or word in _FTS_OPERATORS or word.isdigit():
+            continue
+        term = word.lower()
+        for suffix in _TERM_SUFFIXES:
+            if len(term) > len(suffix) + 3 and term.endswith(suffix):
+                term = term[: -len(suffix)]
+                break
+        terms.append(term)
+    return terms
+
+
+def _snippet(text: str, terms: list[str], highlight: tuple[str, str]) -> str:
+    """Window of SNIPPET_WORDS words around the first term, terms highlighted."""
+    words = text.split()
+    if not terms:
+        return " ".join(words[:SNIPPET_WORDS])
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, terms)) + r")\w*", re.IGNORECASE)
+    first = next((i for i, word in enumerate(words) if pattern.search(word)), 0)
+    start = max(0, first - SNIPPET_WORDS // 4)
+    end = start + SNIPPET_WORDS
+    window = pattern.sub(
+        lambda m: f"{highlight[0]}{m.group(0)}{highlight[1]}", " ".join(words[start:end])
+    )
+    return ("..." if start else "") + window + ("..." if end < len(words) else "")
+
+
+def load_answers_raw(
+    conn: sqlite3.Connection,
+    run_id: str | None = None,
+    intent_id: str | None = None,
+    model_provider: str | None = None,
+    model_name: str | None = None,
+) -> list[dict]:
+    """
+    Load answers with their texts resolved from the blob store.
+
+    This is the read API for answers_raw: prompt, answer_text and
+    web_search_results_json hold the full texts whether a row references
+    blobs (schema v10+) or still stores them inline.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Only answers of this run
+        intent_id: Only answers for this intent
+        model_provider: Only answers from this provider
+        model_name: Only answers from this model
+
+    Returns:
+        list[dict]: One dict per answers_raw row (all columns), in insert order
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Example:
+        >>> rows = load_answers_raw(conn, run_id="2025-11-02T08-00-00Z")
+        >>> rows[0]["answer_text"]
+        'Here are top email warmup tools: ...'
+    """
+    filters = {
+        "run_id": run_id,
+        "intent_id": intent_id,
+        "model_provider": model_provider,
+        "model_name": model_name,
+    }
+    where = [f"a.{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    sql = """
+        SELECT a.*, p.codec, p.data, t.codec, t.data, w.codec, w.data
+        FROM answers_raw a
+        LEFT JOIN blobs p ON p.hash = a.prompt_hash
+        LEFT JOIN blobs t ON t.hash = a.answer_hash
+        LEFT JOIN blobs w ON w.hash = a.web_search_results_hash
+    """
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY a.id"
+
+    cursor = conn.execute(sql, params)
+    columns = [description[0] for description in cursor.description[:-6]]
+    answers = []
+    for row in cursor.fetchall():
+        answer = dict(zip(columns, row[:-6], strict=True))
+        blob_columns = ("prompt", "answer_text", "web_search_results_json")
+        for index, column in enumerate(blob_columns):
+            codec, data = row[-6 + 2 * index], row[-5 + 2 * index]
+            if codec is not None:
+                answer[column] = _decode_blob(codec, data)
+        answers.append(answer)
+    return answers
+
+
 def update_run_cost(
     conn: sqlite3.Connection, run_id: str, total_cost_usd: float
 ) -> None:
@@ -1502,6 +2913,33 @@ def update_run_cost(
     logger.debug(f"Updated run {run_id} total cost: ${total_cost_usd:.6f}")
 
 
+def update_run_status(conn: sqlite3.Connection, run_id: str, status: str) -> None:
+    """
+    Record how a run ended in the runs table.
+
+    Args:
+        conn: Active SQLite database connection
+        run_id: Run identifier to update
+        status: "complete" or "budget-truncated"
+
+    Raises:
+        sqlite3.Error: If database operation fails
+        ValueError: If run_id does not exist (rowcount == 0)
+
+    Note:
+        Always call conn.commit() after update to persist changes.
+    """
+    cursor = conn.execute("UPDATE runs SET status = ? WHERE run_id = ?", (status, run_id))
+
+    if cursor.rowcount == 0:
+        raise ValueError(
+            f"Cannot update status for run_id={run_id}: run does not exist. "
+            f"Call insert_run() first."
+        )
+
+    logger.debug(f"Updated run {run_id} status: {status}")
+
+
 def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
     """
     Retrieve summary information for a specific run.
@@ -1514,7 +2952,8 @@ def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
         run_id: Run identifier to retrieve
 
     Returns:
-        dict with keys: run_id, timestamp_utc, total_intents, total_models, total_cost_usd
+        dict with keys: run_id, timestamp_utc, total_intents, total_models,
+        total_cost_usd, status (None until the run finished)
         None if run_id does not exist
 
     Example:
@@ -1525,7 +2964,8 @@ def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
             "timestamp_utc": "2025-11-02T08:00:00Z",
             "total_intents": 3,
             "total_models": 2,
-            "total_cost_usd": 0.0234
+            "total_cost_usd": 0.0234,
+            "status": "complete"
         }
 
     Security:
@@ -1536,7 +2976,7 @@ def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
     """
     cursor = conn.execute(
         """
-        SELECT run_id, timestamp_utc, total_intents, total_models, total_cost_usd
+        SELECT run_id, timestamp_utc, total_intents, total_models, total_cost_usd, status
         FROM runs
         WHERE run_id = ?
         """,
@@ -1553,4 +2993,38 @@ def get_run_summary(conn: sqlite3.Connection, run_id: str) -> dict | None:
         "total_intents": row[2],
         "total_models": row[3],
         "total_cost_usd": row[4],
+        "status": row[5],
     }
+
+
+def list_runs(conn: sqlite3.Connection, limit: int = 20) -> list[dict]:
+    """
+    List the most recent runs, newest first.
+
+    Args:
+        conn: Active SQLite database connection
+        limit: Maximum number of runs
+
+    Returns:
+        list[dict]: Run summaries with the same keys as get_run_summary()
+    """
+    cursor = conn.execute(
+        """
+        SELECT run_id, timestamp_utc, total_intents, total_models, total_cost_usd, status
+        FROM runs
+        ORDER BY timestamp_utc DESC, run_id DESC
+        LIMIT ?
+        """,
+        (limit,),
+    )
+    return [
+        {
+            "run_id": row[0],
+            "timestamp_utc": row[1],
+            "total_intents": row[2],
+            "total_models": row[3],
+            "total_cost_usd": row[4],
+            "status": row[5],
+        }
+        for row in cursor.fetchall()
+    ]
@@ -483,6 +483,77 @@ def insert_eval_result(
     )
 
 
+def insert_eval_results_batch(
+    conn: sqlite3.Connection,
+    eval_run_id: str,
+    results: list[Any],
+) -> int:
+    """
+    Insert all metric results for a list of test case results in one batch.
+
+    Equivalent to calling insert_eval_result() for every metric of every
+    result, but uses a single executemany() so large suites (thousands of
+    test cases) avoid per-row statement overhead.
+
+    Args:
+        conn: Active SQLite database connection
+        eval_run_id: Run identifier (foreign key to eval_runs.run_id)
+        results: EvalResult objects (test_description, overall_passed, metrics)
+
+    Returns:
+        int: Number of metric rows written
+
+    Raises:
+        sqlite3.Error: If database operation fails
+
+    Example:
+        >>> count = insert_eval_results_batch(conn, "2025-11-02T08-00-00Z", results)
+        >>> conn.commit()
+
+    Security:
+        Uses parameterized query to prevent SQL injection.
+
+    Note:
+        Always call conn.commit() after insert to persist changes.
+        All rows share one created_at timestamp.
+    """
+    import json
+
+    timestamp = utc_timestamp()
+    rows = [
+        (
+            eval_run_id,
+            result.test_description,
+            1 if result.overall_passed else 0,
+            metric.name,
+            metric.value,
+            1 if metric.passed else 0,
+            json.dumps(metric.details, separators=(",", ":")) if metric.details else None,
+            timestamp,
+        )
+        for result in results
+        for metric in result.metrics
+    ]
+
+    conn.executemany(
+        """
+        INSERT OR REPLACE INTO eval_results (
+            eval_run_id,
+            test_description,
+            overall_passed,
+            metric_name,
+            metric_value,
+            metric_passed,
+            metric_details_json,
+            created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    logger.debug(f"Inserted {len(rows)} eval results for run {eval_run_id}")
+    return len(rows)
+
+
 def store_eval_results(
     conn: sqlite3.Connection,
     eval_results: dict[str, Any],
@@ -516,8 +587,8 @@ def store_eval_results(
         Uses parameterized queries to prevent SQL injection.
 
     Note:
-        This function handles both insert_eval_run and multiple insert_eval_result
-        calls in a single transaction for atomicity.
+        This function handles insert_eval_run and the batched metric inserts
+        in a single transaction for atomicity.
     """
     from ..utils.time import run_id_from_timestamp
 
@@ -531,22 +602,8 @@ def store_eval_results(
         # Insert eval run summary
         insert_eval_run(conn, run_id, eval_results["summary"])
 
-        # Insert detailed results for each test case
-        for result in eval_results["results"]:
-            test_description = result.test_description
-            overall_passed = result.overall_passed
-
-            for metric in result.metrics:
-                insert_eval_result(
-                    conn,
-                    eval_run_id=run_id,
-                    test_description=test_description,
-                    overall_passed=overall_passed,
-                    metric_name=metric.name,
-                    metric_value=metric.value,
-                    metric_passed=metric.passed,
-                    metric_details=metric.details,
-                )
+        # Insert detailed results for all test cases in one batched statement
+        insert_eval_results_batch(conn, run_id, eval_results["results"])
 
         logger.info(
             f"Stored eval results for run {run_id}: "
@@ -167,6 +167,40 @@ def get_run_meta_filename() -> str:
     return "run_meta.json"
 
 
+def get_timings_otel_filename() -> str:
+    """
+    Get filename for the OpenTelemetry timing export.
+
+    Contains per-query timing spans in OTLP/JSON trace format, written only
+    when run_settings.export_otel_timings is enabled.
+
+    Returns:
+        Constant filename "timings.otel.json"
+
+    Example:
+        >>> get_timings_otel_filename()
+        'timings.otel.json'
+    """
+    return "timings.otel.json"
+
+
+def get_error_log_filename() -> str:
+    """
+    Get filename for the run's error log.
+
+    Contains one JSON object per line for every failed query, appended as
+    queries fail, so large runs do not have to hold all errors in memory.
+
+    Returns:
+        Constant filename "errors.jsonl"
+
+    Example:
+        >>> get_error_log_filename()
+        'errors.jsonl'
+    """
+    return "errors.jsonl"
+
+
 def get_report_filename() -> str:
     """
     Get filename for HTML report.
@@ -31,12 +31,14 @@ from pathlib import Path
 from ..utils.time import utc_timestamp
 from .layout import (
     get_error_filename,
+    get_error_log_filename,
     get_operation_result_filename,
     get_parsed_answer_filename,
     get_raw_answer_filename,
     get_report_filename,
     get_run_directory,
     get_run_meta_filename,
+    get_timings_otel_filename,
 )
 
 logger = logging.getLogger(__name__)
@@ -365,6 +367,47 @@ def write_run_meta(run_dir: str, meta: dict) -> None:
     logger.info(f"Wrote run metadata: {filepath}")
 
 
+def append_error_log(run_dir: str, error: dict) -> None:
+    """
+    Append one failed query to the run's error log (errors.jsonl).
+
+    Args:
+        run_dir: Run directory path (from create_run_directory)
+        error: Error dict (intent_id, model_provider, model_name, error_message)
+
+    Raises:
+        OSError: If file cannot be written
+
+    Example:
+        >>> append_error_log(
+        ...     "./output/2025-11-02T08-00-00Z",
+        ...     {"intent_id": "email-warmup", "error_message": "timeout"},
+        ... )
+    """
+    filepath = os.path.join(run_dir, get_error_log_filename())
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(json.dumps(error, ensure_ascii=False) + "\n")
+
+
+def write_timings_otel(run_dir: str, trace: dict) -> None:
+    """
+    Write per-query timing spans as OpenTelemetry JSON to run directory.
+
+    Args:
+        run_dir: Run directory path (from create_run_directory)
+        trace: OTLP/JSON trace document (from timing.build_otel_trace)
+
+    Raises:
+        OSError: If file cannot be written
+
+    Example:
+        >>> write_timings_otel("./output/2025-11-02T08-00-00Z", trace)
+    """
+    filepath = os.path.join(run_dir, get_timings_otel_filename())
+    write_json(filepath, trace)
+    logger.info(f"Wrote timing spans: {filepath}")
+
+
 def write_report_html(run_dir: str, html: str) -> None:
     """
     Write HTML report to run directory.
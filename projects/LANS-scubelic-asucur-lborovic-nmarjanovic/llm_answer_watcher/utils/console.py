@@ -542,6 +542,24 @@ def print_final_summary(
     console.print(panel)
 
 
+def format_duration(seconds: float) -> str:
+    """
+    Format a duration for display, e.g. "45s", "3m 20s", "1h 05m".
+
+    Args:
+        seconds: Duration in seconds
+
+    Returns:
+        str: Compact human-readable duration
+    """
+    seconds = round(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+
 def print_cost_breakdown(
     cost_estimate: dict, budget_limit: float | None = None
 ) -> None:
@@ -557,6 +575,9 @@ def print_cost_breakdown(
             - base_cost: Total cost before safety buffer
             - total_estimated_cost: Total with safety buffer
             - buffer_percentage: Safety buffer percentage
+            - predicted_duration_s: Predicted wall time (optional)
+            - history_coverage: Fraction predicted from history (optional)
+            - reused_queries: Queries answered from fresh earlier answers (optional)
         budget_limit: Optional budget limit in USD to compare against
 
     Example:
@@ -658,6 +679,8 @@ def print_cost_breakdown(
     # Print totals
     # Build queries/operations summary
     summary_parts = [f"{cost_estimate['total_queries']} queries"]
+    if cost_estimate.get("reused_queries", 0) > 0:
+        summary_parts.append(f"{cost_estimate['reused_queries']} reused while fresh")
     if cost_estimate.get("total_operations", 0) > 0:
         summary_parts.append(f"{cost_estimate['total_operations']} operations")
     summary_text = ", ".join(summary_parts)
@@ -675,6 +698,13 @@ def print_cost_breakdown(
         f"[bold cyan]Total estimated cost:[/bold cyan] "
         f"${cost_estimate['total_estimated_cost']:.6f}"
     )
+    if "predicted_duration_s" in cost_estimate:
+        coverage = int(cost_estimate.get("history_coverage", 0) * 100)
+        basis = f"{coverage}% of queries from run history" if coverage else "no run history yet"
+        console.print(
+            f"[bold cyan]Predicted wall time:[/bold cyan] "
+            f"~{format_duration(cost_estimate['predicted_duration_s'])} ({basis})"
+        )
 
     # Budget check
     if budget_limit is not None:
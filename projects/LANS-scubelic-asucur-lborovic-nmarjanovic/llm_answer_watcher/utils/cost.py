@@ -8,6 +8,13 @@ update date. Users should verify costs on their provider's billing dashboard.
 This module provides:
 - PRICING: Public pricing table for all supported providers/models
 - estimate_cost: Calculate estimated cost from token usage metadata
+- summarize_prompt_cache: Per-model prompt cache hit ratios for run_meta.json
+
+Prompt caching: usage_meta may carry "cached_tokens" (prompt tokens read from
+the provider's prompt cache) and "cache_write_tokens" (prompt tokens written
+to it, Anthropic only). Both are part of "prompt_tokens". Cached tokens are
+billed at the model's "input_cached" price, or at CACHED_INPUT_PRICE_RATIO of
+the input price when the pricing table has no explicit cached price.
 
 Important:
     Cost estimates are approximate and based on public pricing as of the
@@ -65,14 +72,17 @@ PRICING = {
         "gpt-5": {
             "input": 1.25 / 1_000_000,  # $1.25 per 1M input tokens
             "output": 10.00 / 1_000_000,  # $10.00 per 1M output tokens
+            "input_cached": 0.125 / 1_000_000,  # $0.125 per 1M cached input tokens
         },
         "gpt-5-mini": {
             "input": 0.25 / 1_000_000,  # $0.25 per 1M input tokens
             "output": 2.00 / 1_000_000,  # $2.00 per 1M output tokens
+            "input_cached": 0.025 / 1_000_000,  # $0.025 per 1M cached input tokens
         },
         "gpt-5-nano": {
             "input": 0.05 / 1_000_000,  # $0.05 per 1M input tokens
             "output": 0.40 / 1_000_000,  # $0.40 per 1M output tokens
+            "input_cached": 0.005 / 1_000_000,  # $0.005 per 1M cached input tokens
         },
         "gpt-5-pro": {
             "input": 5.00 / 1_000_000,  # $5.00 per 1M input tokens
@@ -81,6 +91,7 @@ PRICING = {
         "gpt-5-chat-latest": {
             "input": 1.25 / 1_000_000,  # Same as gpt-5
             "output": 10.00 / 1_000_000,
+            "input_cached": 0.125 / 1_000_000,
         },
     },
     "anthropic": {
@@ -243,10 +254,60 @@ PRICING = {
     },
 }
 
+# Cached input price as a fraction of the input price, used when a model has
+# no explicit "input_cached" price. OpenAI and Gemini cache automatically;
+# Anthropic caches prefixes marked with cache_control.
+CACHED_INPUT_PRICE_RATIO = {
+    "openai": 0.5,
+    "anthropic": 0.1,
+    "google": 0.25,
+}
+
+# Anthropic bills writes to the prompt cache (5-minute TTL) at 1.25x input
+CACHE_WRITE_PRICE_RATIO = {
+    "anthropic": 1.25,
+}
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 
+def _input_cost(
+    provider: str,
+    usage_meta: dict,
+    input_rate: float,
+    cached_rate: float | None = None,
+) -> float:
+    """
+    Cost of prompt tokens, splitting out cache reads and writes.
+
+    Args:
+        provider: Provider name (selects the fallback cache price ratios)
+        usage_meta: Token usage with "prompt_tokens" and optional
+            "cached_tokens" / "cache_write_tokens"
+        input_rate: USD per uncached input token
+        cached_rate: USD per cached input token (None: derive from
+            CACHED_INPUT_PRICE_RATIO)
+
+    Returns:
+        float: Unrounded input cost in USD
+    """
+    input_tokens = usage_meta.get("prompt_tokens", 0)
+    cached_tokens = min(usage_meta.get("cached_tokens", 0) or 0, input_tokens)
+    write_tokens = min(
+        usage_meta.get("cache_write_tokens", 0) or 0, input_tokens - cached_tokens
+    )
+    if cached_rate is None:
+        cached_rate = input_rate * CACHED_INPUT_PRICE_RATIO.get(provider, 1.0)
+    write_rate = input_rate * CACHE_WRITE_PRICE_RATIO.get(provider, 1.0)
+
+    return (
+        (input_tokens - cached_tokens - write_tokens) * input_rate
+        + cached_tokens * cached_rate
+        + write_tokens * write_rate
+    )
+
+
 def estimate_cost(provider: str, model: str, usage_meta: dict) -> float:
     """
     Estimate cost in USD based on token usage and provider pricing.
@@ -263,6 +324,10 @@ def estimate_cost(provider: str, model: str, usage_meta: dict) -> float:
         usage_meta: Dictionary containing token usage with keys:
             - "prompt_tokens" (int): Number of input tokens
             - "completion_tokens" (int): Number of output tokens
+            - "cached_tokens" (int, optional): Prompt tokens read from the
+              prompt cache, billed at the cached input price
+            - "cache_write_tokens" (int, optional): Prompt tokens written to
+              the prompt cache (Anthropic), billed at the cache write price
             Other keys are ignored.
 
     Returns:
@@ -313,11 +378,12 @@ def estimate_cost(provider: str, model: str, usage_meta: dict) -> float:
         return 0.0
 
     # Extract token counts (default to 0 if missing)
-    input_tokens = usage_meta.get("prompt_tokens", 0)
     output_tokens = usage_meta.get("completion_tokens", 0)
 
-    # Calculate cost: (input tokens * input price) + (output tokens * output price)
-    cost = (input_tokens * pricing["input"]) + (output_tokens * pricing["output"])
+    # Calculate cost: input tokens (cached ones at the cached price) + output tokens
+    cost = _input_cost(
+        provider, usage_meta, pricing["input"], pricing.get("input_cached")
+    ) + (output_tokens * pricing["output"])
 
     # Round to 6 decimal places for consistency
     return round(cost, 6)
@@ -342,7 +408,8 @@ def estimate_cost_with_dynamic_pricing(
     Args:
         provider: Provider name (e.g., "openai", "anthropic")
         model: Model identifier (e.g., "gpt-4o-mini")
-        usage_meta: Token usage dictionary {"prompt_tokens": X, "completion_tokens": Y}
+        usage_meta: Token usage dictionary {"prompt_tokens": X, "completion_tokens": Y},
+            optionally with "cached_tokens" / "cache_write_tokens" (see estimate_cost)
         web_search_count: Number of web search tool calls made (default: 0)
         web_search_version: Web search tool version:
             - "web_search" (standard, all models): $10/1k calls
@@ -382,11 +449,17 @@ def estimate_cost_with_dynamic_pricing(
             # Convert from $/1M to per-token
             input_rate = pricing_info.input / 1_000_000
             output_rate = pricing_info.output / 1_000_000
+            cached_rate = (
+                pricing_info.input_cached / 1_000_000
+                if pricing_info.input_cached is not None
+                else None
+            )
 
-            input_tokens = usage_meta.get("prompt_tokens", 0)
             output_tokens = usage_meta.get("completion_tokens", 0)
 
-            token_cost = (input_tokens * input_rate) + (output_tokens * output_rate)
+            token_cost = _input_cost(provider, usage_meta, input_rate, cached_rate) + (
+                output_tokens * output_rate
+            )
             pricing_source = pricing_info.source
 
         except Exception as e:
@@ -569,3 +642,75 @@ def detect_web_search_version(model: str, tool_version: str | None = None) -> st
 
     # Default: standard web search
     return "web_search"
+
+
+def summarize_prompt_cache(
+    usage_by_model: dict[str, list[dict]],
+) -> dict[str, dict[str, float | int]]:
+    """
+    Build per-provider/model prompt cache statistics for run_meta.json.
+
+    Args:
+        usage_by_model: {"provider/model": [usage_meta, ...]} for every LLM
+            call in the run (answers and extraction calls)
+
+    Returns:
+        dict: {"provider/model": {"calls", "prompt_tokens", "cached_tokens",
+            "hit_ratio"}}, where hit_ratio is cached_tokens / prompt_tokens
+            (0.0 when no prompt tokens were reported)
+
+    Example:
+        >>> summarize_prompt_cache({
+        ...     "openai/gpt-4o-mini": [
+        ...         {"prompt_tokens": 2000, "cached_tokens": 0},
+        ...         {"prompt_tokens": 2000, "cached_tokens": 1536},
+        ...     ]
+        ... })["openai/gpt-4o-mini"]["hit_ratio"]
+        0.384
+    """
+    totals: dict[str, dict[str, int]] = {}
+    for key, usages in usage_by_model.items():
+        for usage in usages:
+            tally_prompt_cache(totals, key, usage)
+    return prompt_cache_report(totals)
+
+
+def tally_prompt_cache(totals: dict[str, dict[str, int]], key: str, usage: dict) -> None:
+    """
+    Fold one call's usage into running per-model prompt cache totals.
+
+    Lets long runs report prompt cache statistics without keeping the usage
+    of every call.
+
+    Args:
+        totals: Running totals, updated in place
+        key: "provider/model"
+        usage: usage_meta of the call (prompt_tokens, cached_tokens)
+    """
+    entry = totals.setdefault(key, {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0})
+    entry["calls"] += 1
+    entry["prompt_tokens"] += usage.get("prompt_tokens", 0) or 0
+    entry["cached_tokens"] += usage.get("cached_tokens", 0) or 0
+
+
+def prompt_cache_report(totals: dict[str, dict[str, int]]) -> dict[str, dict[str, float | int]]:
+    """
+    Build the run_meta.json "prompt_cache" section from running totals.
+
+    Args:
+        totals: Totals built with tally_prompt_cache()
+
+    Returns:
+        dict: Same format as summarize_prompt_cache()
+    """
+    summary = {}
+    for key, entry in sorted(totals.items()):
+        prompt_tokens = entry["prompt_tokens"]
+        cached_tokens = entry["cached_tokens"]
+        summary[key] = {
+            "calls": entry["calls"],
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "hit_ratio": round(cached_tokens / prompt_tokens, 4) if prompt_tokens else 0.0,
+        }
+    return summary
@@ -0,0 +1,92 @@
+"""
+SimHash fingerprints for detecting run-over-run answer changes.
+
+Comparing full answer texts between runs is slow and too strict: a model that
+rewords one sentence should not look like a model that changed its
+recommendations. A SimHash condenses an answer into 64 bits such that similar
+texts get fingerprints that differ in few bits:
+
+1. The text is lower-cased and split into overlapping 3-word shingles
+2. Each shingle is hashed to 64 bits
+3. Every bit position sums +1/-1 over all shingles; positive sums become 1
+
+The Hamming distance between two fingerprints then measures how much of the
+text changed, and classify_change() turns it into "unchanged", "minor" or
+"major".
+
+Example:
+    >>> a = simhash("1. HubSpot 2. Salesforce 3. Pipedrive")
+    >>> b = simhash("1. HubSpot 2. Salesforce 3. Pipedrive!")
+    >>> classify_change(hamming_distance(a, b))
+    'unchanged'
+"""
+
+import hashlib
+import re
+from collections import Counter
+
+SIMHASH_BITS = 64
+SHINGLE_WORDS = 3
+
+# Hamming distance thresholds (out of 64 bits)
+UNCHANGED_MAX_DISTANCE = 3  # Whitespace, punctuation, a word or two
+MINOR_MAX_DISTANCE = 12  # Rewording; anything above is a major change
+
+CHANGE_NEW = "new"  # No earlier answer for the same intent and model
+CHANGE_UNCHANGED = "unchanged"
+CHANGE_MINOR = "minor"
+CHANGE_MAJOR = "major"
+
+_MASK = (1 << SIMHASH_BITS) - 1
+_WORD = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash of a text over 3-word shingles.
+
+    Args:
+        text: Answer text
+
+    Returns:
+        int: Fingerprint as a signed 64-bit integer, so it fits an SQLite
+            INTEGER column
+    """
+    words = _WORD.findall(text.lower())
+    shingles = Counter(
+        " ".join(words[i : i + SHINGLE_WORDS])
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    )
+    weights = [0] * SIMHASH_BITS
+    for shingle, count in shingles.items():
+        digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    fingerprint = sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+    return fingerprint - (1 << SIMHASH_BITS) if fingerprint >> (SIMHASH_BITS - 1) else fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return ((a ^ b) & _MASK).bit_count()
+
+
+def classify_change(distance: int | None) -> str:
+    """
+    Classify a fingerprint distance.
+
+    Args:
+        distance: Hamming distance to the previous answer (None if there is
+            no previous answer)
+
+    Returns:
+        str: CHANGE_NEW, CHANGE_UNCHANGED, CHANGE_MINOR or CHANGE_MAJOR
+    """
+    if distance is None:
+        return CHANGE_NEW
+    if distance <= UNCHANGED_MAX_DISTANCE:
+        return CHANGE_UNCHANGED
+    if distance <= MINOR_MAX_DISTANCE:
+        return CHANGE_MINOR
+    return CHANGE_MAJOR
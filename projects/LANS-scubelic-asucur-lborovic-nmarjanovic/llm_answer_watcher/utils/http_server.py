@@ -0,0 +1,292 @@
+"""
+Minimal asyncio HTTP/1.1 server for local endpoints.
+
+Used for small, local-only HTTP surfaces (e.g. the daemon status endpoint)
+where pulling in a web framework would be overkill. Built directly on
+asyncio streams with no third-party dependencies.
+
+Features:
+- Keep-alive connections (HTTP/1.1 default)
+- Content-Length request bodies
+- Fixed responses or streamed responses (chunked transfer encoding)
+- A single async handler function does all routing
+
+Not supported (by design): TLS, request chunked encoding, pipelining
+guarantees beyond sequential request handling per connection.
+
+Example:
+    >>> async def handler(request: HTTPRequest) -> HTTPResponse:
+    ...     if request.path == "/status":
+    ...         return HTTPResponse.json({"ok": True})
+    ...     return HTTPResponse.json({"error": "not found"}, status=404)
+    >>> server = LocalHTTPServer(handler, port=0)
+    >>> await server.start()
+    >>> server.url
+    'http://127.0.0.1:54321'
+    >>> await server.stop()
+
+Security:
+    Binds to 127.0.0.1 by default. Do not expose to untrusted networks.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds to protect local endpoints from malformed clients
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class HTTPRequest:
+    """
+    Parsed HTTP request.
+
+    Attributes:
+        method: Request method in upper case (e.g., "GET", "POST")
+        path: URL path without query string (e.g., "/v1/responses")
+        query: Query string parameters (last value wins)
+        headers: Request headers with lower-cased names
+        body: Raw request body bytes
+    """
+
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    def json(self) -> Any:
+        """Decode the request body as JSON (None for an empty body)."""
+        if not self.body:
+            return None
+        return json.loads(self.body)
+
+
+@dataclass
+class HTTPResponse:
+    """
+    HTTP response returned by a handler.
+
+    Either ``body`` (sent with Content-Length) or ``stream`` (sent with
+    chunked transfer encoding, one chunk per yielded item) is used.
+
+    Attributes:
+        status: HTTP status code
+        body: Response body bytes for fixed-size responses
+        headers: Extra response headers
+        stream: Optional async iterator of body chunks for streamed responses
+    """
+
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=dict)
+    stream: AsyncIterator[bytes] | None = None
+
+    @classmethod
+    def json(
+        cls,
+        data: Any,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> "HTTPResponse":
+        """Build a JSON response."""
+        all_headers = {"Content-Type": "application/json"}
+        if headers:
+            all_headers.update(headers)
+        return cls(
+            status=status,
+            body=json.dumps(data).encode("utf-8"),
+            headers=all_headers,
+        )
+
+    @classmethod
+    def text(cls, text: str, status: int = 200) -> "HTTPResponse":
+        """Build a plain-text response."""
+        return cls(
+            status=status,
+            body=text.encode("utf-8"),
+            headers={"Content-Type": "text/plain; charset=utf-8"},
+        )
+
+
+Handler = Callable[[HTTPRequest], Awaitable[HTTPResponse]]
+
+
+class LocalHTTPServer:
+    """
+    Asyncio HTTP/1.1 server dispatching every request to one handler.
+
+    Attributes:
+        handler: Async function mapping HTTPRequest -> HTTPResponse
+        host: Interface to bind (default: 127.0.0.1)
+        port: Port to bind (0 picks a free port; read back after start())
+    """
+
+    def __init__(self, handler: Handler, host: str = "127.0.0.1", port: int = 0):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._connections: set[asyncio.Task] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server (e.g., "http://127.0.0.1:8765")."""
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> None:
+        """Bind the listening socket and start accepting connections."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # Resolve the real port when port=0 was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Local HTTP server listening on {self.url}")
+
+    async def stop(self) -> None:
+        """Stop accepting connections and close open ones."""
+        if self._server is None:
+            return
+        self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        for task in list(self._connections):
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        await self._server.wait_closed()
+        self._server = None
+        logger.info(f"Local HTTP server on {self.url} stopped")
+
+    async def __aenter__(self) -> "LocalHTTPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve sequential requests on one connection until it closes."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+
+                try:
+                    response = await self.handler(request)
+                except Exception as e:
+                    logger.error(f"HTTP handler error for {request.path}: {e}", exc_info=True)
+                    response = HTTPResponse.json({"error": "internal server error"}, status=500)
+
+                keep_alive = request.headers.get("connection", "").lower() != "close"
+                await self._write_response(writer, response, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError:
+            # Cancelled by stop(); finish quietly so asyncio's stream callback
+            # doesn't log the cancellation as an unhandled error
+            pass
+        except ValueError as e:
+            logger.debug(f"Rejected malformed HTTP request: {e}")
+            with contextlib.suppress(Exception):
+                await self._write_response(
+                    writer, HTTPResponse.text("bad request", status=400), keep_alive=False
+                )
+        finally:
+            if task is not None:
+                self._connections.discard(task)
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> HTTPRequest | None:
+        """Read one request from the stream (None on clean EOF)."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise
+        except asyncio.LimitOverrunError as e:
+            raise ValueError("request header too large") from e
+
+        if len(head) > MAX_HEADER_BYTES:
+            raise ValueError("request header too large")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, _version = lines[0].split(" ", 2)
+        except ValueError as e:
+            raise ValueError(f"invalid request line: {lines[0]!r}") from e
+
+        headers = {}
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = int(headers.get("content-length", "0") or 0)
+        if content_length > MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        body = await reader.readexactly(content_length) if content_length else b""
+
+        split = urlsplit(target)
+        return HTTPRequest(
+            method=method.upper(),
+            path=split.path or "/",
+            query=dict(parse_qsl(split.query)),
+            headers=headers,
+            body=body,
+        )
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        response: HTTPResponse,
+        keep_alive: bool,
+    ) -> None:
+        """Serialize a response to the stream."""
+        try:
+            reason = HTTPStatus(response.status).phrase
+        except ValueError:
+            reason = "Unknown"
+
+        headers = dict(response.headers)
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        if response.stream is not None:
+            headers["Transfer-Encoding"] = "chunked"
+        else:
+            headers["Content-Length"] = str(len(response.body))
+
+        head = f"HTTP/1.1 {response.status} {reason}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode("latin-1") + b"\r\n")
+
+        if response.stream is None:
+            writer.write(response.body)
+            await writer.drain()
+            return
+
+        async for chunk in response.stream:
+            if not chunk:
+                continue
+            writer.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
@@ -48,6 +48,9 @@ OVERRIDES_FILE = PROJECT_ROOT / "config" / "pricing_overrides.json"
 # Cache duration (24 hours)
 CACHE_DURATION = timedelta(hours=24)
 
+# Parsed pricing files keyed by path -> ((mtime_ns, size), data)
+_json_memo: dict[Path, tuple[tuple[int, int], Any]] = {}
+
 # Provider name mapping (our names -> llm-prices.com vendor names)
 PROVIDER_MAPPING = {
     "openai": "openai",
@@ -218,7 +221,11 @@ def get_pricing(provider: str, model: str, use_cache: bool = True) -> ModelPrici
             model=model,
             input=pricing_data["input"] * 1_000_000,
             output=pricing_data["output"] * 1_000_000,
-            input_cached=None,
+            input_cached=(
+                pricing_data["input_cached"] * 1_000_000
+                if "input_cached" in pricing_data
+                else None
+            ),
             source="fallback",
         )
 
@@ -397,7 +404,11 @@ def list_available_models() -> list[dict[str, Any]]:
                         "model": model,
                         "input": pricing["input"] * 1_000_000,
                         "output": pricing["output"] * 1_000_000,
-                        "input_cached": None,
+                        "input_cached": (
+                            pricing["input_cached"] * 1_000_000
+                            if "input_cached" in pricing
+                            else None
+                        ),
                         "source": "fallback",
                     }
                 )
@@ -408,6 +419,43 @@ def list_available_models() -> list[dict[str, Any]]:
 # Private helper functions
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_json_memoized(path: Path) -> Any:
+    """
+    Read a JSON file, reusing the parsed result while the file is unchanged.
+
+    get_pricing() is called once per query and per cost estimate, so re-reading
+    and re-parsing the pricing files each time adds up in long-running processes.
+    The memo is keyed on (path, mtime, size): edits to the file on disk are picked
+    up on the next call. Callers must treat the returned data as read-only.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError, ValueError: If the file cannot be read or parsed
+    """
+    signature = _file_signature(path)
+    if signature is None:
+        raise FileNotFoundError(path)
+
+    memo = _json_memo.get(path)
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+
+    with open(path) as f:
+        data = json.load(f)
+
+    _json_memo[path] = (signature, data)
+    return data
+
+
 def _load_overrides() -> dict[str, Any]:
     """Load local pricing overrides from JSON file."""
     if not OVERRIDES_FILE.exists():
@@ -415,10 +463,9 @@ def _load_overrides() -> dict[str, Any]:
         return {}
 
     try:
-        with open(OVERRIDES_FILE) as f:
-            data = json.load(f)
-            logger.debug(f"Loaded pricing overrides from {OVERRIDES_FILE}")
-            return data
+        data = _read_json_memoized(OVERRIDES_FILE)
+        logger.debug(f"Loaded pricing overrides from {OVERRIDES_FILE}")
+        return data
     except Exception as e:
         logger.warning(f"Failed to load pricing overrides: {e}")
         return {}
@@ -431,13 +478,12 @@ def _load_cache() -> dict[str, Any] | None:
         return None
 
     try:
-        with open(CACHE_FILE) as f:
-            data = json.load(f)
-            logger.debug(
-                f"Loaded pricing cache from {CACHE_FILE} "
-                f"(cached at {data.get('cached_at')})"
-            )
-            return data
+        data = _read_json_memoized(CACHE_FILE)
+        logger.debug(
+            f"Loaded pricing cache from {CACHE_FILE} "
+            f"(cached at {data.get('cached_at')})"
+        )
+        return data
     except Exception as e:
         logger.warning(f"Failed to load pricing cache: {e}")
         return None
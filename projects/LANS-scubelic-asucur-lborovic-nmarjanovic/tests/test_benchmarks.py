@@ -0,0 +1,118 @@
+"""
+Tests for the benchmark harness in benchmarks/.
+
+Runs a tiny scenario end-to-end so the harness keeps working as run_all
+evolves, and checks result comparison logic.
+"""
+
+import logging
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# benchmarks/ lives at the project root, outside the package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.__main__ import main
+from benchmarks.extraction import run_extraction_benchmark
+from benchmarks.harness import (
+    BenchmarkScenario,
+    compare_results,
+    make_latency_sampler,
+    run_scenario,
+)
+
+
+class TestLatencySampler:
+    @pytest.mark.parametrize("distribution", ["fixed", "uniform", "exponential", "lognormal"])
+    def test_mean_is_close(self, distribution):
+        sampler = make_latency_sampler(distribution, 100.0, random.Random(1))
+        samples = [sampler() for _ in range(5000)]
+        assert all(s >= 0 for s in samples)
+        assert sum(samples) / len(samples) == pytest.approx(100.0, rel=0.1)
+
+    def test_zero_mean_disables_latency(self):
+        assert make_latency_sampler("lognormal", 0, random.Random(1))() == 0.0
+
+    def test_invalid_distribution(self):
+        with pytest.raises(ValueError):
+            BenchmarkScenario(latency_distribution="pareto")
+
+
+class TestRunScenario:
+    @pytest.mark.asyncio
+    async def test_smoke_scenario(self, tmp_path):
+        scenario = BenchmarkScenario(
+            name="tiny", intents=2, models=2, operations=1, latency_mean_ms=1
+        )
+
+        result = await run_scenario(scenario, tmp_path)
+
+        metrics = result["metrics"]
+        assert result["scenario"]["name"] == "tiny"
+        assert metrics["queries"] == scenario.total_queries
+        assert metrics["success_count"] == 4
+        assert metrics["queries_per_sec"] > 0
+        assert metrics["db_write_ms"] > 0
+        assert metrics["report_ms"] > 0
+
+    def test_cli_writes_results(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        output = tmp_path / "results.json"
+
+        # main() silences package logging; restore it for later caplog tests
+        package_logger = logging.getLogger("llm_answer_watcher")
+        previous_level = package_logger.level
+        try:
+            exit_code = main(["--scenario", "smoke", "--latency-ms", "0", "-o", str(output)])
+        finally:
+            package_logger.setLevel(previous_level)
+
+        assert exit_code == 0
+        assert output.exists()
+
+
+class TestCompareResults:
+    def _doc(self, **metrics):
+        return {"results": [{"scenario": {"name": "default"}, "metrics": metrics}]}
+
+    def test_throughput_drop_is_regression(self):
+        rows = compare_results(self._doc(queries_per_sec=100.0), self._doc(queries_per_sec=80.0))
+        assert rows == [
+            {
+                "scenario": "default",
+                "metric": "queries_per_sec",
+                "baseline": 100.0,
+                "current": 80.0,
+                "change": -0.2,
+                "regression": True,
+            }
+        ]
+
+    def test_latency_drop_is_improvement(self):
+        rows = compare_results(self._doc(report_ms=100.0), self._doc(report_ms=50.0))
+        assert rows[0]["regression"] is False
+
+    def test_within_threshold(self):
+        rows = compare_results(
+            self._doc(db_write_ms=100.0), self._doc(db_write_ms=105.0), threshold=0.1
+        )
+        assert rows[0]["regression"] is False
+
+    def test_unknown_scenarios_skipped(self):
+        current = {"results": [{"scenario": {"name": "other"}, "metrics": {}}]}
+        assert compare_results(self._doc(report_ms=1.0), current) == []
+
+
+class TestExtractionBenchmark:
+    def test_small_run(self):
+        result = run_extraction_benchmark(answer_chars=2000, brand_count=40, repeats=1)
+
+        assert result["answer_chars"] >= 2000
+        assert result["brands"] == 40
+        assert result["ranked_brands"] > 0
+        assert result["occurrences"] >= result["mentions"] > 0
+        assert result["rank_ms"] >= 0
+        assert result["labels_ms"] >= 0
@@ -48,6 +48,7 @@ from llm_answer_watcher.config.schema import (
     RuntimeConfig,
     RuntimeModel,
 )
+from llm_answer_watcher.exceptions import ConfigValidationError
 
 # ============================================================================
 # Fixtures
@@ -1081,6 +1082,81 @@ class TestRunCommandErrorHandling:
         assert "failed" in result.output.lower()
 
 
+# ============================================================================
+# Test Run-Many Command
+# ============================================================================
+
+
+class TestRunManyCommand:
+    """Test run-many command."""
+
+    @pytest.fixture
+    def mock_run_many_summary(self, mock_successful_run):
+        return {
+            "plan": {"total_queries": 2, "unique_queries": 1, "shared_queries": 1},
+            "sharing": {"api_calls": 1, "shared_answers": 1, "saved_cost_usd": 0.001},
+            "results": [{**mock_successful_run, "status": "complete"}, None],
+            "errors": [None, "Budget exceeded"],
+        }
+
+    @patch("llm_answer_watcher.cli.run_many")
+    @patch("llm_answer_watcher.cli.write_report")
+    @patch("llm_answer_watcher.cli.init_db_if_needed")
+    @patch("llm_answer_watcher.cli.load_config")
+    def test_run_many_json_output(
+        self,
+        mock_load_config,
+        mock_init_db,
+        mock_write_report,
+        mock_run_many,
+        *,
+        cli_runner,
+        valid_config_yaml,
+        mock_runtime_config,
+        mock_run_many_summary,
+        reset_output_mode,
+    ):
+        """Run-many reports the plan and each config's run; a failed config is partial."""
+        mock_load_config.return_value = mock_runtime_config
+        mock_run_many.return_value = mock_run_many_summary
+
+        result = cli_runner.invoke(
+            app,
+            [
+                "run-many",
+                "-c",
+                str(valid_config_yaml),
+                "-c",
+                str(valid_config_yaml),
+                "--format",
+                "json",
+                "--max-concurrent",
+                "4",
+            ],
+        )
+
+        assert result.exit_code == EXIT_PARTIAL_FAILURE
+        output = json.loads(result.stdout)
+        assert output["plan"]["unique_queries"] == 1
+        assert output["sharing"]["api_calls"] == 1
+        assert [run["status"] for run in output["runs"]] == ["complete", "error"]
+        assert output["runs"][1]["error"] == "Budget exceeded"
+        assert mock_run_many.call_args.kwargs["max_concurrent_requests"] == 4
+        # Only the config whose run finished gets a report
+        assert mock_write_report.call_count == 1
+
+    @patch("llm_answer_watcher.cli.load_config")
+    def test_run_many_config_error(
+        self, mock_load_config, cli_runner, valid_config_yaml, reset_output_mode
+    ):
+        """A config that fails to load stops the command before any query."""
+        mock_load_config.side_effect = ConfigValidationError("bad intents")
+
+        result = cli_runner.invoke(app, ["run-many", "-c", str(valid_config_yaml)])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+
 # ============================================================================
 # Test Validate Command
 # ============================================================================
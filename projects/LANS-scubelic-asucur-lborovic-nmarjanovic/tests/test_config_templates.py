@@ -0,0 +1,134 @@
+"""
+Tests for compiled operation prompt templates and conditions.
+"""
+
+import pytest
+
+from llm_answer_watcher.config.schema import RuntimeOperation
+from llm_answer_watcher.config.templates import (
+    Comparison,
+    Contains,
+    NullCheck,
+    UnparsedCondition,
+    compile_condition,
+    compile_template,
+)
+from llm_answer_watcher.llm_runner.operation_executor import (
+    OperationContext,
+    evaluate_condition,
+    render_template,
+)
+
+
+def _context(my_rank=3, operation_results=None):
+    return OperationContext(
+        intent_data={"id": "best-crm", "prompt": "Best CRM?", "response": "1. HubSpot {run:id}"},
+        extraction_data={
+            "my_brand": "Acme",
+            "my_brand_aliases": ["Acme", "Acme CRM"],
+            "competitors": ["HubSpot", "Salesforce"],
+            "competitors_mentioned": ["HubSpot"],
+            "my_rank": my_rank,
+            "my_mentions": ["Acme"],
+            "competitor_mentions": ["HubSpot"],
+        },
+        run_metadata={"run_id": "2025-11-05T10-00-00Z", "timestamp": "2025-11-05T10:00:00Z"},
+        model_info={"provider": "openai", "name": "gpt-4o-mini"},
+        operation_results=operation_results,
+    )
+
+
+class TestCompileTemplate:
+    def test_splits_literals_and_slots(self):
+        template = compile_template("Rank of {brand:mine}: {rank:mine}.")
+
+        assert template.literals == ("Rank of ", ": ", ".")
+        assert template.slots == ("brand:mine", "rank:mine")
+
+    def test_unknown_placeholders_stay_literal(self):
+        template = compile_template('Return {"score": 1} for {brand:unknown} and {brand:mine}')
+
+        assert template.slots == ("brand:mine",)
+        assert template.render({"brand:mine": "Acme"}.get) == (
+            'Return {"score": 1} for {brand:unknown} and Acme'
+        )
+
+    def test_unresolved_slot_keeps_placeholder(self):
+        template = compile_template("Previous: {operation:gaps}")
+
+        assert template.render({}.get) == "Previous: {operation:gaps}"
+
+
+class TestRenderTemplate:
+    def test_renders_every_variable(self):
+        template = (
+            "{brand:mine}|{brand:mine_all}|{brand:competitors}|{competitors:mentioned}|"
+            "{intent:id}|{intent:prompt}|{rank:mine}|{mentions:mine}|{mentions:competitors}|"
+            "{model:provider}|{model:name}|{run:id}|{run:timestamp}"
+        )
+
+        assert render_template(template, _context()) == (
+            "Acme|Acme, Acme CRM|HubSpot, Salesforce|HubSpot|best-crm|Best CRM?|3|Acme|HubSpot|"
+            "openai|gpt-4o-mini|2025-11-05T10-00-00Z|2025-11-05T10:00:00Z"
+        )
+
+    def test_values_are_not_expanded_again(self):
+        # The response itself contains "{run:id}"
+        assert render_template("{intent:response}", _context()) == "1. HubSpot {run:id}"
+
+    def test_operation_results_are_chained(self):
+        context = _context(operation_results={"gaps": "Write about pricing"})
+
+        rendered = render_template("Plan: {operation:gaps} / {operation:later}", context)
+
+        assert rendered == "Plan: Write about pricing / {operation:later}"
+
+    def test_runtime_operation_compiles_prompt_once(self):
+        operation = RuntimeOperation(id="gaps", prompt="Gaps for {brand:mine}")
+        compiled = operation.compiled_prompt
+
+        assert operation.compiled_prompt is compiled
+        assert render_template(compiled, _context()) == "Gaps for Acme"
+
+        operation.prompt = "Gaps for {model:name}"
+        assert render_template(operation.compiled_prompt, _context()) == "Gaps for gpt-4o-mini"
+
+
+class TestConditions:
+    @pytest.mark.parametrize(
+        ("condition", "kind"),
+        [
+            ("{rank:mine} == null", NullCheck),
+            ("{rank:mine} >= 3", Comparison),
+            ('{competitors:mentioned} contains "HubSpot"', Contains),
+            ("{rank:mine} is good", UnparsedCondition),
+        ],
+    )
+    def test_compiled_kinds(self, condition, kind):
+        assert isinstance(compile_condition(condition), kind)
+
+    @pytest.mark.parametrize(
+        ("condition", "my_rank", "expected"),
+        [
+            ("{rank:mine} == null", None, True),
+            ("{rank:mine} == null", 2, False),
+            ("{rank:mine} > 3", 5, True),
+            ("{rank:mine} > 3", 3, False),
+            ("{rank:mine} >= 3", 3, True),
+            ("{rank:mine} <= 5", 6, False),
+            ("{rank:mine} != 1", 1, False),
+            ("{rank:mine} > 3", None, False),
+            ('{competitors:mentioned} contains "HubSpot"', 1, True),
+            ("{competitors:mentioned} contains 'Salesforce'", 1, False),
+            ("{rank:mine} is good", 1, True),
+        ],
+    )
+    def test_evaluate(self, condition, my_rank, expected):
+        assert evaluate_condition(condition, _context(my_rank=my_rank)) is expected
+
+    def test_runtime_operation_compiles_condition(self):
+        operation = RuntimeOperation(id="gaps", prompt="p", condition="{rank:mine} > 3")
+
+        assert isinstance(operation.compiled_condition, Comparison)
+        assert evaluate_condition(operation.compiled_condition, _context(my_rank=4)) is True
+        assert RuntimeOperation(id="gaps", prompt="p").compiled_condition is None
@@ -0,0 +1,321 @@
+"""
+Tests for the watcher daemon: cron schedules, hot reload, scheduled runs,
+and the local status endpoint.
+"""
+
+import asyncio
+import os
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from llm_answer_watcher.cli import EXIT_CONFIG_ERROR, app
+from llm_answer_watcher.daemon import CronSchedule, DaemonJob, WatcherDaemon
+from llm_answer_watcher.daemon.watcher import build_report_results
+
+
+def _write_config(path, tmp_path, intents=("intent-1",)):
+    """Write a minimal valid watcher config to path."""
+    config_data = {
+        "run_settings": {
+            "output_dir": str(tmp_path / "output"),
+            "sqlite_db_path": str(tmp_path / "watcher.db"),
+            "models": [
+                {
+                    "provider": "openai",
+                    "model_name": "gpt-4o-mini",
+                    "env_api_key": "OPENAI_API_KEY",
+                }
+            ],
+        },
+        "brands": {"mine": ["MyBrand"], "competitors": ["Competitor1"]},
+        "intents": [
+            {"id": intent_id, "prompt": "What are the best tools?"} for intent_id in intents
+        ],
+    }
+    path.write_text(yaml.dump(config_data), encoding="utf-8")
+
+
+def _bump_mtime(path):
+    """Force a distinct mtime so change detection does not depend on fs resolution."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    path = tmp_path / "watcher.config.yaml"
+    _write_config(path, tmp_path)
+    return path
+
+
+def _fake_results(config):
+    return {
+        "run_id": "2025-11-01T08-00-00Z",
+        "timestamp_utc": "2025-11-01T08:00:00Z",
+        "output_dir": "/tmp/unused",
+        "total_queries": len(config.intents) * len(config.models),
+        "success_count": len(config.intents) * len(config.models),
+        "error_count": 0,
+        "total_cost_usd": 0.002,
+        "errors": [],
+    }
+
+
+class TestCronSchedule:
+    """Test cron expression parsing and next-fire computation."""
+
+    def test_every_fifteen_minutes(self):
+        schedule = CronSchedule.parse("*/15 * * * *")
+        start = datetime(2025, 11, 1, 8, 7, 30, tzinfo=UTC)
+        assert schedule.next_after(start) == datetime(2025, 11, 1, 8, 15, tzinfo=UTC)
+
+    def test_next_after_is_strictly_after(self):
+        schedule = CronSchedule.parse("0 * * * *")
+        start = datetime(2025, 11, 1, 8, 0, tzinfo=UTC)
+        assert schedule.next_after(start) == datetime(2025, 11, 1, 9, 0, tzinfo=UTC)
+
+    def test_weekday_range(self):
+        schedule = CronSchedule.parse("0 9 * * 1-5")
+        # 2025-11-01 is a Saturday -> next weekday 09:00 is Monday 2025-11-03
+        start = datetime(2025, 11, 1, 10, 0, tzinfo=UTC)
+        assert schedule.next_after(start) == datetime(2025, 11, 3, 9, 0, tzinfo=UTC)
+
+    def test_lists_and_sunday_as_seven(self):
+        schedule = CronSchedule.parse("30 6,18 * * 7")
+        assert schedule.weekdays == frozenset({0})
+        assert schedule.hours == frozenset({6, 18})
+
+    def test_shortcuts(self):
+        assert CronSchedule.parse("@daily").next_after(
+            datetime(2025, 11, 1, 8, 0, tzinfo=UTC)
+        ) == datetime(2025, 11, 2, 0, 0, tzinfo=UTC)
+
+    def test_every_interval(self):
+        schedule = CronSchedule.parse("@every 90m")
+        start = datetime(2025, 11, 1, 8, 0, 15, tzinfo=UTC)
+        assert schedule.next_after(start) == datetime(2025, 11, 1, 9, 30, 15, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["", "* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "@yearly", "a * * * *"],
+    )
+    def test_invalid_expressions(self, expression):
+        with pytest.raises(ValueError):
+            CronSchedule.parse(expression)
+
+    def test_never_firing_expression(self):
+        schedule = CronSchedule.parse("0 0 31 2 *")
+        with pytest.raises(ValueError, match="never fires"):
+            schedule.next_after(datetime(2025, 1, 1, tzinfo=UTC))
+
+
+class TestDaemonJob:
+    """Test config loading and hot reload."""
+
+    def test_initial_load(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        assert job.reload_if_changed() is True
+        assert job.runtime_config is not None
+        assert job.reload_count == 1
+
+    def test_unchanged_file_not_reloaded(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+        with patch("llm_answer_watcher.daemon.watcher.load_config") as mock_load:
+            assert job.reload_if_changed() is False
+            mock_load.assert_not_called()
+
+    def test_changed_file_reloaded(self, config_path, tmp_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+
+        _write_config(config_path, tmp_path, intents=("intent-1", "intent-2"))
+        _bump_mtime(config_path)
+
+        assert job.reload_if_changed() is True
+        assert len(job.runtime_config.intents) == 2
+        assert job.reload_count == 2
+
+    def test_invalid_change_keeps_previous_config(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+        previous = job.runtime_config
+
+        config_path.write_text("run_settings: [not, valid", encoding="utf-8")
+        _bump_mtime(config_path)
+
+        assert job.reload_if_changed() is False
+        assert job.runtime_config is previous
+        assert job.last_reload_error
+
+
+class TestWatcherDaemon:
+    """Test scheduled runs and the status endpoint."""
+
+    def test_requires_jobs(self):
+        with pytest.raises(ValueError):
+            WatcherDaemon([])
+
+    @pytest.mark.asyncio
+    async def test_run_job_records_timings(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        daemon = WatcherDaemon([job], status_port=None, generate_reports=False)
+
+        async def fake_run_all(config, config_filename=None):
+            return _fake_results(config)
+
+        with patch("llm_answer_watcher.daemon.watcher.run_all", side_effect=fake_run_all):
+            record = await daemon.run_job(job)
+
+        assert record.error is None
+        assert record.run_id == "2025-11-01T08-00-00Z"
+        assert record.success_count == 1
+        assert record.wall_seconds >= 0
+        assert record.cpu_seconds >= 0
+        assert job.last_run is record
+        assert job.run_count == 1
+        assert job.running is False
+
+    @pytest.mark.asyncio
+    async def test_run_job_captures_failure(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        daemon = WatcherDaemon([job], status_port=None, generate_reports=False)
+
+        with patch(
+            "llm_answer_watcher.daemon.watcher.run_all",
+            side_effect=RuntimeError("provider down"),
+        ):
+            record = await daemon.run_job(job)
+
+        assert record.error == "provider down"
+        assert job.running is False
+
+    @pytest.mark.asyncio
+    async def test_database_initialized_once(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        daemon = WatcherDaemon([job], status_port=None, generate_reports=False)
+
+        async def fake_run_all(config, config_filename=None):
+            return _fake_results(config)
+
+        with (
+            patch("llm_answer_watcher.daemon.watcher.run_all", side_effect=fake_run_all),
+            patch("llm_answer_watcher.daemon.watcher.init_db_if_needed") as mock_init,
+        ):
+            await daemon.run_job(job)
+            await daemon.run_job(job)
+
+        mock_init.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_serve_forever_runs_due_jobs_and_serves_status(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        daemon = WatcherDaemon([job], status_port=0, generate_reports=False, poll_interval=0.01)
+        ran = asyncio.Event()
+
+        async def fake_run_all(config, config_filename=None):
+            ran.set()
+            return _fake_results(config)
+
+        with patch("llm_answer_watcher.daemon.watcher.run_all", side_effect=fake_run_all):
+            serve_task = asyncio.create_task(daemon.serve_forever())
+            while daemon.status_server is None or daemon.started_at is None:
+                await asyncio.sleep(0.01)
+
+            # Make the job due immediately
+            job.next_run_at = daemon.started_at
+            await asyncio.wait_for(ran.wait(), timeout=5)
+            while job.last_run is None:
+                await asyncio.sleep(0.01)
+
+            async with httpx.AsyncClient(base_url=daemon.status_server.url) as client:
+                health = await client.get("/healthz")
+                status = await client.get("/status")
+                missing = await client.get("/nope")
+
+            daemon.request_stop()
+            await asyncio.wait_for(serve_task, timeout=5)
+
+        assert health.json() == {"status": "ok"}
+        body = status.json()
+        assert body["jobs"][0]["schedule"] == "@hourly"
+        assert body["jobs"][0]["run_count"] == 1
+        assert body["jobs"][0]["last_run"]["run_id"] == "2025-11-01T08-00-00Z"
+        assert "wall_seconds" in body["jobs"][0]["last_run"]
+        assert missing.status_code == 404
+
+
+class TestBuildReportResults:
+    def test_marks_errors(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+        results = _fake_results(job.runtime_config)
+        results["success_count"] = 0
+        results["errors"] = [
+            {"intent_id": "intent-1", "model_provider": "openai", "model_name": "gpt-4o-mini"}
+        ]
+
+        result_list = build_report_results(job.runtime_config, results)
+
+        assert result_list == [
+            {
+                "intent_id": "intent-1",
+                "provider": "openai",
+                "model_name": "gpt-4o-mini",
+                "status": "error",
+                "cost_usd": 0.0,
+                "timestamp_utc": "2025-11-01T08:00:00Z",
+            }
+        ]
+
+    def test_failures_past_the_error_cap_are_errors(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+        results = _fake_results(job.runtime_config)
+        results["success_count"] = 0
+        # "errors" was capped before this query; failed_queries is complete
+        results["failed_queries"] = [("intent-1", "openai", "gpt-4o-mini")]
+
+        result_list = build_report_results(job.runtime_config, results)
+
+        assert [row["status"] for row in result_list] == ["error"]
+
+    def test_skips_past_the_skip_cap_are_skipped(self, config_path):
+        job = DaemonJob(config_path, CronSchedule.parse("@hourly"))
+        job.reload_if_changed()
+        results = _fake_results(job.runtime_config)
+        results["success_count"] = 0
+        # The budget account's skip list was capped; skipped_queries is complete
+        results["skipped_queries"] = [("intent-1", "openai", "gpt-4o-mini")]
+
+        result_list = build_report_results(job.runtime_config, results)
+
+        assert [row["status"] for row in result_list] == ["skipped"]
+
+
+class TestDaemonCommand:
+    def test_mismatched_schedule_count(self, config_path):
+        result = CliRunner().invoke(
+            app,
+            ["daemon", "-c", str(config_path), "-s", "@hourly", "-s", "@daily"],
+        )
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+    def test_invalid_schedule(self, config_path):
+        result = CliRunner().invoke(app, ["daemon", "-c", str(config_path), "-s", "bogus"])
+        assert result.exit_code == EXIT_CONFIG_ERROR
+
+    def test_starts_and_stops(self, config_path):
+        with patch.object(WatcherDaemon, "serve_forever", new_callable=AsyncMock) as mock_serve:
+            result = CliRunner().invoke(
+                app, ["daemon", "-c", str(config_path), "--status-port", "0"]
+            )
+
+        assert result.exit_code == 0
+        mock_serve.assert_awaited_once()
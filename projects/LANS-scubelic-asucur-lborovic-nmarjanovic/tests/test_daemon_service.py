@@ -0,0 +1,194 @@
+"""
+Tests for the HTTP run service: job queue, progress events and stored runs.
+
+Runs query the local stand-in server through real OpenAI clients.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import yaml
+from typer.testing import CliRunner
+
+from llm_answer_watcher.cli import EXIT_CONFIG_ERROR, app
+from llm_answer_watcher.daemon import RunService
+from llm_answer_watcher.llm_runner.standin_server import StandinBehavior, StandinServer
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+
+
+def _write_config(path, tmp_path, base_url="http://127.0.0.1:1/openai/v1"):
+    """Write a two-intent watcher config querying base_url to path."""
+    config_data = {
+        "run_settings": {
+            "output_dir": str(tmp_path / "output"),
+            "sqlite_db_path": str(tmp_path / "watcher.db"),
+            "models": [
+                {
+                    "provider": "openai",
+                    "model_name": "gpt-4o-mini",
+                    "env_api_key": "OPENAI_API_KEY",
+                    "base_url": base_url,
+                }
+            ],
+        },
+        "brands": {"mine": ["Acme"], "competitors": ["HubSpot"]},
+        "intents": [
+            {"id": "best-crm", "prompt": "What is the best CRM?"},
+            {"id": "best-dialer", "prompt": "What is the best dialer?"},
+        ],
+    }
+    path.write_text(yaml.dump(config_data), encoding="utf-8")
+    return path
+
+
+async def _events(client, job_id):
+    """Collect a job's server-sent events until the stream ends."""
+    events = []
+    async with client.stream("GET", f"/runs/{job_id}/events") as response:
+        assert response.headers["content-type"] == "text/event-stream"
+        event = None
+        async for line in response.aiter_lines():
+            if line.startswith("event: "):
+                event = line.removeprefix("event: ")
+            elif line.startswith("data: "):
+                events.append((event, json.loads(line.removeprefix("data: "))))
+    return events
+
+
+class TestRunService:
+    @pytest.mark.asyncio
+    async def test_run_streams_progress_and_serves_stored_run(self, tmp_path):
+        behavior = StandinBehavior(answer="1. Acme\n2. HubSpot", latency_ms=10)
+        async with StandinServer(behavior) as standin:
+            config_path = _write_config(
+                tmp_path / "brand.yaml", tmp_path, standin.base_url("openai")
+            )
+            service = RunService([config_path], port=0)
+            await service.start()
+            try:
+                async with httpx.AsyncClient(base_url=service.url) as client:
+                    accepted = await client.post("/runs", json={"config": "brand.yaml"})
+                    job_id = accepted.json()["job_id"]
+                    events = await _events(client, job_id)
+                    job = (await client.get(f"/runs/{job_id}")).json()
+                    run_id = job["results"]["run_id"]
+                    listing = await client.get("/configs/brand.yaml/runs")
+                    summary = await client.get(f"/configs/brand.yaml/runs/{run_id}")
+                    report = await client.get(f"/configs/brand.yaml/runs/{run_id}/report")
+                    status = await client.get("/status")
+            finally:
+                await service.stop()
+
+        assert accepted.status_code == 202
+        assert accepted.json()["status"] == "queued"
+
+        names = [name for name, _ in events]
+        assert names[:2] == ["queued", "started"]
+        assert names.count("query_started") == names.count("query_completed") == 2
+        assert names[-1] == "succeeded"
+        assert events[1][1] == {"total_queries": 2}
+        assert events[-1][1]["success_count"] == 2
+
+        assert job["status"] == "succeeded"
+        assert job["config"] == "brand.yaml"
+        assert [run["run_id"] for run in listing.json()["runs"]] == [run_id]
+        assert summary.json()["total_intents"] == 2
+        assert summary.json()["report"].endswith(f"/runs/{run_id}/report")
+        assert report.headers["content-type"].startswith("text/html")
+        assert "Acme" in report.text
+        assert status.json()["jobs"]["succeeded"] == 1
+        assert standin.request_counts["openai"] == 2
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_rejected(self, tmp_path):
+        config_path = _write_config(tmp_path / "brand.yaml", tmp_path)
+        service = RunService(
+            [config_path], port=0, max_concurrent_runs=1, queue_size=1, generate_reports=False
+        )
+        release = asyncio.Event()
+
+        async def blocked_run_all(config, **kwargs):
+            await release.wait()
+            raise RuntimeError("not needed")
+
+        with patch("llm_answer_watcher.daemon.service.run_all", side_effect=blocked_run_all):
+            await service.start()
+            try:
+                async with httpx.AsyncClient(base_url=service.url) as client:
+                    running = await client.post("/runs", json={"config": "brand.yaml"})
+                    while service.jobs[running.json()["job_id"]].status != "running":
+                        await asyncio.sleep(0.01)
+                    queued = await client.post("/runs", json={"config": "brand.yaml"})
+                    rejected = await client.post("/runs", json={"config": "brand.yaml"})
+                release.set()
+            finally:
+                await service.stop()
+
+        assert (running.status_code, queued.status_code) == (202, 202)
+        assert rejected.status_code == 429
+        assert rejected.headers["retry-after"] == "5"
+        assert service.jobs[running.json()["job_id"]].status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_configs_and_bad_requests(self, tmp_path):
+        config_path = _write_config(tmp_path / "brand.yaml", tmp_path)
+        service = RunService([config_path], port=0, generate_reports=False)
+        await service.start()
+        try:
+            async with httpx.AsyncClient(base_url=service.url) as client:
+                unknown = await client.post("/runs", json={"config": "../etc/passwd"})
+                malformed = await client.post("/runs", content=b"not json")
+                missing_job = await client.get("/runs/nope")
+                missing_run = await client.get("/configs/brand.yaml/runs/nope")
+                wrong_method = await client.delete("/runs")
+        finally:
+            await service.stop()
+
+        assert unknown.status_code == 404
+        assert unknown.json()["configs"] == ["brand.yaml"]
+        assert malformed.status_code == 400
+        assert missing_job.status_code == 404
+        assert missing_run.status_code == 404
+        assert wrong_method.status_code == 405
+
+    def test_requires_distinct_config_names(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        first = _write_config(tmp_path / "brand.yaml", tmp_path)
+        second = _write_config(tmp_path / "a" / "brand.yaml", tmp_path)
+
+        with pytest.raises(ValueError, match="distinct file names"):
+            RunService([first, second])
+
+
+class TestServeCommand:
+    def test_starts_and_stops(self, tmp_path):
+        config_path = _write_config(tmp_path / "brand.yaml", tmp_path)
+        with patch.object(RunService, "serve_forever", new_callable=AsyncMock) as mock_serve:
+            result = CliRunner().invoke(app, ["serve", "-c", str(config_path), "--port", "0"])
+
+        assert result.exit_code == 0
+        mock_serve.assert_awaited_once()
+
+    def test_invalid_config(self, tmp_path):
+        config_path = tmp_path / "broken.yaml"
+        config_path.write_text("intents: [", encoding="utf-8")
+
+        result = CliRunner().invoke(app, ["serve", "-c", str(config_path)])
+
+        assert result.exit_code == EXIT_CONFIG_ERROR
@@ -623,3 +623,121 @@ class TestWriteEvalResults:
 
             # Should have written all 8 test cases
             # (We could query the database here to verify, but that's tested in eval_db tests)
+
+
+class TestFixtureCache:
+    """Test cases for the content-hash fixture cache."""
+
+    def _write_fixture(self, path: Path, description: str) -> Path:
+        path.write_text(
+            yaml.safe_dump(
+                {
+                    "test_cases": [
+                        {
+                            "description": description,
+                            "intent_id": "cache_test",
+                            "llm_answer_text": "HubSpot beats Salesforce.",
+                            "brands_mine": ["HubSpot"],
+                            "brands_competitors": ["Salesforce"],
+                            "expected_my_mentions": ["HubSpot"],
+                            "expected_competitor_mentions": ["Salesforce"],
+                            "expected_ranked_list": [],
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+        return path
+
+    def test_unchanged_file_skips_parsing(self, tmp_path, monkeypatch):
+        """Test repeated loads of an unchanged file reuse parsed test cases."""
+        from llm_answer_watcher.evals import runner
+
+        fixtures = self._write_fixture(tmp_path / "fixtures.yaml", "cached once")
+        first = load_test_cases(fixtures)
+
+        def fail_parse(raw):
+            raise AssertionError("fixtures re-parsed")
+
+        monkeypatch.setattr(runner, "_parse_test_cases", fail_parse)
+        assert load_test_cases(fixtures) == first
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Test the cache is keyed on content, not path."""
+        fixtures = self._write_fixture(tmp_path / "fixtures.yaml", "version one")
+        assert load_test_cases(fixtures)[0].description == "version one"
+
+        self._write_fixture(fixtures, "version two")
+        assert load_test_cases(fixtures)[0].description == "version two"
+
+    def test_disk_cache_reused_across_processes(self, tmp_path, monkeypatch):
+        """Test the on-disk cache is written and read back when memory is cold."""
+        from llm_answer_watcher.evals import runner
+
+        cache_dir = tmp_path / "cache"
+        fixtures = self._write_fixture(tmp_path / "fixtures.yaml", "on disk")
+        expected = load_test_cases(fixtures, cache_dir=cache_dir)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        # Simulate a fresh process
+        monkeypatch.setattr(runner, "_FIXTURE_CACHE", {})
+        monkeypatch.setattr(
+            runner, "_parse_test_cases", lambda _raw: pytest.fail("fixtures re-parsed")
+        )
+        assert load_test_cases(fixtures, cache_dir=cache_dir) == expected
+
+    def test_corrupt_disk_cache_falls_back(self, tmp_path):
+        """Test an unreadable cache entry is ignored."""
+        import hashlib
+
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        fixtures = self._write_fixture(tmp_path / "fixtures.yaml", "corrupt cache")
+        digest = hashlib.sha256(fixtures.read_bytes()).hexdigest()
+        (cache_dir / f"{digest}.json").write_text("not json", encoding="utf-8")
+
+        test_cases = load_test_cases(fixtures, cache_dir=cache_dir)
+        assert test_cases[0].description == "corrupt cache"
+
+
+class TestParallelEvalSuite:
+    """Test cases for process-pool evaluation."""
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """Test parallel evaluation returns the same results in fixture order."""
+        from llm_answer_watcher.evals import runner
+
+        fixtures_path = "llm_answer_watcher/evals/testcases/fixtures.yaml"
+        serial = run_eval_suite(fixtures_path, workers=1)
+
+        monkeypatch.setattr(runner, "PARALLEL_MIN_TEST_CASES", 0)
+        parallel = run_eval_suite(fixtures_path, workers=2)
+
+        assert parallel["results"] == serial["results"]
+        assert parallel["summary"] == serial["summary"]
+
+    def test_brand_set_batches_cover_all_cases(self):
+        """Test batches group brand sets and include every index once."""
+        from llm_answer_watcher.evals.runner import _brand_set_batches
+
+        def case(mine):
+            return EvalTestCase(
+                description=f"case {mine}",
+                intent_id="batch_test",
+                llm_answer_text="text",
+                brands_mine=[mine],
+                brands_competitors=["Rival"],
+                expected_my_mentions=[],
+                expected_competitor_mentions=[],
+                expected_ranked_list=[],
+            )
+
+        test_cases = [case("B"), case("A"), case("B"), case("A")]
+        batches = _brand_set_batches(test_cases, batch_count=2)
+
+        assert sorted(i for batch in batches for i in batch) == [0, 1, 2, 3]
+        assert [{test_cases[i].brands_mine[0] for i in b} for b in batches] == [
+            {"A"},
+            {"B"},
+        ]
@@ -0,0 +1,247 @@
+"""
+Tests for the local sentiment and mention-context classifier and its eval harness.
+"""
+
+import sqlite3
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    RuntimeExtractionModel,
+    RuntimeExtractionSettings,
+)
+from llm_answer_watcher.evals.sentiment import (
+    compare_with_llm_labels,
+    load_labeled_answers,
+    load_stored_labels,
+)
+from llm_answer_watcher.extractor.function_extractor import extract_with_function_calling
+from llm_answer_watcher.extractor.mention_detector import detect_mentions
+from llm_answer_watcher.extractor.parser import parse_answer
+from llm_answer_watcher.extractor.sentiment_classifier import (
+    MentionLabel,
+    classify_mentions,
+    label_mentions,
+)
+from llm_answer_watcher.storage.db import (
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_mention,
+    insert_run,
+)
+
+
+def _labels(text, mine, competitors):
+    mentions = detect_mentions(text, mine, competitors)
+    return {
+        m.normalized_name: label
+        for m, label in zip(mentions, classify_mentions(text, mentions), strict=True)
+    }
+
+
+def _settings(method="regex", enable_sentiment_analysis=True):
+    return RuntimeExtractionSettings(
+        extraction_model=RuntimeExtractionModel(
+            provider="openai", model_name="gpt-4o-mini", api_key="sk-test-key"
+        ),
+        method=method,
+        fallback_to_regex=True,
+        min_confidence=0.7,
+        enable_sentiment_analysis=enable_sentiment_analysis,
+        enable_intent_classification=False,
+    )
+
+
+class TestClassifyMentions:
+    def test_numbered_list_positions(self):
+        text = "Top tools:\n\n1. Lemwarm - excellent\n2. Mailwarm - affordable\n3. HubSpot - clunky and slow"
+
+        labels = _labels(text, ["Lemwarm"], ["Mailwarm", "HubSpot"])
+
+        assert labels == {
+            "Lemwarm": MentionLabel("positive", "primary_recommendation"),
+            "Mailwarm": MentionLabel("positive", "alternative_listing"),
+            "HubSpot": MentionLabel("negative", "competitor_negative"),
+        }
+
+    def test_sentence_prefix_applies_to_every_mention(self):
+        text = (
+            "The best tools are Lemwarm for warmup and Instantly for outreach. "
+            "HubSpot is also an option but quite expensive."
+        )
+
+        labels = _labels(text, ["Lemwarm"], ["Instantly", "HubSpot"])
+
+        assert (
+            labels["Lemwarm"]
+            == labels["Instantly"]
+            == MentionLabel("positive", "primary_recommendation")
+        )
+        # A lone price caveat does not make the mention negative
+        assert labels["HubSpot"] == MentionLabel("neutral", "alternative_listing")
+
+    def test_negation_flips_polarity(self):
+        text = "Reply.io is not very reliable. Apollo has no issues at all."
+
+        labels = _labels(text, ["Apollo"], ["Reply.io"])
+
+        assert labels["Reply.io"].sentiment == "negative"
+        assert labels["Apollo"].sentiment == "positive"
+
+    def test_passing_references(self):
+        text = (
+            "Suites (for example Lemwarm) bundle warmup with outreach.\n"
+            "Mailwarm exists.\n"
+            "Instantly focuses on sequences for agencies with many inboxes."
+        )
+
+        labels = _labels(text, ["Lemwarm"], ["Mailwarm", "Instantly"])
+
+        assert labels["Lemwarm"].mention_context == "passing_reference"
+        assert labels["Mailwarm"].mention_context == "passing_reference"
+        assert labels["Instantly"] == MentionLabel("neutral", "competitor_neutral")
+
+    def test_bullets_count_only_lines_with_mentions(self):
+        text = "Consider:\n- Pricing first\n- HubSpot has a free tier\n- Zoho CRM covers support"
+
+        labels = _labels(text, ["Zoho CRM"], ["HubSpot"])
+
+        assert labels["HubSpot"].mention_context == "primary_recommendation"
+        assert labels["Zoho CRM"].mention_context == "alternative_listing"
+
+    def test_labels_keep_input_order(self):
+        text = "1. Alpha is great\n2. Beta is bad"
+        mentions = detect_mentions(text, ["Alpha"], ["Beta"])
+
+        labels = classify_mentions(text, list(reversed(mentions)))
+
+        assert [label.sentiment for label in labels] == ["negative", "positive"]
+        assert classify_mentions(text, []) == []
+
+    def test_label_mentions_keeps_existing_labels(self):
+        text = "1. Alpha is great\n2. Beta is bad"
+        mentions = detect_mentions(text, ["Alpha"], ["Beta"])
+        mentions[1].sentiment = "neutral"
+
+        label_mentions(text, mentions)
+
+        assert [(m.sentiment, m.mention_context) for m in mentions] == [
+            ("positive", "primary_recommendation"),
+            ("neutral", "competitor_negative"),
+        ]
+
+
+class TestExtractionIntegration:
+    @pytest.mark.asyncio
+    async def test_regex_method_fills_labels(self):
+        result = await parse_answer(
+            answer_text="1. Acme - excellent\n2. HubSpot - clunky",
+            brands=Brands(mine=["Acme"], competitors=["HubSpot"]),
+            intent_id="best-crm",
+            provider="openai",
+            model_name="gpt-4o-mini",
+            timestamp_utc="2025-11-05T10:00:00Z",
+            extraction_settings=_settings(),
+        )
+
+        assert result.extraction_cost_usd == 0.0
+        assert (result.my_mentions[0].sentiment, result.my_mentions[0].mention_context) == (
+            "positive",
+            "primary_recommendation",
+        )
+        assert result.competitor_mentions[0].sentiment == "negative"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "extraction_settings", [None, _settings(enable_sentiment_analysis=False)]
+    )
+    async def test_labels_stay_empty_without_sentiment_analysis(self, extraction_settings):
+        result = await parse_answer(
+            answer_text="1. Acme - excellent",
+            brands=Brands(mine=["Acme"], competitors=["HubSpot"]),
+            intent_id="best-crm",
+            provider="openai",
+            model_name="gpt-4o-mini",
+            timestamp_utc="2025-11-05T10:00:00Z",
+            extraction_settings=extraction_settings,
+        )
+
+        assert result.my_mentions[0].sentiment is None
+        assert result.my_mentions[0].mention_context is None
+
+    @pytest.mark.asyncio
+    async def test_function_calling_fallback_fills_labels(self):
+        failing = AsyncMock(side_effect=RuntimeError("extraction model down"))
+        with patch("llm_answer_watcher.extractor.function_extractor.generate_coalesced", failing):
+            result = await extract_with_function_calling(
+                answer_text="1. Acme - excellent\n2. HubSpot - clunky",
+                brands=Brands(mine=["Acme"], competitors=["HubSpot"]),
+                extraction_settings=_settings(method="function_calling"),
+                intent_id="best-crm",
+            )
+
+        assert result.method == "regex_fallback"
+        assert [(b["sentiment"], b["mention_context"]) for b in result.brands_mentioned] == [
+            ("positive", "primary_recommendation"),
+            ("negative", "competitor_negative"),
+        ]
+
+
+class TestSentimentEval:
+    def test_reference_labels_agreement(self):
+        report = compare_with_llm_labels(load_labeled_answers())
+
+        assert report["mentions_compared"] > 20
+        assert report["mentions_unmatched"] == 0
+        assert report["sentiment_agreement"] >= 0.9
+        assert report["context_agreement"] >= 0.8
+
+    def test_stored_function_calling_labels(self, tmp_path):
+        db_path = tmp_path / "watcher.db"
+        init_db_if_needed(str(db_path))
+        with sqlite3.connect(db_path) as conn:
+            insert_run(conn, "run-1", "t", 1, 1)
+            insert_answer_raw(
+                conn,
+                run_id="run-1",
+                intent_id="best-crm",
+                model_provider="openai",
+                model_name="gpt-4o-mini",
+                timestamp_utc="t",
+                prompt="p",
+                answer_text="1. Acme - excellent\n2. HubSpot - clunky",
+            )
+            for brand, is_mine, sentiment, context in [
+                ("Acme", True, "positive", "primary_recommendation"),
+                ("HubSpot", False, "neutral", "alternative_listing"),
+                ("Salesforce", False, "neutral", "passing_reference"),
+            ]:
+                insert_mention(
+                    conn,
+                    run_id="run-1",
+                    timestamp_utc="t",
+                    intent_id="best-crm",
+                    model_provider="openai",
+                    model_name="gpt-4o-mini",
+                    brand_name=brand,
+                    normalized_name=brand,
+                    is_mine=is_mine,
+                    sentiment=sentiment,
+                    mention_context=context,
+                )
+            conn.commit()
+
+        answers = load_stored_labels(db_path, ["run-1"])
+        report = compare_with_llm_labels(answers)
+
+        assert len(answers) == 1
+        assert answers[0].brands_mine == ["Acme"]
+        assert report["mentions_compared"] == 2
+        assert report["unmatched"] == [
+            {"answer": "run-1 best-crm openai/gpt-4o-mini", "brand": "Salesforce"}
+        ]
+        assert report["sentiment_agreement"] == 0.5
+        assert report["sentiment_confusion"]["neutral"] == {"negative": 1}
+        assert load_stored_labels(db_path, ["other-run"]) == []
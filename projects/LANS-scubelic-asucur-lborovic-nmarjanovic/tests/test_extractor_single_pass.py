@@ -0,0 +1,178 @@
+"""
+Parity tests for the single-pass rank parser and the sweep overlap removal.
+
+The reference functions below are the previous multi-pass and pairwise
+implementations; the optimized code must return exactly the same results on
+the eval fixtures and on generated answers.
+"""
+
+import random
+import re
+from difflib import SequenceMatcher
+from pathlib import Path
+
+import pytest
+
+from llm_answer_watcher.evals.runner import load_test_cases
+from llm_answer_watcher.extractor.mention_detector import (
+    BrandMention,
+    detect_mentions,
+    remove_overlapping_mentions,
+)
+from llm_answer_watcher.extractor.rank_extractor import (
+    FUZZY_THRESHOLD,
+    RankedBrand,
+    _extract_from_mention_order,
+    _scan_list_lines,
+    extract_ranked_list_pattern,
+)
+
+FIXTURES_PATH = (
+    Path(__file__).parent.parent / "llm_answer_watcher" / "evals" / "testcases" / "fixtures.yaml"
+)
+
+
+def _reference_match_brand(candidate, known_brands):
+    candidate_lower = candidate.lower()
+    for brand in known_brands:
+        if brand.lower() in candidate_lower:
+            return brand
+    best_match = None
+    best_ratio = 0.0
+    for brand in known_brands:
+        ratio = SequenceMatcher(None, candidate_lower, brand.lower()).ratio()
+        if ratio > best_ratio and ratio >= FUZZY_THRESHOLD:
+            best_ratio = ratio
+            best_match = brand
+    return best_match
+
+
+def _reference_list(text, known_brands, pattern, confidence, numbered=False):
+    ranked, seen = [], set()
+    for line in text.split("\n"):
+        match = re.match(pattern, line)
+        if not match:
+            continue
+        brand = _reference_match_brand(match.groups()[-1].strip(), known_brands)
+        if brand and brand not in seen:
+            position = int(match.group(1)) if numbered else len(ranked) + 1
+            ranked.append(RankedBrand(brand, position, confidence))
+            seen.add(brand)
+    ranked.sort(key=lambda b: b.rank_position)
+    return ranked
+
+
+def _reference_rank(text, known_brands):
+    """Previous implementation: one full scan of the text per list kind."""
+    if not text or not known_brands:
+        return ([], 0.3)
+    for pattern, confidence, numbered in (
+        (r"^\s*(\d+)[\.\)]\s+(.+)$", 1.0, True),
+        (r"^\s*[-•*]\s+(.+)$", 0.8, False),
+        (r"^\s*#{2,3}\s+(.+)$", 0.8, False),
+    ):
+        ranked = _reference_list(text, known_brands, pattern, confidence, numbered)
+        if ranked:
+            return (ranked, confidence)
+    return _extract_from_mention_order(text, known_brands)
+
+
+def _reference_remove_overlapping(mentions):
+    """Previous implementation: compare each mention with every kept one."""
+    result = []
+    for mention in sorted(mentions, key=lambda m: (m.match_position, -len(m.original_text))):
+        mention_end = mention.match_position + len(mention.original_text)
+        overlaps = False
+        for kept in result:
+            kept_end = kept.match_position + len(kept.original_text)
+            if mention.match_position < kept_end and mention_end > kept.match_position:
+                if len(mention.original_text) > len(kept.original_text):
+                    result.remove(kept)
+                    result.append(mention)
+                overlaps = True
+                break
+        if not overlaps:
+            result.append(mention)
+    result.sort(key=lambda m: m.match_position)
+    return result
+
+
+def _variants(test_case):
+    """The fixture answer plus list-style variants of it."""
+    text = test_case.llm_answer_text
+    yield text
+    yield re.sub(r"^(\s*)\d+[\.\)]", r"\1-", text, flags=re.MULTILINE)
+    yield re.sub(r"^(\s*)[-•*]", r"\1###", text, flags=re.MULTILINE)
+    yield text.replace("\n", "\r\n")
+
+
+@pytest.fixture(scope="module")
+def test_cases():
+    return load_test_cases(FIXTURES_PATH)
+
+
+class TestScanListLines:
+    def test_classifies_each_line_once(self):
+        text = "Intro\n1. Alpha\n2) Beta\n- Gamma\n• Delta\n* Eps\n## Zeta\n#### Not\n# Not\n1 Not"
+
+        lines = _scan_list_lines(text)
+
+        assert lines.numbered == [(1, "Alpha"), (2, "Beta")]
+        assert lines.bullets == ["Gamma", "Delta", "Eps"]
+        assert lines.headers == ["Zeta"]
+
+
+class TestParityOnEvalFixtures:
+    def test_ranked_lists_match_reference(self, test_cases):
+        checked = 0
+        for test_case in test_cases:
+            brands = test_case.brands_mine + test_case.brands_competitors
+            for text in _variants(test_case):
+                assert extract_ranked_list_pattern(text, brands) == _reference_rank(text, brands)
+                checked += 1
+        assert checked == 4 * len(test_cases)
+
+    def test_overlap_removal_matches_reference(self, test_cases):
+        for test_case in test_cases:
+            text = test_case.llm_answer_text
+            for fuzzy_threshold in (0.0, 80.0):
+                mentions = detect_mentions(
+                    text,
+                    test_case.brands_mine,
+                    test_case.brands_competitors,
+                    fuzzy_threshold=fuzzy_threshold,
+                )
+                assert remove_overlapping_mentions(mentions) == (
+                    _reference_remove_overlapping(mentions)
+                )
+
+
+class TestParityOnGeneratedInput:
+    def test_random_overlaps_match_reference(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            mentions = [
+                BrandMention(
+                    original_text="x" * rng.randint(1, 12),
+                    normalized_name=f"brand-{i}",
+                    brand_category="competitor",
+                    match_position=rng.randint(0, 80),
+                )
+                for i in range(rng.randint(0, 30))
+            ]
+            assert remove_overlapping_mentions(mentions) == _reference_remove_overlapping(mentions)
+
+    def test_fuzzy_list_items_match_reference(self):
+        brands = ["Salesforce", "HubSpot", "Pipedrive", "Zoho CRM", "Close", "Copper"]
+        text = "\n".join(
+            [
+                "1. Salesfroce Sales Cloud",
+                "2. Hubspt",
+                "3. Pipedriv",
+                "4. Zoho",
+                "5. Something else entirely",
+                "- Coper",
+            ]
+        )
+
+        assert extract_ranked_list_pattern(text, brands) == _reference_rank(text, brands)
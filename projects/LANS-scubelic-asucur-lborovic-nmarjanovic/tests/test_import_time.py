@@ -0,0 +1,91 @@
+"""
+Import-time regression tests for CLI startup.
+
+`llm-answer-watcher --help` and light commands should not pay for the
+async runner, provider clients, Jinja2, pydantic schemas or the Steel SDK.
+These tests run a fresh interpreter with `python -X importtime` and fail if
+heavy modules sneak back into the CLI import path or startup exceeds the
+budget.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for llm_answer_watcher.cli (microseconds).
+# Lazy imports bring this to roughly 100ms; the eager version took over 500ms.
+CLI_IMPORT_BUDGET_US = 300_000
+
+# Modules that must not be imported just by importing the CLI
+HEAVY_MODULES = [
+    "asyncio",
+    "httpx",
+    "jinja2",
+    "pydantic",
+    "rich.traceback",
+    "steel",
+    "yaml",
+    "llm_answer_watcher.config.schema",
+    "llm_answer_watcher.evals.runner",
+    "llm_answer_watcher.llm_runner.runner",
+    "llm_answer_watcher.report.generator",
+]
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import module in a fresh interpreter; return cumulative µs per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if cumulative_us.strip().isdigit():
+            times[name.strip()] = int(cumulative_us)
+    return times
+
+
+class TestCLIImportTime:
+    """Test that importing the CLI stays light."""
+
+    def test_heavy_modules_not_imported(self):
+        times = _import_times("llm_answer_watcher.cli")
+        loaded = [module for module in HEAVY_MODULES if module in times]
+        assert loaded == [], f"CLI import pulled in heavy modules: {loaded}"
+
+    def test_cli_import_within_budget(self):
+        # Best of 3 to smooth out noisy CI machines
+        best = min(
+            _import_times("llm_answer_watcher.cli")["llm_answer_watcher.cli"] for _ in range(3)
+        )
+        assert best < CLI_IMPORT_BUDGET_US, (
+            f"Importing llm_answer_watcher.cli took {best / 1000:.0f}ms "
+            f"(budget {CLI_IMPORT_BUDGET_US / 1000:.0f}ms)"
+        )
+
+    def test_runner_package_does_not_import_steel_sdk(self):
+        times = _import_times("llm_answer_watcher.llm_runner")
+        assert "steel" not in times
+
+
+class TestLazyAttributes:
+    """Test that lazily imported CLI names resolve on demand."""
+
+    def test_lazy_name_resolves(self):
+        from llm_answer_watcher import cli
+        from llm_answer_watcher.llm_runner.runner import run_all
+
+        assert cli.run_all is run_all
+
+    def test_unknown_name_raises_attribute_error(self):
+        from llm_answer_watcher import cli
+
+        with pytest.raises(AttributeError):
+            _ = cli.does_not_exist
@@ -190,7 +190,13 @@ class TestGenerateAnswerSuccess:
         data = json.loads(payload)
 
         assert data["model"] == "claude-3-5-haiku-20241022"
-        assert data["system"] == TEST_SYSTEM_PROMPT
+        assert data["system"] == [
+            {
+                "type": "text",
+                "text": TEST_SYSTEM_PROMPT,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
         assert data["max_tokens"] == 4096  # Default max_tokens
         assert data["temperature"] == 0.7
         assert len(data["messages"]) == 1
@@ -0,0 +1,203 @@
+"""
+Tests for provider Batch API execution.
+
+Real OpenAI and Anthropic clients submit, poll and collect batch jobs from
+the local stand-in server; run_all() batch mode is checked end-to-end.
+"""
+
+import sqlite3
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.batch import (
+    BATCH_COST_DISCOUNT,
+    BatchStatus,
+    batch_eligible,
+    run_batch,
+    supports_batch,
+)
+from llm_answer_watcher.llm_runner.models import LLMResponse, build_client
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-20241022",
+}
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class _FailedJobClient:
+    """Batch client whose job fails without producing output."""
+
+    model_name = "gpt-4o-mini"
+
+    async def submit_batch(self, prompts):
+        return "batch_1"
+
+    async def get_batch_status(self, batch_id):
+        return BatchStatus(batch_id, "failed", error_message="expired")
+
+    async def get_batch_results(self, status):
+        raise AssertionError("results must not be fetched for a failed job")
+
+
+class TestRunBatch:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    async def test_round_trip(self, provider):
+        behavior = StandinBehavior(
+            answer=lambda _p, prompt: f"HubSpot for {prompt}", batch_pending_polls=2
+        )
+        prompts = {f"intent-{i}": f"question {i}" for i in range(3)}
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                provider, MODELS[provider], "test-key", "sys", base_url=server.base_url(provider)
+            )
+            sync_response = await client.generate_answer("question 0")
+            results = await run_batch(client, prompts, poll_interval=0.01)
+
+        assert [results[f"intent-{i}"].answer_text for i in range(3)] == [
+            f"HubSpot for question {i}" for i in range(3)
+        ]
+        (batch,) = server.batches.values()
+        assert batch["polls"] == 3  # Two pending polls, then completed
+        assert results["intent-0"].cost_usd == pytest.approx(
+            sync_response.cost_usd * BATCH_COST_DISCOUNT, rel=1e-3
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    async def test_failed_requests_reported_per_item(self, provider):
+        prompts = {f"intent-{i}": f"question {i}" for i in range(4)}
+        async with StandinServer(StandinBehavior(batch_error_every=2)) as server:
+            client = build_client(
+                provider, MODELS[provider], "test-key", "sys", base_url=server.base_url(provider)
+            )
+            results = await run_batch(client, prompts, poll_interval=0.01)
+
+        assert isinstance(results["intent-0"], LLMResponse)
+        assert isinstance(results["intent-1"], RuntimeError)
+        assert isinstance(results["intent-2"], LLMResponse)
+        assert isinstance(results["intent-3"], RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_failed_job_raises(self):
+        with pytest.raises(RuntimeError, match="expired"):
+            await run_batch(_FailedJobClient(), {"intent-0": "q"}, poll_interval=0)
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_not_retried(self):
+        async with StandinServer() as server:
+            client = build_client(
+                "openai", MODELS["openai"], "test-key", "sys", base_url=f"{server.url}/nope"
+            )
+            with pytest.raises(RuntimeError, match="non-retryable"):
+                await client.submit_batch({"intent-0": "q"})
+
+    def test_eligibility(self):
+        assert supports_batch(build_client("anthropic", MODELS["anthropic"], "k", "sys"))
+        assert not supports_batch(build_client("mistral", "mistral-small-latest", "k", "sys"))
+        function_model = RuntimeModel(
+            provider="openai",
+            model_name="gpt-4o-mini",
+            api_key="k",
+            tools=[{"type": "function", "name": "extract"}],
+        )
+        assert not batch_eligible(function_model)
+        assert batch_eligible(function_model.model_copy(update={"tools": [{"type": "web_search"}]}))
+
+
+class TestRunAllBatchMode:
+    def _config(self, tmp_path, server, **settings):
+        models = [
+            RuntimeModel(
+                provider=provider,
+                model_name=model_name,
+                api_key="test-key",
+                base_url=server.base_url(provider),
+            )
+            for provider, model_name in (
+                ("openai", MODELS["openai"]),
+                ("mistral", "mistral-small-latest"),
+            )
+        ]
+        return RuntimeConfig(
+            run_settings=RunSettings(
+                output_dir=str(tmp_path / "output"),
+                sqlite_db_path=str(tmp_path / "test.db"),
+                models=[
+                    ModelConfig(
+                        provider=m.provider, model_name=m.model_name, env_api_key="TEST_API_KEY"
+                    )
+                    for m in models
+                ],
+                **settings,
+            ),
+            brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+            intents=[
+                Intent(id="crm", prompt="best CRM?"),
+                Intent(id="warmup", prompt="best warmup tool?"),
+            ],
+            models=models,
+        )
+
+    def test_settings_validated(self, tmp_path):
+        with pytest.raises(ValidationError):
+            RunSettings(output_dir="out", sqlite_db_path="db", execution_mode="async")
+        with pytest.raises(ValidationError):
+            RunSettings(output_dir="out", sqlite_db_path="db", batch_poll_interval_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_batch_results_ingested(self, tmp_path):
+        behavior = StandinBehavior(answer="1. HubSpot\n2. Warmly")
+        async with StandinServer(behavior) as server:
+            config = self._config(
+                tmp_path, server, execution_mode="batch", batch_poll_interval_seconds=0.01
+            )
+            init_db_if_needed(config.run_settings.sqlite_db_path)
+            result = await run_all(config)
+
+        assert result["success_count"] == 4
+        (batch,) = server.batches.values()
+        assert batch["provider"] == "openai"
+        assert len(batch["requests"]) == 2
+        # Non-batch providers still run synchronously
+        assert server.request_counts["mistral"] == 2
+
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            rows = conn.execute(
+                "SELECT intent_id, model_provider, answer_text FROM answers_raw "
+                "ORDER BY intent_id, model_provider"
+            ).fetchall()
+            mentions = conn.execute(
+                "SELECT COUNT(*) FROM mentions WHERE model_provider = 'openai'"
+            ).fetchone()[0]
+        assert [(r[0], r[1]) for r in rows] == [
+            ("crm", "mistral"),
+            ("crm", "openai"),
+            ("warmup", "mistral"),
+            ("warmup", "openai"),
+        ]
+        assert mentions == 4
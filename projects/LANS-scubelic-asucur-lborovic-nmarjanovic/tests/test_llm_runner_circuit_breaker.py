@@ -0,0 +1,259 @@
+"""
+Tests for per-provider/model circuit breakers.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    CircuitBreakerConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.exceptions import LLMCircuitOpenError, LLMProviderError
+from llm_answer_watcher.llm_runner.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreakers,
+    is_transient_failure,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.retry_config import create_retry_decorator
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breakers(clock=None, **overrides):
+    config = CircuitBreakerConfig(
+        **{"window_size": 4, "min_calls": 2, "open_seconds": 10.0, **overrides}
+    )
+    return CircuitBreakers(config, clock=clock or FakeClock())
+
+
+def _fail(breakers, provider="openai", model="gpt-4o-mini"):
+    with pytest.raises(httpx.ConnectError), breakers.guard(provider, model):
+        raise httpx.ConnectError("provider down")
+
+
+def _status_error(status_code):
+    request = httpx.Request("POST", "https://api.example.com/v1")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+class TestCircuitBreaker:
+    def test_opens_at_failure_rate_and_short_circuits(self):
+        breakers = _breakers()
+        breaker = breakers.get("openai", "gpt-4o-mini")
+
+        _fail(breakers)
+        assert breaker.state == STATE_CLOSED  # Below min_calls
+        _fail(breakers)
+        assert breaker.state == STATE_OPEN
+
+        with pytest.raises(LLMCircuitOpenError), breakers.guard("openai", "gpt-4o-mini"):
+            pytest.fail("call must not run while the circuit is open")
+        assert breaker.short_circuited == 1
+        # Other models are unaffected
+        with breakers.guard("anthropic", "claude-3-5-haiku"):
+            pass
+
+    def test_mixed_outcomes_below_threshold_stay_closed(self):
+        breakers = _breakers(failure_rate_threshold=0.75)
+        for _ in range(3):
+            with breakers.guard("openai", "gpt-4o-mini"):
+                pass
+            _fail(breakers)
+
+        assert breakers.get("openai", "gpt-4o-mini").state == STATE_CLOSED
+
+    def test_half_open_probe(self):
+        clock = FakeClock()
+        breakers = _breakers(clock)
+        breaker = breakers.get("openai", "gpt-4o-mini")
+        _fail(breakers)
+        _fail(breakers)
+
+        # Failed probe reopens the circuit
+        clock.now = 10.0
+        _fail(breakers)
+        assert breaker.state == STATE_OPEN
+
+        # Only one probe at a time; a successful probe closes the circuit
+        clock.now = 20.0
+        with breakers.guard("openai", "gpt-4o-mini"):
+            assert breaker.state == STATE_HALF_OPEN
+            with pytest.raises(LLMCircuitOpenError), breakers.guard("openai", "gpt-4o-mini"):
+                pass
+        assert breaker.state == STATE_CLOSED
+
+        summary = breakers.summary()
+        assert [(t["from"], t["to"]) for t in summary["transitions"]] == [
+            (STATE_CLOSED, STATE_OPEN),
+            (STATE_OPEN, STATE_HALF_OPEN),
+            (STATE_HALF_OPEN, STATE_OPEN),
+            (STATE_OPEN, STATE_HALF_OPEN),
+            (STATE_HALF_OPEN, STATE_CLOSED),
+        ]
+        assert summary["transitions"][1]["elapsed_s"] == 10.0
+        assert summary["short_circuited"] == {"openai/gpt-4o-mini": 1}
+
+    def test_permanent_errors_do_not_count(self):
+        breakers = _breakers(min_calls=1)
+        for error in (_status_error(400), RuntimeError("non-retryable: 401"), ValueError("prompt")):
+            with pytest.raises(type(error)), breakers.guard("openai", "gpt-4o-mini"):
+                raise error
+
+        assert breakers.get("openai", "gpt-4o-mini").state == STATE_CLOSED
+
+    def test_transient_failures(self):
+        interrupted = RuntimeError("stream interrupted after first token")
+        interrupted.__cause__ = httpx.ReadError("connection reset")
+
+        assert all(
+            is_transient_failure(error)
+            for error in (
+                _status_error(429),
+                _status_error(503),
+                httpx.ReadTimeout("slow"),
+                TimeoutError(),
+                interrupted,
+            )
+        )
+        assert not any(
+            is_transient_failure(error)
+            for error in (_status_error(400), _status_error(404), RuntimeError("bad JSON"))
+        )
+
+    def test_disabled_is_noop(self):
+        breakers = _breakers(enabled=False)
+        for _ in range(5):
+            _fail(breakers)
+
+        assert breakers.summary()["states"] == {}
+
+    def test_circuit_open_error_is_provider_error(self):
+        assert issubclass(LLMCircuitOpenError, LLMProviderError)
+
+    def test_config_validated(self):
+        with pytest.raises(ValidationError):
+            CircuitBreakerConfig(failure_rate_threshold=0)
+        with pytest.raises(ValidationError):
+            CircuitBreakerConfig(min_calls=0)
+
+
+class TestRetryStopsWhenCircuitOpens:
+    @pytest.mark.asyncio
+    async def test_retries_end_once_circuit_opens(self):
+        breakers = _breakers(min_calls=1)
+        attempts = 0
+
+        @create_retry_decorator()
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            # A concurrent query's failure opens the circuit mid-retry
+            breakers.get("openai", "gpt-4o-mini").record_failure()
+            raise LLMProviderError("503 Service Unavailable")
+
+        with pytest.raises(LLMProviderError), breakers.guard("openai", "gpt-4o-mini"):
+            await call()
+
+        assert attempts == 1
+
+
+def _runner_config(tmp_path, base_url=None):
+    config = RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=str(tmp_path / "test.db"),
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="KEY")],
+            max_concurrent_requests=1,
+            circuit_breaker=CircuitBreakerConfig(min_calls=2),
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"intent-{i}", prompt=f"question {i}?") for i in range(6)],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="test-key",
+                base_url=base_url,
+            )
+        ],
+    )
+    init_db_if_needed(config.run_settings.sqlite_db_path)
+    return config
+
+
+class UnreachableClient(MockLLMClient):
+    """Fails every call with a connection error, as after exhausted retries."""
+
+    def __init__(self):
+        super().__init__(model_name="gpt-4o-mini")
+        self.calls = 0
+
+    async def generate_answer(self, prompt, on_chunk=None):
+        self.calls += 1
+        raise httpx.ConnectError("connection refused")
+
+
+class TestRunnerCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_outage_short_circuits_remaining_queries(self, tmp_path):
+        client = UnreachableClient()
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+            result = await run_all(_runner_config(tmp_path))
+
+        assert client.calls == 2
+        assert result["error_count"] == 6
+        assert sum("Circuit open" in e["error_message"] for e in result["errors"]) == 4
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        circuit = run_meta["circuit_breakers"]
+        assert circuit["states"] == {"openai/gpt-4o-mini": STATE_OPEN}
+        assert circuit["short_circuited"] == {"openai/gpt-4o-mini": 4}
+        assert circuit["transitions"][0]["to"] == STATE_OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, tmp_path):
+        behavior = StandinBehavior(fail_every=1, fail_status=400)
+        async with StandinServer(behavior) as server:
+            result = await run_all(_runner_config(tmp_path, server.base_url("openai")))
+
+        # Every query reaches the provider: a bad request is not an outage
+        assert server.request_counts["openai"] == 6
+        assert result["error_count"] == 6
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["circuit_breakers"]["states"] == {"openai/gpt-4o-mini": STATE_CLOSED}
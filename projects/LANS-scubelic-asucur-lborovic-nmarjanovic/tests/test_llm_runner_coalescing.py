@@ -0,0 +1,184 @@
+"""
+Tests for in-flight request coalescing.
+
+Real OpenAI clients query the local stand-in server so that coalescing is
+checked against the number of HTTP requests actually sent.
+"""
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.coalescing import (
+    RequestCoalescer,
+    generate_coalesced,
+    request_fingerprint,
+    reset_current_coalescer,
+)
+from llm_answer_watcher.llm_runner.models import build_client
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _client(server, system_prompt="sys"):
+    return build_client(
+        "openai", "gpt-4o-mini", "test-key", system_prompt, base_url=server.base_url("openai")
+    )
+
+
+class TestRequestCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        coalescer = RequestCoalescer()
+        async with StandinServer(StandinBehavior(latency_ms=50)) as server:
+            client = _client(server)
+            token = coalescer.activate()
+            try:
+                responses = await asyncio.gather(
+                    *(generate_coalesced(client, "best CRM?") for _ in range(3))
+                )
+            finally:
+                reset_current_coalescer(token)
+
+        assert server.request_counts["openai"] == 1
+        assert [r.coalesced for r in responses] == [False, True, True]
+        assert responses[0].cost_usd > 0
+        assert [r.cost_usd for r in responses[1:]] == [0.0, 0.0]
+        assert {r.answer_text for r in responses} == {responses[0].answer_text}
+        assert coalescer.summary() == {
+            "requests": 3,
+            "coalesced": 2,
+            "saved_cost_usd": round(2 * responses[0].cost_usd, 6),
+        }
+
+    @pytest.mark.asyncio
+    async def test_distinct_and_sequential_requests_not_coalesced(self):
+        coalescer = RequestCoalescer()
+        async with StandinServer(StandinBehavior(latency_ms=20)) as server:
+            token = coalescer.activate()
+            try:
+                await asyncio.gather(
+                    generate_coalesced(_client(server), "best CRM?"),
+                    generate_coalesced(_client(server), "best warmup tool?"),
+                    generate_coalesced(_client(server, "other system"), "best CRM?"),
+                )
+                # Not in flight any more: sent again
+                await generate_coalesced(_client(server), "best CRM?")
+            finally:
+                reset_current_coalescer(token)
+
+        assert server.request_counts["openai"] == 4
+        assert coalescer.coalesced_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_callers(self):
+        class FailingClient:
+            model_name = "gpt-4o-mini"
+            calls = 0
+
+            async def generate_answer(self, prompt):
+                FailingClient.calls += 1
+                await asyncio.sleep(0.01)
+                raise RuntimeError("provider down")
+
+        token = RequestCoalescer().activate()
+        try:
+            results = await asyncio.gather(
+                generate_coalesced(FailingClient(), "q"),
+                generate_coalesced(FailingClient(), "q"),
+                return_exceptions=True,
+            )
+        finally:
+            reset_current_coalescer(token)
+
+        assert FailingClient.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_fingerprint_requires_string_model_name(self):
+        class NoModel:
+            model_name = None
+
+        assert request_fingerprint(NoModel(), "q") is None
+        client = build_client("openai", "gpt-4o-mini", "k", "sys")
+        assert request_fingerprint(client, "q") == request_fingerprint(client, "q")
+        assert request_fingerprint(client, "q") != request_fingerprint(client, "q2")
+
+
+class TestRunnerCoalescing:
+    def _config(self, tmp_path, server, **settings):
+        return RuntimeConfig(
+            run_settings=RunSettings(
+                output_dir=str(tmp_path / "output"),
+                sqlite_db_path=str(tmp_path / "test.db"),
+                models=[
+                    ModelConfig(
+                        provider="openai", model_name="gpt-4o-mini", env_api_key="TEST_API_KEY"
+                    )
+                ],
+                **settings,
+            ),
+            brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+            intents=[
+                Intent(id="crm", prompt="best CRM?"),
+                Intent(id="crm-again", prompt="best CRM?"),
+            ],
+            models=[
+                RuntimeModel(
+                    provider="openai",
+                    model_name="gpt-4o-mini",
+                    api_key="test-key",
+                    system_prompt="sys",
+                    base_url=server.base_url("openai"),
+                )
+            ],
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("enabled", [True, False])
+    async def test_duplicate_intent_prompts(self, tmp_path, enabled):
+        behavior = StandinBehavior(answer="1. HubSpot\n2. Warmly", latency_ms=50)
+        async with StandinServer(behavior) as server:
+            config = self._config(tmp_path, server, coalesce_requests=enabled)
+            init_db_if_needed(config.run_settings.sqlite_db_path)
+            result = await run_all(config)
+
+        assert result["success_count"] == 2
+        assert server.request_counts["openai"] == (1 if enabled else 2)
+
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["coalescing"]["coalesced"] == (1 if enabled else 0)
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            costs = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT estimated_cost_usd FROM answers_raw ORDER BY estimated_cost_usd"
+                )
+            ]
+        # Both answers are stored, but the cost is counted once when coalesced
+        assert len(costs) == 2
+        assert (costs[0] == 0.0) is enabled
+        assert run_meta["total_cost_usd"] == pytest.approx(sum(costs), abs=1e-6)
@@ -0,0 +1,208 @@
+"""
+Tests for history-aware cost/duration predictions and longest-first ordering.
+"""
+
+import json
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.estimator import (
+    DEFAULT_INPUT_TOKENS,
+    DEFAULT_OUTPUT_TOKENS,
+    DEFAULT_QUERY_SECONDS,
+    DEFAULT_RUNNER_SECONDS,
+    QueryHistory,
+    predict_makespan,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
+from llm_answer_watcher.storage.db import (
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_query_timing,
+    insert_run,
+    load_query_history,
+)
+from llm_answer_watcher.utils.console import format_duration
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _record(conn, run_id, intent_id, completion_tokens, total_ms, *, wait_ms=0.0):
+    insert_answer_raw(
+        conn=conn,
+        run_id=run_id,
+        intent_id=intent_id,
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc="2025-11-01T08:00:00Z",
+        prompt="q",
+        answer_text="a",
+        usage_meta_json=json.dumps({"prompt_tokens": 100, "completion_tokens": completion_tokens}),
+    )
+    insert_query_timing(
+        conn=conn,
+        run_id=run_id,
+        intent_id=intent_id,
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        status="success",
+        total_ms=total_ms,
+        stage_ms={"semaphore_wait": wait_ms},
+        http_attempts=1,
+        timestamp_utc="2025-11-01T08:00:00Z",
+    )
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    """Database with two runs of a slow, long intent and a fast, short one."""
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    with sqlite3.connect(db_path) as conn:
+        for run_id in ("2025-11-01T08-00-00Z", "2025-11-02T08-00-00Z"):
+            insert_run(conn, run_id, "2025-11-01T08:00:00Z", 2, 1)
+            _record(conn, run_id, "slow", 2000, 30_000.0, wait_ms=5_000.0)
+            _record(conn, run_id, "fast", 200, 2_000.0)
+        conn.commit()
+    return db_path
+
+
+def _config(tmp_path, db_path, intents=("fast", "slow", "new"), max_concurrent=1):
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=db_path,
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            max_concurrent_requests=max_concurrent,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=intent_id, prompt=f"{intent_id}?") for intent_id in intents],
+        models=[
+            RuntimeModel(
+                provider="openai", model_name="gpt-4o-mini", api_key="k", system_prompt="s"
+            )
+        ],
+    )
+
+
+class TestQueryHistory:
+    def test_load_query_history_aggregates(self, history_db):
+        with sqlite3.connect(history_db) as conn:
+            history = load_query_history(conn)
+
+        slow = history[("slow", "openai", "gpt-4o-mini")]
+        assert slow["samples"] == 2
+        assert slow["completion_tokens"] == 2000
+        assert slow["duration_ms"] == 25_000.0  # Semaphore wait excluded
+
+        with sqlite3.connect(history_db) as conn:
+            assert len(load_query_history(conn, recent_runs=0)) == 0
+
+    def test_predict_falls_back_from_intent_to_model_to_default(self, history_db):
+        history = QueryHistory.load(history_db)
+
+        slow = history.predict("slow", "openai", "gpt-4o-mini")
+        assert (slow.output_tokens, slow.duration_s, slow.source) == (2000, 25.0, "intent")
+
+        new = history.predict("new", "openai", "gpt-4o-mini")
+        assert new.source == "model"
+        assert new.output_tokens == 1100
+        assert new.duration_s == 13.5
+
+        unknown = history.predict("new", "anthropic", "claude-3-5-haiku")
+        assert unknown.source == "default"
+        assert (unknown.input_tokens, unknown.output_tokens) == (
+            DEFAULT_INPUT_TOKENS,
+            DEFAULT_OUTPUT_TOKENS,
+        )
+        assert unknown.duration_s == DEFAULT_QUERY_SECONDS
+        assert history.predict("x", "steel", "runner", runner=True).duration_s == (
+            DEFAULT_RUNNER_SECONDS
+        )
+
+    def test_missing_database_is_not_created(self, tmp_path):
+        db_path = tmp_path / "missing.db"
+
+        assert QueryHistory.load(str(db_path)).entries == {}
+        assert not db_path.exists()
+
+
+class TestPredictions:
+    def test_makespan_longest_first(self):
+        assert predict_makespan([10.0, 8.0, 3.0, 2.0], slots=2) == 12.0
+        assert predict_makespan([5.0, 5.0], slots=8) == 5.0
+        assert predict_makespan([], slots=4) == 0.0
+
+    def test_estimate_uses_history(self, tmp_path, history_db):
+        estimate = estimate_run_cost(_config(tmp_path, history_db))
+
+        costs = estimate["per_intent_costs"]
+        assert costs["slow"] > costs["new"] > costs["fast"]
+        assert estimate["predicted_duration_s"] == pytest.approx(25.0 + 13.5 + 2.0, abs=0.1)
+        assert estimate["history_coverage"] == 1.0
+        assert estimate["per_model_costs"][0]["avg_duration_s"] == pytest.approx(13.5)
+
+        no_history = estimate_run_cost(_config(tmp_path, str(tmp_path / "none.db")))
+        assert no_history["history_coverage"] == 0.0
+        assert no_history["predicted_duration_s"] == 3 * DEFAULT_QUERY_SECONDS
+
+    def test_format_duration(self):
+        assert format_duration(42.4) == "42s"
+        assert format_duration(200) == "3m 20s"
+        assert format_duration(3900) == "1h 05m"
+
+
+class TestRunnerOrdering:
+    @pytest.mark.asyncio
+    @patch("llm_answer_watcher.llm_runner.runner.build_client")
+    async def test_queries_run_longest_expected_first(
+        self, mock_build_client, tmp_path, history_db
+    ):
+        prompts = []
+
+        class RecordingClient(MockLLMClient):
+            async def generate_answer(self, prompt, on_chunk=None):
+                prompts.append(prompt)
+                return await super().generate_answer(prompt, on_chunk)
+
+        mock_build_client.return_value = RecordingClient()
+
+        await run_all(_config(tmp_path, history_db))
+
+        assert prompts == ["slow?", "new?", "fast?"]
+
+    @pytest.mark.asyncio
+    @patch("llm_answer_watcher.llm_runner.runner.QUERY_ORDER_WINDOW", 1)
+    @patch("llm_answer_watcher.llm_runner.runner.build_client")
+    async def test_ordering_window_is_bounded(self, mock_build_client, tmp_path, history_db):
+        prompts = []
+
+        class RecordingClient(MockLLMClient):
+            async def generate_answer(self, prompt, on_chunk=None):
+                prompts.append(prompt)
+                return await super().generate_answer(prompt, on_chunk)
+
+        mock_build_client.return_value = RecordingClient()
+
+        await run_all(_config(tmp_path, history_db, intents=("fast", "new", "slow")))
+
+        # "slow" is read after "new" left the window of one pending query
+        assert prompts == ["new?", "slow?", "fast?"]
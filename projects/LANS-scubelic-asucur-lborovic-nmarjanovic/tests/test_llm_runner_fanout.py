@@ -0,0 +1,325 @@
+"""
+Tests for running many configs with shared answers.
+
+Real OpenAI clients query the local stand-in server so that sharing is
+checked against the number of HTTP requests actually sent.
+"""
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.fanout import (
+    SharedAnswerPool,
+    plan_queries,
+    release_answer,
+    reset_current_pool,
+    share_answer,
+)
+from llm_answer_watcher.llm_runner.models import LLMResponse
+from llm_answer_watcher.llm_runner.runner import run_many
+from llm_answer_watcher.llm_runner.standin_server import StandinBehavior, StandinServer
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _config(tmp_path, name, mine, prompts, base_url="http://127.0.0.1:1", *, system_prompt="sys"):
+    db_path = str(tmp_path / name / "watcher.db")
+    (tmp_path / name).mkdir(exist_ok=True)
+    init_db_if_needed(db_path)
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / name / "output"),
+            sqlite_db_path=db_path,
+            models=[
+                ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="TEST_KEY")
+            ],
+        ),
+        brands=Brands(mine=mine, competitors=["HubSpot"]),
+        intents=[Intent(id=f"intent-{i}", prompt=prompt) for i, prompt in enumerate(prompts)],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="test-key",
+                system_prompt=system_prompt,
+                base_url=base_url,
+            )
+        ],
+    )
+
+
+def _response(cost_usd=0.01):
+    return LLMResponse(
+        answer_text="1. Warmly",
+        tokens_used=10,
+        prompt_tokens=5,
+        completion_tokens=5,
+        cost_usd=cost_usd,
+        provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc="2025-11-02T08:00:00Z",
+    )
+
+
+class TestQueryPlan:
+    def test_identical_queries_planned_once(self, tmp_path):
+        plan = plan_queries(
+            [
+                _config(tmp_path, "acme", ["Acme"], ["best CRM?", "best warmup tool?"]),
+                _config(tmp_path, "globex", ["Globex"], ["best CRM?", "best dialer?"]),
+                _config(tmp_path, "initech", ["Initech"], ["best CRM?"], system_prompt="other"),
+            ]
+        )
+
+        assert plan.summary() == {"total_queries": 5, "unique_queries": 4, "shared_queries": 1}
+
+
+class TestSharedAnswerPool:
+    @pytest.mark.asyncio
+    async def test_answer_kept_until_every_subscriber_took_it(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["best CRM?"])
+        model_config = config.models[0]
+        pool = SharedAnswerPool(plan_queries([config, config, config]))
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            return _response()
+
+        token = pool.activate()
+        try:
+            first = await share_answer(model_config, "best CRM?", call)
+            # Asked later, not concurrently: still served from the pool
+            later = [await share_answer(model_config, "best CRM?", call) for _ in range(2)]
+            # Every planned subscriber has its copy, so the answer is released
+            again = await share_answer(model_config, "best CRM?", call)
+        finally:
+            reset_current_pool(token)
+
+        assert calls == 2
+        assert (first.cost_usd, first.coalesced) == (0.01, False)
+        assert [(r.cost_usd, r.coalesced) for r in later] == [(0.0, True), (0.0, True)]
+        assert again.coalesced is False
+        assert pool.summary() == {"api_calls": 2, "shared_answers": 2, "saved_cost_usd": 0.02}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_not_kept(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["best CRM?"])
+        pool = SharedAnswerPool()
+        outcomes = iter([RuntimeError("provider down"), _response()])
+
+        async def call():
+            outcome = next(outcomes)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        token = pool.activate()
+        try:
+            with pytest.raises(RuntimeError):
+                await share_answer(config.models[0], "best CRM?", call)
+            response = await share_answer(config.models[0], "best CRM?", call)
+        finally:
+            reset_current_pool(token)
+
+        assert response.coalesced is False
+        assert pool.fetched_count == 2
+
+    @pytest.mark.asyncio
+    async def test_waiting_configs_retry_when_sender_fails(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["best CRM?"])
+        pool = SharedAnswerPool(plan_queries([config, config]))
+
+        async def invalid_key():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("401 invalid key of config A")
+
+        async def valid_key():
+            return _response()
+
+        token = pool.activate()
+        try:
+            # The second config asks while the first one's request is in flight
+            failed, response = await asyncio.gather(
+                share_answer(config.models[0], "best CRM?", invalid_key),
+                share_answer(config.models[0], "best CRM?", valid_key),
+                return_exceptions=True,
+            )
+        finally:
+            reset_current_pool(token)
+
+        assert isinstance(failed, RuntimeError)
+        assert (response.cost_usd, response.coalesced) == (0.01, False)
+        assert pool.summary() == {"api_calls": 2, "shared_answers": 0, "saved_cost_usd": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_queries_that_never_ask_release_the_answer(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["best CRM?"])
+        model_config = config.models[0]
+        pool = SharedAnswerPool(plan_queries([config, config, config]))
+
+        async def call():
+            return _response()
+
+        token = pool.activate()
+        try:
+            await share_answer(model_config, "best CRM?", call)
+            # Skipped by its budget, reused from an earlier run, or its circuit is open
+            release_answer(model_config, "best CRM?")
+            await share_answer(model_config, "best CRM?", call)
+        finally:
+            reset_current_pool(token)
+
+        # The last subscriber took its copy, so the answer is not kept
+        assert pool._answers == {}
+        assert pool.summary() == {"api_calls": 1, "shared_answers": 1, "saved_cost_usd": 0.01}
+
+    @pytest.mark.asyncio
+    async def test_stopped_early_answer_is_not_shared(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["best CRM?"])
+        pool = SharedAnswerPool(plan_queries([config, config, config]))
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            response = _response()
+            response.stopped_early = calls == 1
+            return response
+
+        token = pool.activate()
+        try:
+            # The other two ask while the truncated answer is in flight
+            truncated, *others = await asyncio.gather(
+                *(share_answer(config.models[0], "best CRM?", call) for _ in range(3))
+            )
+        finally:
+            reset_current_pool(token)
+
+        assert calls == 3
+        assert truncated.stopped_early is True
+        assert [(r.stopped_early, r.coalesced) for r in others] == [(False, False)] * 2
+        assert pool.summary() == {"api_calls": 3, "shared_answers": 0, "saved_cost_usd": 0.0}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_applies_across_keys(self, tmp_path):
+        config = _config(tmp_path, "acme", ["Acme"], ["q"])
+        pool = SharedAnswerPool(max_concurrent_requests=2)
+        active = peak = 0
+
+        async def call():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _response()
+
+        token = pool.activate()
+        try:
+            await asyncio.gather(*(share_answer(config.models[0], f"q{i}", call) for i in range(6)))
+        finally:
+            reset_current_pool(token)
+
+        assert peak == 2
+
+
+class TestRunMany:
+    @pytest.mark.asyncio
+    async def test_api_calls_equal_unique_queries(self, tmp_path):
+        behavior = StandinBehavior(
+            answer="1. Acme\n2. Globex\n3. Initech\n4. HubSpot", latency_ms=20
+        )
+        async with StandinServer(behavior) as server:
+            base_url = server.base_url("openai")
+            configs = [
+                _config(tmp_path, "acme", ["Acme"], ["best CRM?", "best dialer?"], base_url),
+                _config(tmp_path, "globex", ["Globex"], ["best CRM?", "best dialer?"], base_url),
+                _config(tmp_path, "initech", ["Initech"], ["best CRM?", "best email?"], base_url),
+            ]
+            summary = await run_many(configs, config_filenames=["a.yaml", "g.yaml", "i.yaml"])
+
+        assert server.request_counts["openai"] == 3
+        assert summary["plan"] == {"total_queries": 6, "unique_queries": 3, "shared_queries": 3}
+        assert summary["sharing"]["api_calls"] == 3
+        assert summary["sharing"]["shared_answers"] == 3
+        assert summary["errors"] == [None, None, None]
+
+        acme, globex, initech = summary["results"]
+        assert [r["success_count"] for r in summary["results"]] == [2, 2, 2]
+        assert acme["run_id"] == globex["run_id"] == initech["run_id"]
+
+        # Each config extracts the shared answer with its own brands
+        for results, brand, filename in (
+            (acme, "Acme", "a.yaml"),
+            (globex, "Globex", "g.yaml"),
+            (initech, "Initech", "i.yaml"),
+        ):
+            parsed = json.loads(
+                (
+                    Path(results["output_dir"]) / "intent_intent-0_parsed_openai_gpt-4o-mini.json"
+                ).read_text()
+            )
+            assert [m["normalized_name"] for m in parsed["my_mentions"]] == [brand]
+            run_meta = json.loads((Path(results["output_dir"]) / "run_meta.json").read_text())
+            assert run_meta["config_filename"] == filename
+
+        # The cost of each shared answer is charged to one config only
+        costs = []
+        for config in configs:
+            with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+                costs += [
+                    row[0] for row in conn.execute("SELECT estimated_cost_usd FROM answers_raw")
+                ]
+        assert len(costs) == 6
+        assert sum(cost > 0 for cost in costs) == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_database_gets_distinct_run_ids(self, tmp_path):
+        behavior = StandinBehavior(answer="1. Acme", latency_ms=5)
+        async with StandinServer(behavior) as server:
+            base_url = server.base_url("openai")
+            acme = _config(tmp_path, "acme", ["Acme"], ["best CRM?"], base_url)
+            globex = _config(tmp_path, "acme", ["Globex"], ["best CRM?"], base_url)
+            summary = await run_many([acme, globex])
+
+        run_ids = [results["run_id"] for results in summary["results"]]
+        assert run_ids[1] == f"{run_ids[0]}-2"
+        with sqlite3.connect(acme.run_settings.sqlite_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_config_does_not_stop_others(self, tmp_path):
+        behavior = StandinBehavior(answer="1. Acme", latency_ms=5)
+        async with StandinServer(behavior) as server:
+            base_url = server.base_url("openai")
+            acme = _config(tmp_path, "acme", ["Acme"], ["best CRM?"], base_url)
+            broken = _config(tmp_path, "broken", ["Globex"], ["best CRM?"], base_url)
+            broken.run_settings.output_dir = str(tmp_path / "broken" / "watcher.db")
+            summary = await run_many([acme, broken])
+
+        assert summary["results"][0]["success_count"] == 1
+        assert summary["results"][1] is None
+        assert summary["errors"][1]
@@ -0,0 +1,177 @@
+"""
+Tests for freshness policies that carry fresh answers forward between runs.
+"""
+
+import json
+import sqlite3
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    FreshnessPolicy,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.freshness import (
+    find_fresh_answers,
+    resolve_freshness_policy,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
+from llm_answer_watcher.storage.db import init_db_if_needed, load_answers_raw
+from llm_answer_watcher.utils.time import parse_timestamp
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _config(tmp_path, freshness=None, hot_freshness=None, system_prompt="Be helpful."):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=db_path,
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            freshness=freshness,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[
+            Intent(id="hot", prompt="Best CRM tools?", freshness=hot_freshness),
+            Intent(id="cold", prompt="Best email warmup tools?"),
+        ],
+        models=[
+            RuntimeModel(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                api_key="k",
+                system_prompt=system_prompt,
+            )
+        ],
+    )
+
+
+class CountingClient(MockLLMClient):
+    def __init__(self):
+        super().__init__(default_response="1. HubSpot\n2. Warmly", cost_per_response=0.01)
+        self.prompts = []
+
+    async def generate_answer(self, prompt, on_chunk=None):
+        self.prompts.append(prompt)
+        return await super().generate_answer(prompt, on_chunk)
+
+
+async def _run(config, client, run_id):
+    with (
+        patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client),
+        patch("llm_answer_watcher.llm_runner.runner.run_id_from_timestamp", return_value=run_id),
+    ):
+        return await run_all(config)
+
+
+class TestFreshnessPolicy:
+    def test_intent_policy_wins_over_model_and_run_settings(self, tmp_path):
+        config = _config(
+            tmp_path,
+            freshness=FreshnessPolicy(max_age_hours=24),
+            hot_freshness=FreshnessPolicy(max_age_hours=1),
+        )
+        model = config.models[0]
+
+        assert resolve_freshness_policy(config, config.intents[0], model).max_age_hours == 1
+        assert resolve_freshness_policy(config, config.intents[1], model).max_age_hours == 24
+
+        model.freshness = FreshnessPolicy(max_age_hours=6)
+        assert resolve_freshness_policy(config, config.intents[1], model).max_age_hours == 6
+
+    def test_negative_max_age_rejected(self):
+        with pytest.raises(ValidationError):
+            FreshnessPolicy(max_age_hours=-1)
+
+
+class TestFreshRuns:
+    @pytest.mark.asyncio
+    async def test_fresh_answers_carried_forward(self, tmp_path):
+        config = _config(tmp_path, hot_freshness=FreshnessPolicy())
+        client = CountingClient()
+        first = await _run(config, client, "2025-11-01T08-00-00Z")
+
+        assert estimate_run_cost(config)["reused_queries"] == 1
+        second = await _run(config, client, "2025-11-01T09-00-00Z")
+
+        # Only the intent without a policy was queried again
+        assert client.prompts.count("Best CRM tools?") == 1
+        assert client.prompts.count("Best email warmup tools?") == 2
+        assert (second["reused_count"], second["success_count"]) == (1, 2)
+        assert second["total_cost_usd"] < first["total_cost_usd"]
+
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            (reused,) = load_answers_raw(conn, run_id=second["run_id"], intent_id="hot")
+            mentions = conn.execute(
+                "SELECT COUNT(*) FROM mentions WHERE run_id = ? AND intent_id = 'hot'",
+                (second["run_id"],),
+            ).fetchone()[0]
+        assert reused["reused_from_run_id"] == first["run_id"]
+        assert reused["answer_text"] == "1. HubSpot\n2. Warmly"
+        assert reused["estimated_cost_usd"] == 0.0
+        assert mentions == 2
+
+        raw_file = Path(second["output_dir"]) / "intent_hot_raw_openai_gpt-4o-mini.json"
+        assert json.loads(raw_file.read_text())["reused_from_run_id"] == first["run_id"]
+        assert (Path(second["output_dir"]) / "intent_hot_parsed_openai_gpt-4o-mini.json").exists()
+
+        # A third run reuses the original answer, not the copy
+        await _run(config, client, "2025-11-01T10-00-00Z")
+        assert client.prompts.count("Best CRM tools?") == 1
+        fresh = find_fresh_answers(config)
+        assert fresh[("hot", "openai", "gpt-4o-mini")]["run_id"] == first["run_id"]
+
+    @pytest.mark.asyncio
+    async def test_changed_prompt_or_system_prompt_is_stale(self, tmp_path):
+        config = _config(tmp_path, freshness=FreshnessPolicy())
+        await _run(config, CountingClient(), "2025-11-01T08-00-00Z")
+        assert len(find_fresh_answers(config)) == 2
+
+        config.intents[0].prompt = "Best CRM tools for startups?"
+        assert set(find_fresh_answers(config)) == {("cold", "openai", "gpt-4o-mini")}
+
+        config.models[0].system_prompt = "Be concise."
+        assert find_fresh_answers(config) == {}
+
+    @pytest.mark.asyncio
+    async def test_max_age(self, tmp_path):
+        config = _config(tmp_path, freshness=FreshnessPolicy(max_age_hours=2))
+        await _run(config, CountingClient(), "2025-11-01T08-00-00Z")
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            answered_at = parse_timestamp(
+                conn.execute("SELECT MAX(timestamp_utc) FROM answers_raw").fetchone()[0]
+            )
+
+        assert len(find_fresh_answers(config, now=answered_at + timedelta(hours=1))) == 2
+        assert find_fresh_answers(config, now=answered_at + timedelta(hours=3)) == {}
+
+        config.intents[0].freshness = FreshnessPolicy(max_age_hours=0)
+        assert set(find_fresh_answers(config, now=answered_at)) == {
+            ("cold", "openai", "gpt-4o-mini")
+        }
+
+    def test_missing_database_means_nothing_fresh(self, tmp_path):
+        config = _config(tmp_path, freshness=FreshnessPolicy())
+        config.run_settings.sqlite_db_path = str(tmp_path / "missing.db")
+
+        assert find_fresh_answers(config) == {}
+        assert not (tmp_path / "missing.db").exists()
@@ -0,0 +1,263 @@
+"""
+Tests for latency histograms, adaptive timeouts and hedged requests.
+
+Real OpenAI clients query the local stand-in server with scripted latency,
+so timeouts and hedges are exercised over HTTP end-to-end.
+"""
+
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.coalescing import RequestCoalescer, reset_current_coalescer
+from llm_answer_watcher.llm_runner.hedging import (
+    MAX_HISTOGRAM_SAMPLES,
+    MIN_SAMPLES,
+    MIN_TIMEOUT_SECONDS,
+    LatencyController,
+    LatencyHistogram,
+)
+from llm_answer_watcher.llm_runner.http_pool import (
+    count_attempts,
+    pooled_client,
+    request_timeout,
+)
+from llm_answer_watcher.llm_runner.models import LLMResponse, build_client
+from llm_answer_watcher.llm_runner.retry_config import REQUEST_TIMEOUT
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed, load_latency_histograms
+
+KEY = ("openai", "gpt-4o-mini")
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _controller(latency_ms, samples=MIN_SAMPLES, **kwargs):
+    histogram = LatencyHistogram()
+    for _ in range(samples):
+        histogram.record(latency_ms)
+    return LatencyController({KEY: histogram}, **kwargs)
+
+
+def _first_slow(slow_ms, fast_ms=10.0):
+    """Latency sampler: the first request is slow, later ones are fast."""
+    delays = iter([slow_ms])
+    return lambda: next(delays, fast_ms)
+
+
+class TestLatencyHistogram:
+    def test_quantiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(float(value))
+
+        assert histogram.count == 1000
+        assert 500 <= histogram.quantile(0.5) <= 500 * 1.12
+        assert 990 <= histogram.quantile(0.99) <= 990 * 1.12
+        assert LatencyHistogram().quantile(0.5) is None
+
+    def test_decay_and_layout_change(self):
+        histogram = LatencyHistogram()
+        for _ in range(MAX_HISTOGRAM_SAMPLES + 10):
+            histogram.record(200.0)
+        histogram.decay()
+
+        assert histogram.count <= MAX_HISTOGRAM_SAMPLES
+        assert LatencyHistogram([1, 2, 3]).count == 0  # Stale layout dropped
+
+
+class TestAdaptiveTimeouts:
+    def test_timeout_from_history(self):
+        assert LatencyController().timeout_for(*KEY) == REQUEST_TIMEOUT
+        assert _controller(1000.0, samples=MIN_SAMPLES - 1).timeout_for(*KEY) == REQUEST_TIMEOUT
+        assert _controller(1000.0).timeout_for(*KEY) == MIN_TIMEOUT_SECONDS
+        assert 30.0 <= _controller(10_000.0).timeout_for(*KEY) <= 30.0 * 1.12
+        assert _controller(100_000.0).timeout_for(*KEY) == REQUEST_TIMEOUT
+        fixed = _controller(1000.0, adaptive_timeouts=False)
+        assert fixed.timeout_for(*KEY) == REQUEST_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_timeout_applied_to_pooled_requests(self):
+        async with StandinServer(StandinBehavior(latency_ms=500)) as server:
+            url = f"{server.base_url('openai')}/responses"
+            payload = {"model": "gpt-4o-mini", "input": "q"}
+            headers = {"Authorization": "Bearer test-key"}
+            async with pooled_client() as http:
+                with request_timeout(0.05), pytest.raises(httpx.TimeoutException):
+                    await http.post(url, json=payload, headers=headers)
+                response = await http.post(url, json=payload, headers=headers)
+
+        assert response.status_code == 200
+
+
+class TestLatencySamples:
+    @pytest.mark.asyncio
+    async def test_retried_calls_are_not_recorded(self):
+        controller = LatencyController()
+
+        async with StandinServer() as server:
+            url = f"{server.base_url('openai')}/responses"
+
+            async def call(attempts):
+                async with pooled_client() as http:
+                    for _ in range(attempts):
+                        await http.post(url, json={"model": "gpt-4o-mini", "input": "q"})
+                return LLMResponse("answer", 10, 0.0, *KEY, "2025-11-01T08:00:00Z")
+
+            await controller._timed(call(1), *KEY)
+            # A retry's duration includes the failed attempt and the backoff
+            await controller._timed(call(2), *KEY)
+
+        assert controller.histograms[KEY].count == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesced_calls_are_not_recorded(self):
+        controller = LatencyController()
+        coalescer = RequestCoalescer()
+
+        async with StandinServer(StandinBehavior(latency_ms=50)) as server:
+            client = build_client(*KEY, "test-key", "sys", base_url=server.base_url("openai"))
+            token = coalescer.activate()
+            try:
+                first = asyncio.ensure_future(controller.generate(client, "best CRM?", *KEY))
+                await asyncio.sleep(0.02)
+                # Joins the in-flight request and only waits for its rest
+                joined = await controller.generate(client, "best CRM?", *KEY)
+                await first
+            finally:
+                reset_current_coalescer(token)
+
+        assert joined.coalesced
+        assert server.request_counts["openai"] == 1
+        assert controller.histograms[KEY].count == 1
+
+    def test_count_attempts_nests(self):
+        with count_attempts() as outer:
+            with count_attempts() as inner:
+                assert inner.attempts == 0
+        assert outer.attempts == 0
+
+
+class TestHedging:
+    @pytest.mark.asyncio
+    async def test_hedge_wins_over_slow_request(self):
+        controller = _controller(50.0, hedge=True, max_extra_cost_usd=1.0)
+        behavior = StandinBehavior(latency_sampler=_first_slow(800.0))
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                "openai", "gpt-4o-mini", "k", "sys", base_url=server.base_url("openai")
+            )
+            charged = []
+            response = await controller.generate(
+                client, "best CRM?", *KEY, on_hedge_cost=charged.append
+            )
+
+        assert server.request_counts["openai"] == 2
+        assert controller.hedged == 1
+        assert controller.hedge_wins == 1
+        assert controller.extra_cost_usd == pytest.approx(response.cost_usd)
+        assert charged == [response.cost_usd]
+        assert controller.histograms[KEY].count == MIN_SAMPLES + 1
+
+    @pytest.mark.asyncio
+    async def test_spend_cap_stops_hedging(self):
+        controller = _controller(50.0, hedge=True, max_extra_cost_usd=0.0)
+        behavior = StandinBehavior(latency_sampler=_first_slow(300.0))
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                "openai", "gpt-4o-mini", "k", "sys", base_url=server.base_url("openai")
+            )
+            await controller.generate(client, "best CRM?", *KEY)
+
+        assert server.request_counts["openai"] == 1
+        assert controller.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_hedging(self):
+        controller = _controller(50.0, hedge=True, max_extra_cost_usd=1.0)
+        behavior = StandinBehavior(latency_sampler=_first_slow(300.0))
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                "openai", "gpt-4o-mini", "k", "sys", base_url=server.base_url("openai")
+            )
+            # e.g. CostLedger.allows() once the intent's budget is spent
+            await controller.generate(client, "best CRM?", *KEY, can_hedge=lambda: False)
+
+        assert server.request_counts["openai"] == 1
+        assert controller.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises(self):
+        class FailingClient:
+            model_name = "gpt-4o-mini"
+
+            async def generate_answer(self, prompt):
+                raise RuntimeError("provider down")
+
+        controller = _controller(50.0, hedge=True, max_extra_cost_usd=1.0)
+        controller.hedge_delay = lambda *_: 0.0
+        with pytest.raises(RuntimeError, match="provider down"):
+            await controller.generate(FailingClient(), "q", *KEY)
+
+    def test_settings_validated(self):
+        with pytest.raises(ValidationError):
+            RunSettings(output_dir="out", sqlite_db_path="db", hedge_max_extra_cost_usd=-1)
+
+
+class TestRunnerLatencyHistograms:
+    @pytest.mark.asyncio
+    async def test_histograms_persisted_across_runs(self, tmp_path):
+        async with StandinServer() as server:
+            config = RuntimeConfig(
+                run_settings=RunSettings(
+                    output_dir=str(tmp_path / "output"),
+                    sqlite_db_path=str(tmp_path / "test.db"),
+                    models=[
+                        ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="KEY")
+                    ],
+                ),
+                brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+                intents=[Intent(id=f"intent-{i}", prompt=f"question {i}?") for i in range(3)],
+                models=[
+                    RuntimeModel(
+                        provider="openai",
+                        model_name="gpt-4o-mini",
+                        api_key="test-key",
+                        base_url=server.base_url("openai"),
+                    )
+                ],
+            )
+            init_db_if_needed(config.run_settings.sqlite_db_path)
+            await run_all(config)
+            result = await run_all(config)
+
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            histograms = load_latency_histograms(conn)
+        assert sum(histograms[KEY]) == 6
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["latency_control"]["timeouts_s"] == {"openai/gpt-4o-mini": REQUEST_TIMEOUT}
+        assert run_meta["latency_control"]["hedged"] == 0
@@ -0,0 +1,226 @@
+"""
+Tests for the live cost ledger that enforces budgets during a run.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    BudgetConfig,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    RuntimeOperation,
+    SamplingConfig,
+)
+from llm_answer_watcher.llm_runner.ledger import (
+    COST_ANSWERS,
+    COST_OPERATIONS,
+    RUN_BUDGET_TRUNCATED,
+    RUN_COMPLETE,
+    CostLedger,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.db import get_run_summary, init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestCostLedger:
+    def test_run_limit_blocks_every_intent(self):
+        ledger = CostLedger(BudgetConfig(max_per_run_usd=0.05))
+        ledger.charge("crm", 0.03, COST_ANSWERS)
+        assert ledger.allows("warmup")
+
+        ledger.charge("crm", 0.02, COST_OPERATIONS)
+        assert not ledger.allows("warmup")
+        assert ledger.limit_reached == "per_run"
+
+    def test_intent_limit_blocks_only_that_intent(self):
+        ledger = CostLedger(BudgetConfig(max_per_intent_usd=0.01))
+        ledger.charge("crm", 0.01, COST_ANSWERS)
+
+        assert not ledger.allows("crm")
+        assert ledger.allows("warmup")
+        assert ledger.limit_reached == "per_intent:crm"
+
+    def test_disabled_budget_is_not_enforced(self):
+        ledger = CostLedger(BudgetConfig(enabled=False, max_per_run_usd=0.01))
+        ledger.charge("crm", 1.0, COST_ANSWERS)
+
+        assert ledger.allows("crm")
+        assert CostLedger(None).allows("crm")
+
+    def test_summary_accounts_for_spend_and_skips(self):
+        ledger = CostLedger(BudgetConfig(max_per_run_usd=0.01))
+        ledger.charge("crm", 0.004, COST_ANSWERS)
+        ledger.charge("crm", 0.008, COST_OPERATIONS)
+        assert ledger.status == RUN_COMPLETE
+        ledger.skip("warmup", "openai", "gpt-4o-mini")
+
+        summary = ledger.summary()
+        assert ledger.status == RUN_BUDGET_TRUNCATED
+        assert summary["spent_usd"] == 0.012
+        assert summary["by_category"] == {COST_ANSWERS: 0.004, COST_OPERATIONS: 0.008}
+        assert summary["by_intent"] == {"crm": 0.012}
+        assert summary["skipped"] == [
+            {
+                "intent_id": "warmup",
+                "model_provider": "openai",
+                "model_name": "gpt-4o-mini",
+                "stage": "query",
+            }
+        ]
+
+    def test_skipped_queries_are_not_capped(self):
+        ledger = CostLedger(BudgetConfig(max_per_run_usd=0.01))
+        with patch("llm_answer_watcher.llm_runner.ledger.MAX_REPORTED_SKIPS", 2):
+            for index in range(5):
+                ledger.skip(f"intent-{index}", "openai", "gpt-4o-mini")
+            ledger.skip("intent-0", "openai", "gpt-4o-mini", stage="sample")
+
+        assert len(ledger.summary()["skipped"]) == 2
+        assert ledger.skipped_count == 6
+        assert ledger.skipped_queries == [
+            (f"intent-{index}", "openai", "gpt-4o-mini") for index in range(5)
+        ]
+
+
+def _config(tmp_path, budget, model_names=("gpt-4o-mini",), intents=4, sampling=None):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=db_path,
+            max_concurrent_requests=1,
+            models=[
+                ModelConfig(provider="openai", model_name=name, env_api_key="K")
+                for name in model_names
+            ],
+            budget=budget,
+            sampling=sampling,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[Intent(id=f"intent-{i}", prompt=f"Question {i}?") for i in range(intents)],
+        models=[
+            RuntimeModel(provider="openai", model_name=name, api_key="k") for name in model_names
+        ],
+    )
+
+
+async def _run(config):
+    client = MockLLMClient(default_response="1. Warmly\n2. HubSpot", cost_per_response=0.01)
+    with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+        return await run_all(config)
+
+
+class TestLiveBudget:
+    @pytest.mark.asyncio
+    async def test_run_limit_truncates_run(self, tmp_path):
+        # The pre-run estimate (~$0.002) passes; actual answers cost $0.01 each
+        config = _config(tmp_path, BudgetConfig(max_per_run_usd=0.02))
+        result = await _run(config)
+
+        assert result["status"] == RUN_BUDGET_TRUNCATED
+        assert (result["success_count"], result["error_count"]) == (2, 0)
+        assert result["total_cost_usd"] == pytest.approx(0.02)
+        assert result["budget"]["skipped_count"] == 2
+        assert len(result["skipped_queries"]) == 2
+        assert result["budget"]["limit_reached"] == "per_run"
+
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["status"] == RUN_BUDGET_TRUNCATED
+        assert run_meta["budget"]["spent_usd"] == 0.02
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            summary = get_run_summary(conn, result["run_id"])
+            answers = conn.execute("SELECT COUNT(*) FROM answers_raw").fetchone()[0]
+        assert summary["status"] == RUN_BUDGET_TRUNCATED
+        assert summary["total_cost_usd"] == pytest.approx(0.02)
+        assert answers == 2
+
+    @pytest.mark.asyncio
+    async def test_intent_limit_skips_rest_of_intent(self, tmp_path):
+        config = _config(
+            tmp_path,
+            BudgetConfig(max_per_intent_usd=0.01),
+            model_names=("gpt-4o-mini", "gpt-4o"),
+            intents=2,
+        )
+        result = await _run(config)
+
+        assert result["success_count"] == 2
+        skipped = result["budget"]["skipped"]
+        assert sorted(skip["intent_id"] for skip in skipped) == ["intent-0", "intent-1"]
+        assert result["budget"]["by_intent"] == {"intent-0": 0.01, "intent-1": 0.01}
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_sampling(self, tmp_path):
+        config = _config(
+            tmp_path,
+            BudgetConfig(max_per_run_usd=0.03),
+            intents=1,
+            sampling=SamplingConfig(min_samples=5, max_samples=5),
+        )
+        result = await _run(config)
+
+        assert result["success_count"] == 1
+        assert result["total_cost_usd"] == pytest.approx(0.03)
+        assert result["budget"]["skipped"][0]["stage"] == "sampling"
+        parsed = json.loads(
+            (
+                Path(result["output_dir"]) / "intent_intent-0_parsed_openai_gpt-4o-mini.json"
+            ).read_text()
+        )
+        assert (parsed["sampling"]["samples"], parsed["sampling"]["stop_reason"]) == (3, "budget")
+
+    @pytest.mark.asyncio
+    async def test_budget_stops_operation_chain(self, tmp_path):
+        config = _config(tmp_path, BudgetConfig(max_per_run_usd=0.025), intents=1)
+        config.global_operations = [
+            RuntimeOperation(id="gaps", prompt="Gaps?"),
+            RuntimeOperation(id="ideas", prompt="Ideas?", depends_on=["gaps"]),
+            RuntimeOperation(id="outline", prompt="Outline?", depends_on=["ideas"]),
+        ]
+        client = MockLLMClient(default_response="1. Warmly", cost_per_response=0.01)
+        with (
+            patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client),
+            patch(
+                "llm_answer_watcher.llm_runner.operation_executor.build_client",
+                return_value=client,
+            ),
+        ):
+            result = await run_all(config)
+
+        # Each operation is charged as it finishes: the third would start over budget
+        assert result["total_cost_usd"] == pytest.approx(0.03)
+        assert result["budget"]["by_category"] == {COST_ANSWERS: 0.01, COST_OPERATIONS: 0.02}
+        assert result["budget"]["skipped"][0]["stage"] == "operations"
+        assert result["status"] == RUN_BUDGET_TRUNCATED
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            operations = conn.execute("SELECT operation_id FROM operations").fetchall()
+        assert sorted(operations) == [("gaps",), ("ideas",)]
+
+    @pytest.mark.asyncio
+    async def test_within_budget_is_complete(self, tmp_path):
+        config = _config(tmp_path, BudgetConfig(max_per_run_usd=1.0))
+        result = await _run(config)
+
+        assert result["status"] == RUN_COMPLETE
+        assert result["budget"]["skipped_count"] == 0
+        assert result["budget"]["by_category"] == {COST_ANSWERS: 0.04}
@@ -166,6 +166,38 @@ Line 3"""
         assert response.answer_text == multiline_answer
         assert "\n" in response.answer_text
 
+    @pytest.mark.asyncio
+    async def test_generate_answer_fixed_latency(self, monkeypatch):
+        """Test mock client sleeps for latency_ms before responding."""
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        client = MockLLMClient(latency_ms=250)
+
+        await client.generate_answer("test")
+
+        assert delays == [0.25]
+
+    @pytest.mark.asyncio
+    async def test_generate_answer_latency_sampler(self, monkeypatch):
+        """Test latency_sampler overrides latency_ms on every call."""
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr("asyncio.sleep", fake_sleep)
+        samples = iter([100.0, 300.0])
+        client = MockLLMClient(latency_ms=999, latency_sampler=lambda: next(samples))
+
+        await client.generate_answer("test")
+        await client.generate_answer("test")
+
+        assert delays == [0.1, 0.3]
+
 
 class TestMockLLMClientProtocolCompliance:
     """Test that MockLLMClient conforms to LLMClient protocol."""
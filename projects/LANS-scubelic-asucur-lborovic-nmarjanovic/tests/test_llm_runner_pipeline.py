@@ -0,0 +1,162 @@
+"""
+Tests for bounded producer/consumer execution of run queries.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.daemon.watcher import build_report_results
+from llm_answer_watcher.llm_runner import runner
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.pipeline import run_bounded
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestRunBounded:
+    @pytest.mark.asyncio
+    async def test_window_bounds_running_and_pulled_items(self):
+        pulled = 0
+        running = 0
+        peak = 0
+        results = {}
+
+        def items():
+            nonlocal pulled
+            for i in range(50):
+                pulled += 1
+                # Producer never runs more than the window ahead of completions
+                assert pulled - len(results) <= 4
+                yield i
+
+        async def worker(item):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001 * (item % 3))
+            running -= 1
+            return item * 2
+
+        processed = await run_bounded(items(), worker, 4, results.__setitem__)
+
+        assert processed == 50
+        assert peak == 4
+        assert results == {i: i * 2 for i in range(50)}
+
+    @pytest.mark.asyncio
+    async def test_async_producer_and_worker_exceptions(self):
+        async def items():
+            for i in range(5):
+                yield i
+
+        async def worker(item):
+            if item == 2:
+                raise RuntimeError("boom")
+            return item
+
+        results = {}
+        await run_bounded(items(), worker, 2, results.__setitem__)
+
+        assert isinstance(results.pop(2), RuntimeError)
+        assert results == {0: 0, 1: 1, 3: 3, 4: 4}
+
+    @pytest.mark.asyncio
+    async def test_cancellation_cancels_running_tasks(self):
+        started = asyncio.Event()
+        cancelled = []
+
+        async def worker(item):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+
+        task = asyncio.ensure_future(run_bounded(range(10), worker, 3, lambda *_: None))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sorted(cancelled) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_invalid_window(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            await run_bounded([], asyncio.sleep, 0, lambda *_: None)
+
+
+class TestRunAllPipeline:
+    def _config(self, tmp_path, intents):
+        return RuntimeConfig(
+            run_settings=RunSettings(
+                output_dir=str(tmp_path / "output"),
+                sqlite_db_path=str(tmp_path / "test.db"),
+                models=[
+                    ModelConfig(
+                        provider="openai", model_name="gpt-4o-mini", env_api_key="TEST_API_KEY"
+                    )
+                ],
+                max_concurrent_requests=2,
+            ),
+            brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+            intents=[Intent(id=f"intent-{i}", prompt=f"question {i}?") for i in range(intents)],
+            models=[
+                RuntimeModel(
+                    provider="openai", model_name="gpt-4o-mini", api_key="k", system_prompt="s"
+                )
+            ],
+        )
+
+    @pytest.mark.asyncio
+    @patch("llm_answer_watcher.llm_runner.runner.build_client")
+    async def test_errors_streamed_to_log_and_summary_capped(
+        self, mock_build_client, tmp_path, monkeypatch
+    ):
+        class FailingClient(MockLLMClient):
+            async def generate_answer(self, prompt):
+                raise RuntimeError(f"failed: {prompt}")
+
+        mock_build_client.return_value = FailingClient()
+        monkeypatch.setattr(runner, "MAX_REPORTED_ERRORS", 3)
+        monkeypatch.setattr(runner, "TIMING_FLUSH_SIZE", 4)
+        config = self._config(tmp_path, intents=10)
+        init_db_if_needed(config.run_settings.sqlite_db_path)
+
+        result = await run_all(config)
+
+        assert result["error_count"] == 10
+        assert len(result["errors"]) == 3
+        # Every failure stays in failed_queries, so reports mark all 10 as errors
+        assert result["failed_queries"] == sorted(
+            (f"intent-{i}", "openai", "gpt-4o-mini") for i in range(10)
+        )
+        statuses = [row["status"] for row in build_report_results(config, result)]
+        assert statuses == ["error"] * 10
+        error_log = Path(result["output_dir"]) / "errors.jsonl"
+        logged = [json.loads(line) for line in error_log.read_text().splitlines()]
+        assert sorted(e["intent_id"] for e in logged) == sorted(f"intent-{i}" for i in range(10))
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["latency"]["openai/gpt-4o-mini"]["count"] == 10
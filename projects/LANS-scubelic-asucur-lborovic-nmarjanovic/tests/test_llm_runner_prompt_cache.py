@@ -0,0 +1,148 @@
+"""
+Tests for provider prompt caching.
+
+Real OpenAI, Anthropic and Gemini clients query the local stand-in server
+with prompt cache emulation enabled, so request structure, cached-token
+parsing and cached pricing are exercised over HTTP end-to-end.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.extractor.function_extractor import build_extraction_prompt
+from llm_answer_watcher.llm_runner.models import build_client
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-20241022",
+    "google": "gemini-1.5-flash",
+}
+
+# Long enough that the shared prefix dominates the prompt
+SYSTEM_PROMPT = "You are an unbiased market analyst. " * 200
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestProviderPromptCache:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_repeat_prefix_reported_and_priced_as_cached(self, provider, stream):
+        async with StandinServer(StandinBehavior(prompt_cache=True)) as server:
+            client = build_client(
+                provider,
+                MODELS[provider],
+                "test-key",
+                SYSTEM_PROMPT,
+                base_url=server.base_url(provider),
+            )
+            call = client.stream_answer if stream else client.generate_answer
+            first = await call("best CRM?")
+            second = await call("best email warmup tool?")
+
+        assert first.cached_tokens == 0
+        assert second.cached_tokens > 0
+        assert second.cached_tokens <= second.prompt_tokens
+        assert second.prompt_tokens >= len(SYSTEM_PROMPT) // 4
+        assert second.cost_usd < first.cost_usd
+
+    @pytest.mark.asyncio
+    async def test_anthropic_marks_system_prompt_for_caching(self):
+        async with StandinServer(StandinBehavior(prompt_cache=True)) as server:
+            client = build_client(
+                "anthropic",
+                MODELS["anthropic"],
+                "test-key",
+                SYSTEM_PROMPT,
+                base_url=server.base_url("anthropic"),
+            )
+            payload = client._build_payload("best CRM?")
+            first = await client.generate_answer("best CRM?")
+
+        assert payload["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        # First request writes the cache: billed above the uncached input price
+        uncached = build_client("anthropic", MODELS["anthropic"], "k", "sys")._build_llm_response(
+            "x",
+            tokens_used=first.tokens_used,
+            prompt_tokens=first.prompt_tokens,
+            completion_tokens=first.completion_tokens,
+        )
+        assert first.cost_usd > uncached.cost_usd
+
+    def test_extraction_prompt_shares_prefix(self):
+        brands = (["Warmly"], ["HubSpot", "Instantly"])
+        first = build_extraction_prompt("1. HubSpot", *brands)
+        second = build_extraction_prompt("Try Warmly or Instantly", *brands)
+
+        prefix = first[: first.index("ANSWER TO ANALYZE")]
+        assert second.startswith(prefix)
+        assert "Known competitors: HubSpot, Instantly" in prefix
+
+
+class TestRunnerPromptCacheReport:
+    @pytest.mark.asyncio
+    async def test_hit_ratio_in_run_meta(self, tmp_path):
+        async with StandinServer(StandinBehavior(prompt_cache=True)) as server:
+            config = RuntimeConfig(
+                run_settings=RunSettings(
+                    output_dir=str(tmp_path / "output"),
+                    sqlite_db_path=str(tmp_path / "test.db"),
+                    models=[
+                        ModelConfig(
+                            provider="openai", model_name="gpt-4o-mini", env_api_key="TEST_KEY"
+                        )
+                    ],
+                    max_concurrent_requests=1,
+                ),
+                brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+                intents=[
+                    Intent(id="crm", prompt="best CRM?"),
+                    Intent(id="warmup", prompt="best warmup tool?"),
+                ],
+                models=[
+                    RuntimeModel(
+                        provider="openai",
+                        model_name="gpt-4o-mini",
+                        api_key="test-key",
+                        system_prompt=SYSTEM_PROMPT,
+                        base_url=server.base_url("openai"),
+                    )
+                ],
+            )
+            init_db_if_needed(config.run_settings.sqlite_db_path)
+            result = await run_all(config)
+
+        assert result["success_count"] == 2
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        stats = run_meta["prompt_cache"]["openai/gpt-4o-mini"]
+        assert stats["calls"] == 2
+        assert 0.4 < stats["hit_ratio"] < 0.5  # Second call reads the system prompt
+
+        raw = json.loads(
+            (Path(result["output_dir"]) / "intent_warmup_raw_openai_gpt-4o-mini.json").read_text()
+        )
+        assert raw["usage_meta"]["cached_tokens"] == stats["cached_tokens"]
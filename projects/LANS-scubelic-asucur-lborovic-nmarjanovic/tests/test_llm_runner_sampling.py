@@ -0,0 +1,212 @@
+"""
+Tests for adaptive multi-sampling of visibility estimates.
+"""
+
+import json
+import sqlite3
+from itertools import cycle
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+    SamplingConfig,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import estimate_run_cost, run_all
+from llm_answer_watcher.llm_runner.sampling import (
+    STOP_ERROR,
+    STOP_MAX_SAMPLES,
+    STOP_PRECISE,
+    VisibilityEstimate,
+    sample_visibility,
+    wilson_interval,
+)
+from llm_answer_watcher.storage.db import init_db_if_needed
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestIntervals:
+    def test_wilson_interval(self):
+        assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+        low, high = wilson_interval(5, 10, 1.96)
+        assert low == pytest.approx(0.2366, abs=1e-4)
+        assert high == pytest.approx(0.7634, abs=1e-4)
+        # Unanimous samples still leave a non-zero interval
+        low, high = wilson_interval(5, 5, 1.96)
+        assert high == 1.0
+        assert 0.5 < low < 0.6
+
+    def test_stable_answers_stop_early(self):
+        estimate = VisibilityEstimate(SamplingConfig(min_samples=3, max_samples=10))
+        while estimate.needs_more_samples():
+            estimate.add(appeared=True, rank=2)
+
+        assert estimate.samples == 5
+        assert estimate.stop_reason == STOP_PRECISE
+        assert estimate.rank_interval() == (2.0, 2.0)
+
+    def test_varying_answers_use_all_samples(self):
+        estimate = VisibilityEstimate(SamplingConfig(min_samples=3, max_samples=8))
+        outcomes = cycle([(True, 1), (False, None)])
+        while estimate.needs_more_samples():
+            estimate.add(*next(outcomes))
+
+        summary = estimate.summary()
+        assert (summary["samples"], summary["appeared_count"]) == (8, 4)
+        assert summary["stop_reason"] == STOP_MAX_SAMPLES
+        assert summary["appearance_low"] < 0.5 < summary["appearance_high"]
+        assert summary["mean_rank"] == 1.0
+
+    def test_single_rank_needs_more_samples(self):
+        estimate = VisibilityEstimate(
+            SamplingConfig(min_samples=2, max_samples=10, max_appearance_interval_width=0.99)
+        )
+        estimate.add(appeared=True, rank=3)
+        estimate.add(appeared=True, rank=None)
+
+        assert estimate.rank_interval() is None
+        assert estimate.needs_more_samples()
+
+    @pytest.mark.asyncio
+    async def test_failed_sample_keeps_estimate(self):
+        async def draw():
+            raise RuntimeError("rate limited")
+
+        estimate = await sample_visibility(SamplingConfig(), (True, 1), draw)
+
+        assert (estimate.samples, estimate.stop_reason) == (1, STOP_ERROR)
+
+    def test_config_validation(self):
+        with pytest.raises(ValidationError):
+            SamplingConfig(min_samples=5, max_samples=3)
+        with pytest.raises(ValidationError):
+            SamplingConfig(confidence=1.0)
+        with pytest.raises(ValidationError):
+            SamplingConfig(max_rank_interval_width=0)
+
+
+class CyclingClient(MockLLMClient):
+    """Returns the given answers for a prompt in turn."""
+
+    def __init__(self, answers_by_prompt):
+        super().__init__(cost_per_response=0.001)
+        self.answers = {prompt: cycle(answers) for prompt, answers in answers_by_prompt.items()}
+        self.calls = 0
+
+    async def generate_answer(self, prompt, on_chunk=None):
+        self.calls += 1
+        self.default_response = next(self.answers[prompt])
+        return await super().generate_answer(prompt, on_chunk)
+
+
+def _config(tmp_path, sampling):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=db_path,
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            sampling=sampling,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot"]),
+        intents=[
+            Intent(id="stable", prompt="Best CRM?"),
+            Intent(id="varying", prompt="Best warmup tool?"),
+        ],
+        models=[RuntimeModel(provider="openai", model_name="gpt-4o-mini", api_key="k")],
+    )
+
+
+class TestSampledRuns:
+    @pytest.mark.asyncio
+    async def test_run_records_estimates(self, tmp_path):
+        config = _config(tmp_path, SamplingConfig(min_samples=3, max_samples=6))
+        client = CyclingClient(
+            {
+                "Best CRM?": ["1. Warmly\n2. HubSpot"],
+                "Best warmup tool?": ["1. Warmly\n2. HubSpot", "1. HubSpot"],
+            }
+        )
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+            result = await run_all(config)
+
+        assert result["success_count"] == 2
+        assert client.calls == 5 + 6
+        assert result["total_cost_usd"] == pytest.approx(0.011)
+
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            rows = conn.execute(
+                "SELECT intent_id, samples, appeared_count, mean_rank, stop_reason, confidence "
+                "FROM visibility_estimates ORDER BY intent_id"
+            ).fetchall()
+        assert rows == [
+            ("stable", 5, 5, 1.0, STOP_PRECISE, 0.9),
+            ("varying", 6, 3, 1.0, STOP_MAX_SAMPLES, 0.9),
+        ]
+
+        run_dir = Path(result["output_dir"])
+        run_meta = json.loads((run_dir / "run_meta.json").read_text())
+        assert run_meta["sampling"] == {
+            "sampled_queries": 2,
+            "samples": 11,
+            "stopped_early": 1,
+            "cost_usd": 0.009,
+            "max_samples": 6,
+        }
+        parsed = json.loads((run_dir / "intent_varying_parsed_openai_gpt-4o-mini.json").read_text())
+        assert parsed["sampling"]["appearance_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_draws_are_not_coalesced(self, tmp_path):
+        # Two intents with the same prompt draw samples at the same time
+        config = _config(tmp_path, SamplingConfig(min_samples=4, max_samples=4))
+        config.intents[1] = Intent(id="same-prompt", prompt="Best CRM?")
+        config.run_settings.max_concurrent_requests = 2
+        client = CyclingClient({"Best CRM?": ["1. Warmly\n2. HubSpot"]})
+        client.latency_ms = 20
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+            result = await run_all(config)
+
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        draws = run_meta["sampling"]["samples"] - 2
+        assert draws == 6
+        # Only the first answers may share a request; every draw is its own call
+        assert run_meta["coalescing"]["requests"] == 2
+        assert client.calls == 2 + draws - run_meta["coalescing"]["coalesced"]
+        assert run_meta["sampling"]["cost_usd"] == pytest.approx(0.001 * draws)
+
+    @pytest.mark.asyncio
+    async def test_sampling_disabled_by_default(self, tmp_path):
+        config = _config(tmp_path, None)
+        client = CyclingClient({"Best CRM?": ["Warmly"], "Best warmup tool?": ["HubSpot"]})
+        with patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client):
+            result = await run_all(config)
+
+        assert client.calls == 2
+        run_meta = json.loads((Path(result["output_dir"]) / "run_meta.json").read_text())
+        assert "sampling" not in run_meta
+
+    def test_estimate_budgets_max_samples(self, tmp_path):
+        single = estimate_run_cost(_config(tmp_path, None))
+        sampled = estimate_run_cost(_config(tmp_path, SamplingConfig(max_samples=4)))
+
+        assert sampled["max_samples_per_query"] == 4
+        assert sampled["base_cost"] == pytest.approx(single["base_cost"] * 4)
@@ -0,0 +1,242 @@
+"""
+Tests for the local provider stand-in server and base_url overrides.
+
+Every real provider client is exercised over HTTP against the stand-in
+server via its base_url, so request/response parsing is checked end-to-end.
+Rate limiting and streaming are checked at the raw HTTP level to avoid
+waiting on retry backoff.
+"""
+
+import json
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import ModelConfig
+from llm_answer_watcher.llm_runner.models import (
+    BASE_URL_ENV_VARS,
+    build_client,
+    resolve_base_url,
+)
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-20241022",
+    "mistral": "mistral-small-latest",
+    "grok": "grok-3-mini",
+    "google": "gemini-2.0-flash",
+    "perplexity": "sonar",
+}
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+def _sse_events(text: str) -> list[str]:
+    return [line[len("data: ") :] for line in text.splitlines() if line.startswith("data: ")]
+
+
+class TestProviderClients:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    async def test_client_round_trip(self, provider):
+        behavior = StandinBehavior(answer=lambda p, prompt: f"{p} says: HubSpot for {prompt}")
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                provider,
+                MODELS[provider],
+                "test-key",
+                "You are helpful.",
+                base_url=server.base_url(provider),
+            )
+            response = await client.generate_answer("best CRM?")
+
+        assert response.answer_text == f"{provider} says: HubSpot for best CRM?"
+        assert response.prompt_tokens > 0
+        assert response.completion_tokens > 0
+        assert server.request_counts[provider] == 1
+        assert server.requests[0]["model"] == MODELS[provider]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", ["openai", "google"])
+    async def test_web_search_annotations(self, provider):
+        async with StandinServer(StandinBehavior(web_search=True)) as server:
+            client = build_client(
+                provider, MODELS[provider], "test-key", "sys", base_url=server.base_url(provider)
+            )
+            response = await client.generate_answer("best CRM?")
+
+        assert response.web_search_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_openai_function_call(self):
+        tools = [
+            {
+                "type": "function",
+                "name": "extract_brands",
+                "parameters": {
+                    "type": "object",
+                    "properties": {"brands": {"type": "array"}, "count": {"type": "integer"}},
+                    "required": ["brands", "count"],
+                },
+            }
+        ]
+        async with StandinServer() as server:
+            client = build_client(
+                "openai",
+                MODELS["openai"],
+                "test-key",
+                "sys",
+                tools=tools,
+                base_url=server.base_url("openai"),
+            )
+            response = await client.generate_answer("Warmly and HubSpot")
+
+        call = json.loads(response.answer_text)["_function_call"]
+        assert call["name"] == "extract_brands"
+        assert call["arguments"] == {"brands": [], "count": 0}
+
+    @pytest.mark.asyncio
+    async def test_env_var_base_url(self, monkeypatch):
+        async with StandinServer() as server:
+            for name, value in server.environment().items():
+                monkeypatch.setenv(name, value)
+            client = build_client("mistral", MODELS["mistral"], "test-key", "sys")
+            await client.generate_answer("hi")
+
+        assert server.request_counts["mistral"] == 1
+
+
+class TestBehavior:
+    @pytest.mark.asyncio
+    async def test_missing_credentials_rejected(self):
+        async with StandinServer() as server, httpx.AsyncClient() as http:
+            response = await http.post(
+                f"{server.base_url('anthropic')}/messages", json={"messages": []}
+            )
+        assert response.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_returns_429(self):
+        behavior = StandinBehavior(max_requests_per_second=2)
+        headers = {"Authorization": "Bearer test-key"}
+        async with StandinServer(behavior) as server, httpx.AsyncClient() as http:
+            url = f"{server.base_url('grok')}/chat/completions"
+            statuses = [
+                (await http.post(url, json={"messages": []}, headers=headers)).status_code
+                for _ in range(3)
+            ]
+            limited = await http.post(url, json={"messages": []}, headers=headers)
+
+        assert statuses == [200, 200, 429]
+        assert float(limited.headers["retry-after"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_scripted_failures(self):
+        behavior = StandinBehavior(fail_every=2, fail_status=503)
+        headers = {"Authorization": "Bearer test-key"}
+        async with StandinServer(behavior) as server, httpx.AsyncClient() as http:
+            url = f"{server.base_url('perplexity')}/chat/completions"
+            statuses = [
+                (await http.post(url, json={"messages": []}, headers=headers)).status_code
+                for _ in range(4)
+            ]
+        assert statuses == [200, 503, 200, 503]
+
+    @pytest.mark.asyncio
+    async def test_unknown_route(self):
+        async with StandinServer() as server, httpx.AsyncClient() as http:
+            response = await http.post(f"{server.url}/nope", json={})
+        assert response.status_code == 404
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_chat_completions_stream(self):
+        behavior = StandinBehavior(answer="HubSpot and Salesforce", stream_chunk_size=5)
+        async with StandinServer(behavior) as server, httpx.AsyncClient() as http:
+            response = await http.post(
+                f"{server.base_url('mistral')}/chat/completions",
+                json={"messages": [{"role": "user", "content": "hi"}], "stream": True},
+                headers={"Authorization": "Bearer test-key"},
+            )
+
+        events = _sse_events(response.text)
+        assert response.headers["content-type"] == "text/event-stream"
+        assert events[-1] == "[DONE]"
+        chunks = [json.loads(e) for e in events[:-1]]
+        text = "".join(c["choices"][0]["delta"].get("content", "") for c in chunks)
+        assert text == "HubSpot and Salesforce"
+        assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+    @pytest.mark.asyncio
+    async def test_anthropic_stream(self):
+        behavior = StandinBehavior(answer="Warmly leads", stream_chunk_size=4)
+        async with StandinServer(behavior) as server, httpx.AsyncClient() as http:
+            response = await http.post(
+                f"{server.base_url('anthropic')}/messages",
+                json={"messages": [{"role": "user", "content": "hi"}], "stream": True},
+                headers={"x-api-key": "test-key"},
+            )
+
+        events = [json.loads(e) for e in _sse_events(response.text)]
+        assert events[0]["type"] == "message_start"
+        assert events[-1]["type"] == "message_stop"
+        text = "".join(e["delta"]["text"] for e in events if e["type"] == "content_block_delta")
+        assert text == "Warmly leads"
+
+    @pytest.mark.asyncio
+    async def test_gemini_stream(self):
+        behavior = StandinBehavior(answer="Pipedrive wins", stream_chunk_size=3)
+        async with StandinServer(behavior) as server, httpx.AsyncClient() as http:
+            response = await http.post(
+                f"{server.base_url('google')}/models/gemini-2.0-flash:streamGenerateContent",
+                params={"key": "test-key", "alt": "sse"},
+                json={"contents": [{"parts": [{"text": "hi"}]}]},
+            )
+
+        events = [json.loads(e) for e in _sse_events(response.text)]
+        text = "".join(e["candidates"][0]["content"]["parts"][0]["text"] for e in events)
+        assert text == "Pipedrive wins"
+        assert events[-1]["usageMetadata"]["totalTokenCount"] > 0
+
+
+class TestBaseUrlConfig:
+    def test_resolve_explicit_wins(self, monkeypatch):
+        monkeypatch.setenv(BASE_URL_ENV_VARS["openai"], "http://env.example")
+        assert resolve_base_url("openai", "http://explicit.example") == "http://explicit.example"
+
+    def test_resolve_env_and_default(self, monkeypatch):
+        monkeypatch.delenv(BASE_URL_ENV_VARS["anthropic"], raising=False)
+        assert resolve_base_url("anthropic") is None
+        monkeypatch.setenv(BASE_URL_ENV_VARS["anthropic"], "http://env.example")
+        assert resolve_base_url("anthropic") == "http://env.example"
+
+    def test_model_config_accepts_base_url(self):
+        config = ModelConfig(
+            provider="openai",
+            model_name="gpt-4o-mini",
+            env_api_key="OPENAI_API_KEY",
+            base_url="http://127.0.0.1:8900/openai/v1",
+        )
+        assert config.base_url == "http://127.0.0.1:8900/openai/v1"
+
+    def test_model_config_rejects_invalid_base_url(self):
+        with pytest.raises(ValidationError):
+            ModelConfig(
+                provider="openai",
+                model_name="gpt-4o-mini",
+                env_api_key="OPENAI_API_KEY",
+                base_url="api.openai.com",
+            )
@@ -0,0 +1,229 @@
+"""
+Tests for streamed provider responses and incremental mention matching.
+
+Real OpenAI, Anthropic and Gemini clients stream from the local stand-in
+server, so SSE parsing, usage accounting and early stop are exercised over
+HTTP end-to-end.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.extractor.stream_matcher import IncrementalMentionMatcher
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.models import build_client
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.llm_runner.standin_server import (
+    StandinBehavior,
+    StandinServer,
+)
+from llm_answer_watcher.llm_runner.streaming import supports_streaming
+from llm_answer_watcher.storage.db import init_db_if_needed, load_answers_raw
+
+MODELS = {
+    "openai": "gpt-4o-mini",
+    "anthropic": "claude-3-5-haiku-20241022",
+    "google": "gemini-2.0-flash",
+}
+
+RANKED_ANSWER = (
+    "Top picks:\n"
+    "1. HubSpot - all-in-one CRM\n"
+    "2. Warmly - intent signals\n"
+    "3. Instantly - cold email\n"
+    "4. Salesforce - enterprise\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestProviderStreaming:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    async def test_stream_answer_matches_full_answer(self, provider):
+        chunks = []
+        behavior = StandinBehavior(answer=RANKED_ANSWER, stream_chunk_size=7)
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                provider, MODELS[provider], "test-key", "sys", base_url=server.base_url(provider)
+            )
+            response = await client.stream_answer("best CRM?", on_chunk=chunks.append)
+
+        assert response.answer_text == RANKED_ANSWER
+        assert "".join(chunks) == RANKED_ANSWER
+        assert len(chunks) > 1
+        assert response.provider == provider
+        assert response.prompt_tokens > 0
+        assert response.completion_tokens > 0
+        assert response.ttft_ms is not None
+        assert response.stopped_early is False
+        assert server.requests[0]["stream"] is True
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("provider", sorted(MODELS))
+    async def test_early_stop(self, provider):
+        matcher = IncrementalMentionMatcher(
+            ["Warmly"], ["HubSpot", "Instantly", "Salesforce"], stop_after_ranked_items=2
+        )
+        behavior = StandinBehavior(answer=RANKED_ANSWER, stream_chunk_size=5)
+        async with StandinServer(behavior) as server:
+            client = build_client(
+                provider, MODELS[provider], "test-key", "sys", base_url=server.base_url(provider)
+            )
+            response = await client.stream_answer("best CRM?", on_chunk=matcher.feed)
+
+        assert response.stopped_early is True
+        assert "Warmly" in response.answer_text
+        assert "Salesforce" not in response.answer_text
+        assert matcher.ranked_items == 2
+        assert matcher.first_mention_ms is not None
+
+    @pytest.mark.asyncio
+    async def test_gemini_stream_grounding(self):
+        async with StandinServer(StandinBehavior(web_search=True)) as server:
+            client = build_client(
+                "google", MODELS["google"], "test-key", "sys", base_url=server.base_url("google")
+            )
+            response = await client.stream_answer("best CRM?")
+
+        assert response.web_search_count == 1
+        assert response.web_search_results
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status(self):
+        async with StandinServer() as server:
+            client = build_client(
+                "anthropic", MODELS["anthropic"], "test-key", "sys", base_url=server.url
+            )
+            with pytest.raises(RuntimeError, match="non-retryable"):
+                await client.stream_answer("best CRM?")
+
+    def test_supports_streaming(self):
+        assert supports_streaming(MockLLMClient())
+        assert supports_streaming(build_client("openai", "gpt-4o-mini", "k", "sys"))
+        assert not supports_streaming(build_client("mistral", "mistral-small-latest", "k", "sys"))
+
+
+class TestMockClientStreaming:
+    @pytest.mark.asyncio
+    async def test_stream_answer_early_stop(self):
+        client = MockLLMClient(
+            responses={"test": "Hello world"}, streaming_chunk_size=5, streaming_delay_ms=0
+        )
+        response = await client.stream_answer("test", on_chunk=lambda chunk: chunk == " worl")
+
+        assert response.answer_text == "Hello worl"
+        assert response.stopped_early is True
+        assert response.ttft_ms is not None
+        assert response.completion_tokens < 50
+
+
+class TestIncrementalMentionMatcher:
+    def test_brand_split_across_deltas(self):
+        matcher = IncrementalMentionMatcher(["Warmly"], ["HubSpot", "Hub"])
+        for delta in ("Try Hub", "Spot or War", "mly."):
+            matcher.feed(delta)
+        mentions = matcher.finish()
+
+        assert [m.normalized_name for m in mentions] == ["HubSpot", "Warmly"]
+        assert [m.match_position for m in mentions] == [4, 15]
+
+    def test_match_at_buffer_end_deferred(self):
+        matcher = IncrementalMentionMatcher([], ["HubSpot"])
+        matcher.feed("Use HubSpot")
+        assert matcher.mentions == []
+        assert matcher.first_mention_ms is None
+
+        assert [m.normalized_name for m in matcher.finish()] == ["HubSpot"]
+        assert matcher.first_mention_ms is not None
+
+    def test_first_occurrence_kept(self):
+        matcher = IncrementalMentionMatcher(["Warmly"], [])
+        matcher.feed("warmly first, then Warmly again. ")
+        mentions = matcher.finish()
+
+        assert len(mentions) == 1
+        assert mentions[0].original_text == "warmly"
+        assert mentions[0].brand_category == "mine"
+
+    def test_ranked_items_need_brand_and_complete_line(self):
+        matcher = IncrementalMentionMatcher(["Warmly"], ["HubSpot"], stop_after_ranked_items=2)
+        assert matcher.feed("1. Pricing matters\n**1.** HubSpot\n") is False
+        assert matcher.feed("2) Warmly") is False  # Line not complete yet
+        assert matcher.feed("\n") is True
+        assert matcher.feed("3. ignored after stop\n") is True
+        assert "ignored" not in matcher.text
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            IncrementalMentionMatcher(["Warmly"], [], stop_after_ranked_items=0)
+
+
+class TestRunnerStreaming:
+    def _config(self, tmp_path, **settings):
+        return RuntimeConfig(
+            run_settings=RunSettings(
+                output_dir=str(tmp_path / "output"),
+                sqlite_db_path=str(tmp_path / "test.db"),
+                models=[
+                    ModelConfig(
+                        provider="openai", model_name="gpt-4o-mini", env_api_key="TEST_API_KEY"
+                    )
+                ],
+                **settings,
+            ),
+            brands=Brands(mine=["Warmly"], competitors=["HubSpot", "Instantly", "Salesforce"]),
+            intents=[Intent(id="crm", prompt="best CRM?")],
+            models=[
+                RuntimeModel(
+                    provider="openai",
+                    model_name="gpt-4o-mini",
+                    api_key="test-key",
+                    system_prompt="sys",
+                )
+            ],
+        )
+
+    def test_stream_settings_validated(self, tmp_path):
+        with pytest.raises(ValidationError):
+            self._config(tmp_path, stream_stop_after_ranked_items=0)
+
+    @pytest.mark.asyncio
+    @patch("llm_answer_watcher.llm_runner.runner.build_client")
+    async def test_streamed_metrics_persisted(self, mock_build_client, tmp_path):
+        mock_build_client.return_value = MockLLMClient(
+            default_response=RANKED_ANSWER, streaming_chunk_size=6, streaming_delay_ms=0
+        )
+        config = self._config(tmp_path, stream_responses=True, stream_stop_after_ranked_items=2)
+        init_db_if_needed(config.run_settings.sqlite_db_path)
+
+        result = await run_all(config)
+
+        assert result["success_count"] == 1
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            row = conn.execute(
+                "SELECT ttft_ms, first_mention_ms, stopped_early FROM query_timings"
+            ).fetchone()
+            answer = load_answers_raw(conn)[0]["answer_text"]
+        assert row[0] is not None
+        assert row[1] is not None
+        assert row[2] == 1
+        assert "Salesforce" not in answer
@@ -0,0 +1,307 @@
+"""
+Tests for per-query timing spans, latency summaries, OpenTelemetry export,
+and the query_timings table.
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import httpx
+import pytest
+
+from llm_answer_watcher.llm_runner.http_pool import closing_pool, get_pooled_client, pooled_client
+from llm_answer_watcher.llm_runner.timing import (
+    STAGE_DB_WRITE,
+    STAGE_LLM_CALL,
+    STAGE_SEMAPHORE_WAIT,
+    STAGES,
+    LatencyAccumulator,
+    QueryTimer,
+    build_otel_trace,
+    percentile,
+    record_http_attempt,
+    reset_current_timer,
+)
+from llm_answer_watcher.storage.db import (
+    init_db_if_needed,
+    insert_query_timing,
+    insert_run,
+)
+
+
+def _finished_timer(provider, model, total_ms, status="success"):
+    timer = QueryTimer("run-1", "intent-1", provider, model)
+    timer.finish(status)
+    timer.total_ms = total_ms
+    return timer
+
+
+class TestPercentile:
+    def test_empty(self):
+        assert percentile([], 50) == 0.0
+
+    def test_single_value(self):
+        assert percentile([42.0], 99) == 42.0
+
+    def test_interpolates(self):
+        assert percentile([40.0, 10.0, 30.0, 20.0], 50) == 25.0
+
+    def test_bounds(self):
+        values = [1.0, 2.0, 3.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 100) == 3.0
+
+
+class TestQueryTimer:
+    def test_spans_and_stage_totals(self):
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        timer.mark_since_start(STAGE_SEMAPHORE_WAIT)
+        with timer.span(STAGE_DB_WRITE):
+            pass
+        with timer.span(STAGE_DB_WRITE):
+            pass
+        timer.finish()
+
+        totals = timer.stage_totals()
+        assert set(totals) == set(STAGES)
+        assert [s.name for s in timer.spans] == [
+            STAGE_SEMAPHORE_WAIT,
+            STAGE_DB_WRITE,
+            STAGE_DB_WRITE,
+        ]
+        assert totals[STAGE_LLM_CALL] == 0.0
+        assert timer.total_ms >= totals[STAGE_DB_WRITE]
+
+    def test_span_recorded_on_exception(self):
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        with pytest.raises(RuntimeError), timer.span(STAGE_LLM_CALL):
+            raise RuntimeError("boom")
+        assert timer.spans[0].name == STAGE_LLM_CALL
+
+    def test_finish_sets_status(self):
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        timer.finish("error")
+        assert timer.status == "error"
+        assert timer.total_ms is not None
+
+    def test_http_attempts_counted_in_active_span(self):
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        token = timer.activate()
+        try:
+            record_http_attempt()  # Outside any span: ignored
+            with timer.span(STAGE_LLM_CALL):
+                record_http_attempt()
+                record_http_attempt()
+        finally:
+            reset_current_timer(token)
+
+        record_http_attempt()  # Timer no longer current
+        assert timer.http_attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_do_not_share_timers(self):
+        async def query(attempts):
+            timer = QueryTimer("run-1", f"intent-{attempts}", "openai", "gpt-4o-mini")
+            token = timer.activate()
+            try:
+                with timer.span(STAGE_LLM_CALL):
+                    for _ in range(attempts):
+                        await asyncio.sleep(0)
+                        record_http_attempt()
+            finally:
+                reset_current_timer(token)
+            return timer
+
+        timers = await asyncio.gather(query(1), query(3))
+        assert [t.http_attempts for t in timers] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_reports_attempts(self, httpx_mock):
+        httpx_mock.add_response(url="https://api.example.com/v1", status_code=500)
+        httpx_mock.add_response(url="https://api.example.com/v1", json={"ok": True})
+
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        token = timer.activate()
+        try:
+            with timer.span(STAGE_LLM_CALL):
+                async with pooled_client() as client:
+                    first = await client.post("https://api.example.com/v1")
+                    second = await client.post("https://api.example.com/v1")
+        finally:
+            reset_current_timer(token)
+
+        assert isinstance(first, httpx.Response)
+        assert second.json() == {"ok": True}
+        assert timer.http_attempts == 2
+
+    def test_closing_pool_closes_client_after_run(self):
+        async def run():
+            return get_pooled_client()
+
+        client = asyncio.run(closing_pool(run()))
+        assert client.is_closed
+
+        async def failing_run():
+            get_pooled_client()
+            raise RuntimeError("run failed")
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(closing_pool(failing_run()))
+
+
+def _summarize(timers):
+    latency = LatencyAccumulator()
+    for timer in timers:
+        latency.add(timer)
+    return latency.summary()
+
+
+class TestSummaries:
+    def test_latency_summary_groups_by_model(self):
+        timers = [
+            _finished_timer("openai", "gpt-4o-mini", 100.0),
+            _finished_timer("openai", "gpt-4o-mini", 300.0),
+            _finished_timer("anthropic", "claude-3-5-haiku", 50.0, status="error"),
+        ]
+        timers.append(QueryTimer("run-1", "intent-2", "openai", "gpt-4o-mini"))
+
+        summary = _summarize(timers)
+
+        assert list(summary) == ["anthropic/claude-3-5-haiku", "openai/gpt-4o-mini"]
+        openai = summary["openai/gpt-4o-mini"]
+        assert openai["count"] == 2  # Unfinished timer skipped
+        assert openai["p50_ms"] == 200.0
+        assert openai["max_ms"] == 300.0
+        assert set(openai["mean_stage_ms"]) == set(STAGES)
+        assert openai["http_retries"] == 0
+
+    def test_latency_summary_streaming_metrics(self):
+        streamed = [_finished_timer("openai", "gpt-4o-mini", 900.0) for _ in range(3)]
+        for timer, ttft in zip(streamed, (100.0, 200.0, 300.0), strict=True):
+            timer.ttft_ms = ttft
+            timer.tokens_per_sec = 50.0
+        streamed[0].stopped_early = True
+        plain = _finished_timer("anthropic", "claude-3-5-haiku", 500.0)
+
+        summary = _summarize([*streamed, plain])
+
+        openai = summary["openai/gpt-4o-mini"]
+        assert openai["ttft_p50_ms"] == 200.0
+        assert openai["tokens_per_sec"] == 50.0
+        assert openai["stopped_early"] == 1
+        assert "ttft_p50_ms" not in summary["anthropic/claude-3-5-haiku"]
+
+    def test_latency_accumulator_bounded_sample(self):
+        latency = LatencyAccumulator(sample_size=50)
+        for i in range(1, 1001):
+            latency.add(_finished_timer("openai", "gpt-4o-mini", float(i)))
+
+        summary = latency.summary()["openai/gpt-4o-mini"]
+        assert len(latency._models["openai/gpt-4o-mini"].totals) == 50
+        assert summary["count"] == 1000  # Exact despite sampling
+        assert summary["max_ms"] == 1000.0
+        assert 300 < summary["p50_ms"] < 700  # Estimated from the reservoir
+
+    def test_otel_trace_structure(self):
+        timer = QueryTimer("run-1", "intent-1", "openai", "gpt-4o-mini")
+        with timer.span(STAGE_LLM_CALL):
+            pass
+        timer.finish("error")
+
+        trace = build_otel_trace("run-1", [timer])
+
+        spans = trace["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        root, child = spans
+        assert len(root["traceId"]) == 32
+        assert len(root["spanId"]) == 16
+        assert child["parentSpanId"] == root["spanId"]
+        assert child["name"] == STAGE_LLM_CALL
+        assert root["status"]["code"] == 2
+        assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        json.dumps(trace)  # Must be serializable
+
+
+class TestQueryTimingsTable:
+    @pytest.fixture
+    def conn(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        init_db_if_needed(str(db_path))
+        with sqlite3.connect(str(db_path)) as connection:
+            insert_run(connection, "run-1", "2025-11-01T08:00:00Z", 1, 1)
+            yield connection
+
+    def test_insert_and_read_back(self, conn):
+        insert_query_timing(
+            conn,
+            "run-1",
+            "intent-1",
+            "openai",
+            "gpt-4o-mini",
+            status="success",
+            total_ms=1240.5,
+            stage_ms={STAGE_SEMAPHORE_WAIT: 3.1, STAGE_LLM_CALL: 1180.2},
+            http_attempts=2,
+            timestamp_utc="2025-11-01T08:00:02Z",
+            spans_json="[]",
+        )
+
+        row = conn.execute(
+            "SELECT total_ms, semaphore_wait_ms, llm_call_ms, extraction_ms, "
+            "http_attempts, spans_json FROM query_timings"
+        ).fetchone()
+        assert row == (1240.5, 3.1, 1180.2, 0.0, 2, "[]")
+
+    def test_streaming_columns(self, conn):
+        insert_query_timing(
+            conn,
+            "run-1",
+            "intent-1",
+            "openai",
+            "gpt-4o-mini",
+            status="success",
+            total_ms=800.0,
+            stage_ms={},
+            http_attempts=1,
+            timestamp_utc="2025-11-01T08:00:02Z",
+            ttft_ms=210.5,
+            tokens_per_sec=61.2,
+            first_mention_ms=260.0,
+            stopped_early=True,
+        )
+
+        row = conn.execute(
+            "SELECT ttft_ms, tokens_per_sec, first_mention_ms, stopped_early FROM query_timings"
+        ).fetchone()
+        assert row == (210.5, 61.2, 260.0, 1)
+
+    def test_duplicate_ignored(self, conn):
+        for _ in range(2):
+            insert_query_timing(
+                conn,
+                "run-1",
+                "intent-1",
+                "openai",
+                "gpt-4o-mini",
+                status="success",
+                total_ms=10.0,
+                stage_ms={},
+                http_attempts=1,
+                timestamp_utc="2025-11-01T08:00:02Z",
+            )
+        assert conn.execute("SELECT COUNT(*) FROM query_timings").fetchone()[0] == 1
+
+    def test_invalid_status(self, conn):
+        with pytest.raises(ValueError):
+            insert_query_timing(
+                conn,
+                "run-1",
+                "intent-1",
+                "openai",
+                "gpt-4o-mini",
+                status="timeout",
+                total_ms=10.0,
+                stage_ms={},
+                http_attempts=1,
+                timestamp_utc="2025-11-01T08:00:02Z",
+            )
@@ -500,6 +500,32 @@ class TestHtmlSections:
         assert_html_contains(html, "Cost Disclaimer")
         assert_html_contains(html, "LLM Answer Watcher")
 
+    def test_contains_sampled_visibility(
+        self, tmp_path, runtime_config, sample_results, sample_parsed_data
+    ):
+        """Test HTML shows adaptive sampling estimates when present."""
+        run_dir = tmp_path / "run"
+        run_dir.mkdir()
+        sample_parsed_data["sampling"] = {
+            "samples": 5,
+            "appeared_count": 4,
+            "appearance_low": 0.42,
+            "appearance_high": 0.96,
+            "mean_rank": 1.5,
+            "rank_low": 1.1,
+            "rank_high": 1.9,
+            "stop_reason": "precise",
+        }
+        create_parsed_json_file(
+            run_dir, "email-warmup", "openai", "gpt-4o-mini", sample_parsed_data
+        )
+
+        html = generate_report(str(run_dir), "test-run", runtime_config, sample_results)
+
+        assert_html_contains(html, "appeared in 4/5 answers")
+        assert_html_contains(html, "mean rank 1.5")
+        assert_html_contains(html, "stopped early")
+
 
 # ============================================================================
 # Tests - Cost Formatting
@@ -0,0 +1,182 @@
+"""
+Tests for the content-addressed blob store of answer texts (schema v10).
+"""
+
+import sqlite3
+
+import pytest
+
+from llm_answer_watcher.storage.db import (
+    apply_migrations,
+    get_blob,
+    get_schema_version,
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_run,
+    load_answers_raw,
+    put_blob,
+    search_answers,
+)
+
+
+@pytest.fixture
+def conn(tmp_path):
+    path = str(tmp_path / "watcher.db")
+    init_db_if_needed(path)
+    with sqlite3.connect(path) as connection:
+        yield connection
+
+
+def _insert(conn, run_id, answer_text, prompt="What are the best CRMs?"):
+    insert_answer_raw(
+        conn=conn,
+        run_id=run_id,
+        intent_id="crm-tools",
+        model_provider="openai",
+        model_name="gpt-4o-mini",
+        timestamp_utc="2025-11-01T08:00:00Z",
+        prompt=prompt,
+        answer_text=answer_text,
+        web_search_results_json='[{"url": "https://example.com"}]',
+    )
+
+
+class TestBlobStore:
+    def test_roundtrip_and_compression(self, conn):
+        text = "HubSpot is a CRM. " * 200
+        content_hash = put_blob(conn, text)
+
+        assert get_blob(conn, content_hash) == text
+        codec, size, stored = conn.execute(
+            "SELECT codec, size, length(data) FROM blobs WHERE hash = ?", (content_hash,)
+        ).fetchone()
+        assert codec == "zlib"
+        assert size == len(text)
+        assert stored < size / 10
+
+    def test_short_text_stored_uncompressed(self, conn):
+        content_hash = put_blob(conn, "Hi")
+
+        assert conn.execute("SELECT codec FROM blobs").fetchone() == ("none",)
+        assert get_blob(conn, content_hash) == "Hi"
+        assert put_blob(conn, None) is None
+        assert get_blob(conn, None) is None
+        assert get_blob(conn, "unknown") is None
+
+    def test_repeated_texts_stored_once(self, conn):
+        for run_id in ("r1", "r2", "r3"):
+            insert_run(conn, run_id, "2025-11-01T08:00:00Z", 1, 1)
+            _insert(conn, run_id, "HubSpot is the leading CRM.")
+        conn.commit()
+
+        # One prompt, one answer, one web search payload
+        assert conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0] == 3
+        inline = conn.execute("SELECT DISTINCT prompt, answer_text FROM answers_raw").fetchall()
+        assert inline == [("", "")]
+
+    def test_load_answers_raw_resolves_texts(self, conn):
+        insert_run(conn, "r1", "2025-11-01T08:00:00Z", 1, 1)
+        _insert(conn, "r1", "Try Warmly.")
+        conn.commit()
+
+        (answer,) = load_answers_raw(conn, run_id="r1")
+        assert answer["prompt"] == "What are the best CRMs?"
+        assert answer["answer_text"] == "Try Warmly."
+        assert answer["web_search_results_json"] == '[{"url": "https://example.com"}]'
+        assert load_answers_raw(conn, run_id="r2") == []
+
+
+class TestBlobMigration:
+    def test_inline_answers_moved_to_blobs(self, tmp_path):
+        path = str(tmp_path / "old.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+            )
+            apply_migrations(conn, 0, 9)
+            insert_run(conn, "r1", "2025-11-01T08:00:00Z", 1, 2)
+            for model_name in ("gpt-4o-mini", "gpt-4o"):
+                conn.execute(
+                    "INSERT INTO answers_raw (run_id, intent_id, model_provider, model_name, "
+                    "timestamp_utc, prompt, answer_text, answer_length) "
+                    "VALUES ('r1', 'crm-tools', 'openai', ?, '2025-11-01T08:00:00Z', "
+                    "'Best CRM?', 'HubSpot.', 8)",
+                    (model_name,),
+                )
+            conn.commit()
+
+        init_db_if_needed(path)
+
+        with sqlite3.connect(path) as conn:
+            answers = load_answers_raw(conn, run_id="r1")
+            blob_count = conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+            inline = conn.execute("SELECT answer_text FROM answers_raw").fetchall()
+        assert [a["answer_text"] for a in answers] == ["HubSpot.", "HubSpot."]
+        assert answers[0]["prompt"] == "Best CRM?"
+        assert blob_count == 2
+        assert inline == [("",), ("",)]
+
+    def test_v9_to_v10_rebuilds_search_index_without_text(self, tmp_path):
+        path = str(tmp_path / "v9.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+            )
+            apply_migrations(conn, 0, 9)
+            insert_run(conn, "r1", "2025-11-01T08:00:00Z", 1, 1)
+            # v9 triggers index the inline text into answers_fts
+            conn.execute(
+                "INSERT INTO answers_raw (run_id, intent_id, model_provider, model_name, "
+                "timestamp_utc, prompt, answer_text, answer_length) "
+                "VALUES ('r1', 'crm-tools', 'openai', 'gpt-4o-mini', '2025-11-01T08:00:00Z', "
+                "'Best CRM?', 'HubSpot leads, Warmly follows.', 30)"
+            )
+            conn.commit()
+
+            apply_migrations(conn, 9, 10)
+
+            assert get_schema_version(conn) == 10
+            triggers = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'answers_fts%'"
+            ).fetchall()
+            assert triggers == []
+            fts_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'answers_fts'"
+            ).fetchone()[0]
+            assert "content=''" in fts_sql
+
+            results = search_answers(conn, "warmly", highlight=("[", "]"))
+            assert [r["intent_id"] for r in results] == ["crm-tools"]
+            assert "[Warmly]" in results[0]["snippet"]
+            assert search_answers(conn, "salesforce") == []
+            (inline,) = conn.execute("SELECT answer_text FROM answers_raw").fetchone()
+            assert inline == ""
+
+    def test_v9_index_not_built_when_migrating_past_it(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "v8.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+            )
+            apply_migrations(conn, 0, 8)
+            insert_run(conn, "r1", "2025-11-01T08:00:00Z", 1, 1)
+            conn.execute(
+                "INSERT INTO answers_raw (run_id, intent_id, model_provider, model_name, "
+                "timestamp_utc, prompt, answer_text, answer_length) "
+                "VALUES ('r1', 'crm-tools', 'openai', 'gpt-4o-mini', '2025-11-01T08:00:00Z', "
+                "'Best CRM?', 'HubSpot leads, Warmly follows.', 30)"
+            )
+            conn.commit()
+
+            # v10 drops the external-content index and its triggers anyway
+            def fail(_conn):
+                raise AssertionError("v9 index built only to be dropped")
+
+            monkeypatch.setattr("llm_answer_watcher.storage.db._migrate_to_v9", fail)
+            apply_migrations(conn, 8, 10)
+
+            versions = conn.execute("SELECT version FROM schema_version").fetchall()
+            assert (9,) in versions
+            assert get_schema_version(conn) == 10
+            results = search_answers(conn, "warmly")
+            assert [r["intent_id"] for r in results] == ["crm-tools"]
@@ -31,6 +31,8 @@ from llm_answer_watcher.storage.db import (
     insert_answer_raw,
     insert_mention,
     insert_run,
+    list_runs,
+    load_answers_raw,
     update_run_cost,
 )
 from llm_answer_watcher.utils.time import utc_timestamp
@@ -111,7 +113,7 @@ def test_init_db_creates_schema_version_table(tmp_path):
 
 
 def test_init_db_creates_all_tables(tmp_path):
-    """Test that all tables are created (runs, answers_raw, mentions, operations, intent_classifications, intent_classification_cache, schema_version)."""
+    """Test that all tables are created (runs, answers_raw, mentions, operations, intent_classifications, intent_classification_cache, query_timings, model_latency_histograms, answers_fts with its FTS5 shadow tables, blobs, visibility_estimates, schema_version)."""
     db_path = tmp_path / "test.db"
     init_db_if_needed(str(db_path))
 
@@ -122,13 +124,22 @@ def test_init_db_creates_all_tables(tmp_path):
         tables = [row[0] for row in cursor.fetchall()]
 
     expected_tables = [
+        "answers_fts",
+        "answers_fts_config",
+        "answers_fts_data",
+        "answers_fts_docsize",
+        "answers_fts_idx",
         "answers_raw",
+        "blobs",
         "intent_classification_cache",
         "intent_classifications",
         "mentions",
+        "model_latency_histograms",
         "operations",
+        "query_timings",
         "runs",
         "schema_version",
+        "visibility_estimates",
     ]
     assert sorted(tables) == sorted(expected_tables)
 
@@ -474,18 +485,19 @@ def test_insert_answer_raw_stores_response(tmp_path):
         )
         conn.commit()
 
-        cursor = conn.execute("SELECT * FROM answers_raw WHERE run_id = ?", (run_id,))
-        row = cursor.fetchone()
+        rows = load_answers_raw(conn, run_id=run_id)
 
-    assert row is not None
-    assert row[1] == run_id
-    assert row[2] == "email-warmup"
-    assert row[3] == "openai"
-    assert row[4] == "gpt-4o-mini"
-    assert row[7] == answer_text
-    assert row[8] == len(answer_text)  # answer_length computed correctly
-    assert row[9] == json.dumps(usage_meta)
-    assert row[10] == 0.0012
+    assert len(rows) == 1
+    row = rows[0]
+    assert row["run_id"] == run_id
+    assert row["intent_id"] == "email-warmup"
+    assert row["model_provider"] == "openai"
+    assert row["model_name"] == "gpt-4o-mini"
+    assert row["prompt"] == "What are the best email warmup tools?"
+    assert row["answer_text"] == answer_text
+    assert row["answer_length"] == len(answer_text)  # answer_length computed correctly
+    assert row["usage_meta_json"] == json.dumps(usage_meta)
+    assert row["estimated_cost_usd"] == 0.0012
 
 
 def test_insert_answer_raw_computes_answer_length(tmp_path):
@@ -591,10 +603,7 @@ def test_insert_answer_raw_is_idempotent(tmp_path):
         conn.commit()
 
         # Should still have first answer
-        cursor = conn.execute(
-            "SELECT answer_text FROM answers_raw WHERE run_id = ?", (run_id,)
-        )
-        answer_text = cursor.fetchone()[0]
+        answer_text = load_answers_raw(conn, run_id=run_id)[0]["answer_text"]
 
     assert answer_text == "First answer"
 
@@ -622,10 +631,7 @@ def test_insert_answer_raw_with_unicode(tmp_path):
         )
         conn.commit()
 
-        cursor = conn.execute(
-            "SELECT answer_text FROM answers_raw WHERE run_id = ?", (run_id,)
-        )
-        stored_text = cursor.fetchone()[0]
+        stored_text = load_answers_raw(conn, run_id=run_id)[0]["answer_text"]
 
     assert stored_text == answer_text
 
@@ -987,6 +993,23 @@ def test_get_run_summary_returns_none_for_nonexistent_run(tmp_path):
     assert summary is None
 
 
+def test_list_runs_newest_first_with_limit(tmp_path):
+    """Test that list_runs() returns the most recent runs first."""
+    db_path = tmp_path / "test.db"
+    init_db_if_needed(str(db_path))
+
+    with sqlite3.connect(db_path) as conn:
+        for hour in ("08", "09", "10"):
+            insert_run(conn, f"2025-11-02T{hour}-00-00Z", f"2025-11-02T{hour}:00:00Z", 1, 1)
+        conn.commit()
+
+        runs = list_runs(conn, limit=2)
+        summary = get_run_summary(conn, runs[0]["run_id"])
+
+    assert [run["run_id"] for run in runs] == ["2025-11-02T10-00-00Z", "2025-11-02T09-00-00Z"]
+    assert runs[0] == summary
+
+
 def test_get_run_summary_returns_dict_with_correct_keys(tmp_path):
     """Test that get_run_summary() returns dict with correct keys."""
     db_path = tmp_path / "test.db"
@@ -1008,6 +1031,7 @@ def test_get_run_summary_returns_dict_with_correct_keys(tmp_path):
         "total_intents",
         "total_models",
         "total_cost_usd",
+        "status",
     }
     assert set(summary.keys()) == expected_keys
 
@@ -1558,14 +1582,10 @@ def test_very_long_text_stored_correctly(tmp_path):
         )
         conn.commit()
 
-        cursor = conn.execute(
-            "SELECT answer_text, answer_length FROM answers_raw WHERE run_id = ?",
-            (run_id,),
-        )
-        row = cursor.fetchone()
+        row = load_answers_raw(conn, run_id=run_id)[0]
 
-    assert row[0] == long_text
-    assert row[1] == 50000
+    assert row["answer_text"] == long_text
+    assert row["answer_length"] == 50000
 
 
 def test_sql_injection_prevention_in_queries(tmp_path):
@@ -24,6 +24,7 @@ from llm_answer_watcher.storage.eval_db import (
     get_recent_eval_runs,
     init_eval_db_if_needed,
     insert_eval_result,
+    insert_eval_results_batch,
     insert_eval_run,
     store_eval_results,
 )
@@ -926,3 +927,45 @@ class TestEvalDatabasePerformance:
         # Should use idx_eval_results_metric_name index
         plan_str = str(plan)
         assert "idx_eval_results_metric_name" in plan_str
+
+    def test_insert_eval_results_batch(self, tmp_path):
+        """Test batched insert writes one row per metric with encoded fields."""
+        from llm_answer_watcher.evals.schema import EvalMetricScore, EvalResult
+
+        db_path = tmp_path / "test_eval.db"
+        init_eval_db_if_needed(str(db_path))
+        results = [
+            EvalResult(
+                test_description=f"Test {i}",
+                metrics=[
+                    EvalMetricScore(name="precision", value=1.0, passed=True, details={"tp": i}),
+                    EvalMetricScore(name="recall", value=0.5, passed=False),
+                ],
+                overall_passed=i % 2 == 0,
+            )
+            for i in range(3)
+        ]
+
+        with sqlite3.connect(str(db_path)) as conn:
+            insert_eval_run(
+                conn,
+                "batch-run",
+                {
+                    "pass_rate": 2 / 3,
+                    "total_test_cases": 3,
+                    "total_passed": 2,
+                    "total_failed": 1,
+                },
+            )
+            written = insert_eval_results_batch(conn, "batch-run", results)
+            conn.commit()
+
+            rows = conn.execute(
+                "SELECT test_description, overall_passed, metric_name, metric_passed, "
+                "metric_details_json FROM eval_results ORDER BY id"
+            ).fetchall()
+
+        assert written == 6
+        assert rows[0] == ("Test 0", 1, "precision", 1, '{"tp":0}')
+        assert rows[1] == ("Test 0", 1, "recall", 0, None)
+        assert rows[2][1] == 0  # Test 1 failed overall
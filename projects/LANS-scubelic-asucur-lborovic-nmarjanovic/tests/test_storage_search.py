@@ -0,0 +1,148 @@
+"""
+Tests for the full-text answer index (answers_fts) and the search command.
+"""
+
+import json
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from llm_answer_watcher.cli import app
+from llm_answer_watcher.storage.db import (
+    apply_migrations,
+    init_db_if_needed,
+    insert_answer_raw,
+    insert_mention,
+    insert_run,
+    search_answers,
+)
+
+ANSWERS = [
+    ("2025-11-01T08:00:00Z", "crm-tools", "gpt-4o-mini", "HubSpot is the leading CRM."),
+    ("2025-11-02T08:00:00Z", "crm-tools", "gpt-4o-mini", "Try HubSpot or Warmly for outreach."),
+    ("2025-11-03T08:00:00Z", "warmup", "gpt-4o", "Warmly is mentioned with HubSpot often."),
+    ("2025-11-04T08:00:00Z", "warmup", "gpt-4o", "Email warmup tools: Lemwarm, Warmbox."),
+]
+
+
+def _add_answer(conn, timestamp, intent_id, model_name, text):
+    run_id = timestamp.replace(":", "-")
+    insert_run(conn, run_id, timestamp, 1, 1)
+    insert_answer_raw(
+        conn=conn,
+        run_id=run_id,
+        intent_id=intent_id,
+        model_provider="openai",
+        model_name=model_name,
+        timestamp_utc=timestamp,
+        prompt=f"Question about {intent_id}?",
+        answer_text=text,
+    )
+    return run_id
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "watcher.db")
+    init_db_if_needed(path)
+    with sqlite3.connect(path) as conn:
+        for answer in ANSWERS:
+            run_id = _add_answer(conn, *answer)
+        insert_mention(
+            conn=conn,
+            run_id=run_id,
+            timestamp_utc=ANSWERS[-1][0],
+            intent_id="warmup",
+            model_provider="openai",
+            model_name="gpt-4o",
+            brand_name="Lemwarm",
+            normalized_name="Lemwarm",
+            is_mine=False,
+            first_position=22,
+            rank_position=1,
+            match_type="exact",
+        )
+        conn.commit()
+    return path
+
+
+class TestSearchAnswers:
+    def test_both_brands_oldest_first(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            results = search_answers(conn, "HubSpot AND Warmly", order="oldest")
+
+        assert [r["timestamp_utc"] for r in results] == [
+            "2025-11-02T08:00:00Z",
+            "2025-11-03T08:00:00Z",
+        ]
+        assert "**HubSpot**" in results[0]["snippet"]
+        assert "**Warmly**" in results[0]["snippet"]
+
+    def test_filters(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            by_model = search_answers(conn, "HubSpot", model_name="gpt-4o")
+            by_date = search_answers(conn, "HubSpot", since="2025-11-02", until="2025-11-02")
+            by_brand = search_answers(conn, "warmup", brand="lemwarm")
+            stemmed = search_answers(conn, "mention")
+            by_intent = search_answers(conn, "intent_id:crm*")
+
+        assert [r["intent_id"] for r in by_model] == ["warmup"]
+        assert [r["timestamp_utc"] for r in by_date] == ["2025-11-02T08:00:00Z"]
+        assert [r["timestamp_utc"] for r in by_brand] == ["2025-11-04T08:00:00Z"]
+        assert [r["timestamp_utc"] for r in stemmed] == ["2025-11-03T08:00:00Z"]
+        assert len(by_intent) == 2
+
+    def test_rank_orders_by_bm25(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            results = search_answers(conn, "HubSpot", order="rank")
+
+        scores = [r["score"] for r in results]
+        assert scores == sorted(scores)
+        with sqlite3.connect(db_path) as conn, pytest.raises(ValueError):
+            search_answers(conn, "HubSpot", order="random")
+
+    def test_deleted_answers_drop_out(self, db_path):
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("DELETE FROM answers_raw WHERE timestamp_utc = '2025-11-02T08:00:00Z'")
+            conn.commit()
+
+            assert len(search_answers(conn, "HubSpot")) == 2
+
+    def test_migration_indexes_existing_answers(self, tmp_path):
+        path = str(tmp_path / "old.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TEXT NOT NULL)"
+            )
+            apply_migrations(conn, 0, 8)
+            insert_run(conn, "r1", ANSWERS[0][0], 1, 1)
+            conn.execute(
+                "INSERT INTO answers_raw (run_id, intent_id, model_provider, model_name, "
+                "timestamp_utc, prompt, answer_text, answer_length) "
+                "VALUES ('r1', 'crm-tools', 'openai', 'gpt-4o-mini', ?, 'Best CRM?', ?, 27)",
+                (ANSWERS[0][0], ANSWERS[0][3]),
+            )
+            conn.commit()
+
+        init_db_if_needed(path)
+
+        with sqlite3.connect(path) as conn:
+            results = search_answers(conn, "HubSpot")
+        assert results[0]["snippet"] == "**HubSpot** is the leading CRM."
+
+
+class TestSearchCommand:
+    def test_json_output(self, db_path):
+        result = CliRunner().invoke(
+            app, ["search", "Warmly", "--db", db_path, "--order", "oldest", "--format", "json"]
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert [r["intent_id"] for r in data["results"]] == ["crm-tools", "warmup"]
+
+    def test_invalid_query_exits_config_error(self, db_path):
+        result = CliRunner().invoke(app, ["search", "AND OR", "--db", db_path])
+
+        assert result.exit_code == 1
@@ -7,13 +7,19 @@ Tests cover:
 - Edge cases (zero tokens, missing token fields, large token counts)
 - Proper rounding to 6 decimal places
 - Logging behavior (warnings when pricing unavailable)
+- Prompt cache pricing (cached reads, Anthropic cache writes) and hit ratios
 """
 
 import logging
 
 import pytest
 
-from llm_answer_watcher.utils.cost import PRICING, estimate_cost
+from llm_answer_watcher.utils.cost import (
+    PRICING,
+    estimate_cost,
+    summarize_prompt_cache,
+)
+from llm_answer_watcher.utils.pricing import ModelPricing
 
 
 class TestEstimateCostOpenAI:
@@ -683,3 +689,78 @@ class TestEstimateCostWithDynamicPricing:
             + breakdown["web_search_tool_cost_usd"]
             + breakdown["web_search_content_cost_usd"]
         )
+
+
+class TestPromptCachePricing:
+    """Test suite for cached prompt token pricing."""
+
+    def test_cached_tokens_use_provider_ratio(self):
+        """gpt-4o-mini has no explicit cached price: cached tokens cost 50%."""
+        usage = {"prompt_tokens": 1000, "completion_tokens": 0, "cached_tokens": 800}
+        cost = estimate_cost("openai", "gpt-4o-mini", usage)
+
+        # 200 * $0.15/1M + 800 * $0.075/1M
+        assert cost == pytest.approx(0.00009)
+
+    def test_explicit_input_cached_price(self):
+        """gpt-5 lists an explicit cached input price ($0.125/1M)."""
+        usage = {"prompt_tokens": 1000, "completion_tokens": 0, "cached_tokens": 1000}
+        assert estimate_cost("openai", "gpt-5", usage) == pytest.approx(0.000125)
+
+    def test_anthropic_cache_reads_and_writes(self):
+        """Anthropic cache reads cost 10% of input, cache writes 125%."""
+        read = {"prompt_tokens": 1000, "completion_tokens": 0, "cached_tokens": 1000}
+        write = {"prompt_tokens": 1000, "completion_tokens": 0, "cache_write_tokens": 1000}
+
+        assert estimate_cost("anthropic", "claude-3-5-haiku-20241022", read) == pytest.approx(
+            0.00008
+        )
+        assert estimate_cost("anthropic", "claude-3-5-haiku-20241022", write) == pytest.approx(
+            0.001
+        )
+
+    def test_cached_tokens_capped_at_prompt_tokens(self):
+        """Inconsistent usage never produces a negative uncached count."""
+        usage = {"prompt_tokens": 1000, "completion_tokens": 0, "cached_tokens": 5000}
+        assert estimate_cost("openai", "gpt-4o-mini", usage) == pytest.approx(0.000075)
+
+    def test_dynamic_pricing_uses_input_cached(self, monkeypatch):
+        """Dynamic pricing bills cached tokens at ModelPricing.input_cached."""
+        from llm_answer_watcher.utils.cost import estimate_cost_with_dynamic_pricing
+
+        monkeypatch.setattr(
+            "llm_answer_watcher.utils.pricing.get_pricing",
+            lambda provider, model: ModelPricing(
+                provider, model, input=1.0, output=2.0, input_cached=0.1, source="remote"
+            ),
+        )
+        usage = {"prompt_tokens": 1_000_000, "completion_tokens": 0, "cached_tokens": 500_000}
+        breakdown = estimate_cost_with_dynamic_pricing("openai", "gpt-4o-mini", usage)
+
+        assert breakdown["token_cost_usd"] == pytest.approx(0.55)
+        assert breakdown["pricing_source"] == "remote"
+
+
+class TestSummarizePromptCache:
+    """Test suite for per-model prompt cache statistics."""
+
+    def test_hit_ratio_per_model(self):
+        summary = summarize_prompt_cache(
+            {
+                "openai/gpt-4o-mini": [
+                    {"prompt_tokens": 2000, "cached_tokens": 0},
+                    {"prompt_tokens": 2000, "cached_tokens": 1536},
+                ],
+                "mistral/mistral-small-latest": [{"prompt_tokens": 100}],
+                "anthropic/claude-3-5-haiku-20241022": [{"prompt_tokens": 0}],
+            }
+        )
+
+        assert summary["openai/gpt-4o-mini"] == {
+            "calls": 2,
+            "prompt_tokens": 4000,
+            "cached_tokens": 1536,
+            "hit_ratio": 0.384,
+        }
+        assert summary["mistral/mistral-small-latest"]["hit_ratio"] == 0.0
+        assert summary["anthropic/claude-3-5-haiku-20241022"]["hit_ratio"] == 0.0
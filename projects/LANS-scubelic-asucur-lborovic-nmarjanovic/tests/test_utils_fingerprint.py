@@ -0,0 +1,146 @@
+"""
+Tests for SimHash answer fingerprints and run-over-run change detection.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from llm_answer_watcher.config.schema import (
+    Brands,
+    Intent,
+    ModelConfig,
+    RunSettings,
+    RuntimeConfig,
+    RuntimeModel,
+)
+from llm_answer_watcher.llm_runner.mock_client import MockLLMClient
+from llm_answer_watcher.llm_runner.runner import run_all
+from llm_answer_watcher.storage.db import init_db_if_needed
+from llm_answer_watcher.utils.fingerprint import (
+    CHANGE_MAJOR,
+    CHANGE_MINOR,
+    CHANGE_NEW,
+    CHANGE_UNCHANGED,
+    classify_change,
+    hamming_distance,
+    simhash,
+)
+
+ANSWER = (
+    "Here are the best CRM tools for startups. 1. HubSpot is free and easy to use. "
+    "2. Salesforce is the enterprise leader with many integrations. 3. Pipedrive "
+    "focuses on sales pipelines. 4. Warmly is affordable. Each tool has a free "
+    "trial so you can compare them before committing."
+)
+
+
+@pytest.fixture(autouse=True)
+def no_remote_pricing(monkeypatch):
+    """Keep cost estimation offline."""
+    monkeypatch.setattr(
+        "llm_answer_watcher.utils.pricing._fetch_remote_pricing",
+        lambda *_args, **_kwargs: None,
+    )
+
+
+class TestSimHash:
+    def test_similar_texts_are_close(self):
+        fingerprint = simhash(ANSWER)
+
+        assert simhash(ANSWER) == fingerprint
+        assert hamming_distance(fingerprint, simhash(ANSWER.upper() + "!")) == 0
+        reworded = ANSWER.replace("is affordable", "is cheap")
+        assert 0 < hamming_distance(fingerprint, simhash(reworded)) <= 12
+        other = "Email warmup tools: Lemwarm, Warmbox and Mailreach improve deliverability."
+        assert hamming_distance(fingerprint, simhash(other)) > 12
+
+    def test_fits_signed_sqlite_integer(self):
+        for text in (ANSWER, "a", "", "Warmly " * 50):
+            assert -(2**63) <= simhash(text) < 2**63
+
+    def test_classify_change(self):
+        assert classify_change(None) == CHANGE_NEW
+        assert classify_change(3) == CHANGE_UNCHANGED
+        assert classify_change(12) == CHANGE_MINOR
+        assert classify_change(13) == CHANGE_MAJOR
+
+
+def _config(tmp_path, reuse_unchanged_extractions=False):
+    db_path = str(tmp_path / "watcher.db")
+    init_db_if_needed(db_path)
+    return RuntimeConfig(
+        run_settings=RunSettings(
+            output_dir=str(tmp_path / "output"),
+            sqlite_db_path=db_path,
+            models=[ModelConfig(provider="openai", model_name="gpt-4o-mini", env_api_key="K")],
+            reuse_unchanged_extractions=reuse_unchanged_extractions,
+        ),
+        brands=Brands(mine=["Warmly"], competitors=["HubSpot", "Salesforce"]),
+        intents=[Intent(id="crm", prompt="Best CRM?"), Intent(id="warmup", prompt="Warmup?")],
+        models=[RuntimeModel(provider="openai", model_name="gpt-4o-mini", api_key="k")],
+    )
+
+
+async def _run(config, responses, run_id):
+    client = MockLLMClient(responses=responses)
+    with (
+        patch("llm_answer_watcher.llm_runner.runner.build_client", return_value=client),
+        patch("llm_answer_watcher.llm_runner.runner.run_id_from_timestamp", return_value=run_id),
+    ):
+        return await run_all(config)
+
+
+class TestRunChanges:
+    @pytest.mark.asyncio
+    async def test_run_summary_flags_changes(self, tmp_path):
+        config = _config(tmp_path)
+        first = await _run(config, {"Best CRM?": ANSWER, "Warmup?": "Try Lemwarm."}, "r1")
+        second = await _run(
+            config,
+            {"Best CRM?": ANSWER, "Warmup?": "Warmly and HubSpot both offer sequences now."},
+            "r2",
+        )
+
+        assert first["answer_changes"][CHANGE_NEW] == 2
+        assert second["answer_changes"] == {
+            CHANGE_NEW: 0,
+            CHANGE_UNCHANGED: 1,
+            CHANGE_MINOR: 0,
+            CHANGE_MAJOR: 1,
+        }
+        run_meta = json.loads((Path(second["output_dir"]) / "run_meta.json").read_text())
+        assert run_meta["answer_changes"]["changed"] == [
+            {
+                "intent_id": "warmup",
+                "model_provider": "openai",
+                "model_name": "gpt-4o-mini",
+                "change": CHANGE_MAJOR,
+            }
+        ]
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            statuses = conn.execute(
+                "SELECT intent_id, change_status FROM answers_raw WHERE run_id = 'r2' "
+                "ORDER BY intent_id"
+            ).fetchall()
+        assert statuses == [("crm", CHANGE_UNCHANGED), ("warmup", CHANGE_MAJOR)]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_answers_keep_previous_extraction(self, tmp_path):
+        config = _config(tmp_path, reuse_unchanged_extractions=True)
+        responses = {"Best CRM?": ANSWER, "Warmup?": "Try Lemwarm."}
+        await _run(config, responses, "r1")
+
+        with patch("llm_answer_watcher.llm_runner.runner.parse_answer", side_effect=AssertionError):
+            second = await _run(config, responses, "r2")
+
+        assert second["success_count"] == 2
+        with sqlite3.connect(config.run_settings.sqlite_db_path) as conn:
+            mentions = conn.execute(
+                "SELECT run_id, COUNT(*) FROM mentions GROUP BY run_id ORDER BY run_id"
+            ).fetchall()
+        assert mentions == [("r1", 3), ("r2", 3)]
+        assert (Path(second["output_dir"]) / "intent_crm_parsed_openai_gpt-4o-mini.json").exists()